@@ -0,0 +1,180 @@
+"""
+Alumni cube reads and the drain task that keeps the cube current.
+
+core.alumni_cube (supabase/migrations/20261019_alumni_cube.sql) holds one row
+per past employer x Sales Nav job function x person country, with '*' rows
+for the rollups, carrying the distinct alumni counts and a sample of alumni
+present in core.leads. The past-employer endpoints and the priority-company
+counts read those rows by primary key instead of aggregating
+core.person_work_history per request.
+
+Triggers queue employers whose work history or alumni locations change in
+core.alumni_cube_dirty, and the past employers of people added to or removed
+from core.leads (for sample_linkedin_urls). A lifespan task drains the queue
+every ALUMNI_CUBE_DRAIN_SECONDS; an employer read while still queued with no
+cube rows yet (e.g. during the initial backfill) is refreshed inline first.
+
+The drain works like company_cards.py: each batch of ALUMNI_CUBE_DRAIN_BATCH
+employers is claimed with a lease, refreshed and finished as separate
+statements on the bulk pool. A batch that fails is retried one employer at a
+time, and an employer that still fails goes back in the queue behind an
+exponential backoff, so one slow employer can't stall the backfill.
+"""
+
+import os
+import asyncio
+from typing import Dict, List, Optional
+from db import get_pool, get_bulk_pool
+
+ALUMNI_CUBE_DRAIN_SECONDS = int(os.getenv("ALUMNI_CUBE_DRAIN_SECONDS", "10"))
+ALUMNI_CUBE_DRAIN_BATCH = int(os.getenv("ALUMNI_CUBE_DRAIN_BATCH", "50"))
+ALUMNI_CUBE_REFRESH_TIMEOUT_SECONDS = float(os.getenv("ALUMNI_CUBE_REFRESH_TIMEOUT_SECONDS", "300"))
+# First retry delay for a failed employer, doubled per attempt (capped at 64x)
+ALUMNI_CUBE_RETRY_SECONDS = int(os.getenv("ALUMNI_CUBE_RETRY_SECONDS", "60"))
+# Claims outlive the refresh timeout, so a lease never expires under a running refresh
+ALUMNI_CUBE_LEASE_SECONDS = int(ALUMNI_CUBE_REFRESH_TIMEOUT_SECONDS * 2)
+
+# Cube value for a rolled-up dimension
+ALL = "*"
+
+
+def cell_keys(job_function: Optional[str], country: Optional[str]):
+    """(job_function, country) cube coordinates for the endpoint filters."""
+    return (job_function or ALL, country.strip().lower() if country else ALL)
+
+
+async def _ensure_built(conn, company_name: str) -> bool:
+    """Refresh the employer inline if it is queued but has no cube rows yet."""
+    async with conn.transaction():
+        key = await conn.fetchval("""
+            DELETE FROM core.alumni_cube_dirty
+            WHERE employer_key = core.alumni_employer_key($1)
+              AND NOT EXISTS (
+                  SELECT 1 FROM core.alumni_cube
+                  WHERE employer_key = core.alumni_employer_key($1)
+              )
+            RETURNING employer_key
+        """, company_name)
+        if key is None:
+            return False
+        await conn.execute(
+            "SELECT core.refresh_alumni_cube(ARRAY[$1])", key, timeout=ALUMNI_CUBE_REFRESH_TIMEOUT_SECONDS
+        )
+    return True
+
+
+async def fetch_cell(company_name: str, job_function: Optional[str], country: Optional[str]) -> Optional[dict]:
+    """The cube row for one employer / function / country cell, or None when it has no alumni."""
+    fn, ctry = cell_keys(job_function, country)
+    query = """
+        SELECT alumni, alumni_with_function, sample_linkedin_urls, refreshed_at
+        FROM core.alumni_cube
+        WHERE employer_key = core.alumni_employer_key($1) AND job_function = $2 AND country = $3
+    """
+    async with get_pool().acquire() as conn:
+        row = await conn.fetchrow(query, company_name, fn, ctry)
+        if row is None and await _ensure_built(conn, company_name):
+            row = await conn.fetchrow(query, company_name, fn, ctry)
+    return dict(row) if row else None
+
+
+async def fetch_breakdown(company_name: str, country: Optional[str]) -> Dict[str, int]:
+    """Alumni with a matched job function, per Sales Nav function, largest first."""
+    _, ctry = cell_keys(None, country)
+    query = """
+        SELECT job_function, alumni_with_function
+        FROM core.alumni_cube
+        WHERE employer_key = core.alumni_employer_key($1) AND country = $2
+          AND job_function <> '*' AND alumni_with_function > 0
+        ORDER BY alumni_with_function DESC
+    """
+    async with get_pool().acquire() as conn:
+        rows = await conn.fetch(query, company_name, ctry)
+        if not rows and await _ensure_built(conn, company_name):
+            rows = await conn.fetch(query, company_name, ctry)
+    return {row["job_function"]: row["alumni_with_function"] for row in rows}
+
+
+async def fetch_employer_totals(company_names: List[str]) -> Dict[str, dict]:
+    """{company_name: {"total", "engineering", "sales"}} for many employers in one query."""
+    if not company_names:
+        return {}
+    rows = await get_pool().fetch("""
+        SELECT n.company_name,
+               COALESCE(c.alumni, 0) AS total,
+               COALESCE(c.engineering, 0) AS engineering,
+               COALESCE(c.sales, 0) AS sales
+        FROM unnest($1::text[]) AS n(company_name)
+        LEFT JOIN core.alumni_cube c
+               ON c.employer_key = core.alumni_employer_key(n.company_name)
+              AND c.job_function = '*' AND c.country = '*'
+    """, company_names)
+    return {row["company_name"]: dict(row) for row in rows}
+
+
+async def _refresh(keys: List[str], versions: List[int]) -> bool:
+    """Refresh one claimed set of employers and finish it; returns whether the refresh succeeded."""
+    pool = get_bulk_pool()
+    try:
+        await pool.execute(
+            "SELECT core.refresh_alumni_cube($1::text[])", keys, timeout=ALUMNI_CUBE_REFRESH_TIMEOUT_SECONDS
+        )
+        ok = True
+    except Exception as e:
+        if len(keys) == 1:
+            print(f"[ALUMNI_CUBE] refresh failed for {keys[0]}: {e}")
+        ok = False
+    if ok or len(keys) == 1:
+        await pool.execute(
+            "SELECT core.finish_alumni_cube_batch($1::text[], $2::bigint[], $3, $4)",
+            keys, versions, not ok, ALUMNI_CUBE_RETRY_SECONDS,
+        )
+    return ok
+
+
+async def drain(limit: int = ALUMNI_CUBE_DRAIN_BATCH) -> int:
+    """Refresh up to `limit` queued employers; returns how many were claimed."""
+    rows = await get_bulk_pool().fetch(
+        "SELECT employer_key, version FROM core.claim_alumni_cube_batch($1, $2)", limit, ALUMNI_CUBE_LEASE_SECONDS
+    )
+    if not rows:
+        return 0
+    keys = [r["employer_key"] for r in rows]
+    versions = [r["version"] for r in rows]
+    if not await _refresh(keys, versions) and len(keys) > 1:
+        # Isolate the employer(s) that fail so the rest of the batch still lands
+        for key, version in zip(keys, versions):
+            await _refresh([key], [version])
+    return len(rows)
+
+
+_drainer: Optional[asyncio.Task] = None
+
+
+async def _drain_loop():
+    while True:
+        try:
+            # Keep draining while full batches come back (backfill, bulk ingests)
+            while await drain() >= ALUMNI_CUBE_DRAIN_BATCH:
+                pass
+        except Exception as e:
+            print(f"[ALUMNI_CUBE] drain failed: {e}")
+        await asyncio.sleep(ALUMNI_CUBE_DRAIN_SECONDS)
+
+
+async def start_drain():
+    """Start the periodic queue drain task."""
+    global _drainer
+    if _drainer is None and ALUMNI_CUBE_DRAIN_SECONDS > 0:
+        _drainer = asyncio.create_task(_drain_loop())
+
+
+async def stop_drain():
+    global _drainer
+    if _drainer is not None:
+        _drainer.cancel()
+        try:
+            await _drainer
+        except asyncio.CancelledError:
+            pass
+        _drainer = None
@@ -0,0 +1,314 @@
+"""
+Background jobs for long-running batch endpoints.
+
+POST /jobs/{kind} enqueues a row in hq.api_jobs and returns its id. Worker
+tasks started in the app lifespan claim queued jobs (FOR UPDATE SKIP LOCKED,
+so several replicas can share the queue), run the registered handler, and
+store its result.
+
+While a job runs, batch_executor.run_batch() checkpoints every finished
+record to hq.api_job_items and keeps the job's counters current. A job whose
+worker dies stops heartbeating; once its heartbeat is older than
+JOB_STALE_SECONDS any worker reclaims it and the batch skips the records
+already checkpointed. The job's counters and per-outcome counts (outcomes)
+cover every attempt, and the resumed batch's result includes the outcomes
+and errors checkpointed by earlier attempts.
+
+Jobs without per-record checkpoints simply run again, which is safe for the
+registered handlers because they skip records that already have a value.
+Loops other than run_batch report counters through
+batch_executor.track_progress(); jobs that report nothing (single Modal
+calls) get an ETA from the median duration of the kind's recent successes.
+"""
+
+import os
+import json
+import asyncio
+from uuid import UUID
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from db import get_pool
+from batch_executor import batch_checkpoint
+
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+JOB_POLL_INTERVAL_SECONDS = float(os.getenv("JOB_POLL_INTERVAL_SECONDS", "2"))
+JOB_HEARTBEAT_SECONDS = float(os.getenv("JOB_HEARTBEAT_SECONDS", "15"))
+# A running job with no heartbeat for this long is treated as interrupted
+JOB_STALE_SECONDS = float(os.getenv("JOB_STALE_SECONDS", "90"))
+# Checkpointed records buffered before a write to hq.api_job_items
+JOB_CHECKPOINT_EVERY = int(os.getenv("JOB_CHECKPOINT_EVERY", "25"))
+# Recent successful runs of a kind used to estimate ETA for jobs without counters
+JOB_ETA_HISTORY = int(os.getenv("JOB_ETA_HISTORY", "20"))
+
+JOB_COLUMNS = """
+    id, kind, status, payload, total, completed, succeeded, failed, outcomes,
+    result, error, attempts, created_at, started_at, heartbeat_at, finished_at
+"""
+
+# kind -> async handler(payload) returning a dict or pydantic model
+_handlers: Dict[str, Callable[[dict], Awaitable[Any]]] = {}
+_workers: List[asyncio.Task] = []
+
+
+def register_job(kind: str, handler: Callable[[dict], Awaitable[Any]]):
+    _handlers[kind] = handler
+
+
+def job_kinds() -> List[str]:
+    return sorted(_handlers)
+
+
+class JobCheckpoint:
+    """Per-record progress for one job run; installed via batch_checkpoint."""
+
+    def __init__(self, job_id: UUID, items: list, total: Optional[int]):
+        self.job_id = job_id
+        self.done_keys = {r["item_key"] for r in items}
+        self.outcomes: Dict[str, int] = {}
+        self._resumed_errors: List[dict] = []
+        for r in items:
+            if r["error"] is None:
+                self.outcomes[r["outcome"]] = self.outcomes.get(r["outcome"], 0) + 1
+            else:
+                self._resumed_errors.append({"domain": r["item_key"], "error": r["error"]})
+        self._resumed_outcomes = dict(self.outcomes)
+        self.failed = len(self._resumed_errors)
+        self.succeeded = len(items) - self.failed
+        self.completed = len(items)
+        self.total = total
+        self._pending: list = []
+        self._unflushed = 0
+
+    def begin_batch(self, remaining: int):
+        self.total = self.completed + remaining
+
+    def resumed_results(self):
+        """Outcome counts and errors checkpointed by earlier attempts (handed out once)."""
+        outcomes, errors = self._resumed_outcomes, self._resumed_errors
+        self._resumed_outcomes, self._resumed_errors = {}, []
+        return outcomes, errors
+
+    async def record(self, key: str, outcome: Optional[str], error: Optional[str]):
+        self._pending.append((self.job_id, key, outcome, error))
+        if error is None:
+            self.outcomes[outcome] = self.outcomes.get(outcome, 0) + 1
+        await self.advance(failed=error is not None)
+
+    async def advance(self, failed: bool = False):
+        """Count one finished record without checkpointing it (see track_progress)."""
+        self.completed += 1
+        if failed:
+            self.failed += 1
+        else:
+            self.succeeded += 1
+        self._unflushed += 1
+        if self._unflushed >= JOB_CHECKPOINT_EVERY:
+            await self.flush()
+
+    async def flush(self):
+        pending, self._pending = self._pending, []
+        self._unflushed = 0
+        pool = get_pool()
+        if pending:
+            await pool.executemany("""
+                INSERT INTO hq.api_job_items (job_id, item_key, outcome, error)
+                VALUES ($1, $2, $3, $4)
+                ON CONFLICT (job_id, item_key) DO NOTHING
+            """, pending)
+        await pool.execute("""
+            UPDATE hq.api_jobs
+            SET total = $2, completed = $3, succeeded = $4, failed = $5, outcomes = $6::jsonb,
+                heartbeat_at = NOW()
+            WHERE id = $1
+        """, self.job_id, self.total, self.completed, self.succeeded, self.failed, json.dumps(self.outcomes))
+
+
+def _json_dumps(value) -> str:
+    if hasattr(value, "model_dump"):
+        value = value.model_dump(mode="json")
+    return json.dumps(value, default=str)
+
+
+def job_to_dict(row, typical_seconds: Optional[float] = None) -> dict:
+    """
+    Serialize a job row, adding elapsed time and an ETA while it runs.
+
+    The ETA comes from the job's counters, or from typical_seconds (the
+    kind's usual duration) for jobs that report no counters.
+    """
+    job = dict(row)
+    job["id"] = str(job["id"])
+    for field in ("payload", "result", "outcomes"):
+        if isinstance(job[field], str):
+            job[field] = json.loads(job[field])
+
+    eta_seconds = None
+    elapsed_seconds = None
+    if job["started_at"]:
+        end = job["finished_at"] or datetime.now(timezone.utc)
+        elapsed_seconds = round((end - job["started_at"]).total_seconds(), 1)
+        if job["status"] == "running" and job["total"] and job["completed"]:
+            rate = job["completed"] / max(elapsed_seconds, 0.001)
+            eta_seconds = round((job["total"] - job["completed"]) / rate, 1)
+        elif job["status"] == "running" and job["total"] is None and typical_seconds:
+            eta_seconds = round(max(0.0, typical_seconds - elapsed_seconds), 1)
+    job["elapsed_seconds"] = elapsed_seconds
+    job["eta_seconds"] = eta_seconds
+    return job
+
+
+async def enqueue(kind: str, payload: dict) -> str:
+    row = await get_pool().fetchrow("""
+        INSERT INTO hq.api_jobs (kind, payload)
+        VALUES ($1, $2::jsonb)
+        RETURNING id
+    """, kind, _json_dumps(payload))
+    return str(row["id"])
+
+
+async def _typical_seconds(kind: str) -> Optional[float]:
+    """Median duration of the kind's recent successful jobs."""
+    return await get_pool().fetchval("""
+        SELECT percentile_cont(0.5) WITHIN GROUP (ORDER BY seconds)
+        FROM (
+            SELECT EXTRACT(EPOCH FROM finished_at - started_at)::float8 AS seconds
+            FROM hq.api_jobs
+            WHERE kind = $1 AND status = 'succeeded' AND started_at IS NOT NULL
+            ORDER BY finished_at DESC
+            LIMIT $2
+        ) recent
+    """, kind, JOB_ETA_HISTORY)
+
+
+async def get_job(job_id: UUID) -> Optional[dict]:
+    row = await get_pool().fetchrow(f"SELECT {JOB_COLUMNS} FROM hq.api_jobs WHERE id = $1", job_id)
+    if not row:
+        return None
+    typical_seconds = None
+    if row["status"] == "running" and row["total"] is None:
+        typical_seconds = await _typical_seconds(row["kind"])
+    return job_to_dict(row, typical_seconds)
+
+
+async def list_jobs(status: Optional[str] = None, kind: Optional[str] = None, limit: int = 50) -> List[dict]:
+    rows = await get_pool().fetch(f"""
+        SELECT {JOB_COLUMNS}
+        FROM hq.api_jobs
+        WHERE ($1::text IS NULL OR status = $1)
+          AND ($2::text IS NULL OR kind = $2)
+        ORDER BY created_at DESC
+        LIMIT $3
+    """, status, kind, limit)
+    return [job_to_dict(r) for r in rows]
+
+
+async def _claim_next():
+    """Claim the oldest queued job, or a running one whose worker stopped heartbeating."""
+    return await get_pool().fetchrow("""
+        UPDATE hq.api_jobs
+        SET status = 'running',
+            started_at = COALESCE(started_at, NOW()),
+            heartbeat_at = NOW(),
+            attempts = attempts + 1
+        WHERE id = (
+            SELECT id FROM hq.api_jobs
+            WHERE status = 'queued'
+               OR (status = 'running' AND heartbeat_at < NOW() - make_interval(secs => $1))
+            ORDER BY created_at
+            FOR UPDATE SKIP LOCKED
+            LIMIT 1
+        )
+        RETURNING id, kind, payload, total, attempts
+    """, JOB_STALE_SECONDS)
+
+
+async def _heartbeat(job_id: UUID):
+    while True:
+        await asyncio.sleep(JOB_HEARTBEAT_SECONDS)
+        await get_pool().execute("UPDATE hq.api_jobs SET heartbeat_at = NOW() WHERE id = $1", job_id)
+
+
+async def _finish(job_id: UUID, status: str, result: Any = None, error: Optional[str] = None):
+    await get_pool().execute("""
+        UPDATE hq.api_jobs
+        SET status = $2, result = $3::jsonb, error = $4, finished_at = NOW(), heartbeat_at = NOW()
+        WHERE id = $1
+    """, job_id, status, _json_dumps(result) if result is not None else None, error)
+
+
+async def _run_job(row):
+    job_id = row["id"]
+    handler = _handlers.get(row["kind"])
+    if handler is None:
+        await _finish(job_id, "failed", error=f"Unknown job kind '{row['kind']}'")
+        return
+
+    # Resume from whatever earlier attempts checkpointed
+    items = await get_pool().fetch("""
+        SELECT item_key, outcome, error
+        FROM hq.api_job_items
+        WHERE job_id = $1
+    """, job_id)
+    checkpoint = JobCheckpoint(job_id, items, total=row["total"])
+
+    payload = row["payload"]
+    if isinstance(payload, str):
+        payload = json.loads(payload)
+
+    token = batch_checkpoint.set(checkpoint)
+    heartbeat = asyncio.create_task(_heartbeat(job_id))
+    try:
+        result = await handler(payload)
+        await checkpoint.flush()
+        await _finish(job_id, "succeeded", result=result)
+    except asyncio.CancelledError:
+        # Shutting down: save progress and requeue so the next worker resumes it
+        try:
+            await checkpoint.flush()
+            await get_pool().execute("UPDATE hq.api_jobs SET status = 'queued' WHERE id = $1", job_id)
+        except Exception:
+            pass
+        raise
+    except Exception as e:
+        try:
+            await checkpoint.flush()
+        except Exception:
+            pass
+        await _finish(job_id, "failed", error=str(e))
+    finally:
+        heartbeat.cancel()
+        batch_checkpoint.reset(token)
+
+
+async def _worker(n: int):
+    while True:
+        try:
+            row = await _claim_next()
+        except Exception as e:
+            print(f"[JOBS] Worker {n} failed to claim a job: {e}")
+            row = None
+
+        if row is None:
+            await asyncio.sleep(JOB_POLL_INTERVAL_SECONDS)
+            continue
+
+        print(f"[JOBS] Worker {n} running {row['kind']} job {row['id']} (attempt {row['attempts']})")
+        try:
+            await _run_job(row)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"[JOBS] Job {row['id']} crashed: {e}")
+
+
+async def start_workers():
+    """Start background job workers (JOB_WORKERS=0 disables them on this instance)."""
+    for n in range(JOB_WORKERS):
+        _workers.append(asyncio.create_task(_worker(n)))
+
+
+async def stop_workers():
+    for task in _workers:
+        task.cancel()
+    await asyncio.gather(*_workers, return_exceptions=True)
+    _workers.clear()
@@ -0,0 +1,253 @@
+"""
+Bounded-concurrency executor for per-domain batch endpoints.
+
+run_batch() fans a list of records out to an async worker with:
+    - a concurrency cap (asyncio.Semaphore) per batch
+    - a requests/second limit per upstream provider, shared by all batches
+    - retries with full-jitter exponential backoff for transient failures
+    - per-key error aggregation and live progress counters
+
+Workers return an outcome label (counted in BatchResult.outcomes) or raise.
+Only failures the upstream can't have acted on are retried by default:
+RetryableError (429/503 from raise_for_upstream_status) and httpx
+ConnectError/ConnectTimeout/PoolTimeout. TransientError (408/425/500/502/504)
+and other httpx transport errors may come after the upstream did the work,
+so a retry could duplicate a POST; they are retried only for idempotent
+batches (run_batch(idempotent=True), or a provider listed in
+BATCH_IDEMPOTENT_PROVIDERS). Any other exception is recorded for that key
+without retrying.
+"""
+
+import os
+import time
+import uuid
+import random
+import asyncio
+import httpx
+from contextvars import ContextVar
+from dataclasses import dataclass, field, asdict
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", "10"))
+BATCH_MAX_RETRIES = int(os.getenv("BATCH_MAX_RETRIES", "3"))
+BATCH_RETRY_BASE_DELAY = float(os.getenv("BATCH_RETRY_BASE_DELAY", "1.0"))
+BATCH_RETRY_MAX_DELAY = float(os.getenv("BATCH_RETRY_MAX_DELAY", "30.0"))
+
+# Upstream requests/second per provider (0 = unlimited)
+PROVIDER_RATE_LIMITS = {
+    "openai": float(os.getenv("BATCH_RATE_LIMIT_OPENAI", "8")),
+    "parallel": float(os.getenv("BATCH_RATE_LIMIT_PARALLEL", "4")),
+    "gemini": float(os.getenv("BATCH_RATE_LIMIT_GEMINI", "8")),
+}
+
+# Providers whose batch workers are safe to repeat (opt-in, comma-separated)
+IDEMPOTENT_PROVIDERS = {
+    p.strip() for p in os.getenv("BATCH_IDEMPOTENT_PROVIDERS", "").split(",") if p.strip()
+}
+
+# Upstream statuses that mean the request was not processed - always retried
+RETRYABLE_STATUS_CODES = {429, 503}
+# Transient statuses the upstream may have acted on - retried only when idempotent
+TRANSIENT_STATUS_CODES = {408, 425, 500, 502, 504}
+
+# Transport errors raised before the request reached the upstream
+SAFE_TRANSPORT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class RetryableError(Exception):
+    """Transient failure the upstream didn't act on - the executor retries the record with backoff."""
+
+
+class TransientError(Exception):
+    """Transient failure after the upstream may have acted - retried only for idempotent batches."""
+
+
+def raise_for_upstream_status(response: httpx.Response):
+    """Raise RetryableError/TransientError for transient statuses, a plain error for other non-200s."""
+    if response.status_code == 200:
+        return
+    if response.status_code in RETRYABLE_STATUS_CODES:
+        raise RetryableError(f"Modal returned {response.status_code}")
+    if response.status_code in TRANSIENT_STATUS_CODES:
+        raise TransientError(f"Modal returned {response.status_code}")
+    raise Exception(f"Modal returned {response.status_code}")
+
+
+class RateLimiter:
+    """Spaces call starts at least 1/rate seconds apart."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        if not self.interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_at)
+            self._next_at = start_at + self.interval
+        if start_at > now:
+            await asyncio.sleep(start_at - now)
+
+
+_rate_limiters: Dict[str, RateLimiter] = {}
+
+
+def _rate_limiter(provider: Optional[str]) -> Optional[RateLimiter]:
+    if not provider:
+        return None
+    limiter = _rate_limiters.get(provider)
+    if limiter is None:
+        limiter = RateLimiter(PROVIDER_RATE_LIMITS.get(provider, 0))
+        _rate_limiters[provider] = limiter
+    return limiter
+
+
+@dataclass
+class BatchProgress:
+    batch_id: str
+    name: str
+    total: int
+    provider: Optional[str] = None
+    completed: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    retries: int = 0
+    in_flight: int = 0
+    started_at: float = field(default_factory=time.time)
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        elapsed = time.time() - self.started_at
+        data["elapsed_seconds"] = round(elapsed, 1)
+        data["rate_per_second"] = round(self.completed / elapsed, 2) if elapsed > 0 else 0.0
+        return data
+
+
+@dataclass
+class BatchResult:
+    outcomes: Dict[str, int]
+    errors: List[dict]
+    progress: BatchProgress
+
+    def count(self, outcome: str) -> int:
+        return self.outcomes.get(outcome, 0)
+
+
+# batch_id -> progress, for batches currently running in this process
+_active: Dict[str, BatchProgress] = {}
+
+# Set by background_jobs.py while a background job runs: records already in
+# checkpoint.done_keys are skipped and each finished record is reported to it
+batch_checkpoint: ContextVar = ContextVar("batch_checkpoint", default=None)
+
+
+def active_batches() -> List[dict]:
+    """Progress snapshots for every batch still running."""
+    return [p.to_dict() for p in _active.values()]
+
+
+async def run_batch(
+    name: str,
+    records: List[Any],
+    worker: Callable[[Any], Awaitable[str]],
+    *,
+    key: Callable[[Any], str] = lambda record: record["domain"],
+    provider: Optional[str] = None,
+    concurrency: Optional[int] = None,
+    max_retries: int = BATCH_MAX_RETRIES,
+    idempotent: Optional[bool] = None,
+    on_progress: Optional[Callable[[BatchProgress], Awaitable[None]]] = None,
+) -> BatchResult:
+    """
+    Run worker(record) for every record with bounded concurrency.
+
+    Errors are collected as {"domain": key(record), "error": "..."} to match
+    the existing batch responses, and include those checkpointed by earlier
+    attempts when a background job resumes. on_progress, if given, is
+    awaited after each record finishes. idempotent (default: provider in
+    BATCH_IDEMPOTENT_PROVIDERS) also retries TransientError and every httpx
+    transport error; leave it off for workers whose POST isn't safe to repeat.
+    """
+    outcomes: Dict[str, int] = {}
+    errors: List[dict] = []
+    checkpoint = batch_checkpoint.get()
+    if checkpoint is not None:
+        records = [r for r in records if key(r) not in checkpoint.done_keys]
+        checkpoint.begin_batch(len(records))
+        # A resumed job's result covers the records earlier attempts finished
+        outcomes, errors = checkpoint.resumed_results()
+
+    progress = BatchProgress(
+        batch_id=uuid.uuid4().hex[:12], name=name, total=len(records), provider=provider
+    )
+    sem = asyncio.Semaphore(concurrency or BATCH_CONCURRENCY)
+    limiter = _rate_limiter(provider)
+    if idempotent is None:
+        idempotent = provider in IDEMPOTENT_PROVIDERS
+    retry_on = (RetryableError, *SAFE_TRANSPORT_ERRORS)
+    if idempotent:
+        retry_on += (TransientError, httpx.TransportError)
+
+    async def run_one(record):
+        outcome = None
+        error = None
+        async with sem:
+            progress.in_flight += 1
+            try:
+                attempt = 0
+                while True:
+                    if limiter:
+                        await limiter.acquire()
+                    try:
+                        outcome = await worker(record)
+                        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+                        progress.succeeded += 1
+                        break
+                    except retry_on:
+                        if attempt >= max_retries:
+                            raise
+                        progress.retries += 1
+                        delay = min(BATCH_RETRY_MAX_DELAY, BATCH_RETRY_BASE_DELAY * 2 ** attempt)
+                        attempt += 1
+                        await asyncio.sleep(random.uniform(0, delay))
+            except Exception as e:
+                error = str(e) or type(e).__name__
+                errors.append({"domain": key(record), "error": error})
+                progress.failed += 1
+            finally:
+                progress.in_flight -= 1
+                progress.completed += 1
+        if checkpoint is not None:
+            await checkpoint.record(key(record), outcome, error)
+        if on_progress:
+            await on_progress(progress)
+
+    _active[progress.batch_id] = progress
+    try:
+        await asyncio.gather(*(run_one(record) for record in records))
+    finally:
+        _active.pop(progress.batch_id, None)
+
+    return BatchResult(outcomes=outcomes, errors=errors, progress=progress)
+
+
+async def track_progress(records: List[Any], errors: Optional[list] = None) -> AsyncIterator[Any]:
+    """
+    Iterate records in a loop that doesn't use run_batch, reporting each
+    finished record to the running background job's counters (no-op outside
+    a job). A record counts as failed if it grew `errors` while it ran.
+    Nothing is checkpointed per record, so a resumed job walks every record.
+    """
+    checkpoint = batch_checkpoint.get()
+    if checkpoint is not None:
+        checkpoint.begin_batch(len(records))
+    seen_errors = len(errors) if errors is not None else 0
+    for record in records:
+        yield record
+        if checkpoint is not None:
+            failed = errors is not None and len(errors) > seen_errors
+            seen_errors = len(errors) if errors is not None else 0
+            await checkpoint.advance(failed=failed)
@@ -0,0 +1,97 @@
+"""
+Drain task that keeps core.company_card current.
+
+core.company_card (supabase/migrations/20261018_company_card.sql) is the
+one-row-per-domain projection of the enrichment tables that job-board
+listings join. Writes to those tables only queue the touched domains in
+core.company_card_dirty (20261020_company_card_queue.sql); a lifespan task
+drains the queue every COMPANY_CARD_DRAIN_SECONDS, so cards lag their
+sources by about that much.
+
+Each batch of COMPANY_CARD_DRAIN_BATCH domains is claimed with a lease,
+recomputed and finished as separate statements on the bulk pool, so no
+queue row stays locked and no connection is held between batches. A batch
+that fails is retried one domain at a time; a domain that still fails goes
+back in the queue behind an exponential backoff.
+"""
+
+import os
+import asyncio
+from typing import List, Optional
+from db import get_bulk_pool
+
+COMPANY_CARD_DRAIN_SECONDS = int(os.getenv("COMPANY_CARD_DRAIN_SECONDS", "5"))
+COMPANY_CARD_DRAIN_BATCH = int(os.getenv("COMPANY_CARD_DRAIN_BATCH", "200"))
+COMPANY_CARD_REFRESH_TIMEOUT_SECONDS = float(os.getenv("COMPANY_CARD_REFRESH_TIMEOUT_SECONDS", "60"))
+# First retry delay for a failed domain, doubled per attempt (capped at 64x)
+COMPANY_CARD_RETRY_SECONDS = int(os.getenv("COMPANY_CARD_RETRY_SECONDS", "30"))
+# Claims outlive the refresh timeout, so a lease never expires under a running refresh
+COMPANY_CARD_LEASE_SECONDS = int(COMPANY_CARD_REFRESH_TIMEOUT_SECONDS * 2)
+
+
+async def _refresh(domains: List[str], versions: List[int]) -> bool:
+    """Refresh one claimed set of domains and finish it; returns whether the refresh succeeded."""
+    pool = get_bulk_pool()
+    try:
+        await pool.execute(
+            "SELECT core.refresh_company_cards($1::text[])", domains, timeout=COMPANY_CARD_REFRESH_TIMEOUT_SECONDS
+        )
+        ok = True
+    except Exception as e:
+        if len(domains) == 1:
+            print(f"[COMPANY_CARD] refresh failed for {domains[0]}: {e}")
+        ok = False
+    if ok or len(domains) == 1:
+        await pool.execute(
+            "SELECT core.finish_company_card_batch($1::text[], $2::bigint[], $3, $4)",
+            domains, versions, not ok, COMPANY_CARD_RETRY_SECONDS,
+        )
+    return ok
+
+
+async def drain(limit: int = COMPANY_CARD_DRAIN_BATCH) -> int:
+    """Refresh up to `limit` queued domains; returns how many were claimed."""
+    rows = await get_bulk_pool().fetch(
+        "SELECT domain, version FROM core.claim_company_card_batch($1, $2)", limit, COMPANY_CARD_LEASE_SECONDS
+    )
+    if not rows:
+        return 0
+    domains = [r["domain"] for r in rows]
+    versions = [r["version"] for r in rows]
+    if not await _refresh(domains, versions) and len(domains) > 1:
+        # Isolate the domain(s) that fail so the rest of the batch still lands
+        for domain, version in zip(domains, versions):
+            await _refresh([domain], [version])
+    return len(rows)
+
+
+_drainer: Optional[asyncio.Task] = None
+
+
+async def _drain_loop():
+    while True:
+        try:
+            # Keep draining while full batches come back (bulk ingests)
+            while await drain() >= COMPANY_CARD_DRAIN_BATCH:
+                pass
+        except Exception as e:
+            print(f"[COMPANY_CARD] drain failed: {e}")
+        await asyncio.sleep(COMPANY_CARD_DRAIN_SECONDS)
+
+
+async def start_drain():
+    """Start the periodic queue drain task."""
+    global _drainer
+    if _drainer is None and COMPANY_CARD_DRAIN_SECONDS > 0:
+        _drainer = asyncio.create_task(_drain_loop())
+
+
+async def stop_drain():
+    global _drainer
+    if _drainer is not None:
+        _drainer.cancel()
+        try:
+            await _drainer
+        except asyncio.CancelledError:
+            pass
+        _drainer = None
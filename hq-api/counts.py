@@ -0,0 +1,237 @@
+"""
+Row counts for paginated endpoints and admin table counts.
+
+Three modes:
+    exact      - SELECT COUNT(*) every time
+    estimated  - planner row estimate from EXPLAIN (no scan); for whole
+                 tables, the catalog statistics (see table_count)
+    cached     - exact count memoized per normalized filter set; served
+                 stale while a background refresh runs once the TTL passes
+"""
+
+import os
+import json
+import time
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Iterable, Optional, Set
+from db import get_pool
+
+COUNT_MODES = ("exact", "estimated", "cached")
+
+COUNT_CACHE_TTL_SECONDS = int(os.getenv("COUNT_CACHE_TTL_SECONDS", "300"))
+# Past this age a cached count is recomputed inline instead of served stale
+COUNT_CACHE_MAX_STALE_SECONDS = int(os.getenv("COUNT_CACHE_MAX_STALE_SECONDS", "3600"))
+COUNT_CACHE_MAX_ENTRIES = int(os.getenv("COUNT_CACHE_MAX_ENTRIES", "2048"))
+
+
+@dataclass
+class CountResult:
+    total: Optional[int]
+    mode: str
+    stale: bool = False
+    counted_at: Optional[datetime] = None
+    # Set (with total None) when table_counts couldn't count this table
+    error: Optional[str] = None
+
+
+# key -> (total, monotonic time counted, wall clock time counted)
+_cache: dict = {}
+# key -> task, so concurrent misses share one COUNT(*)
+_inflight: dict = {}
+# Strong references to background refreshes until they finish
+_refreshes: Set[asyncio.Task] = set()
+
+
+def cache_key(namespace: str, params: dict, list_params: Iterable[str] = ()) -> str:
+    """
+    Normalize a filter set so equivalent requests share a cache entry.
+    `list_params` are comma-separated IN-lists, whose order doesn't matter;
+    every other string is only trimmed.
+    """
+    list_params = set(list_params)
+    normalized = {}
+    for k, v in params.items():
+        if v is None or v == "":
+            continue
+        if k in list_params and isinstance(v, str):
+            v = ",".join(sorted(set(v.split(","))))
+        elif isinstance(v, str):
+            v = v.strip()
+        normalized[k] = str(v)
+    return f"{namespace}:{json.dumps(normalized, sort_keys=True)}"
+
+
+async def exact_count(query: str, *args) -> int:
+    """Run a COUNT(*) query and return the scalar."""
+    return await get_pool().fetchval(query, *args) or 0
+
+
+async def estimated_count(query: str, *args) -> int:
+    """Planner row estimate for a SELECT, without executing it."""
+    plan = await get_pool().fetchval(f"EXPLAIN (FORMAT JSON) {query}", *args)
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def _store(key: str, total: int):
+    if len(_cache) >= COUNT_CACHE_MAX_ENTRIES and key not in _cache:
+        # Drop the oldest entry
+        oldest = min(_cache, key=lambda k: _cache[k][1])
+        _cache.pop(oldest, None)
+    _cache[key] = (total, time.monotonic(), datetime.now(timezone.utc))
+
+
+def _refresh(key: str, compute: Callable[[], Awaitable[int]]) -> asyncio.Task:
+    task = _inflight.get(key)
+    if task is None:
+        async def run():
+            try:
+                total = await compute()
+                _store(key, total)
+                return total
+            finally:
+                _inflight.pop(key, None)
+
+        task = asyncio.create_task(run())
+        _inflight[key] = task
+        _refreshes.add(task)
+        task.add_done_callback(_refresh_done(key))
+    return task
+
+
+def _refresh_done(key: str):
+    def done(task: asyncio.Task):
+        _refreshes.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            print(f"[COUNT_CACHE] refresh failed for {key}: {task.exception()}")
+    return done
+
+
+async def cached_count(key: str, compute: Callable[[], Awaitable[int]]) -> CountResult:
+    """
+    Serve an exact count from cache.
+
+    Fresh (< TTL): returned as-is. Stale (< max stale): returned with
+    stale=True and refreshed in the background. Older or missing: counted
+    inline, with concurrent callers for the same key sharing one query.
+    """
+    entry = _cache.get(key)
+    if entry:
+        total, counted, counted_at = entry
+        age = time.monotonic() - counted
+        if age < COUNT_CACHE_TTL_SECONDS:
+            return CountResult(total=total, mode="cached", counted_at=counted_at)
+        if age < COUNT_CACHE_MAX_STALE_SECONDS:
+            _refresh(key, compute)
+            return CountResult(total=total, mode="cached", stale=True, counted_at=counted_at)
+
+    total = await asyncio.shield(_refresh(key, compute))
+    entry = _cache.get(key)
+    return CountResult(total=total, mode="cached", counted_at=entry[2] if entry else None)
+
+
+def invalidate(namespace: Optional[str] = None):
+    """Drop cached counts, optionally only for one namespace."""
+    if namespace is None:
+        _cache.clear()
+        return
+    prefix = f"{namespace}:"
+    for key in [k for k in _cache if k.startswith(prefix)]:
+        _cache.pop(key, None)
+
+
+# Whole-table counts (admin dashboards). Estimates come from the statistics
+# autovacuum/ANALYZE keep: pg_stat_user_tables.n_live_tup where the table has
+# stats, else pg_class.reltuples; views have neither and fall back to the
+# planner estimate of a scan over them.
+
+TABLE_STATS_SQL = """
+    SELECT
+        n.nspname || '.' || c.relname AS table_name,
+        c.relkind,
+        c.reltuples,
+        s.n_live_tup
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    LEFT JOIN pg_stat_user_tables s ON s.relid = c.oid
+    WHERE n.nspname || '.' || c.relname = ANY($1::text[])
+"""
+
+
+def _stats_estimate(row) -> Optional[int]:
+    if row["relkind"] == "v":
+        return None
+    if row["n_live_tup"] is not None and (row["n_live_tup"] > 0 or row["reltuples"] <= 0):
+        return int(row["n_live_tup"])
+    if row["reltuples"] >= 0:
+        return int(row["reltuples"])
+    # Never vacuumed or analyzed
+    return None
+
+
+async def estimated_table_counts(tables: list) -> dict:
+    """
+    Catalog-statistics row estimate per table ("schema.table" -> count), one
+    round trip; None for views and tables never vacuumed or analyzed.
+    """
+    rows = await get_pool().fetch(TABLE_STATS_SQL, list(tables))
+    return {row["table_name"]: _stats_estimate(row) for row in rows}
+
+
+async def _estimated_table_count(table: str, estimates: dict) -> CountResult:
+    total = estimates.get(table)
+    if total is None:
+        total = await estimated_count(f"SELECT 1 FROM {table}")
+    return CountResult(total=total, mode="estimated")
+
+
+def _failed(table: str, mode: str, error: Exception) -> CountResult:
+    print(f"[COUNTS] {mode} count failed for {table}: {error}")
+    return CountResult(total=None, mode=mode, error=str(error) or type(error).__name__)
+
+
+async def table_count(table: str, mode: str = "estimated") -> CountResult:
+    """Row count for a whole table ("schema.table"); exact counts are cached unless mode is exact."""
+    if mode == "estimated":
+        return await _estimated_table_count(table, await estimated_table_counts([table]))
+
+    query = f"SELECT COUNT(*) FROM {table}"
+    if mode == "cached":
+        return await cached_count(f"table:{table}", lambda: exact_count(query))
+
+    total = await exact_count(query)
+    return CountResult(total=total, mode="exact", counted_at=datetime.now(timezone.utc))
+
+
+async def table_counts(tables: list, mode: str = "estimated", concurrency: int = 4) -> dict:
+    """
+    Counts for many tables ("schema.table" -> CountResult), `concurrency`
+    queries at a time. A table that fails to count comes back with total None
+    and the error instead of failing the others.
+    """
+    if mode == "estimated":
+        try:
+            estimates = await estimated_table_counts(tables)
+        except Exception as e:
+            return {t: _failed(t, mode, e) for t in tables}
+
+        def count(table: str):
+            return _estimated_table_count(table, estimates)
+    else:
+        def count(table: str):
+            return table_count(table, mode)
+
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one(table: str) -> CountResult:
+        async with sem:
+            try:
+                return await count(table)
+            except Exception as e:
+                return _failed(table, mode, e)
+
+    results = await asyncio.gather(*(one(t) for t in tables))
+    return dict(zip(tables, results))
@@ -0,0 +1,130 @@
+"""
+Company data coverage: which core tables hold rows for which domains.
+
+The domain x table matrix is computed in a single round trip: one EXISTS
+semi-join per table, combined with UNION ALL, and grouped back to one row
+per domain holding the positions of the tables that matched. Adding a table
+adds a branch to the same statement, not another query.
+
+Each domain's coverage is a bitset over COVERAGE_TABLE_KEYS - bit i is set
+when COVERAGE_TABLE_KEYS[i] has a row for the domain - sent to clients as a
+hex string (the set can outgrow a JSON-safe integer).
+"""
+
+from typing import Dict, List
+from db import get_pool
+
+# Largest domain list accepted per request
+MAX_COVERAGE_DOMAINS = 10000
+
+# All core company tables and the column used for domain lookup
+COVERAGE_TABLES = {
+    # core.companies base record
+    "core.companies": "domain",
+    # Dimension tables using "domain"
+    "core.company_add_ons_offered": "domain",
+    "core.company_annual_commitment_required": "domain",
+    "core.company_billing_default": "domain",
+    "core.company_business_model": "domain",
+    "core.company_categories": "domain",
+    "core.company_comparison_pages": "domain",
+    "core.company_custom_pricing_mentioned": "domain",
+    "core.company_descriptions": "domain",
+    "core.company_employee_range": "domain",
+    "core.company_employee_ranges": "domain",
+    "core.company_enterprise_tier_exists": "domain",
+    "core.company_free_trial": "domain",
+    "core.company_funding": "domain",
+    "core.company_funding_rounds": "domain",
+    "core.company_google_ads": "domain",
+    "core.company_industries": "domain",
+    "core.company_job_postings": "domain",
+    "core.company_keywords": "domain",
+    "core.company_linkedin_ads": "domain",
+    "core.company_locations": "domain",
+    "core.company_meta_ads": "domain",
+    "core.company_minimum_seats": "domain",
+    "core.company_money_back_guarantee": "domain",
+    "core.company_naics_codes": "domain",
+    "core.company_names": "domain",
+    "core.company_number_of_tiers": "domain",
+    "core.company_plan_naming_style": "domain",
+    "core.company_predictleads_technologies": "domain",
+    "core.company_pricing_model": "domain",
+    "core.company_pricing_visibility": "domain",
+    "core.company_revenue": "domain",
+    "core.company_sales_motion": "domain",
+    "core.company_security_compliance_gating": "domain",
+    "core.company_social_urls": "domain",
+    "core.company_tech_on_site": "domain",
+    "core.company_types": "domain",
+    "core.company_vc_backed": "domain",
+    "core.company_webinars": "domain",
+    # Tables using "origin_company_domain"
+    "core.company_customers": "origin_company_domain",
+    # Tables using "company_domain"
+    "core.company_people_snapshot_history": "company_domain",
+    "core.company_similar_companies_preview": "company_domain",
+    "core.company_vc_investments": "company_domain",
+    "core.company_vc_investors": "company_domain",
+}
+
+# Bit positions: bit i is COVERAGE_TABLE_KEYS[i]
+COVERAGE_TABLE_KEYS: List[str] = list(COVERAGE_TABLES)
+
+
+def build_coverage_query(tables: Dict[str, str]) -> str:
+    """One statement returning (domain, present int[]) for the domains bound to $1."""
+    branches = [
+        f"SELECT d.domain, {pos} AS pos FROM d "
+        f"WHERE EXISTS (SELECT 1 FROM {table_key} t WHERE t.{domain_col} = d.domain)"
+        for pos, (table_key, domain_col) in enumerate(tables.items())
+    ]
+    union = "\n        UNION ALL ".join(branches)
+    return f"""
+        WITH d AS (SELECT DISTINCT unnest($1::text[]) AS domain)
+        SELECT domain, array_agg(pos) AS present
+        FROM (
+        {union}
+        ) hits
+        GROUP BY domain
+    """
+
+
+COVERAGE_QUERY = build_coverage_query(COVERAGE_TABLES)
+
+
+def encode_bitset(bits: int) -> str:
+    return format(bits, "x")
+
+
+def decode_bitset(value: str) -> int:
+    return int(value, 16)
+
+
+def bitset_flags(bits: int) -> Dict[str, bool]:
+    """Expand a coverage bitset into {table_key: bool} in COVERAGE_TABLE_KEYS order."""
+    return {key: bool(bits >> i & 1) for i, key in enumerate(COVERAGE_TABLE_KEYS)}
+
+
+async def coverage_bitsets(domains: List[str]) -> Dict[str, int]:
+    """Coverage bitset for each domain (0 when no table has it)."""
+    if not domains:
+        return {}
+    pool = get_pool()
+    rows = await pool.fetch(COVERAGE_QUERY, list(domains))
+    bitsets = dict.fromkeys(domains, 0)
+    for row in rows:
+        bits = 0
+        for bit in row["present"]:
+            bits |= 1 << bit
+        bitsets[row["domain"]] = bits
+    return bitsets
+
+
+async def fetch_focus_companies() -> List[dict]:
+    pool = get_pool()
+    rows = await pool.fetch(
+        "SELECT domain, company_name FROM public.focus_companies ORDER BY company_name"
+    )
+    return [dict(r) for r in rows]
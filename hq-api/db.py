@@ -1,8 +1,13 @@
 import os
+import time
+import asyncio
 import asyncpg
+from concurrent.futures import ThreadPoolExecutor
 from supabase import create_client, Client
 from dotenv import load_dotenv
 from urllib.parse import urlparse
+from metrics import InstrumentedConnection, InstrumentedPool, instrument_connection, record_supabase
+import querylog
 
 load_dotenv()
 
@@ -11,11 +16,14 @@ SUPABASE_KEY = os.getenv("SUPABASE_SERVICE_KEY")
 DATABASE_URL = (os.getenv("DATABASE_URL") or "").strip() or None
 AUTH_DATABASE_URL = (os.getenv("AUTH_DATABASE_URL") or "").strip() or None
 PIPELINE_DATABASE_URL = (os.getenv("PIPELINE_DATABASE_URL") or "").strip() or None
+SUPABASE_MAX_WORKERS = int(os.getenv("SUPABASE_MAX_WORKERS", "16"))
+BULK_POOL_MAX_SIZE = int(os.getenv("BULK_POOL_MAX_SIZE", "4"))
 
-# Connection pools for direct PostgreSQL access
-_pool: asyncpg.Pool = None
-_auth_pool: asyncpg.Pool = None
-_pipeline_pool: asyncpg.Pool = None
+# Connection pools for direct PostgreSQL access (InstrumentedPool proxies, see metrics.py)
+_pool: InstrumentedPool = None
+_auth_pool: InstrumentedPool = None
+_pipeline_pool: InstrumentedPool = None
+_bulk_pool: InstrumentedPool = None
 
 def get_supabase() -> Client:
     if not SUPABASE_URL or not SUPABASE_KEY:
@@ -24,38 +32,77 @@ def get_supabase() -> Client:
 
 supabase = get_supabase()
 
+# Bounded thread pool for the synchronous supabase client, so PostgREST
+# round trips never run on the event loop
+_supabase_executor = ThreadPoolExecutor(max_workers=SUPABASE_MAX_WORKERS, thread_name_prefix="supabase")
+
+async def execute_async(query):
+    """Run a supabase query builder's .execute() on the bounded thread pool."""
+    loop = asyncio.get_running_loop()
+    started = time.perf_counter()
+    try:
+        return await loop.run_in_executor(_supabase_executor, query.execute)
+    finally:
+        record_supabase(time.perf_counter() - started)
+
+def _connection_init(pool_name: str, get_pool):
+    """Pool `init` hook: metrics plus the query log (see querylog.py) on every connection."""
+    logger = querylog.query_logger(pool_name, get_pool)
+
+    async def init(conn):
+        await instrument_connection(conn, pool_name)
+        conn.add_query_logger(logger)
+    return init
+
 async def init_pool():
     """Initialize asyncpg connection pools."""
-    global _pool, _auth_pool, _pipeline_pool
+    global _pool, _auth_pool, _pipeline_pool, _bulk_pool
     if not DATABASE_URL:
         raise ValueError("DATABASE_URL must be set")
-    _pool = await asyncpg.create_pool(
+    _pool = InstrumentedPool(await asyncpg.create_pool(
         DATABASE_URL,
         min_size=2,
         max_size=10,
         command_timeout=30,
-    )
+        connection_class=InstrumentedConnection,
+        init=_connection_init("main", lambda: _pool),
+    ), "main")
+    # Small pool on the same database for long-running and background work (CSV
+    # imports, rollup rebuilds, queue drains), so it can't hold the main pool's
+    # connections; no command timeout, callers pass their own
+    _bulk_pool = InstrumentedPool(await asyncpg.create_pool(
+        DATABASE_URL,
+        min_size=0,
+        max_size=BULK_POOL_MAX_SIZE,
+        command_timeout=None,
+        connection_class=InstrumentedConnection,
+        init=_connection_init("bulk", lambda: _bulk_pool),
+    ), "bulk")
     # Initialize auth pool if AUTH_DATABASE_URL is set
     if AUTH_DATABASE_URL:
-        _auth_pool = await asyncpg.create_pool(
+        _auth_pool = InstrumentedPool(await asyncpg.create_pool(
             AUTH_DATABASE_URL,
             min_size=1,
             max_size=5,
             command_timeout=30,
-        )
+            connection_class=InstrumentedConnection,
+            init=_connection_init("auth", lambda: _auth_pool),
+        ), "auth")
     # Initialize pipeline pool if PIPELINE_DATABASE_URL is set
     if PIPELINE_DATABASE_URL:
-        _pipeline_pool = await asyncpg.create_pool(
+        _pipeline_pool = InstrumentedPool(await asyncpg.create_pool(
             PIPELINE_DATABASE_URL,
             min_size=1,
             max_size=5,
             command_timeout=30,
-        )
+            connection_class=InstrumentedConnection,
+            init=_connection_init("pipeline", lambda: _pipeline_pool),
+        ), "pipeline")
     return _pool
 
 async def close_pool():
     """Close the connection pools."""
-    global _pool, _auth_pool, _pipeline_pool
+    global _pool, _auth_pool, _pipeline_pool, _bulk_pool
     if _pool:
         await _pool.close()
         _pool = None
@@ -65,6 +112,9 @@ async def close_pool():
     if _pipeline_pool:
         await _pipeline_pool.close()
         _pipeline_pool = None
+    if _bulk_pool:
+        await _bulk_pool.close()
+        _bulk_pool = None
 
 def get_pool() -> asyncpg.Pool:
     """Get the main data connection pool."""
@@ -84,8 +134,14 @@ def get_pipeline_pool() -> asyncpg.Pool:
         raise RuntimeError("Pipeline database pool not initialized. Set PIPELINE_DATABASE_URL.")
     return _pipeline_pool
 
+def get_bulk_pool() -> asyncpg.Pool:
+    """Get the pool for long-running and background work (CSV imports, rollup rebuilds, queue drains)."""
+    if _bulk_pool is None:
+        raise RuntimeError("Database pool not initialized. Call init_pool() first.")
+    return _bulk_pool
+
 # Export
-__all__ = ['supabase', 'core', 'raw', 'extracted', 'reference', 'init_pool', 'close_pool', 'get_pool', 'get_auth_pool', 'get_pipeline_pool']
+__all__ = ['supabase', 'execute_async', 'core', 'raw', 'extracted', 'reference', 'init_pool', 'close_pool', 'get_pool', 'get_auth_pool', 'get_pipeline_pool', 'get_bulk_pool']
 
 # Helper to get core schema client (for simple table queries via Supabase)
 def core():
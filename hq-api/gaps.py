@@ -0,0 +1,431 @@
+"""
+Gap analysis recipes and the snapshot engine behind the admin gap endpoints.
+
+A recipe counts source rows with (or without) a match in a target table -
+an anti-join across whole core tables, too slow to run per dashboard load.
+run_snapshot() computes every recipe, GAP_SNAPSHOT_CONCURRENCY at a time,
+plus the per-country splits for recipes with a country_join, and appends the
+counts to hq.gap_snapshots with their timestamp. The admin endpoints serve
+the latest snapshot (?fresh=true queues a recompute of one recipe instead of
+waiting for it), and the history is the trend series.
+
+Snapshots run on the bulk pool, one connection per recipe for as long as
+that recipe takes, so they never hold request connections. Each recipe is
+computed and stored in one transaction under a per-recipe
+pg_try_advisory_xact_lock, so replicas skip a recipe another one is
+computing and the lock goes away with the transaction. A lifespan task runs
+a snapshot every GAP_SNAPSHOT_INTERVAL_SECONDS, skipping recipes whose
+newest snapshot is recent.
+"""
+
+import os
+import time
+import asyncio
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Literal, Tuple
+from uuid import UUID, uuid4
+from pydantic import BaseModel
+from db import get_pool, get_bulk_pool
+
+GAP_SNAPSHOT_INTERVAL_SECONDS = int(os.getenv("GAP_SNAPSHOT_INTERVAL_SECONDS", "3600"))
+GAP_SNAPSHOT_CONCURRENCY = int(os.getenv("GAP_SNAPSHOT_CONCURRENCY", "2"))
+# Per-query timeout; the pool default (30s) is too short for whole-table anti-joins
+GAP_SNAPSHOT_QUERY_TIMEOUT_SECONDS = float(os.getenv("GAP_SNAPSHOT_QUERY_TIMEOUT_SECONDS", "600"))
+GAP_SNAPSHOT_RETENTION_DAYS = int(os.getenv("GAP_SNAPSHOT_RETENTION_DAYS", "180"))
+
+# Snapshot scope for the unfiltered count, and the country splits
+ALL_COUNTRIES = "all"
+COUNTRY_SCOPES = ("United States", "not United States")
+
+# Advisory lock key prefix; the recipe id completes it
+_SNAPSHOT_LOCK_PREFIX = "gap_snapshot:"
+
+
+class GapRecipe(BaseModel):
+    id: str
+    label: str
+    description: str
+    source_table: str
+    target_table: str
+    join_column: str
+    comparison: Literal["not_in_target", "in_target"]
+    priority: Literal["P0", "P1", "P2", "P3"]
+    # Optional: how to join for country filtering. Format: "location_table:join_col:country_col"
+    # e.g., "core.company_locations:domain:country" means JOIN core.company_locations ON domain, filter by country
+    country_join: Optional[str] = None
+
+
+# Define all gap recipes
+GAP_RECIPES: List[GapRecipe] = [
+    # P0 - Pipeline health: extraction to core
+    GapRecipe(
+        id="extracted-companies-not-in-core",
+        label="Companies stuck in extraction",
+        description="Companies in extracted.company_discovery that haven't made it to core.companies. These may have data quality issues preventing promotion to core.",
+        source_table="extracted.company_discovery",
+        target_table="core.companies",
+        join_column="domain",
+        comparison="not_in_target",
+        priority="P0"
+    ),
+    GapRecipe(
+        id="extracted-people-not-in-core",
+        label="People stuck in extraction",
+        description="People in extracted.person_discovery that haven't made it to core.people. These may be missing required fields or have invalid LinkedIn URLs.",
+        source_table="extracted.person_discovery",
+        target_table="core.people",
+        join_column="linkedin_url",
+        comparison="not_in_target",
+        priority="P0"
+    ),
+    # P1 - Data quality: core records missing enrichment
+    GapRecipe(
+        id="companies-missing-industry",
+        label="Companies missing industry",
+        description="Companies in core.companies that don't have an industry classification in core.company_industries.",
+        source_table="core.companies",
+        target_table="core.company_industries",
+        join_column="domain",
+        comparison="not_in_target",
+        priority="P1"
+    ),
+    GapRecipe(
+        id="companies-missing-location",
+        label="Companies missing location",
+        description="Companies in core.companies that don't have location data in core.company_locations.",
+        source_table="core.companies",
+        target_table="core.company_locations",
+        join_column="domain",
+        comparison="not_in_target",
+        priority="P1"
+    ),
+    GapRecipe(
+        id="people-missing-job-title",
+        label="People missing job title",
+        description="People in core.people that don't have job title data in core.person_job_titles.",
+        source_table="core.people",
+        target_table="core.person_job_titles",
+        join_column="linkedin_url",
+        comparison="not_in_target",
+        priority="P1"
+    ),
+    GapRecipe(
+        id="people-missing-location",
+        label="People missing location",
+        description="People in core.people that don't have location data in core.person_locations.",
+        source_table="core.people",
+        target_table="core.person_locations",
+        join_column="linkedin_url",
+        comparison="not_in_target",
+        priority="P1"
+    ),
+    # P2 - Additional data quality gaps
+    GapRecipe(
+        id="companies-missing-description",
+        label="Companies missing description",
+        description="Companies in core.companies that don't have a description in core.company_descriptions.",
+        source_table="core.companies",
+        target_table="core.company_descriptions",
+        join_column="domain",
+        comparison="not_in_target",
+        priority="P2"
+    ),
+    GapRecipe(
+        id="companies-missing-employee-range",
+        label="Companies missing employee range",
+        description="Companies in core.companies that don't have employee range data in core.company_employee_range.",
+        source_table="core.companies",
+        target_table="core.company_employee_range",
+        join_column="domain",
+        comparison="not_in_target",
+        priority="P2"
+    ),
+    GapRecipe(
+        id="people-missing-tenure",
+        label="People missing tenure",
+        description="People in core.people that don't have job start date/tenure data in core.person_tenure.",
+        source_table="core.people",
+        target_table="core.person_tenure",
+        join_column="linkedin_url",
+        comparison="not_in_target",
+        priority="P2"
+    ),
+    GapRecipe(
+        id="customers-without-find-similar",
+        label="Customer companies not enriched with find-similar",
+        description="Unique customer domains from core.company_customers that haven't had find-similar-companies run on them yet.",
+        source_table="core.company_customers",
+        target_table="extracted.company_enrich_similar",
+        join_column="customer_domain:input_domain",  # Special syntax: source_col:target_col
+        comparison="not_in_target",
+        priority="P2"
+    ),
+    # P3 - VC-backed companies gaps
+    GapRecipe(
+        id="vc-backed-without-customers",
+        label="VC-backed companies without customers",
+        description="Companies that have raised VC funding but we haven't yet identified their customers.",
+        source_table="core.company_vc_backed",
+        target_table="core.company_customers",
+        join_column="domain:origin_company_domain",
+        comparison="not_in_target",
+        priority="P3",
+        country_join="core.company_locations:domain:country"
+    ),
+]
+
+# Index recipes by ID for fast lookup
+RECIPES_BY_ID = {r.id: r for r in GAP_RECIPES}
+
+
+def parse_join_columns(join_column: str) -> tuple[str, str]:
+    """Parse join_column which may be 'col' or 'source_col:target_col'."""
+    if ":" in join_column:
+        source_col, target_col = join_column.split(":")
+        return source_col, target_col
+    return join_column, join_column
+
+
+def build_country_filter(country_join: Optional[str], country: Optional[str], source_col: str) -> tuple[str, str]:
+    """
+    Build JOIN and WHERE clauses for country filtering.
+
+    country_join format: "location_table:join_col:country_col"
+    country values: None (no filter), "United States", "not United States"
+
+    Returns: (join_clause, where_clause)
+    """
+    if not country_join or not country:
+        return "", ""
+
+    parts = country_join.split(":")
+    if len(parts) != 3:
+        return "", ""
+
+    location_table, join_col, country_col = parts
+
+    join_clause = f"INNER JOIN {location_table} loc ON loc.{join_col} = s.{source_col}"
+
+    if country == "United States":
+        where_clause = f"AND loc.{country_col} = 'United States'"
+    elif country == "not United States":
+        where_clause = f"AND loc.{country_col} != 'United States' AND loc.{country_col} IS NOT NULL"
+    else:
+        where_clause = ""
+
+    return join_clause, where_clause
+
+
+def country_scope(recipe: GapRecipe, country: Optional[str]) -> str:
+    """Snapshot scope a country filter reads; recipes without a country_join ignore it."""
+    if not country or not recipe.country_join:
+        return ALL_COUNTRIES
+    if country not in COUNTRY_SCOPES:
+        raise ValueError(f"country must be one of: {', '.join(COUNTRY_SCOPES)}")
+    return country
+
+
+def gap_query(recipe: GapRecipe, select: str, country: Optional[str] = None, join: str = "") -> str:
+    """SELECT over a recipe's gap rows (source alias s), optionally filtered by country."""
+    source_col, target_col = parse_join_columns(recipe.join_column)
+    country_join_clause, country_where_clause = build_country_filter(recipe.country_join, country, source_col)
+    exists = "NOT EXISTS" if recipe.comparison == "not_in_target" else "EXISTS"
+    return f"""
+        SELECT {select} FROM {recipe.source_table} s
+        {country_join_clause or join}
+        WHERE s.{source_col} IS NOT NULL
+        AND s.{source_col} != ''
+        {country_where_clause}
+        AND {exists} (
+            SELECT 1 FROM {recipe.target_table} t
+            WHERE t.{target_col} = s.{source_col}
+        )
+    """
+
+
+def _country_split_query(recipe: GapRecipe) -> str:
+    """Both country splits in one pass over the gap rows joined to their locations."""
+    source_col, _ = parse_join_columns(recipe.join_column)
+    location_table, join_col, country_col = recipe.country_join.split(":")
+    return gap_query(
+        recipe,
+        f"""
+            COUNT(*) FILTER (WHERE loc.{country_col} = 'United States') AS us,
+            COUNT(*) FILTER (WHERE loc.{country_col} != 'United States' AND loc.{country_col} IS NOT NULL) AS non_us
+        """,
+        join=f"INNER JOIN {location_table} loc ON loc.{join_col} = s.{source_col}",
+    )
+
+
+async def compute_recipe(conn, recipe: GapRecipe) -> Dict[str, int]:
+    """Gap counts for a recipe: scope ("all" or a country split) -> count."""
+    timeout = GAP_SNAPSHOT_QUERY_TIMEOUT_SECONDS
+    total = await conn.fetchval(gap_query(recipe, "COUNT(*)"), timeout=timeout)
+    if not recipe.country_join:
+        return {ALL_COUNTRIES: total}
+
+    split = await conn.fetchrow(_country_split_query(recipe), timeout=timeout)
+    return {ALL_COUNTRIES: total, "United States": split["us"], "not United States": split["non_us"]}
+
+
+async def _store(conn, run_id: UUID, recipe_id: str, counts: Dict[str, int], duration_ms: int) -> datetime:
+    rows = await conn.fetch("""
+        INSERT INTO hq.gap_snapshots (run_id, recipe_id, country, gap_count, duration_ms)
+        SELECT $1, $2, scope, gap_count, $5
+        FROM unnest($3::text[], $4::bigint[]) AS c(scope, gap_count)
+        RETURNING computed_at
+    """, run_id, recipe_id, list(counts), list(counts.values()), duration_ms)
+    return rows[0]["computed_at"]
+
+
+# Bounds snapshot connections on the bulk pool across scheduled runs and queued refreshes
+_slots = asyncio.Semaphore(GAP_SNAPSHOT_CONCURRENCY)
+
+
+async def snapshot_recipe(
+    recipe: GapRecipe, run_id: Optional[UUID] = None, max_age_seconds: Optional[float] = None
+) -> Optional[Tuple[Dict[str, int], datetime]]:
+    """
+    Compute one recipe and store it as a snapshot. Returns the counts and their
+    timestamp, or None when another replica is computing the recipe or (with
+    max_age_seconds) its newest snapshot is younger than that.
+    """
+    async with _slots, get_bulk_pool().acquire() as conn:
+        async with conn.transaction():
+            if not await conn.fetchval(
+                "SELECT pg_try_advisory_xact_lock(hashtext($1))", _SNAPSHOT_LOCK_PREFIX + recipe.id
+            ):
+                return None
+            if max_age_seconds is not None:
+                last = await conn.fetchval(
+                    "SELECT MAX(computed_at) FROM hq.gap_snapshots WHERE recipe_id = $1", recipe.id
+                )
+                if last and (datetime.now(timezone.utc) - last).total_seconds() < max_age_seconds:
+                    return None
+            started = time.perf_counter()
+            counts = await compute_recipe(conn, recipe)
+            duration_ms = round((time.perf_counter() - started) * 1000)
+            computed_at = await _store(conn, run_id or uuid4(), recipe.id, counts, duration_ms)
+    return counts, computed_at
+
+
+async def run_snapshot(max_age_seconds: Optional[float] = None) -> dict:
+    """Snapshot every recipe (see snapshot_recipe for skips). Failed recipes are reported, not stored."""
+    run_id = uuid4()
+    started = time.perf_counter()
+
+    async def one(recipe: GapRecipe):
+        try:
+            stored = await snapshot_recipe(recipe, run_id, max_age_seconds)
+            return "stored" if stored else "skipped"
+        except Exception as e:
+            print(f"[GAP_SNAPSHOT] {recipe.id} failed: {e}")
+            return "failed"
+
+    results = await asyncio.gather(*(one(r) for r in GAP_RECIPES))
+    failed = [recipe.id for recipe, result in zip(GAP_RECIPES, results) if result == "failed"]
+    stored = results.count("stored")
+
+    await get_bulk_pool().execute(
+        "DELETE FROM hq.gap_snapshots WHERE computed_at < NOW() - make_interval(days => $1)",
+        GAP_SNAPSHOT_RETENTION_DAYS,
+    )
+
+    duration_ms = round((time.perf_counter() - started) * 1000)
+    if stored or failed:
+        print(f"[GAP_SNAPSHOT] run {run_id}: {stored}/{len(GAP_RECIPES)} recipes in {duration_ms}ms")
+    return {
+        "run_id": str(run_id), "recipes": len(GAP_RECIPES), "stored": stored,
+        "skipped": results.count("skipped"), "failed": failed, "duration_ms": duration_ms,
+    }
+
+
+_refreshes: Dict[str, asyncio.Task] = {}
+
+
+def queue_refresh(recipe: GapRecipe) -> None:
+    """Recompute one recipe in the background; a no-op while a refresh of it is already pending."""
+    if recipe.id in _refreshes:
+        return
+
+    async def refresh():
+        try:
+            await snapshot_recipe(recipe)
+        except Exception as e:
+            print(f"[GAP_SNAPSHOT] {recipe.id} refresh failed: {e}")
+        finally:
+            _refreshes.pop(recipe.id, None)
+
+    _refreshes[recipe.id] = asyncio.create_task(refresh())
+
+
+async def latest_snapshots(recipe_id: Optional[str] = None) -> List[dict]:
+    """Newest snapshot row per (recipe, country scope)."""
+    rows = await get_pool().fetch("""
+        SELECT DISTINCT ON (recipe_id, country)
+            recipe_id, country, gap_count, computed_at, duration_ms
+        FROM hq.gap_snapshots
+        WHERE $1::text IS NULL OR recipe_id = $1
+        ORDER BY recipe_id, country, computed_at DESC
+    """, recipe_id)
+    return [dict(row) for row in rows]
+
+
+async def latest_snapshot(recipe_id: str, scope: str) -> Optional[dict]:
+    row = await get_pool().fetchrow("""
+        SELECT gap_count, computed_at
+        FROM hq.gap_snapshots
+        WHERE recipe_id = $1 AND country = $2
+        ORDER BY computed_at DESC
+        LIMIT 1
+    """, recipe_id, scope)
+    return dict(row) if row else None
+
+
+async def trend(recipe_id: str, scope: str, days: int) -> List[dict]:
+    """Snapshot counts for a recipe over the last `days` days, oldest first."""
+    rows = await get_pool().fetch("""
+        SELECT computed_at, gap_count
+        FROM hq.gap_snapshots
+        WHERE recipe_id = $1 AND country = $2
+          AND computed_at >= NOW() - make_interval(days => $3)
+        ORDER BY computed_at
+    """, recipe_id, scope, days)
+    return [dict(row) for row in rows]
+
+
+async def _run_if_due():
+    """Snapshot the recipes whose newest snapshot is older than (most of) the interval."""
+    await run_snapshot(max_age_seconds=GAP_SNAPSHOT_INTERVAL_SECONDS * 0.9)
+
+
+_scheduler: Optional[asyncio.Task] = None
+
+
+async def _schedule_loop():
+    while True:
+        try:
+            await _run_if_due()
+        except Exception as e:
+            print(f"[GAP_SNAPSHOT] scheduled run failed: {e}")
+        await asyncio.sleep(GAP_SNAPSHOT_INTERVAL_SECONDS)
+
+
+async def start_scheduler():
+    """Start the periodic snapshot task (runs one right away if the last is old)."""
+    global _scheduler
+    if _scheduler is None and GAP_SNAPSHOT_INTERVAL_SECONDS > 0:
+        _scheduler = asyncio.create_task(_schedule_loop())
+
+
+async def stop_scheduler():
+    global _scheduler
+    for task in list(_refreshes.values()):
+        task.cancel()
+    if _scheduler is not None:
+        _scheduler.cancel()
+        try:
+            await _scheduler
+        except asyncio.CancelledError:
+            pass
+        _scheduler = None
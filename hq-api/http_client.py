@@ -0,0 +1,94 @@
+import os
+import asyncio
+import httpx
+from urllib.parse import urlparse
+from fastapi import HTTPException
+
+# Shared outbound client for Modal (*.modal.run) proxy calls
+MODAL_MAX_CONNECTIONS = int(os.getenv("MODAL_MAX_CONNECTIONS", "200"))
+MODAL_MAX_KEEPALIVE = int(os.getenv("MODAL_MAX_KEEPALIVE", "50"))
+MODAL_MAX_CONNECTIONS_PER_HOST = int(os.getenv("MODAL_MAX_CONNECTIONS_PER_HOST", "20"))
+MODAL_KEEPALIVE_EXPIRY = float(os.getenv("MODAL_KEEPALIVE_EXPIRY", "60"))
+MODAL_DEFAULT_TIMEOUT = 60.0
+
+_modal_client: httpx.AsyncClient = None
+# One semaphore per Modal function host so a slow function can't hog the pool
+_host_limits: dict = {}
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+async def init_http_client():
+    """Initialize the shared keep-alive client used to proxy to Modal."""
+    global _modal_client
+    _modal_client = httpx.AsyncClient(
+        http2=_http2_available(),
+        timeout=MODAL_DEFAULT_TIMEOUT,
+        limits=httpx.Limits(
+            max_connections=MODAL_MAX_CONNECTIONS,
+            max_keepalive_connections=MODAL_MAX_KEEPALIVE,
+            keepalive_expiry=MODAL_KEEPALIVE_EXPIRY,
+        ),
+    )
+    return _modal_client
+
+
+async def close_http_client():
+    """Close the shared client and drop idle connections."""
+    global _modal_client
+    if _modal_client:
+        await _modal_client.aclose()
+        _modal_client = None
+    _host_limits.clear()
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared Modal proxy client."""
+    if _modal_client is None:
+        raise RuntimeError("HTTP client not initialized. Call init_http_client() first.")
+    return _modal_client
+
+
+def _host_limit(url: str) -> asyncio.Semaphore:
+    host = urlparse(url).netloc
+    sem = _host_limits.get(host)
+    if sem is None:
+        sem = asyncio.Semaphore(MODAL_MAX_CONNECTIONS_PER_HOST)
+        _host_limits[host] = sem
+    return sem
+
+
+async def modal_post(url: str, *, timeout: float = MODAL_DEFAULT_TIMEOUT, **kwargs) -> httpx.Response:
+    """POST to a Modal endpoint over the shared client, bounded per upstream host."""
+    client = get_http_client()
+    async with _host_limit(url):
+        return await client.post(url, timeout=timeout, **kwargs)
+
+
+async def forward_to_modal(url: str, payload: dict, timeout: float = MODAL_DEFAULT_TIMEOUT) -> dict:
+    """
+    Forward a JSON payload to a Modal function and return its JSON body.
+
+    Upstream HTTP errors are passed through with the Modal status code;
+    connection failures become 503.
+    """
+    try:
+        response = await modal_post(url, json=payload, timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+    except httpx.HTTPStatusError as e:
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"Modal function error: {e.response.text}"
+        )
+    except httpx.RequestError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Failed to reach Modal function: {str(e)}"
+        )
@@ -1,16 +1,37 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
-from routers import leads, filters, views, auth, companies, enrichment, people, admin, run, read, hq, workflows, workflows_single, pipeline, parallel_native, job_boards, brightdata_ingest, lunos
+from routers import leads, filters, views, auth, companies, enrichment, people, admin, run, read, hq, workflows, workflows_single, pipeline, parallel_native, job_boards, brightdata_ingest, lunos, jobs
+import db
+import metrics
 from db import init_pool, close_pool
+from http_client import init_http_client, close_http_client
+from background_jobs import start_workers, stop_workers
+from typeahead import start_refresh as start_typeahead_refresh, stop_refresh as stop_typeahead_refresh
+from gaps import start_scheduler as start_gap_snapshots, stop_scheduler as stop_gap_snapshots
+from alumni import start_drain as start_alumni_drain, stop_drain as stop_alumni_drain
+from company_cards import start_drain as start_company_card_drain, stop_drain as stop_company_card_drain
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup: initialize database pool
+    # Startup: initialize database pool, shared Modal proxy client, job workers and periodic refreshes
     await init_pool()
+    await init_http_client()
+    await start_workers()
+    await start_typeahead_refresh()
+    await start_gap_snapshots()
+    await start_alumni_drain()
+    await start_company_card_drain()
     yield
-    # Shutdown: close database pool
+    # Shutdown: stop periodic refreshes and job workers (requeueing running jobs), then close clients
+    await stop_company_card_drain()
+    await stop_alumni_drain()
+    await stop_gap_snapshots()
+    await stop_typeahead_refresh()
+    await stop_workers()
+    await close_http_client()
     await close_pool()
 
 
@@ -80,6 +101,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-route latency / DB / upstream metrics, served at /metrics
+metrics.instrument_httpx()
+app.add_middleware(metrics.MetricsMiddleware)
+
 # Include routers
 app.include_router(leads.router)
 app.include_router(filters.router)
@@ -99,6 +124,7 @@ app.include_router(parallel_native.router)
 app.include_router(job_boards.router)
 app.include_router(brightdata_ingest.router)
 app.include_router(lunos.router)
+app.include_router(jobs.router)
 
 
 @app.get("/")
@@ -113,3 +139,13 @@ async def root():
 @app.get("/health")
 async def health():
     return {"status": "healthy"}
+
+
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics():
+    pools = {
+        name: pool
+        for name, pool in (("main", db._pool), ("auth", db._auth_pool), ("pipeline", db._pipeline_pool), ("bulk", db._bulk_pool))
+        if pool is not None
+    }
+    return PlainTextResponse(metrics.render(pools), media_type="text/plain; version=0.0.4")
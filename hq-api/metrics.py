@@ -0,0 +1,402 @@
+"""
+Per-route latency, database and upstream metrics, exposed at /metrics in
+the Prometheus text format.
+
+MetricsMiddleware times every request and, through a context variable,
+collects what the request spent waiting on:
+
+    asyncpg    - query count and time, from a query logger installed on every
+                 pool connection (covers pool.fetch* and acquired connections);
+                 per-query statistics and slow-query plans are in querylog.py
+    pool wait  - time to acquire a connection, from the InstrumentedPool
+                 wrapper db.get_pool() / get_auth_pool() / get_pipeline_pool()
+                 return
+    supabase   - PostgREST round trips made through db.execute_async
+    upstream   - outbound httpx requests (Modal functions and other APIs),
+                 timed at the transport so ad-hoc AsyncClients count too
+
+Prepared-statement cache hits and misses are counted per pool, from a mirror
+of each connection's asyncpg statement cache (pool connections are
+InstrumentedConnections); a low hit rate means queries whose SQL text varies
+per call (see sqlbuilder.py).
+
+Per-request totals are observed into histograms labelled by route template
+(not raw path, so cardinality is bounded by the ~300 routes), and upstream
+calls are also observed individually by upstream (the Modal function host).
+
+No client library: observations are a bisect and three additions under the
+GIL, well inside the per-request budget. Histograms are per process; each
+replica is scraped on its own.
+"""
+
+import time
+import asyncio
+import contextvars
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import httpx
+import asyncpg
+
+import querylog
+
+# Seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+WAIT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+# Queries per request
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class Histogram:
+    """Cumulative-bucket histogram keyed by a tuple of label values."""
+
+    def __init__(self, name: str, help_text: str, label_names: Tuple[str, ...], buckets):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = tuple(buckets)
+        # labels -> [per-bucket counts (last is +Inf), sum, count]
+        self._series: Dict[tuple, list] = {}
+
+    def observe(self, labels: tuple, value: float):
+        series = self._series.get(labels)
+        if series is None:
+            series = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            self._series[labels] = series
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for labels, (counts, total, count) in sorted(self._series.items()):
+            base = ",".join(f'{k}="{_escape(v)}"' for k, v in zip(self.label_names, labels))
+            sep = "," if base else ""
+            cumulative = 0
+            for bound, n in zip(self.buckets, counts):
+                cumulative += n
+                lines.append(f'{self.name}_bucket{{{base}{sep}le="{bound}"}} {cumulative}')
+            lines.append(f'{self.name}_bucket{{{base}{sep}le="+Inf"}} {count}')
+            lines.append(f"{self.name}_sum{{{base}}} {total}")
+            lines.append(f"{self.name}_count{{{base}}} {count}")
+        return "\n".join(lines)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+REQUEST_DURATION = Histogram(
+    "hq_http_request_duration_seconds", "Total request latency.",
+    ("method", "route", "status"), LATENCY_BUCKETS)
+DB_QUERIES = Histogram(
+    "hq_db_queries_per_request", "asyncpg queries issued per request.",
+    ("route",), COUNT_BUCKETS)
+DB_TIME = Histogram(
+    "hq_db_time_per_request_seconds", "Time spent in asyncpg queries per request.",
+    ("route",), LATENCY_BUCKETS)
+POOL_WAIT = Histogram(
+    "hq_db_pool_wait_per_request_seconds", "Time spent waiting for pool connections per request.",
+    ("route",), WAIT_BUCKETS)
+POOL_ACQUIRE = Histogram(
+    "hq_db_pool_acquire_seconds", "Time to acquire a connection, per acquire.",
+    ("pool",), WAIT_BUCKETS)
+SUPABASE_TIME = Histogram(
+    "hq_supabase_time_per_request_seconds", "Time spent in Supabase PostgREST calls per request.",
+    ("route",), LATENCY_BUCKETS)
+UPSTREAM_TIME = Histogram(
+    "hq_upstream_time_per_request_seconds", "Time spent in outbound HTTP calls per request.",
+    ("route",), LATENCY_BUCKETS)
+UPSTREAM_DURATION = Histogram(
+    "hq_upstream_request_duration_seconds", "Outbound HTTP request latency by upstream (Modal function host).",
+    ("upstream", "status"), LATENCY_BUCKETS)
+
+HISTOGRAMS = (
+    REQUEST_DURATION, DB_QUERIES, DB_TIME, POOL_WAIT, POOL_ACQUIRE,
+    SUPABASE_TIME, UPSTREAM_TIME, UPSTREAM_DURATION,
+)
+
+
+class RequestStats:
+    __slots__ = ("db_queries", "db_seconds", "pool_wait_seconds", "supabase_seconds", "upstream_seconds")
+
+    def __init__(self):
+        self.db_queries = 0
+        self.db_seconds = 0.0
+        self.pool_wait_seconds = 0.0
+        self.supabase_seconds = 0.0
+        self.upstream_seconds = 0.0
+
+
+_current: contextvars.ContextVar[Optional[RequestStats]] = contextvars.ContextVar("hq_request_stats", default=None)
+
+
+def current_stats() -> Optional[RequestStats]:
+    return _current.get()
+
+
+# =============================================================================
+# Middleware
+# =============================================================================
+
+class MetricsMiddleware:
+    """Pure ASGI middleware (no BaseHTTPMiddleware task/stream overhead)."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        stats = RequestStats()
+        token = _current.set(stats)
+        status = [500]
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            _current.reset(token)
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or UNMATCHED_ROUTE
+            # Query loggers report via loop.call_soon; queue the observation behind them
+            asyncio.get_running_loop().call_soon(
+                _finish, scope["method"], route_path, status[0], elapsed, stats
+            )
+
+
+def _finish(method: str, route: str, status: int, elapsed: float, stats: RequestStats):
+    REQUEST_DURATION.observe((method, route, f"{status // 100}xx"), elapsed)
+    DB_QUERIES.observe((route,), stats.db_queries)
+    DB_TIME.observe((route,), stats.db_seconds)
+    POOL_WAIT.observe((route,), stats.pool_wait_seconds)
+    SUPABASE_TIME.observe((route,), stats.supabase_seconds)
+    UPSTREAM_TIME.observe((route,), stats.upstream_seconds)
+
+
+# =============================================================================
+# asyncpg
+# =============================================================================
+
+# asyncpg's statement cache defaults (db.py doesn't override them)
+STATEMENT_CACHE_SIZE = 100
+STATEMENT_CACHE_LIFETIME_SECONDS = 300
+STATEMENT_CACHE_MAX_QUERY_SIZE = 15 * 1024
+
+# (pool, "hit" | "miss") -> prepared-statement cache lookups
+STATEMENT_CACHE: Dict[Tuple[str, str], int] = {}
+
+
+def _record_query(record):
+    stats = _current.get()
+    if stats is not None:
+        stats.db_queries += 1
+        stats.db_seconds += record.elapsed
+
+
+class InstrumentedConnection(asyncpg.Connection):
+    """
+    Connection class for the pools. Flags execute() calls without arguments,
+    which run over the simple query protocol and never touch the statement
+    cache, so the tracker can tell them from argument-less fetch*() calls.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # query -> argument-less execute() calls not yet seen by the tracker
+        self.simple_queries: Dict[str, int] = {}
+
+    async def execute(self, query: str, *args, timeout=None) -> str:
+        if not args:
+            self.simple_queries[query] = self.simple_queries.get(query, 0) + 1
+        return await super().execute(query, *args, timeout=timeout)
+
+
+def _statement_cache_tracker(conn, pool_name: str):
+    """
+    Query logger mirroring one connection's statement cache: an LRU of
+    STATEMENT_CACHE_SIZE entries that each expire STATEMENT_CACHE_LIFETIME_SECONDS
+    after they were prepared, with queries over STATEMENT_CACHE_MAX_QUERY_SIZE
+    never cached. Every query except an argument-less execute() is a lookup.
+    """
+    # query -> monotonic time it was prepared
+    cached: "OrderedDict[str, float]" = OrderedDict()
+    simple = getattr(conn, "simple_queries", None)
+
+    def track(record):
+        query = record.query
+        if not record.args and simple and simple.get(query):
+            simple[query] -= 1
+            if not simple[query]:
+                del simple[query]
+            return
+        now = time.monotonic()
+        prepared = cached.get(query)
+        if prepared is not None and now - prepared < STATEMENT_CACHE_LIFETIME_SECONDS:
+            cached.move_to_end(query)
+            result = "hit"
+        else:
+            cached.pop(query, None)
+            if len(query) <= STATEMENT_CACHE_MAX_QUERY_SIZE:
+                cached[query] = now
+                if len(cached) > STATEMENT_CACHE_SIZE:
+                    cached.popitem(last=False)
+            result = "miss"
+        key = (pool_name, result)
+        STATEMENT_CACHE[key] = STATEMENT_CACHE.get(key, 0) + 1
+    return track
+
+
+async def instrument_connection(conn, pool_name: str):
+    """Pool `init` hook: report every query on this connection."""
+    conn.add_query_logger(_record_query)
+    conn.add_query_logger(_statement_cache_tracker(conn, pool_name))
+
+
+class _TimedAcquire:
+    """Wraps a PoolAcquireContext, timing the wait for a connection."""
+
+    __slots__ = ("_ctx", "_pool_name")
+
+    def __init__(self, ctx, pool_name: str):
+        self._ctx = ctx
+        self._pool_name = pool_name
+
+    def _record(self, started: float):
+        waited = time.perf_counter() - started
+        POOL_ACQUIRE.observe((self._pool_name,), waited)
+        stats = _current.get()
+        if stats is not None:
+            stats.pool_wait_seconds += waited
+
+    async def __aenter__(self):
+        started = time.perf_counter()
+        conn = await self._ctx.__aenter__()
+        self._record(started)
+        return conn
+
+    async def __aexit__(self, *exc):
+        return await self._ctx.__aexit__(*exc)
+
+    def __await__(self):
+        started = time.perf_counter()
+        conn = yield from self._ctx.__await__()
+        self._record(started)
+        return conn
+
+
+class InstrumentedPool:
+    """asyncpg.Pool proxy whose acquires (including pool.fetch* and execute) are timed."""
+
+    def __init__(self, pool, name: str):
+        self._pool = pool
+        self.name = name
+
+    def __getattr__(self, attr):
+        return getattr(self._pool, attr)
+
+    def acquire(self, *, timeout=None):
+        return _TimedAcquire(self._pool.acquire(timeout=timeout), self.name)
+
+    async def execute(self, query: str, *args, timeout=None):
+        async with self.acquire() as conn:
+            status = await conn.execute(query, *args, timeout=timeout)
+        querylog.record_rows(query, querylog.status_rows(status))
+        return status
+
+    async def executemany(self, command: str, args, *, timeout=None):
+        async with self.acquire() as conn:
+            return await conn.executemany(command, args, timeout=timeout)
+
+    async def fetch(self, query, *args, timeout=None, record_class=None):
+        async with self.acquire() as conn:
+            rows = await conn.fetch(query, *args, timeout=timeout, record_class=record_class)
+        querylog.record_rows(query, len(rows))
+        return rows
+
+    async def fetchval(self, query, *args, column=0, timeout=None):
+        async with self.acquire() as conn:
+            return await conn.fetchval(query, *args, column=column, timeout=timeout)
+
+    async def fetchrow(self, query, *args, timeout=None, record_class=None):
+        async with self.acquire() as conn:
+            row = await conn.fetchrow(query, *args, timeout=timeout, record_class=record_class)
+        querylog.record_rows(query, 0 if row is None else 1)
+        return row
+
+
+# =============================================================================
+# Supabase and outbound HTTP
+# =============================================================================
+
+def record_supabase(seconds: float):
+    stats = _current.get()
+    if stats is not None:
+        stats.supabase_seconds += seconds
+
+
+def upstream_label(url) -> str:
+    """Modal function name for *.modal.run hosts, otherwise the host."""
+    host = url.host if isinstance(url, httpx.URL) else urlparse(str(url)).hostname or ""
+    return host[:-len(".modal.run")] if host.endswith(".modal.run") else host
+
+
+_original_handle = httpx.AsyncHTTPTransport.handle_async_request
+
+
+async def _timed_handle(self, request):
+    started = time.perf_counter()
+    status = "error"
+    try:
+        response = await _original_handle(self, request)
+        status = f"{response.status_code // 100}xx"
+        return response
+    finally:
+        elapsed = time.perf_counter() - started
+        UPSTREAM_DURATION.observe((upstream_label(request.url), status), elapsed)
+        stats = _current.get()
+        if stats is not None:
+            stats.upstream_seconds += elapsed
+
+
+def instrument_httpx():
+    """Time every request sent through an httpx async transport, whichever client made it."""
+    httpx.AsyncHTTPTransport.handle_async_request = _timed_handle
+
+
+# =============================================================================
+# Exposition
+# =============================================================================
+
+def render(pools: Dict[str, object] = None) -> str:
+    parts = [h.render() for h in HISTOGRAMS]
+    if STATEMENT_CACHE:
+        lines = [
+            "# HELP hq_db_statement_cache_total Prepared-statement cache lookups by result.",
+            "# TYPE hq_db_statement_cache_total counter",
+        ]
+        for (name, result), n in sorted(STATEMENT_CACHE.items()):
+            lines.append(f'hq_db_statement_cache_total{{pool="{name}",result="{result}"}} {n}')
+        parts.append("\n".join(lines))
+    if pools:
+        lines = [
+            "# HELP hq_db_pool_connections Pool connections by state.",
+            "# TYPE hq_db_pool_connections gauge",
+        ]
+        for name, pool in pools.items():
+            size, idle = pool.get_size(), pool.get_idle_size()
+            lines.append(f'hq_db_pool_connections{{pool="{name}",state="idle"}} {idle}')
+            lines.append(f'hq_db_pool_connections{{pool="{name}",state="busy"}} {size - idle}')
+        parts.append("\n".join(lines))
+    return "\n".join(parts) + "\n"
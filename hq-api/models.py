@@ -45,6 +45,7 @@ class PaginationMeta(BaseModel):
     total: int
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
 
 
 class LeadsResponse(BaseModel):
@@ -52,6 +53,17 @@ class LeadsResponse(BaseModel):
     meta: PaginationMeta
 
 
+class CountedPaginationMeta(PaginationMeta):
+    count_mode: str = "exact"
+    count_stale: bool = False
+    counted_at: Optional[datetime] = None
+
+
+class LeadsCountedResponse(BaseModel):
+    data: List[Lead]
+    meta: CountedPaginationMeta
+
+
 class LeadsQuickResponse(BaseModel):
     data: List[Lead]
 
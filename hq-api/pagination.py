@@ -0,0 +1,124 @@
+"""
+Keyset (cursor) pagination helpers.
+
+A cursor is an opaque, url-safe token holding the sort-key values of the
+last row on the previous page. The next page seeks past it with a row
+comparison, e.g. (created_at, id) < ($1, $2), so page N costs the same as
+page 1 instead of scanning and discarding N * limit rows like OFFSET.
+"""
+
+import json
+import base64
+from uuid import UUID
+from decimal import Decimal
+from datetime import date, datetime
+from typing import Optional, List, Sequence, Tuple
+from fastapi import HTTPException
+
+
+def _encode_value(v) -> list:
+    if v is None:
+        return ["n", None]
+    if isinstance(v, datetime):
+        return ["t", v.isoformat()]
+    if isinstance(v, date):
+        return ["d", v.isoformat()]
+    if isinstance(v, UUID):
+        return ["u", str(v)]
+    if isinstance(v, Decimal):
+        return ["m", str(v)]
+    if isinstance(v, bool):
+        return ["b", v]
+    if isinstance(v, int):
+        return ["i", v]
+    if isinstance(v, float):
+        return ["f", v]
+    return ["s", str(v)]
+
+
+def _decode_value(tag: str, v):
+    if tag == "n":
+        return None
+    if tag == "t":
+        return datetime.fromisoformat(v)
+    if tag == "d":
+        return date.fromisoformat(v)
+    if tag == "u":
+        return UUID(v)
+    if tag == "m":
+        return Decimal(v)
+    if tag in ("b", "i", "f", "s"):
+        return v
+    raise ValueError(f"unknown cursor value type {tag!r}")
+
+
+def encode_cursor(values: Sequence) -> str:
+    """Encode sort-key values into an opaque cursor token."""
+    raw = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, key_count: int) -> list:
+    """Decode a cursor token. Raises 400 if it is malformed or for a different sort key."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        items = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values = [_decode_value(tag, v) for tag, v in items]
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if len(values) != key_count:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+def cursor_from_row(row, keys: Sequence[str]) -> str:
+    """Build the cursor pointing just past this row."""
+    return encode_cursor([row[k.split(".")[-1]] for k in keys])
+
+
+def order_by(keys: Sequence[str], descending: bool = False) -> str:
+    direction = " DESC" if descending else ""
+    return ", ".join(f"{k}{direction}" for k in keys)
+
+
+def seek_predicate(keys: Sequence[str], values: Sequence, start_idx: int, descending: bool = False) -> Tuple[str, list]:
+    """Row comparison that skips everything up to and including the cursor row."""
+    op = "<" if descending else ">"
+    placeholders = ", ".join(f"${start_idx + i}" for i in range(len(keys)))
+    return f"({', '.join(keys)}) {op} ({placeholders})", list(values)
+
+
+async def fetch_page(
+    pool,
+    select_sql: str,
+    where_clause: str,
+    params: list,
+    keys: Sequence[str],
+    limit: int,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    descending: bool = False,
+) -> Tuple[List, Optional[str]]:
+    """
+    Fetch one page ordered by `keys`, seeking past `cursor` when given
+    (offset is ignored in that case). Returns (rows, next_cursor); next_cursor
+    is None on the last page.
+    """
+    params = list(params)
+    if cursor:
+        values = decode_cursor(cursor, len(keys))
+        predicate, seek_params = seek_predicate(keys, values, len(params) + 1, descending)
+        where_clause = f"({where_clause}) AND {predicate}"
+        params.extend(seek_params)
+        offset = 0
+
+    idx = len(params) + 1
+    rows = await pool.fetch(f"""
+        {select_sql}
+        WHERE {where_clause}
+        ORDER BY {order_by(keys, descending)}
+        LIMIT ${idx} OFFSET ${idx + 1}
+    """, *params, limit, offset)
+
+    next_cursor = cursor_from_row(rows[-1], keys) if len(rows) == limit else None
+    return rows, next_cursor
@@ -0,0 +1,210 @@
+"""
+Query log for the asyncpg pools: per-fingerprint statistics and slow-query
+plan capture.
+
+Every query on a pool connection is reported by an asyncpg query logger
+(installed by db.init_pool) and aggregated by fingerprint - the SQL with
+literals replaced by ?, comments dropped and whitespace collapsed - so the
+f-string-built queries (job-board filters, gap recipes, enrichment status)
+group by shape rather than by value. Each fingerprint keeps its call count
+and total / max time; row counts are added for calls made through the pool
+methods (fetch*, execute), which see the result.
+
+A read query slower than SLOW_QUERY_THRESHOLD_MS has its plan captured with
+EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) on the pool it ran on, inside a
+read-only transaction that is rolled back, and stored in hq.slow_query_plans.
+Captures run one at a time in the background, at most once per fingerprint
+per SLOW_QUERY_EXPLAIN_COOLDOWN_SECONDS; EXPLAIN ANALYZE runs the query
+again, so the cooldown bounds the extra load.
+
+Statistics are per process, since it started.
+"""
+
+import os
+import re
+import json
+import time
+import asyncio
+import hashlib
+import contextvars
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Set
+
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "1000"))
+SLOW_QUERY_EXPLAIN_ANALYZE = os.getenv("SLOW_QUERY_EXPLAIN_ANALYZE", "true").lower() == "true"
+SLOW_QUERY_EXPLAIN_COOLDOWN_SECONDS = int(os.getenv("SLOW_QUERY_EXPLAIN_COOLDOWN_SECONDS", "3600"))
+SLOW_QUERY_EXPLAIN_TIMEOUT_SECONDS = float(os.getenv("SLOW_QUERY_EXPLAIN_TIMEOUT_SECONDS", "120"))
+QUERY_STATS_MAX_FINGERPRINTS = int(os.getenv("QUERY_STATS_MAX_FINGERPRINTS", "2000"))
+
+_COMMENT = re.compile(r"--[^\n]*|/\*.*?\*/", re.S)
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"(?<![\w$.])-?\d+(?:\.\d+)?\b")
+_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+_READ_QUERY = re.compile(r"^\s*(?:\(\s*)*(?:SELECT|WITH|VALUES|TABLE)\b", re.I)
+
+
+class QueryStats:
+    __slots__ = ("fingerprint", "pools", "calls", "errors", "total_ms", "max_ms",
+                 "rows", "row_calls", "slow_calls", "last_seen")
+
+    def __init__(self, fingerprint: str):
+        self.fingerprint = fingerprint
+        self.pools: Set[str] = set()
+        self.calls = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.row_calls = 0
+        self.slow_calls = 0
+        self.last_seen = 0.0
+
+
+# fingerprint id -> stats
+_stats: Dict[str, QueryStats] = {}
+# fingerprint id -> monotonic time of the last plan capture
+_last_capture: Dict[str, float] = {}
+_capture_lock = asyncio.Lock()
+# Set while capturing, so the capture's own queries aren't logged
+_internal: contextvars.ContextVar[bool] = contextvars.ContextVar("querylog_internal", default=False)
+# Strong references to running capture tasks
+_captures: Set[asyncio.Task] = set()
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(sql: str) -> str:
+    """Normalized query shape: literals as ?, IN-lists collapsed, comments and extra whitespace removed."""
+    text = _COMMENT.sub(" ", sql)
+    text = _STRING.sub("?", text)
+    text = _NUMBER.sub("?", text)
+    text = _LIST.sub("(?)", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+@lru_cache(maxsize=4096)
+def fingerprint_id(sql: str) -> str:
+    return hashlib.md5(fingerprint(sql).encode()).hexdigest()[:16]
+
+
+def _entry(sql: str) -> Optional[QueryStats]:
+    fid = fingerprint_id(sql)
+    stats = _stats.get(fid)
+    if stats is None:
+        if len(_stats) >= QUERY_STATS_MAX_FINGERPRINTS:
+            # Make room by dropping the cheapest shape seen so far
+            cheapest = min(_stats, key=lambda k: _stats[k].total_ms)
+            del _stats[cheapest]
+        stats = QueryStats(fingerprint(sql))
+        _stats[fid] = stats
+    return stats
+
+
+def record_rows(sql: str, rows: Optional[int]):
+    """Add a row count for a call made through a pool method."""
+    if rows is None or _internal.get():
+        return
+    stats = _entry(sql)
+    stats.rows += rows
+    stats.row_calls += 1
+
+
+def status_rows(status: str) -> Optional[int]:
+    """Row count from a command status such as 'UPDATE 5' or 'INSERT 0 3'."""
+    last = status.rsplit(" ", 1)[-1] if status else ""
+    return int(last) if last.isdigit() else None
+
+
+def query_logger(pool_name: str, get_pool: Callable):
+    """asyncpg query logger for a pool; `get_pool` returns the pool to EXPLAIN on."""
+    def log(record):
+        if _internal.get():
+            return
+        elapsed_ms = record.elapsed * 1000
+        stats = _entry(record.query)
+        stats.pools.add(pool_name)
+        stats.calls += 1
+        stats.total_ms += elapsed_ms
+        stats.max_ms = max(stats.max_ms, elapsed_ms)
+        stats.last_seen = time.time()
+        if record.exception is not None:
+            stats.errors += 1
+            return
+        if elapsed_ms >= SLOW_QUERY_THRESHOLD_MS:
+            stats.slow_calls += 1
+            _maybe_capture(pool_name, get_pool, record, elapsed_ms)
+    return log
+
+
+def _maybe_capture(pool_name: str, get_pool: Callable, record, elapsed_ms: float):
+    if not _READ_QUERY.match(record.query):
+        return
+    fid = fingerprint_id(record.query)
+    now = time.monotonic()
+    last = _last_capture.get(fid)
+    if last is not None and now - last < SLOW_QUERY_EXPLAIN_COOLDOWN_SECONDS:
+        return
+    if _capture_lock.locked():
+        # One capture at a time; this shape gets another chance on its next slow call
+        return
+    _last_capture[fid] = now
+    task = asyncio.get_running_loop().create_task(
+        _capture(pool_name, get_pool, record.query, record.args, fid, elapsed_ms)
+    )
+    _captures.add(task)
+    task.add_done_callback(_captures.discard)
+
+
+async def _capture(pool_name: str, get_pool: Callable, sql: str, args, fid: str, elapsed_ms: float):
+    _internal.set(True)
+    options = "ANALYZE, BUFFERS, FORMAT JSON" if SLOW_QUERY_EXPLAIN_ANALYZE else "FORMAT JSON"
+    async with _capture_lock:
+        try:
+            pool = get_pool()
+            async with pool.acquire() as conn:
+                tx = conn.transaction(readonly=True)
+                await tx.start()
+                try:
+                    plan = await conn.fetchval(
+                        f"EXPLAIN ({options}) {sql}", *args, timeout=SLOW_QUERY_EXPLAIN_TIMEOUT_SECONDS
+                    )
+                finally:
+                    await tx.rollback()
+
+            # Imported here: db imports this module to install the logger
+            from db import get_pool as get_main_pool
+            await get_main_pool().execute("""
+                INSERT INTO hq.slow_query_plans
+                    (fingerprint_id, fingerprint, pool, duration_ms, plan, analyzed)
+                VALUES ($1, $2, $3, $4, $5::jsonb, $6)
+            """, fid, fingerprint(sql), pool_name, round(elapsed_ms, 1),
+                plan if isinstance(plan, str) else json.dumps(plan), SLOW_QUERY_EXPLAIN_ANALYZE)
+            print(f"[QUERYLOG] captured plan for {fid} ({pool_name}, {elapsed_ms:.0f}ms)")
+        except Exception as e:
+            print(f"[QUERYLOG] plan capture failed for {fid}: {e}")
+
+
+def top_queries(order_by: str = "total_ms", limit: int = 50) -> List[dict]:
+    """Fingerprints ranked by total_ms, mean_ms, max_ms or calls."""
+    rows = []
+    for fid, s in _stats.items():
+        rows.append({
+            "fingerprint_id": fid,
+            "fingerprint": s.fingerprint,
+            "pools": sorted(s.pools),
+            "calls": s.calls,
+            "errors": s.errors,
+            "slow_calls": s.slow_calls,
+            "total_ms": round(s.total_ms, 1),
+            "mean_ms": round(s.total_ms / s.calls, 2) if s.calls else 0.0,
+            "max_ms": round(s.max_ms, 1),
+            "mean_rows": round(s.rows / s.row_calls, 1) if s.row_calls else None,
+            "last_seen": s.last_seen,
+        })
+    rows.sort(key=lambda r: r[order_by], reverse=True)
+    return rows[:limit]
+
+
+def reset():
+    _stats.clear()
+    _last_capture.clear()
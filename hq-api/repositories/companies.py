@@ -0,0 +1,29 @@
+"""
+Companies repository - company lookups used by async routers on the asyncpg pool.
+"""
+
+from typing import Optional, List
+from db import get_pool
+
+
+async def fetch_similar_companies(domain: str, limit: int) -> List[dict]:
+    """Cached companyenrich similar companies for a domain, best match first."""
+    rows = await get_pool().fetch("""
+        SELECT company_name, company_domain, company_industry, company_description, similarity_score
+        FROM extracted.company_enrich_similar
+        WHERE input_domain = $1
+        ORDER BY similarity_score DESC
+        LIMIT $2
+    """, domain, limit)
+    return [dict(row) for row in rows]
+
+
+async def fetch_workflow_core_table(workflow_slug: str) -> Optional[dict]:
+    """Look up a workflow's registry row. Returns None if the slug is unknown."""
+    row = await get_pool().fetchrow("""
+        SELECT core_table
+        FROM reference.enrichment_workflow_registry
+        WHERE workflow_slug = $1
+        LIMIT 1
+    """, workflow_slug)
+    return dict(row) if row else None
@@ -0,0 +1,144 @@
+"""
+Filters repository - reference table reads for dashboard dropdowns.
+
+The combined dropdown payload is cached in-process. Its ETag is a hash of
+the reference rows themselves, so every replica computes the same ETag for
+the same data and clients can revalidate with If-None-Match. Entries expire
+after FILTERS_CACHE_TTL_SECONDS; writers of reference rows call
+invalidate_filters_cache() so this process reloads on the next request.
+"""
+
+import os
+import json
+import time
+import asyncio
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+from db import get_pool
+
+FILTERS_CACHE_TTL_SECONDS = int(os.getenv("FILTERS_CACHE_TTL_SECONDS", "600"))
+
+# key -> SQL, one per dropdown on the dashboard
+REFERENCE_QUERIES = {
+    "seniorities": "SELECT name, sort_order FROM reference.seniorities ORDER BY sort_order",
+    "job_functions": "SELECT name, sort_order FROM reference.job_functions ORDER BY sort_order",
+    "employee_ranges": "SELECT name, min_employees, max_employees, sort_order FROM reference.employee_ranges ORDER BY sort_order",
+    "industries": "SELECT name FROM reference.company_industries ORDER BY name",
+    "signals": "SELECT name, display_name, endpoint, sort_order FROM reference.signals ORDER BY sort_order",
+    "business_models": "SELECT name, sort_order FROM reference.business_models ORDER BY sort_order",
+}
+
+
+@dataclass
+class CachedFilters:
+    rows: dict
+    etag: str
+    loaded_at: datetime
+    loaded_monotonic: float
+
+
+_cached: Optional[CachedFilters] = None
+# Shared by concurrent misses so a cold cache runs the queries once
+_inflight: Optional[asyncio.Task] = None
+# Bumped by invalidate_filters_cache(); a load started before an
+# invalidation is not stored
+_generation = 0
+
+
+async def _fetch_one(query: str) -> list:
+    async with get_pool().acquire() as conn:
+        rows = await conn.fetch(query)
+    return [dict(row) for row in rows]
+
+
+async def fetch_all_filters() -> dict:
+    """Fetch every dropdown's reference rows, one pooled connection per query, concurrently."""
+    results = await asyncio.gather(*(_fetch_one(q) for q in REFERENCE_QUERIES.values()))
+    return dict(zip(REFERENCE_QUERIES, results))
+
+
+def _etag(rows: dict) -> str:
+    digest = hashlib.sha256(json.dumps(rows, sort_keys=True, default=str).encode()).hexdigest()
+    return f'W/"filters-{digest[:20]}"'
+
+
+def _is_fresh(entry: Optional[CachedFilters]) -> bool:
+    return entry is not None and time.monotonic() - entry.loaded_monotonic < FILTERS_CACHE_TTL_SECONDS
+
+
+async def _load() -> CachedFilters:
+    global _cached, _inflight
+    generation = _generation
+    try:
+        rows = await fetch_all_filters()
+        entry = CachedFilters(
+            rows=rows,
+            etag=_etag(rows),
+            loaded_at=datetime.now(timezone.utc),
+            loaded_monotonic=time.monotonic(),
+        )
+        if generation == _generation:
+            _cached = entry
+        return entry
+    finally:
+        if generation == _generation:
+            _inflight = None
+
+
+async def get_cached_filters() -> CachedFilters:
+    """Dropdown rows and their ETag, loading them if missing, expired or invalidated."""
+    global _inflight
+    entry = _cached
+    if _is_fresh(entry):
+        return entry
+    if _inflight is None:
+        _inflight = asyncio.create_task(_load())
+    return await asyncio.shield(_inflight)
+
+
+def invalidate_filters_cache():
+    """Drop the cached dropdown rows; the next request reloads them."""
+    global _cached, _inflight, _generation
+    _generation += 1
+    _cached = None
+    _inflight = None
+
+
+async def fetch_technology_entries() -> list:
+    """PredictLeads technologies with the number of companies using each, for typeahead."""
+    rows = await get_pool().fetch("""
+        SELECT r.title AS name, r.technology_domain AS domain, r.categories, COALESCE(u.companies, 0) AS weight
+        FROM reference.predictleads_technologies r
+        LEFT JOIN (
+            SELECT technology_id, COUNT(*) AS companies
+            FROM core.company_predictleads_technologies
+            GROUP BY technology_id
+        ) u ON u.technology_id = r.id
+        WHERE r.title IS NOT NULL
+    """)
+    entries = []
+    for row in rows:
+        entry = dict(row)
+        # Handle JSONB - asyncpg may return string or parsed object
+        if isinstance(entry["categories"], str):
+            entry["categories"] = json.loads(entry["categories"])
+        entries.append(entry)
+    return entries
+
+
+async def fetch_job_title_entries() -> list:
+    """Normalized job titles with the number of postings for each, for typeahead."""
+    rows = await get_pool().fetch("""
+        SELECT r.normalized_title AS name, COALESCE(p.postings, 0) AS weight
+        FROM reference.job_titles r
+        LEFT JOIN (
+            SELECT job_title_id, COUNT(*) AS postings
+            FROM core.company_job_postings
+            WHERE job_title_id IS NOT NULL
+            GROUP BY job_title_id
+        ) p ON p.job_title_id = r.id
+        WHERE r.normalized_title IS NOT NULL
+    """)
+    return [dict(row) for row in rows]
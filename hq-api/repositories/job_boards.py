@@ -0,0 +1,341 @@
+"""
+Job boards repository - board config, job listings, and the precomputed
+rollups behind the stats and filters endpoints.
+
+Listings read company fields from core.company_card, a one-row-per-domain
+projection of the enrichment tables that company_cards.py refreshes from a
+queue the tables' triggers fill.
+
+core.job_board_rollups holds per-board counts by dimension (city, state,
+country, seniority, employment type, employee range, location, company,
+posted day) maintained by core.refresh_job_board_rollup(). A rollup older
+than JOB_BOARD_ROLLUP_MAX_AGE_SECONDS is served as-is while one background
+task folds in postings created since its watermark (up to
+JOB_BOARD_ROLLUP_COMMIT_LAG_SECONDS ago). A board with no rollup yet starts
+a build and waits up to JOB_BOARD_ROLLUP_BUILD_WAIT_SECONDS for it (or for
+another replica's); until it lands, stats and filters are aggregated live
+from core.company_job_postings. Refreshes run on the bulk pool (db.py) with
+their own JOB_BOARD_ROLLUP_TIMEOUT_SECONDS, since a rebuild can outlast the
+main pool's command timeout.
+"""
+
+import os
+import json
+import asyncio
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+from db import get_pool, get_bulk_pool
+from search import JOB_POSTING_SEARCH_COLUMNS, contains_pattern, contains_clause
+from sqlbuilder import Predicates, custom_plans
+
+JOB_BOARD_ROLLUP_MAX_AGE_SECONDS = int(os.getenv("JOB_BOARD_ROLLUP_MAX_AGE_SECONDS", "60"))
+JOB_BOARD_ROLLUP_REBUILD_SECONDS = int(os.getenv("JOB_BOARD_ROLLUP_REBUILD_SECONDS", "86400"))
+# Postings are folded in once created this long ago, so ones still committing aren't skipped
+JOB_BOARD_ROLLUP_COMMIT_LAG_SECONDS = int(os.getenv("JOB_BOARD_ROLLUP_COMMIT_LAG_SECONDS", "300"))
+# Statement timeout for a refresh (any refresh may turn into a full rebuild)
+JOB_BOARD_ROLLUP_TIMEOUT_SECONDS = float(os.getenv("JOB_BOARD_ROLLUP_TIMEOUT_SECONDS", "600"))
+# How long a request for a board with no rollup waits for the first build before aggregating live
+JOB_BOARD_ROLLUP_BUILD_WAIT_SECONDS = float(os.getenv("JOB_BOARD_ROLLUP_BUILD_WAIT_SECONDS", "5"))
+
+FILTER_DIMENSIONS = ("city", "state", "country", "seniority", "employment_type", "employee_range")
+# Location filters only list their most common values
+CAPPED_DIMENSIONS = ("city", "state", "country")
+FILTER_VALUE_LIMIT = 50
+
+# days_ago values the filters endpoint reports counts for
+POSTED_WITHIN_DAYS = (1, 7, 30, 90)
+
+# Columns each job listing row returns; company fields come from core.company_card
+JOB_LISTING_COLUMNS = """
+    jp.id,
+    jp.domain as company_domain,
+    jp.title,
+    jp.job_function,
+    jp.url,
+    jp.location,
+    jp.city,
+    jp.state,
+    jp.country,
+    jp.seniority,
+    jp.employment_type,
+    jp.salary_min,
+    jp.salary_max,
+    jp.salary_currency,
+    jp.posted_at,
+    jp.created_at,
+    cc.company_description,
+    cc.company_tagline,
+    cc.company_revenue,
+    cc.company_revenue_range,
+    cc.company_funding,
+    cc.company_funding_range,
+    cc.company_employee_range,
+    cc.company_last_funding_type,
+    cc.company_investors
+"""
+
+ROLLUP_TABLE = "core.job_board_rollups"
+# Temp table fetch_live aggregates into when a board has no rollup yet
+LIVE_ROLLUP_TABLE = "job_board_live"
+
+# board domain -> refresh task, so concurrent stale reads share one refresh
+_inflight: dict = {}
+
+
+async def fetch_board_config(domain: str) -> Optional[dict]:
+    """reference.job_board_domains row with job_functions decoded, or None."""
+    row = await get_pool().fetchrow("""
+        SELECT job_functions, display_name, is_active
+        FROM reference.job_board_domains
+        WHERE domain = $1
+    """, domain)
+    if not row:
+        return None
+    config = dict(row)
+    # Handle JSONB - asyncpg may return string or parsed object
+    if isinstance(config["job_functions"], str):
+        config["job_functions"] = json.loads(config["job_functions"])
+    return config
+
+
+async def refresh_rollup(domain: str, full: bool = False) -> Optional[datetime]:
+    """Fold new postings into a board's rollup (or rebuild it). Returns refreshed_at."""
+    return await get_bulk_pool().fetchval(
+        "SELECT core.refresh_job_board_rollup($1, $2, $3, $4)",
+        domain, full, JOB_BOARD_ROLLUP_REBUILD_SECONDS, JOB_BOARD_ROLLUP_COMMIT_LAG_SECONDS,
+        timeout=JOB_BOARD_ROLLUP_TIMEOUT_SECONDS,
+    )
+
+
+def _refresh_in_background(domain: str) -> asyncio.Task:
+    task = _inflight.get(domain)
+    if task is None:
+        async def run():
+            try:
+                return await refresh_rollup(domain)
+            except Exception as e:
+                print(f"[JOB_BOARD_ROLLUP] refresh failed for {domain}: {e}")
+            finally:
+                _inflight.pop(domain, None)
+
+        task = asyncio.create_task(run())
+        _inflight[domain] = task
+    return task
+
+
+async def _fetch_state(domain: str) -> Optional[dict]:
+    row = await get_pool().fetchrow("""
+        SELECT total_jobs, min_salary, max_salary, refreshed_at
+        FROM core.job_board_rollup_state
+        WHERE board_domain = $1
+    """, domain)
+    return dict(row) if row else None
+
+
+def _is_built(state: Optional[dict]) -> bool:
+    return state is not None and state["refreshed_at"] is not None
+
+
+async def ensure_rollup(domain: str) -> Optional[dict]:
+    """
+    Rollup state for a board, refreshing it in the background if old.
+
+    A board with no rollup starts building one and waits up to
+    JOB_BOARD_ROLLUP_BUILD_WAIT_SECONDS for it, or for another replica that
+    holds the refresh lock to finish; returns None if it isn't ready by then.
+    """
+    state = await _fetch_state(domain)
+    if not _is_built(state):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + JOB_BOARD_ROLLUP_BUILD_WAIT_SECONDS
+        try:
+            await asyncio.wait_for(asyncio.shield(_refresh_in_background(domain)), JOB_BOARD_ROLLUP_BUILD_WAIT_SECONDS)
+        except asyncio.TimeoutError:
+            return None
+        state = await _fetch_state(domain)
+        # Our refresh returns at once if another replica is building it
+        while not _is_built(state) and loop.time() < deadline:
+            await asyncio.sleep(0.5)
+            state = await _fetch_state(domain)
+        return state if _is_built(state) else None
+
+    age = (datetime.now(timezone.utc) - state["refreshed_at"]).total_seconds()
+    if age > JOB_BOARD_ROLLUP_MAX_AGE_SECONDS:
+        _refresh_in_background(domain)
+    return state
+
+
+async def fetch_rollup_stats(domain: str, conn=None, source: str = ROLLUP_TABLE) -> dict:
+    """Headline counts, top locations and top companies from the rollup (or a live one, see fetch_live)."""
+    pool = conn or get_pool()
+    counts = await pool.fetchrow(f"""
+        SELECT
+            (SELECT COUNT(*) FROM {source}
+             WHERE board_domain = $1 AND dimension = 'company') AS unique_companies,
+            (SELECT COALESCE(SUM(job_count), 0) FROM {source}
+             WHERE board_domain = $1 AND dimension = 'posted_day'
+               AND value <> 'unknown' AND value >= (CURRENT_DATE - 7)::text) AS jobs_last_7_days,
+            (SELECT COALESCE(SUM(job_count), 0) FROM {source}
+             WHERE board_domain = $1 AND dimension = 'posted_day'
+               AND value <> 'unknown' AND value >= (CURRENT_DATE - 30)::text) AS jobs_last_30_days
+    """, domain)
+
+    top_locations = await pool.fetch(f"""
+        SELECT value AS location, job_count AS count
+        FROM {source}
+        WHERE board_domain = $1 AND dimension = 'location'
+        ORDER BY job_count DESC
+        LIMIT 10
+    """, domain)
+
+    top_companies = await pool.fetch(f"""
+        SELECT r.value AS domain, r.job_count, cd.description AS company_description
+        FROM (
+            SELECT value, job_count
+            FROM {source}
+            WHERE board_domain = $1 AND dimension = 'company'
+            ORDER BY job_count DESC
+            LIMIT 10
+        ) r
+        LEFT JOIN LATERAL (
+            SELECT description FROM core.company_descriptions WHERE domain = r.value LIMIT 1
+        ) cd ON true
+        ORDER BY r.job_count DESC
+    """, domain)
+
+    return {
+        "counts": dict(counts),
+        "top_locations": [dict(row) for row in top_locations],
+        "top_companies": [dict(row) for row in top_companies],
+    }
+
+
+async def fetch_rollup_filters(domain: str, conn=None, source: str = ROLLUP_TABLE) -> dict:
+    """Filter values with counts per dimension, plus posted-within counts (from the rollup or a live one)."""
+    pool = conn or get_pool()
+    rows = await pool.fetch(f"""
+        SELECT dimension, value, job_count
+        FROM (
+            SELECT
+                dimension, value, job_count,
+                row_number() OVER (PARTITION BY dimension ORDER BY job_count DESC, value) AS value_rank
+            FROM {source}
+            WHERE board_domain = $1 AND dimension = ANY($2::text[])
+        ) ranked
+        WHERE value_rank <= $3 OR NOT (dimension = ANY($4::text[]))
+        ORDER BY dimension, job_count DESC, value
+    """,
+        domain, list(FILTER_DIMENSIONS), FILTER_VALUE_LIMIT, list(CAPPED_DIMENSIONS),
+    )
+
+    values: dict = {dimension: [] for dimension in FILTER_DIMENSIONS}
+    for row in rows:
+        values[row["dimension"]].append({"value": row["value"], "count": row["job_count"]})
+
+    posted = await pool.fetch(f"""
+        SELECT days, COALESCE(SUM(r.job_count), 0) AS count
+        FROM unnest($2::int[]) AS days
+        LEFT JOIN {source} r
+            ON r.board_domain = $1
+           AND r.dimension = 'posted_day'
+           AND r.value <> 'unknown'
+           AND r.value >= (CURRENT_DATE - days)::text
+        GROUP BY days
+        ORDER BY days
+    """, domain, list(POSTED_WITHIN_DAYS))
+
+    values["posted_within"] = [{"days": row["days"], "count": row["count"]} for row in posted]
+    return values
+
+
+async def fetch_live(domain: str, job_functions: list, read) -> Tuple[dict, dict]:
+    """
+    Aggregate a board's postings live into a temp table shaped like
+    core.job_board_rollups and run read (fetch_rollup_stats or
+    fetch_rollup_filters) against it; for boards whose rollup isn't built
+    yet. Returns (state with refreshed_at None, read's result).
+    """
+    async with get_pool().acquire() as conn:
+        async with conn.transaction():
+            await conn.execute(f"""
+                CREATE TEMP TABLE {LIVE_ROLLUP_TABLE}
+                    (LIKE core.job_board_rollups) ON COMMIT DROP
+            """)
+            await conn.execute(f"""
+                INSERT INTO {LIVE_ROLLUP_TABLE} (board_domain, dimension, value, job_count)
+                SELECT $1, d.dimension, d.value, COUNT(*)
+                FROM core.company_job_postings jp
+                LEFT JOIN core.company_card cc ON cc.domain = jp.domain
+                CROSS JOIN LATERAL (VALUES
+                    ('city', jp.city),
+                    ('state', jp.state),
+                    ('country', jp.country),
+                    ('seniority', jp.seniority),
+                    ('employment_type', jp.employment_type),
+                    ('employee_range', cc.company_employee_range),
+                    ('location', COALESCE(jp.city, jp.state, jp.country, 'Unknown')),
+                    ('company', jp.domain),
+                    ('posted_day', COALESCE(jp.posted_at::date::text, 'unknown'))
+                ) AS d(dimension, value)
+                WHERE jp.job_function = ANY($2::text[]) AND d.value IS NOT NULL
+                GROUP BY d.dimension, d.value
+            """, domain, job_functions)
+            state = await conn.fetchrow("""
+                SELECT
+                    COUNT(*) AS total_jobs,
+                    MIN(salary_min) FILTER (WHERE salary_min IS NOT NULL AND salary_max IS NOT NULL) AS min_salary,
+                    MAX(salary_max) FILTER (WHERE salary_min IS NOT NULL AND salary_max IS NOT NULL) AS max_salary,
+                    NULL::timestamptz AS refreshed_at
+                FROM core.company_job_postings
+                WHERE job_function = ANY($1::text[])
+            """, job_functions)
+            return dict(state), await read(domain, conn, LIVE_ROLLUP_TABLE)
+
+
+def job_listing_where(job_functions: list, filters: dict) -> Tuple[str, list]:
+    """
+    WHERE clause and params for a board's postings. Text filters are
+    substring matches; employee_range matches core.company_card exactly.
+    Every filter is always present (NULL when unset, see sqlbuilder.py), so
+    the SQL text doesn't depend on which filters a request sets.
+    """
+    where = Predicates()
+    where.require("jp.job_function = ANY({}::text[])", job_functions)
+
+    for key, column in JOB_POSTING_SEARCH_COLUMNS.items():
+        term = filters.get(key)
+        where.optional(contains_clause(f"jp.{column}", "{}"), contains_pattern(term) if term else None)
+
+    where.optional("jp.salary_min >= {}", filters.get("salary_min") or None)
+    where.optional("jp.salary_max <= {}", filters.get("salary_max") or None)
+    where.optional("cc.company_employee_range = {}", filters.get("employee_range"))
+    where.optional("jp.posted_at >= NOW() - make_interval(days => {})", filters.get("days_ago") or None)
+
+    return where.where, where.params
+
+
+async def fetch_job_listings(job_functions: list, filters: dict, limit: int, offset: int) -> Tuple[List[dict], int]:
+    """One page of a board's postings with company card fields, plus the filtered total."""
+    where, params = job_listing_where(job_functions, filters)
+
+    async with custom_plans(get_pool()) as conn:
+        jobs = await conn.fetch(f"""
+            SELECT {JOB_LISTING_COLUMNS}
+            FROM core.company_job_postings jp
+            LEFT JOIN core.company_card cc ON cc.domain = jp.domain
+            WHERE {where}
+            ORDER BY jp.posted_at DESC NULLS LAST, jp.created_at DESC
+            LIMIT ${len(params) + 1} OFFSET ${len(params) + 2}
+        """, *params, limit, offset)
+
+        # The employee_range predicate is always present, so the count always
+        # joins the card; with employee_range unset the custom plan (see
+        # sqlbuilder.custom_plans) folds the predicate away and drops the
+        # join, since company_card is keyed by domain
+        total = await conn.fetchval(f"""
+            SELECT COUNT(*) FROM core.company_job_postings jp
+            LEFT JOIN core.company_card cc ON cc.domain = jp.domain
+            WHERE {where}
+        """, *params)
+
+    return [dict(job) for job in jobs], total
@@ -0,0 +1,147 @@
+"""
+Leads repository - core.leads queries on the asyncpg pool.
+
+Mirrors routers.leads.apply_lead_filters so the PostgREST and SQL paths
+return the same rows, without blocking the event loop on .execute().
+"""
+
+from datetime import date, datetime, timezone
+from typing import Optional, List, Tuple
+from db import get_pool
+import counts
+from counts import CountResult
+from pagination import fetch_page
+from search import LEAD_SEARCH_COLUMNS, contains_pattern, contains_clause
+
+LEAD_FIELDS = [
+    "person_id", "linkedin_url", "linkedin_slug", "full_name", "linkedin_url_type",
+    "person_city", "person_state", "person_country",
+    "matched_cleaned_job_title", "matched_job_function", "matched_seniority", "job_start_date",
+    "company_id", "company_domain", "company_name", "company_linkedin_url",
+    "company_city", "company_state", "company_country", "matched_industry", "employee_range",
+]
+
+# Stable sort key for cursor pagination
+LEAD_CURSOR_KEYS = ("person_id",)
+
+# Required fields - exclude leads missing any of these
+REQUIRED_FIELDS = [
+    "company_name", "company_country", "person_country", "matched_job_function",
+    "matched_seniority", "matched_cleaned_job_title", "matched_industry",
+]
+
+# param -> column, comma-separated values
+IN_FILTERS = {
+    "job_function": "matched_job_function",
+    "seniority": "matched_seniority",
+    "industry": "matched_industry",
+    "employee_range": "employee_range",
+}
+
+BUSINESS_MODEL_PREDICATES = {
+    "B2B": "is_b2b",
+    "B2C": "is_b2c",
+    "BOTH": "is_b2b AND is_b2c",
+}
+
+
+def row_to_dict(row):
+    """Convert asyncpg Record to dict, converting UUIDs to strings."""
+    d = dict(row)
+    for k, v in d.items():
+        if hasattr(v, 'hex'):  # UUID object
+            d[k] = str(v)
+    return d
+
+
+def _as_date(value):
+    return date.fromisoformat(value) if isinstance(value, str) else value
+
+
+def build_lead_filters(params: dict, business_model: Optional[str] = None, start_idx: int = 1) -> Tuple[List[str], list]:
+    """Build WHERE predicates and positional args for lead filters."""
+    clauses = [f"{col} IS NOT NULL" for col in REQUIRED_FIELDS]
+    # Exclude Miscellaneous job function from dashboard
+    clauses.append("matched_job_function <> 'Miscellaneous'")
+    args = []
+
+    def bind(value) -> str:
+        args.append(value)
+        return f"${start_idx + len(args) - 1}"
+
+    for key, col in IN_FILTERS.items():
+        if params.get(key):
+            clauses.append(f"{col} = ANY({bind(params[key].split(','))})")
+    # Substring filters (trigram-indexed)
+    for key, col in LEAD_SEARCH_COLUMNS.items():
+        if params.get(key):
+            clauses.append(contains_clause(col, bind(contains_pattern(params[key]))))
+    if params.get("company_domain"):
+        clauses.append(f"company_domain = {bind(params['company_domain'])}")
+    if params.get("job_start_date_gte"):
+        clauses.append(f"job_start_date >= {bind(_as_date(params['job_start_date_gte']))}")
+    if params.get("job_start_date_lte"):
+        clauses.append(f"job_start_date <= {bind(_as_date(params['job_start_date_lte']))}")
+    if business_model:
+        predicate = BUSINESS_MODEL_PREDICATES.get(business_model.upper(), "TRUE")
+        clauses.append(
+            f"company_domain IN (SELECT domain FROM core.company_business_model WHERE {predicate})"
+        )
+    return clauses, args
+
+
+async def fetch_leads(
+    params: dict,
+    business_model: Optional[str] = None,
+    limit: int = 50,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+) -> Tuple[List[dict], Optional[str]]:
+    """
+    Fetch a page of leads matching the filters.
+
+    With cursor=None this is plain LIMIT/OFFSET in planner order. Any string
+    cursor (empty for the first page) switches to keyset paging on person_id
+    and a next_cursor is returned while more rows remain.
+    """
+    clauses, args = build_lead_filters(params, business_model)
+    select_sql = f"SELECT {', '.join(LEAD_FIELDS)} FROM core.leads"
+    where = " AND ".join(clauses)
+
+    if cursor is None:
+        n = len(args)
+        rows = await get_pool().fetch(f"""
+            {select_sql}
+            WHERE {where}
+            LIMIT ${n + 1} OFFSET ${n + 2}
+        """, *args, limit, offset)
+        return [row_to_dict(row) for row in rows], None
+
+    rows, next_cursor = await fetch_page(
+        get_pool(), select_sql, where, args, LEAD_CURSOR_KEYS,
+        limit=limit, cursor=cursor,
+    )
+    return [row_to_dict(row) for row in rows], next_cursor
+
+
+async def count_leads(params: dict, business_model: Optional[str] = None, mode: str = "exact") -> CountResult:
+    """
+    Count leads matching the filters.
+
+    mode: exact (COUNT(*)), estimated (planner estimate) or cached
+    (exact, memoized per normalized filter set).
+    """
+    clauses, args = build_lead_filters(params, business_model)
+    where = " AND ".join(clauses)
+
+    if mode == "estimated":
+        total = await counts.estimated_count(f"SELECT 1 FROM core.leads WHERE {where}", *args)
+        return CountResult(total=total, mode="estimated")
+
+    count_query = f"SELECT COUNT(*) FROM core.leads WHERE {where}"
+    if mode == "cached":
+        key = counts.cache_key("core.leads", {**params, "business_model": business_model}, IN_FILTERS)
+        return await counts.cached_count(key, lambda: counts.exact_count(count_query, *args))
+
+    total = await counts.exact_count(count_query, *args)
+    return CountResult(total=total, mode="exact", counted_at=datetime.now(timezone.utc))
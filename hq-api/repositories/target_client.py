@@ -0,0 +1,173 @@
+"""
+Target client repository - set-based writes into target_client.* on the asyncpg pool.
+"""
+
+import uuid
+from typing import Optional, List
+from db import get_pool
+
+LEAD_COPY_COLUMNS = [
+    "id", "target_client_domain", "first_name", "last_name", "full_name",
+    "person_linkedin_url", "work_email", "company_domain",
+    "company_name", "company_linkedin_url", "source",
+    "form_id", "form_title", "core_company_id", "core_person_id",
+]
+
+
+async def _people_by_email(conn, emails: List[str]) -> dict:
+    if not emails:
+        return {}
+    rows = await conn.fetch("""
+        SELECT DISTINCT ON (work_email)
+            id, first_name, last_name, full_name, linkedin_url, work_email, company_domain
+        FROM core.people
+        WHERE work_email = ANY($1::text[])
+        ORDER BY work_email
+    """, emails)
+    return {row["work_email"]: row for row in rows}
+
+
+async def _people_by_linkedin(conn, linkedin_urls: List[str]) -> dict:
+    if not linkedin_urls:
+        return {}
+    rows = await conn.fetch("""
+        SELECT DISTINCT ON (linkedin_url)
+            id, first_name, last_name, full_name, linkedin_url, work_email
+        FROM core.people
+        WHERE linkedin_url = ANY($1::text[])
+        ORDER BY linkedin_url
+    """, linkedin_urls)
+    return {row["linkedin_url"]: row for row in rows}
+
+
+async def _companies_by_domain(conn, domains: List[str]) -> dict:
+    if not domains:
+        return {}
+    rows = await conn.fetch("""
+        SELECT DISTINCT ON (domain) id, domain, name, linkedin_url
+        FROM core.companies
+        WHERE domain = ANY($1::text[])
+        ORDER BY domain
+    """, domains)
+    return {row["domain"]: row for row in rows}
+
+
+async def link_leads_batch(
+    target_client_domain: str,
+    leads: list,
+    source: Optional[str],
+    form_id: Optional[str],
+    form_title: Optional[str],
+) -> List[dict]:
+    """
+    Resolve a batch of CSV leads against core.people / core.companies and
+    insert the matches into target_client.leads.
+
+    Same matching rules as linking one lead at a time (person by email, then
+    by LinkedIn URL; company by the given domain, else the person's domain),
+    but with one array lookup per key type and a single COPY for the inserts,
+    all in one transaction. Returns one result dict per input lead, in order.
+    """
+    normalized = []
+    for lead in leads:
+        normalized.append({
+            "company_domain": lead.company_domain.lower().strip().rstrip("/") if lead.company_domain else None,
+            "person_linkedin_url": lead.person_linkedin_url.strip() if lead.person_linkedin_url else None,
+            "person_email": lead.person_email.lower().strip() if lead.person_email else None,
+            "first_name": lead.first_name,
+            "last_name": lead.last_name,
+            "full_name": lead.full_name,
+        })
+
+    pool = get_pool()
+    async with pool.acquire() as conn:
+        async with conn.transaction():
+            by_email = await _people_by_email(
+                conn, list({n["person_email"] for n in normalized if n["person_email"]})
+            )
+            # LinkedIn is only a fallback for leads the email lookup missed
+            by_linkedin = await _people_by_linkedin(conn, list({
+                n["person_linkedin_url"] for n in normalized
+                if n["person_linkedin_url"] and n["person_email"] not in by_email
+            }))
+
+            domains = set()
+            for n in normalized:
+                if n["company_domain"]:
+                    domains.add(n["company_domain"])
+                else:
+                    person = by_email.get(n["person_email"])
+                    if person and person["company_domain"]:
+                        domains.add(person["company_domain"])
+            by_domain = await _companies_by_domain(conn, list(domains))
+
+            results = []
+            records = []
+            for idx, n in enumerate(normalized):
+                company_domain = n["company_domain"]
+                person_linkedin_url = n["person_linkedin_url"]
+                work_email = n["person_email"]
+                first_name = n["first_name"]
+                last_name = n["last_name"]
+                full_name = n["full_name"]
+
+                company = by_domain.get(company_domain) if company_domain else None
+
+                person = by_email.get(work_email) if work_email else None
+                if person:
+                    first_name = first_name or person["first_name"]
+                    last_name = last_name or person["last_name"]
+                    full_name = full_name or person["full_name"]
+                    person_linkedin_url = person_linkedin_url or person["linkedin_url"]
+                    # Also grab company_domain from person if not provided
+                    if not company_domain and person["company_domain"]:
+                        company_domain = person["company_domain"]
+                        company = by_domain.get(company_domain)
+                elif person_linkedin_url:
+                    person = by_linkedin.get(person_linkedin_url)
+                    if person:
+                        first_name = first_name or person["first_name"]
+                        last_name = last_name or person["last_name"]
+                        full_name = full_name or person["full_name"]
+                        work_email = work_email or person["work_email"]
+
+                # Must find at least person for CSV import
+                if not person:
+                    results.append({
+                        "index": idx,
+                        "success": False,
+                        "error": "No matching person found in core.people",
+                        "company_found": company is not None,
+                        "person_found": False,
+                    })
+                    continue
+
+                lead_id = uuid.uuid4()
+                records.append((
+                    lead_id, target_client_domain, first_name, last_name, full_name,
+                    person_linkedin_url, work_email, company_domain,
+                    company["name"] if company else None,
+                    company["linkedin_url"] if company else None,
+                    source, form_id, form_title,
+                    company["id"] if company else None,
+                    person["id"],
+                ))
+                results.append({
+                    "index": idx,
+                    "success": True,
+                    "lead_id": str(lead_id),
+                    "core_company_id": str(company["id"]) if company else None,
+                    "core_person_id": str(person["id"]),
+                    "company_found": company is not None,
+                    "person_found": True,
+                })
+
+            if records:
+                await conn.copy_records_to_table(
+                    "leads",
+                    schema_name="target_client",
+                    columns=LEAD_COPY_COLUMNS,
+                    records=records,
+                )
+
+    return results
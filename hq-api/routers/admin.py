@@ -1,7 +1,15 @@
-from fastapi import APIRouter, Query, HTTPException, Path
-from typing import Optional, List, Any, Literal
+import json
+from fastapi import APIRouter, Query, HTTPException, Path, BackgroundTasks
+from typing import Optional, List, Any
+from datetime import datetime
 from pydantic import BaseModel
 from db import get_pool
+from pagination import fetch_page
+from sqlbuilder import Predicates, custom_plans
+import counts
+import gaps
+import querylog
+from gaps import GapRecipe, GAP_RECIPES, RECIPES_BY_ID
 
 router = APIRouter(prefix="/api/admin", tags=["admin"])
 
@@ -10,12 +18,44 @@ class PaginationMeta(BaseModel):
     total: int
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
 
 
 class TableCountResponse(BaseModel):
     schema_name: str
     table_name: str
-    count: int
+    # None when the count failed (only in /counts, which reports `error` instead)
+    count: Optional[int] = None
+    count_mode: str = "exact"
+    count_stale: bool = False
+    counted_at: Optional[datetime] = None
+    error: Optional[str] = None
+
+
+class TableCountsResponse(BaseModel):
+    count_mode: str
+    counts: List[TableCountResponse]
+
+
+# Shared `count` query parameter for the table count endpoints
+COUNT_MODE_QUERY = Query(
+    "estimated",
+    pattern="^(exact|estimated|cached)$",
+    description="estimated (default, from table statistics), cached (exact, refreshed after a TTL) or exact",
+)
+
+
+async def table_count_response(full_name: str, mode: str) -> TableCountResponse:
+    schema_name, table_name = full_name.split(".", 1)
+    counted = await counts.table_count(full_name, mode)
+    return TableCountResponse(
+        schema_name=schema_name,
+        table_name=table_name,
+        count=counted.total,
+        count_mode=counted.mode,
+        count_stale=counted.stale,
+        counted_at=counted.counted_at,
+    )
 
 
 class TableDataResponse(BaseModel):
@@ -29,20 +69,6 @@ class TableDataResponse(BaseModel):
 # Gap Analysis Recipes
 # ============================================================
 
-class GapRecipe(BaseModel):
-    id: str
-    label: str
-    description: str
-    source_table: str
-    target_table: str
-    join_column: str
-    comparison: Literal["not_in_target", "in_target"]
-    priority: Literal["P0", "P1", "P2", "P3"]
-    # Optional: how to join for country filtering. Format: "location_table:join_col:country_col"
-    # e.g., "core.company_locations:domain:country" means JOIN core.company_locations ON domain, filter by country
-    country_join: Optional[str] = None
-
-
 class GapRecipeListResponse(BaseModel):
     recipes: List[GapRecipe]
 
@@ -50,178 +76,73 @@ class GapRecipeListResponse(BaseModel):
 class GapCountResponse(BaseModel):
     recipe_id: str
     label: str
-    count: int
+    count: Optional[int] = None
     source_table: str
     target_table: str
+    computed_at: Optional[datetime] = None
+    refresh_queued: bool = False
 
 
 class GapSampleResponse(BaseModel):
     recipe_id: str
     label: str
-    count: int
+    count: Optional[int] = None
     sample: List[dict]
     limit: int
+    computed_at: Optional[datetime] = None
+    refresh_queued: bool = False
 
 
-# Define all gap recipes
-GAP_RECIPES: List[GapRecipe] = [
-    # P0 - Pipeline health: extraction to core
-    GapRecipe(
-        id="extracted-companies-not-in-core",
-        label="Companies stuck in extraction",
-        description="Companies in extracted.company_discovery that haven't made it to core.companies. These may have data quality issues preventing promotion to core.",
-        source_table="extracted.company_discovery",
-        target_table="core.companies",
-        join_column="domain",
-        comparison="not_in_target",
-        priority="P0"
-    ),
-    GapRecipe(
-        id="extracted-people-not-in-core",
-        label="People stuck in extraction",
-        description="People in extracted.person_discovery that haven't made it to core.people. These may be missing required fields or have invalid LinkedIn URLs.",
-        source_table="extracted.person_discovery",
-        target_table="core.people",
-        join_column="linkedin_url",
-        comparison="not_in_target",
-        priority="P0"
-    ),
-    # P1 - Data quality: core records missing enrichment
-    GapRecipe(
-        id="companies-missing-industry",
-        label="Companies missing industry",
-        description="Companies in core.companies that don't have an industry classification in core.company_industries.",
-        source_table="core.companies",
-        target_table="core.company_industries",
-        join_column="domain",
-        comparison="not_in_target",
-        priority="P1"
-    ),
-    GapRecipe(
-        id="companies-missing-location",
-        label="Companies missing location",
-        description="Companies in core.companies that don't have location data in core.company_locations.",
-        source_table="core.companies",
-        target_table="core.company_locations",
-        join_column="domain",
-        comparison="not_in_target",
-        priority="P1"
-    ),
-    GapRecipe(
-        id="people-missing-job-title",
-        label="People missing job title",
-        description="People in core.people that don't have job title data in core.person_job_titles.",
-        source_table="core.people",
-        target_table="core.person_job_titles",
-        join_column="linkedin_url",
-        comparison="not_in_target",
-        priority="P1"
-    ),
-    GapRecipe(
-        id="people-missing-location",
-        label="People missing location",
-        description="People in core.people that don't have location data in core.person_locations.",
-        source_table="core.people",
-        target_table="core.person_locations",
-        join_column="linkedin_url",
-        comparison="not_in_target",
-        priority="P1"
-    ),
-    # P2 - Additional data quality gaps
-    GapRecipe(
-        id="companies-missing-description",
-        label="Companies missing description",
-        description="Companies in core.companies that don't have a description in core.company_descriptions.",
-        source_table="core.companies",
-        target_table="core.company_descriptions",
-        join_column="domain",
-        comparison="not_in_target",
-        priority="P2"
-    ),
-    GapRecipe(
-        id="companies-missing-employee-range",
-        label="Companies missing employee range",
-        description="Companies in core.companies that don't have employee range data in core.company_employee_range.",
-        source_table="core.companies",
-        target_table="core.company_employee_range",
-        join_column="domain",
-        comparison="not_in_target",
-        priority="P2"
-    ),
-    GapRecipe(
-        id="people-missing-tenure",
-        label="People missing tenure",
-        description="People in core.people that don't have job start date/tenure data in core.person_tenure.",
-        source_table="core.people",
-        target_table="core.person_tenure",
-        join_column="linkedin_url",
-        comparison="not_in_target",
-        priority="P2"
-    ),
-    GapRecipe(
-        id="customers-without-find-similar",
-        label="Customer companies not enriched with find-similar",
-        description="Unique customer domains from core.company_customers that haven't had find-similar-companies run on them yet.",
-        source_table="core.company_customers",
-        target_table="extracted.company_enrich_similar",
-        join_column="customer_domain:input_domain",  # Special syntax: source_col:target_col
-        comparison="not_in_target",
-        priority="P2"
-    ),
-    # P3 - VC-backed companies gaps
-    GapRecipe(
-        id="vc-backed-without-customers",
-        label="VC-backed companies without customers",
-        description="Companies that have raised VC funding but we haven't yet identified their customers.",
-        source_table="core.company_vc_backed",
-        target_table="core.company_customers",
-        join_column="domain:origin_company_domain",
-        comparison="not_in_target",
-        priority="P3",
-        country_join="core.company_locations:domain:country"
-    ),
-]
-
-# Index recipes by ID for fast lookup
-RECIPES_BY_ID = {r.id: r for r in GAP_RECIPES}
-
-
-def parse_join_columns(join_column: str) -> tuple[str, str]:
-    """Parse join_column which may be 'col' or 'source_col:target_col'."""
-    if ":" in join_column:
-        source_col, target_col = join_column.split(":")
-        return source_col, target_col
-    return join_column, join_column
-
-
-def build_country_filter(country_join: Optional[str], country: Optional[str], source_col: str) -> tuple[str, str]:
-    """
-    Build JOIN and WHERE clauses for country filtering.
+class GapSnapshotEntry(BaseModel):
+    recipe_id: str
+    country: str
+    count: int
+    computed_at: datetime
+    duration_ms: Optional[int] = None
 
-    country_join format: "location_table:join_col:country_col"
-    country values: None (no filter), "United States", "not United States"
 
-    Returns: (join_clause, where_clause)
-    """
-    if not country_join or not country:
-        return "", ""
+class GapSnapshotListResponse(BaseModel):
+    snapshots: List[GapSnapshotEntry]
 
-    parts = country_join.split(":")
-    if len(parts) != 3:
-        return "", ""
 
-    location_table, join_col, country_col = parts
+class GapTrendPoint(BaseModel):
+    computed_at: datetime
+    count: int
 
-    join_clause = f"INNER JOIN {location_table} loc ON loc.{join_col} = s.{source_col}"
 
-    if country == "United States":
-        where_clause = f"AND loc.{country_col} = 'United States'"
-    elif country == "not United States":
-        where_clause = f"AND loc.{country_col} != 'United States' AND loc.{country_col} IS NOT NULL"
-    else:
-        where_clause = ""
+class GapTrendResponse(BaseModel):
+    recipe_id: str
+    label: str
+    country: str
+    days: int
+    series: List[GapTrendPoint]
+
+
+def get_recipe(recipe_id: str) -> GapRecipe:
+    if recipe_id not in RECIPES_BY_ID:
+        raise HTTPException(status_code=404, detail=f"Recipe '{recipe_id}' not found")
+    return RECIPES_BY_ID[recipe_id]
+
+
+def get_country_scope(recipe: GapRecipe, country: Optional[str]) -> str:
+    try:
+        return gaps.country_scope(recipe, country)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 
-    return join_clause, where_clause
+async def get_gap_count(recipe: GapRecipe, scope: str, fresh: bool) -> tuple[Optional[int], Optional[datetime], bool]:
+    """
+    Gap count and timestamp from the latest snapshot (None, None before the
+    first one), and whether a recompute was queued: on request, or because
+    there is no snapshot yet.
+    """
+    snapshot = await gaps.latest_snapshot(recipe.id, scope)
+    if fresh or not snapshot:
+        gaps.queue_refresh(recipe)
+    if not snapshot:
+        return None, None, True
+    return snapshot["gap_count"], snapshot["computed_at"], fresh
 
 
 @router.get("/gaps/recipes", response_model=GapRecipeListResponse, tags=["gaps"])
@@ -233,56 +154,29 @@ async def get_gap_recipes():
 @router.get("/gaps/recipes/{recipe_id}/count", response_model=GapCountResponse, tags=["gaps"])
 async def get_gap_recipe_count(
     recipe_id: str = Path(..., description="The recipe ID"),
-    country: Optional[str] = Query(None, description="Filter by country: 'United States', 'not United States', or omit for all")
+    country: Optional[str] = Query(None, description="Filter by country: 'United States', 'not United States', or omit for all"),
+    fresh: bool = Query(False, description="Queue a recompute of the recipe; the response still serves the latest snapshot"),
 ):
-    """Get the count of records matching a gap recipe, optionally filtered by country."""
-    if recipe_id not in RECIPES_BY_ID:
-        raise HTTPException(status_code=404, detail=f"Recipe '{recipe_id}' not found")
-
-    recipe = RECIPES_BY_ID[recipe_id]
-    pool = get_pool()
-
-    # Parse join columns (handles both 'col' and 'source_col:target_col' formats)
-    source_col, target_col = parse_join_columns(recipe.join_column)
-
-    # Build country filter if applicable
-    country_join_clause, country_where_clause = build_country_filter(
-        recipe.country_join, country, source_col
-    )
-
-    if recipe.comparison == "not_in_target":
-        query = f"""
-            SELECT COUNT(*) FROM {recipe.source_table} s
-            {country_join_clause}
-            WHERE s.{source_col} IS NOT NULL
-            AND s.{source_col} != ''
-            {country_where_clause}
-            AND NOT EXISTS (
-                SELECT 1 FROM {recipe.target_table} t
-                WHERE t.{target_col} = s.{source_col}
-            )
-        """
-    else:  # in_target
-        query = f"""
-            SELECT COUNT(*) FROM {recipe.source_table} s
-            {country_join_clause}
-            WHERE s.{source_col} IS NOT NULL
-            AND s.{source_col} != ''
-            {country_where_clause}
-            AND EXISTS (
-                SELECT 1 FROM {recipe.target_table} t
-                WHERE t.{target_col} = s.{source_col}
-            )
-        """
+    """
+    Get the count of records matching a gap recipe, optionally filtered by country.
 
-    count = await pool.fetchval(query)
+    Served from the latest gap snapshot (see `computed_at`). `fresh=true`
+    queues a recompute in the background (`refresh_queued`); poll until
+    `computed_at` moves. Before a recipe's first snapshot, `count` is null
+    and a recompute is queued.
+    """
+    recipe = get_recipe(recipe_id)
+    scope = get_country_scope(recipe, country)
+    count, computed_at, refresh_queued = await get_gap_count(recipe, scope, fresh)
 
     return GapCountResponse(
         recipe_id=recipe.id,
         label=recipe.label,
         count=count,
         source_table=recipe.source_table,
-        target_table=recipe.target_table
+        target_table=recipe.target_table,
+        computed_at=computed_at,
+        refresh_queued=refresh_queued,
     )
 
 
@@ -290,63 +184,166 @@ async def get_gap_recipe_count(
 async def get_gap_recipe_sample(
     recipe_id: str = Path(..., description="The recipe ID"),
     limit: int = Query(10, ge=1, le=100, description="Number of sample records to return"),
-    country: Optional[str] = Query(None, description="Filter by country: 'United States', 'not United States', or omit for all")
+    country: Optional[str] = Query(None, description="Filter by country: 'United States', 'not United States', or omit for all"),
+    fresh: bool = Query(False, description="Queue a recompute of the count; the response still serves the latest snapshot"),
 ):
-    """Get sample records matching a gap recipe, optionally filtered by country."""
-    if recipe_id not in RECIPES_BY_ID:
-        raise HTTPException(status_code=404, detail=f"Recipe '{recipe_id}' not found")
+    """
+    Get sample records matching a gap recipe, optionally filtered by country.
 
-    recipe = RECIPES_BY_ID[recipe_id]
+    The sample is read live; the count comes from the latest gap snapshot
+    (`fresh=true` queues a recompute, as for /count).
+    """
+    recipe = get_recipe(recipe_id)
+    scope = get_country_scope(recipe, country)
     pool = get_pool()
 
-    # Parse join columns (handles both 'col' and 'source_col:target_col' formats)
-    source_col, target_col = parse_join_columns(recipe.join_column)
+    query = gaps.gap_query(recipe, "s.*", country if scope != gaps.ALL_COUNTRIES else None) + " LIMIT $1"
+    rows = await pool.fetch(query, limit)
+    count, computed_at, refresh_queued = await get_gap_count(recipe, scope, fresh)
 
-    # Build country filter if applicable
-    country_join_clause, country_where_clause = build_country_filter(
-        recipe.country_join, country, source_col
+    return GapSampleResponse(
+        recipe_id=recipe.id,
+        label=recipe.label,
+        count=count,
+        sample=[row_to_dict(row) for row in rows],
+        limit=limit,
+        computed_at=computed_at,
+        refresh_queued=refresh_queued,
     )
 
-    # Build the query based on comparison type
-    if recipe.comparison == "not_in_target":
-        query = f"""
-            SELECT s.* FROM {recipe.source_table} s
-            {country_join_clause}
-            WHERE s.{source_col} IS NOT NULL
-            AND s.{source_col} != ''
-            {country_where_clause}
-            AND NOT EXISTS (
-                SELECT 1 FROM {recipe.target_table} t
-                WHERE t.{target_col} = s.{source_col}
-            )
-            LIMIT $1
-        """
-    else:  # in_target
-        query = f"""
-            SELECT s.* FROM {recipe.source_table} s
-            {country_join_clause}
-            WHERE s.{source_col} IS NOT NULL
-            AND s.{source_col} != ''
-            {country_where_clause}
-            AND EXISTS (
-                SELECT 1 FROM {recipe.target_table} t
-                WHERE t.{target_col} = s.{source_col}
-            )
-            LIMIT $1
-        """
 
-    rows = await pool.fetch(query, limit)
+@router.get("/gaps/snapshots", response_model=GapSnapshotListResponse, tags=["gaps"])
+async def get_gap_snapshots():
+    """Latest snapshot count for every recipe and country split, for the dashboard in one call."""
+    rows = await gaps.latest_snapshots()
+    return GapSnapshotListResponse(snapshots=[
+        GapSnapshotEntry(
+            recipe_id=row["recipe_id"], country=row["country"], count=row["gap_count"],
+            computed_at=row["computed_at"], duration_ms=row["duration_ms"],
+        )
+        for row in rows
+    ])
 
-    # Get count too (remove LIMIT for count)
-    count_query = query.replace("SELECT s.*", "SELECT COUNT(*)").replace("LIMIT $1", "")
-    count = await pool.fetchval(count_query)
 
-    return GapSampleResponse(
+@router.post("/gaps/snapshots/refresh", tags=["gaps"])
+async def refresh_gap_snapshots(background_tasks: BackgroundTasks):
+    """Snapshot every recipe in the background; new counts show up in /gaps/snapshots when done."""
+    background_tasks.add_task(gaps.run_snapshot)
+    return {"status": "accepted", "recipes": len(GAP_RECIPES)}
+
+
+@router.get("/gaps/recipes/{recipe_id}/trend", response_model=GapTrendResponse, tags=["gaps"])
+async def get_gap_recipe_trend(
+    recipe_id: str = Path(..., description="The recipe ID"),
+    country: Optional[str] = Query(None, description="Filter by country: 'United States', 'not United States', or omit for all"),
+    days: int = Query(30, ge=1, le=365, description="How far back to go"),
+):
+    """Gap size over time for a recipe, one point per stored snapshot, oldest first."""
+    recipe = get_recipe(recipe_id)
+    scope = get_country_scope(recipe, country)
+    rows = await gaps.trend(recipe.id, scope, days)
+
+    return GapTrendResponse(
         recipe_id=recipe.id,
         label=recipe.label,
-        count=count,
-        sample=[row_to_dict(row) for row in rows],
-        limit=limit
+        country=scope,
+        days=days,
+        series=[GapTrendPoint(computed_at=row["computed_at"], count=row["gap_count"]) for row in rows],
+    )
+
+
+# ============================================================
+# Slow Queries
+# ============================================================
+
+class SlowQueryStats(BaseModel):
+    fingerprint_id: str
+    fingerprint: str
+    pools: List[str]
+    calls: int
+    errors: int
+    slow_calls: int
+    total_ms: float
+    mean_ms: float
+    max_ms: float
+    mean_rows: Optional[float] = None
+    last_plan_at: Optional[datetime] = None
+
+
+class SlowQueryListResponse(BaseModel):
+    threshold_ms: float
+    order_by: str
+    queries: List[SlowQueryStats]
+
+
+class SlowQueryPlan(BaseModel):
+    id: int
+    pool: str
+    duration_ms: float
+    analyzed: bool
+    captured_at: datetime
+    plan: Any
+
+
+class SlowQueryPlansResponse(BaseModel):
+    fingerprint_id: str
+    fingerprint: Optional[str] = None
+    plans: List[SlowQueryPlan]
+
+
+@router.get("/slow-queries", response_model=SlowQueryListResponse, tags=["slow-queries"])
+async def get_slow_queries(
+    order_by: str = Query("total_ms", pattern="^(total_ms|mean_ms|max_ms|calls)$", description="Ranking: total_ms (default), mean_ms, max_ms or calls"),
+    limit: int = Query(50, ge=1, le=500),
+):
+    """
+    Top query shapes on this API instance since it started, ranked by total time by default.
+    last_plan_at is the newest EXPLAIN plan captured for the shape, if any (see /slow-queries/{id}/plans).
+    """
+    queries = querylog.top_queries(order_by, limit)
+
+    last_plans = {}
+    if queries:
+        rows = await get_pool().fetch("""
+            SELECT fingerprint_id, MAX(captured_at) AS last_plan_at
+            FROM hq.slow_query_plans
+            WHERE fingerprint_id = ANY($1)
+            GROUP BY fingerprint_id
+        """, [q["fingerprint_id"] for q in queries])
+        last_plans = {row["fingerprint_id"]: row["last_plan_at"] for row in rows}
+
+    return SlowQueryListResponse(
+        threshold_ms=querylog.SLOW_QUERY_THRESHOLD_MS,
+        order_by=order_by,
+        queries=[SlowQueryStats(**q, last_plan_at=last_plans.get(q["fingerprint_id"])) for q in queries],
+    )
+
+
+@router.get("/slow-queries/{fingerprint_id}/plans", response_model=SlowQueryPlansResponse, tags=["slow-queries"])
+async def get_slow_query_plans(
+    fingerprint_id: str = Path(..., description="fingerprint_id from /slow-queries"),
+    limit: int = Query(5, ge=1, le=50),
+):
+    """Captured EXPLAIN plans for a query shape, newest first."""
+    rows = await get_pool().fetch("""
+        SELECT id, fingerprint, pool, duration_ms, analyzed, captured_at, plan
+        FROM hq.slow_query_plans
+        WHERE fingerprint_id = $1
+        ORDER BY captured_at DESC
+        LIMIT $2
+    """, fingerprint_id, limit)
+
+    return SlowQueryPlansResponse(
+        fingerprint_id=fingerprint_id,
+        fingerprint=rows[0]["fingerprint"] if rows else None,
+        plans=[
+            SlowQueryPlan(
+                id=row["id"], pool=row["pool"], duration_ms=float(row["duration_ms"]),
+                analyzed=row["analyzed"], captured_at=row["captured_at"],
+                plan=json.loads(row["plan"]) if isinstance(row["plan"], str) else row["plan"],
+            )
+            for row in rows
+        ],
     )
 
 
@@ -477,15 +474,9 @@ def row_to_dict(row):
 # ============================================================
 
 @router.get("/extracted/company_discovery/count", response_model=TableCountResponse)
-async def get_extracted_company_discovery_count():
+async def get_extracted_company_discovery_count(count: str = COUNT_MODE_QUERY):
     """Get count of records in extracted.company_discovery."""
-    pool = get_pool()
-    count = await pool.fetchval("SELECT COUNT(*) FROM extracted.company_discovery")
-    return TableCountResponse(
-        schema_name="extracted",
-        table_name="company_discovery",
-        count=count
-    )
+    return await table_count_response("extracted.company_discovery", count)
 
 
 @router.get("/extracted/company_discovery", response_model=TableDataResponse)
@@ -499,67 +490,39 @@ async def get_extracted_company_discovery(
     has_country: Optional[bool] = Query(None, description="Filter by has_country flag"),
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.next_cursor (overrides offset)"),
 ):
     """Get records from extracted.company_discovery with optional filters."""
-    pool = get_pool()
-
-    # Build WHERE clause
-    conditions = []
-    params = []
-    param_idx = 1
-
-    if domain:
-        conditions.append(f"domain = ${param_idx}")
-        params.append(domain)
-        param_idx += 1
-    if name:
-        conditions.append(f"name ILIKE ${param_idx}")
-        params.append(f"%{name}%")
-        param_idx += 1
-    if matched_industry:
-        conditions.append(f"matched_industry = ${param_idx}")
-        params.append(matched_industry)
-        param_idx += 1
-    if matched_country:
-        conditions.append(f"matched_country = ${param_idx}")
-        params.append(matched_country)
-        param_idx += 1
-    if has_city is not None:
-        conditions.append(f"has_city = ${param_idx}")
-        params.append(has_city)
-        param_idx += 1
-    if has_state is not None:
-        conditions.append(f"has_state = ${param_idx}")
-        params.append(has_state)
-        param_idx += 1
-    if has_country is not None:
-        conditions.append(f"has_country = ${param_idx}")
-        params.append(has_country)
-        param_idx += 1
-
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-
-    # Get count
-    count_query = f"SELECT COUNT(*) FROM extracted.company_discovery WHERE {where_clause}"
-    total = await pool.fetchval(count_query, *params)
-
-    # Get data
-    data_query = f"""
-        SELECT id, domain, name, linkedin_url, size, type, country, location,
-               industry, matched_industry, city, state, matched_city, matched_state, matched_country,
-               has_city, has_state, has_country, created_at, updated_at
-        FROM extracted.company_discovery
-        WHERE {where_clause}
-        ORDER BY created_at DESC
-        LIMIT ${param_idx} OFFSET ${param_idx + 1}
-    """
-    rows = await pool.fetch(data_query, *params, limit, offset)
+    async with custom_plans(get_pool()) as conn:
+        # Build WHERE clause
+        filters = Predicates()
+        filters.optional("domain = {}", domain)
+        filters.substring("name", name)
+        filters.optional("matched_industry = {}", matched_industry)
+        filters.optional("matched_country = {}", matched_country)
+        filters.optional("has_city = {}", has_city)
+        filters.optional("has_state = {}", has_state)
+        filters.optional("has_country = {}", has_country)
+
+        where_clause, params = filters.where, filters.params
+
+        # Get count
+        count_query = f"SELECT COUNT(*) FROM extracted.company_discovery WHERE {where_clause}"
+        total = await conn.fetchval(count_query, *params)
+
+        # Get data
+        rows, next_cursor = await fetch_page(conn, """
+            SELECT id, domain, name, linkedin_url, size, type, country, location,
+                   industry, matched_industry, city, state, matched_city, matched_state, matched_country,
+                   has_city, has_state, has_country, created_at, updated_at
+            FROM extracted.company_discovery
+        """, where_clause, params, ("created_at", "id"), limit=limit, offset=offset, cursor=cursor, descending=True)
 
     return TableDataResponse(
         schema_name="extracted",
         table_name="company_discovery",
         data=[row_to_dict(row) for row in rows],
-        meta=PaginationMeta(total=total, limit=limit, offset=offset)
+        meta=PaginationMeta(total=total, limit=limit, offset=offset, next_cursor=next_cursor)
     )
 
 
@@ -568,15 +531,9 @@ async def get_extracted_company_discovery(
 # ============================================================
 
 @router.get("/core/companies/count", response_model=TableCountResponse)
-async def get_core_companies_count():
+async def get_core_companies_count(count: str = COUNT_MODE_QUERY):
     """Get count of records in core.companies."""
-    pool = get_pool()
-    count = await pool.fetchval("SELECT COUNT(*) FROM core.companies")
-    return TableCountResponse(
-        schema_name="core",
-        table_name="companies",
-        count=count
-    )
+    return await table_count_response("core.companies", count)
 
 
 # ============================================================
@@ -788,9 +745,12 @@ ALLOWED_TABLES = {
     "raw.vc_portfolio_payloads",
 }
 
+# Every table /counts reports (the dedicated count endpoints' tables are all allowed too)
+TRACKED_COUNT_TABLES = sorted(ALLOWED_TABLES)
+
 
 @router.get("/tables/{schema_name}/{table_name}/count", response_model=TableCountResponse)
-async def get_table_count(schema_name: str, table_name: str):
+async def get_table_count(schema_name: str, table_name: str, count: str = COUNT_MODE_QUERY):
     """Get count of records in a table. Limited to allowed tables for security."""
     full_name = f"{schema_name}.{table_name}"
 
@@ -800,14 +760,32 @@ async def get_table_count(schema_name: str, table_name: str):
             detail=f"Table {full_name} not in allowed list. Allowed: {sorted(ALLOWED_TABLES)}"
         )
 
-    pool = get_pool()
-    count = await pool.fetchval(f"SELECT COUNT(*) FROM {schema_name}.{table_name}")
+    return await table_count_response(full_name, count)
 
-    return TableCountResponse(
-        schema_name=schema_name,
-        table_name=table_name,
-        count=count
-    )
+
+@router.get("/counts", response_model=TableCountsResponse)
+async def get_all_table_counts(count: str = COUNT_MODE_QUERY):
+    """
+    Counts for every tracked admin table in one round trip.
+
+    The default estimated mode reads catalog statistics for all tables in a
+    single query; cached and exact run the COUNT(*)s a few at a time. A
+    table whose count fails is listed with a null count and its `error`.
+    """
+    results = await counts.table_counts(TRACKED_COUNT_TABLES, count)
+    entries = []
+    for full_name, counted in results.items():
+        schema_name, table_name = full_name.split(".", 1)
+        entries.append(TableCountResponse(
+            schema_name=schema_name,
+            table_name=table_name,
+            count=counted.total,
+            count_mode=counted.mode,
+            count_stale=counted.stale,
+            counted_at=counted.counted_at,
+            error=counted.error,
+        ))
+    return TableCountsResponse(count_mode=count, counts=entries)
 
 
 # ============================================================
@@ -819,15 +797,9 @@ async def get_table_count(schema_name: str, table_name: str):
 # ------------------------------------------------------------
 
 @router.get("/core/people/count", response_model=TableCountResponse)
-async def get_core_people_count():
+async def get_core_people_count(count: str = COUNT_MODE_QUERY):
     """Get count of records in core.people."""
-    pool = get_pool()
-    count = await pool.fetchval("SELECT COUNT(*) FROM core.people")
-    return TableCountResponse(
-        schema_name="core",
-        table_name="people",
-        count=count
-    )
+    return await table_count_response("core.people", count)
 
 
 # ------------------------------------------------------------
@@ -835,15 +807,9 @@ async def get_core_people_count():
 # ------------------------------------------------------------
 
 @router.get("/core/company_customers/count", response_model=TableCountResponse)
-async def get_core_company_customers_count():
+async def get_core_company_customers_count(count: str = COUNT_MODE_QUERY):
     """Get count of records in core.company_customers."""
-    pool = get_pool()
-    count = await pool.fetchval("SELECT COUNT(*) FROM core.company_customers")
-    return TableCountResponse(
-        schema_name="core",
-        table_name="company_customers",
-        count=count
-    )
+    return await table_count_response("core.company_customers", count)
 
 
 @router.get("/core/company_customers", response_model=TableDataResponse)
@@ -855,55 +821,33 @@ async def get_core_company_customers(
     source: Optional[str] = Query(None, description="Filter by source"),
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.next_cursor (overrides offset)"),
 ):
     """Get records from core.company_customers with optional filters."""
-    pool = get_pool()
+    async with custom_plans(get_pool()) as conn:
+        filters = Predicates()
+        filters.optional("origin_company_domain = {}", origin_company_domain)
+        filters.optional("customer_domain = {}", customer_domain)
+        filters.substring("customer_name", customer_name)
+        filters.optional("has_case_study = {}", has_case_study)
+        filters.optional("source = {}", source)
 
-    conditions = []
-    params = []
-    param_idx = 1
-
-    if origin_company_domain:
-        conditions.append(f"origin_company_domain = ${param_idx}")
-        params.append(origin_company_domain)
-        param_idx += 1
-    if customer_domain:
-        conditions.append(f"customer_domain = ${param_idx}")
-        params.append(customer_domain)
-        param_idx += 1
-    if customer_name:
-        conditions.append(f"customer_name ILIKE ${param_idx}")
-        params.append(f"%{customer_name}%")
-        param_idx += 1
-    if has_case_study is not None:
-        conditions.append(f"has_case_study = ${param_idx}")
-        params.append(has_case_study)
-        param_idx += 1
-    if source:
-        conditions.append(f"source = ${param_idx}")
-        params.append(source)
-        param_idx += 1
-
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-
-    count_query = f"SELECT COUNT(*) FROM core.company_customers WHERE {where_clause}"
-    total = await pool.fetchval(count_query, *params)
-
-    data_query = f"""
-        SELECT id, origin_company_domain, origin_company_name, customer_name, customer_domain,
-               case_study_url, has_case_study, source, created_at, updated_at
-        FROM core.company_customers
-        WHERE {where_clause}
-        ORDER BY created_at DESC
-        LIMIT ${param_idx} OFFSET ${param_idx + 1}
-    """
-    rows = await pool.fetch(data_query, *params, limit, offset)
+        where_clause, params = filters.where, filters.params
+
+        count_query = f"SELECT COUNT(*) FROM core.company_customers WHERE {where_clause}"
+        total = await conn.fetchval(count_query, *params)
+
+        rows, next_cursor = await fetch_page(conn, """
+            SELECT id, origin_company_domain, origin_company_name, customer_name, customer_domain,
+                   case_study_url, has_case_study, source, created_at, updated_at
+            FROM core.company_customers
+        """, where_clause, params, ("created_at", "id"), limit=limit, offset=offset, cursor=cursor, descending=True)
 
     return TableDataResponse(
         schema_name="core",
         table_name="company_customers",
         data=[row_to_dict(row) for row in rows],
-        meta=PaginationMeta(total=total, limit=limit, offset=offset)
+        meta=PaginationMeta(total=total, limit=limit, offset=offset, next_cursor=next_cursor)
     )
 
 
@@ -912,15 +856,9 @@ async def get_core_company_customers(
 # ------------------------------------------------------------
 
 @router.get("/core/person_work_history/count", response_model=TableCountResponse)
-async def get_core_person_work_history_count():
+async def get_core_person_work_history_count(count: str = COUNT_MODE_QUERY):
     """Get count of records in core.person_work_history."""
-    pool = get_pool()
-    count = await pool.fetchval("SELECT COUNT(*) FROM core.person_work_history")
-    return TableCountResponse(
-        schema_name="core",
-        table_name="person_work_history",
-        count=count
-    )
+    return await table_count_response("core.person_work_history", count)
 
 
 @router.get("/core/person_work_history", response_model=TableDataResponse)
@@ -933,60 +871,35 @@ async def get_core_person_work_history(
     is_current: Optional[bool] = Query(None, description="Filter by is_current flag"),
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.next_cursor (overrides offset)"),
 ):
     """Get records from core.person_work_history with optional filters."""
-    pool = get_pool()
-
-    conditions = []
-    params = []
-    param_idx = 1
-
-    if linkedin_url:
-        conditions.append(f"linkedin_url = ${param_idx}")
-        params.append(linkedin_url)
-        param_idx += 1
-    if company_domain:
-        conditions.append(f"company_domain = ${param_idx}")
-        params.append(company_domain)
-        param_idx += 1
-    if company_name:
-        conditions.append(f"company_name ILIKE ${param_idx}")
-        params.append(f"%{company_name}%")
-        param_idx += 1
-    if matched_job_function:
-        conditions.append(f"matched_job_function = ${param_idx}")
-        params.append(matched_job_function)
-        param_idx += 1
-    if matched_seniority:
-        conditions.append(f"matched_seniority = ${param_idx}")
-        params.append(matched_seniority)
-        param_idx += 1
-    if is_current is not None:
-        conditions.append(f"is_current = ${param_idx}")
-        params.append(is_current)
-        param_idx += 1
-
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-
-    count_query = f"SELECT COUNT(*) FROM core.person_work_history WHERE {where_clause}"
-    total = await pool.fetchval(count_query, *params)
-
-    data_query = f"""
-        SELECT id, linkedin_url, company_domain, company_name, company_linkedin_url,
-               title, matched_job_function, matched_seniority,
-               start_date, end_date, is_current, experience_order, created_at
-        FROM core.person_work_history
-        WHERE {where_clause}
-        ORDER BY created_at DESC
-        LIMIT ${param_idx} OFFSET ${param_idx + 1}
-    """
-    rows = await pool.fetch(data_query, *params, limit, offset)
+    async with custom_plans(get_pool()) as conn:
+        filters = Predicates()
+        filters.optional("linkedin_url = {}", linkedin_url)
+        filters.optional("company_domain = {}", company_domain)
+        filters.substring("company_name", company_name)
+        filters.optional("matched_job_function = {}", matched_job_function)
+        filters.optional("matched_seniority = {}", matched_seniority)
+        filters.optional("is_current = {}", is_current)
+
+        where_clause, params = filters.where, filters.params
+
+        count_query = f"SELECT COUNT(*) FROM core.person_work_history WHERE {where_clause}"
+        total = await conn.fetchval(count_query, *params)
+
+        rows, next_cursor = await fetch_page(conn, """
+            SELECT id, linkedin_url, company_domain, company_name, company_linkedin_url,
+                   title, matched_job_function, matched_seniority,
+                   start_date, end_date, is_current, experience_order, created_at
+            FROM core.person_work_history
+        """, where_clause, params, ("created_at", "id"), limit=limit, offset=offset, cursor=cursor, descending=True)
 
     return TableDataResponse(
         schema_name="core",
         table_name="person_work_history",
         data=[row_to_dict(row) for row in rows],
-        meta=PaginationMeta(total=total, limit=limit, offset=offset)
+        meta=PaginationMeta(total=total, limit=limit, offset=offset, next_cursor=next_cursor)
     )
 
 
@@ -995,15 +908,9 @@ async def get_core_person_work_history(
 # ------------------------------------------------------------
 
 @router.get("/core/person_past_employer/count", response_model=TableCountResponse)
-async def get_core_person_past_employer_count():
+async def get_core_person_past_employer_count(count: str = COUNT_MODE_QUERY):
     """Get count of records in core.person_past_employer."""
-    pool = get_pool()
-    count = await pool.fetchval("SELECT COUNT(*) FROM core.person_past_employer")
-    return TableCountResponse(
-        schema_name="core",
-        table_name="person_past_employer",
-        count=count
-    )
+    return await table_count_response("core.person_past_employer", count)
 
 
 @router.get("/core/person_past_employer", response_model=TableDataResponse)
@@ -1014,50 +921,31 @@ async def get_core_person_past_employer(
     source: Optional[str] = Query(None, description="Filter by source"),
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.next_cursor (overrides offset)"),
 ):
     """Get records from core.person_past_employer with optional filters."""
-    pool = get_pool()
+    async with custom_plans(get_pool()) as conn:
+        filters = Predicates()
+        filters.optional("linkedin_url = {}", linkedin_url)
+        filters.optional("past_company_domain = {}", past_company_domain)
+        filters.substring("past_company_name", past_company_name)
+        filters.optional("source = {}", source)
 
-    conditions = []
-    params = []
-    param_idx = 1
-
-    if linkedin_url:
-        conditions.append(f"linkedin_url = ${param_idx}")
-        params.append(linkedin_url)
-        param_idx += 1
-    if past_company_domain:
-        conditions.append(f"past_company_domain = ${param_idx}")
-        params.append(past_company_domain)
-        param_idx += 1
-    if past_company_name:
-        conditions.append(f"past_company_name ILIKE ${param_idx}")
-        params.append(f"%{past_company_name}%")
-        param_idx += 1
-    if source:
-        conditions.append(f"source = ${param_idx}")
-        params.append(source)
-        param_idx += 1
-
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-
-    count_query = f"SELECT COUNT(*) FROM core.person_past_employer WHERE {where_clause}"
-    total = await pool.fetchval(count_query, *params)
-
-    data_query = f"""
-        SELECT id, linkedin_url, past_company_name, past_company_domain, source, created_at
-        FROM core.person_past_employer
-        WHERE {where_clause}
-        ORDER BY created_at DESC
-        LIMIT ${param_idx} OFFSET ${param_idx + 1}
-    """
-    rows = await pool.fetch(data_query, *params, limit, offset)
+        where_clause, params = filters.where, filters.params
+
+        count_query = f"SELECT COUNT(*) FROM core.person_past_employer WHERE {where_clause}"
+        total = await conn.fetchval(count_query, *params)
+
+        rows, next_cursor = await fetch_page(conn, """
+            SELECT id, linkedin_url, past_company_name, past_company_domain, source, created_at
+            FROM core.person_past_employer
+        """, where_clause, params, ("created_at", "id"), limit=limit, offset=offset, cursor=cursor, descending=True)
 
     return TableDataResponse(
         schema_name="core",
         table_name="person_past_employer",
         data=[row_to_dict(row) for row in rows],
-        meta=PaginationMeta(total=total, limit=limit, offset=offset)
+        meta=PaginationMeta(total=total, limit=limit, offset=offset, next_cursor=next_cursor)
     )
 
 
@@ -1070,11 +958,9 @@ async def get_core_person_past_employer(
 # ------------------------------------------------------------
 
 @router.get("/core/company_descriptions/count", response_model=TableCountResponse)
-async def get_core_company_descriptions_count():
+async def get_core_company_descriptions_count(count: str = COUNT_MODE_QUERY):
     """Get count of records in core.company_descriptions."""
-    pool = get_pool()
-    count = await pool.fetchval("SELECT COUNT(*) FROM core.company_descriptions")
-    return TableCountResponse(schema_name="core", table_name="company_descriptions", count=count)
+    return await table_count_response("core.company_descriptions", count)
 
 
 @router.get("/core/company_descriptions", response_model=TableDataResponse)
@@ -1084,36 +970,25 @@ async def get_core_company_descriptions(
     has_description: Optional[bool] = Query(None, description="Filter by whether description exists"),
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.next_cursor (overrides offset)"),
 ):
     """Get records from core.company_descriptions with optional filters."""
-    pool = get_pool()
-    conditions, params, param_idx = [], [], 1
-
-    if domain:
-        conditions.append(f"domain = ${param_idx}")
-        params.append(domain)
-        param_idx += 1
-    if source:
-        conditions.append(f"source = ${param_idx}")
-        params.append(source)
-        param_idx += 1
-    if has_description is not None:
-        if has_description:
-            conditions.append("description IS NOT NULL AND description != ''")
-        else:
-            conditions.append("(description IS NULL OR description = '')")
-
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-    total = await pool.fetchval(f"SELECT COUNT(*) FROM core.company_descriptions WHERE {where_clause}", *params)
-
-    rows = await pool.fetch(f"""
-        SELECT id, domain, description, tagline, source, created_at, updated_at
-        FROM core.company_descriptions WHERE {where_clause}
-        ORDER BY created_at DESC LIMIT ${param_idx} OFFSET ${param_idx + 1}
-    """, *params, limit, offset)
+    async with custom_plans(get_pool()) as conn:
+        filters = Predicates()
+        filters.optional("domain = {}", domain)
+        filters.optional("source = {}", source)
+        filters.optional("(description IS NOT NULL AND description != '') = {}", has_description)
+
+        where_clause, params = filters.where, filters.params
+        total = await conn.fetchval(f"SELECT COUNT(*) FROM core.company_descriptions WHERE {where_clause}", *params)
+
+        rows, next_cursor = await fetch_page(conn, """
+            SELECT id, domain, description, tagline, source, created_at, updated_at
+            FROM core.company_descriptions
+        """, where_clause, params, ("created_at", "id"), limit=limit, offset=offset, cursor=cursor, descending=True)
 
     return TableDataResponse(schema_name="core", table_name="company_descriptions",
-        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset))
+        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset, next_cursor=next_cursor))
 
 
 # ------------------------------------------------------------
@@ -1121,11 +996,9 @@ async def get_core_company_descriptions(
 # ------------------------------------------------------------
 
 @router.get("/core/company_industries/count", response_model=TableCountResponse)
-async def get_core_company_industries_count():
+async def get_core_company_industries_count(count: str = COUNT_MODE_QUERY):
     """Get count of records in core.company_industries."""
-    pool = get_pool()
-    count = await pool.fetchval("SELECT COUNT(*) FROM core.company_industries")
-    return TableCountResponse(schema_name="core", table_name="company_industries", count=count)
+    return await table_count_response("core.company_industries", count)
 
 
 @router.get("/core/company_industries", response_model=TableDataResponse)
@@ -1135,35 +1008,25 @@ async def get_core_company_industries(
     source: Optional[str] = Query(None, description="Filter by source"),
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.next_cursor (overrides offset)"),
 ):
     """Get records from core.company_industries with optional filters."""
-    pool = get_pool()
-    conditions, params, param_idx = [], [], 1
-
-    if domain:
-        conditions.append(f"domain = ${param_idx}")
-        params.append(domain)
-        param_idx += 1
-    if matched_industry:
-        conditions.append(f"matched_industry = ${param_idx}")
-        params.append(matched_industry)
-        param_idx += 1
-    if source:
-        conditions.append(f"source = ${param_idx}")
-        params.append(source)
-        param_idx += 1
-
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-    total = await pool.fetchval(f"SELECT COUNT(*) FROM core.company_industries WHERE {where_clause}", *params)
-
-    rows = await pool.fetch(f"""
-        SELECT id, domain, matched_industry, source, created_at, updated_at
-        FROM core.company_industries WHERE {where_clause}
-        ORDER BY created_at DESC LIMIT ${param_idx} OFFSET ${param_idx + 1}
-    """, *params, limit, offset)
+    async with custom_plans(get_pool()) as conn:
+        filters = Predicates()
+        filters.optional("domain = {}", domain)
+        filters.optional("matched_industry = {}", matched_industry)
+        filters.optional("source = {}", source)
+
+        where_clause, params = filters.where, filters.params
+        total = await conn.fetchval(f"SELECT COUNT(*) FROM core.company_industries WHERE {where_clause}", *params)
+
+        rows, next_cursor = await fetch_page(conn, """
+            SELECT id, domain, matched_industry, source, created_at, updated_at
+            FROM core.company_industries
+        """, where_clause, params, ("created_at", "id"), limit=limit, offset=offset, cursor=cursor, descending=True)
 
     return TableDataResponse(schema_name="core", table_name="company_industries",
-        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset))
+        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset, next_cursor=next_cursor))
 
 
 # ------------------------------------------------------------
@@ -1171,11 +1034,9 @@ async def get_core_company_industries(
 # ------------------------------------------------------------
 
 @router.get("/core/company_locations/count", response_model=TableCountResponse)
-async def get_core_company_locations_count():
+async def get_core_company_locations_count(count: str = COUNT_MODE_QUERY):
     """Get count of records in core.company_locations."""
-    pool = get_pool()
-    count = await pool.fetchval("SELECT COUNT(*) FROM core.company_locations")
-    return TableCountResponse(schema_name="core", table_name="company_locations", count=count)
+    return await table_count_response("core.company_locations", count)
 
 
 @router.get("/core/company_locations", response_model=TableDataResponse)
@@ -1189,51 +1050,29 @@ async def get_core_company_locations(
     source: Optional[str] = Query(None, description="Filter by source"),
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.next_cursor (overrides offset)"),
 ):
     """Get records from core.company_locations with optional filters."""
-    pool = get_pool()
-    conditions, params, param_idx = [], [], 1
-
-    if domain:
-        conditions.append(f"domain = ${param_idx}")
-        params.append(domain)
-        param_idx += 1
-    if city:
-        conditions.append(f"city ILIKE ${param_idx}")
-        params.append(f"%{city}%")
-        param_idx += 1
-    if state:
-        conditions.append(f"state ILIKE ${param_idx}")
-        params.append(f"%{state}%")
-        param_idx += 1
-    if country:
-        conditions.append(f"country ILIKE ${param_idx}")
-        params.append(f"%{country}%")
-        param_idx += 1
-    if has_city is not None:
-        conditions.append(f"has_city = ${param_idx}")
-        params.append(has_city)
-        param_idx += 1
-    if has_state is not None:
-        conditions.append(f"has_state = ${param_idx}")
-        params.append(has_state)
-        param_idx += 1
-    if source:
-        conditions.append(f"source = ${param_idx}")
-        params.append(source)
-        param_idx += 1
-
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-    total = await pool.fetchval(f"SELECT COUNT(*) FROM core.company_locations WHERE {where_clause}", *params)
-
-    rows = await pool.fetch(f"""
-        SELECT id, domain, city, state, country, raw_location, raw_country, has_city, has_state, source, created_at, updated_at
-        FROM core.company_locations WHERE {where_clause}
-        ORDER BY created_at DESC LIMIT ${param_idx} OFFSET ${param_idx + 1}
-    """, *params, limit, offset)
+    async with custom_plans(get_pool()) as conn:
+        filters = Predicates()
+        filters.optional("domain = {}", domain)
+        filters.substring("city", city)
+        filters.substring("state", state)
+        filters.substring("country", country)
+        filters.optional("has_city = {}", has_city)
+        filters.optional("has_state = {}", has_state)
+        filters.optional("source = {}", source)
+
+        where_clause, params = filters.where, filters.params
+        total = await conn.fetchval(f"SELECT COUNT(*) FROM core.company_locations WHERE {where_clause}", *params)
+
+        rows, next_cursor = await fetch_page(conn, """
+            SELECT id, domain, city, state, country, raw_location, raw_country, has_city, has_state, source, created_at, updated_at
+            FROM core.company_locations
+        """, where_clause, params, ("created_at", "id"), limit=limit, offset=offset, cursor=cursor, descending=True)
 
     return TableDataResponse(schema_name="core", table_name="company_locations",
-        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset))
+        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset, next_cursor=next_cursor))
 
 
 # ------------------------------------------------------------
@@ -1241,11 +1080,9 @@ async def get_core_company_locations(
 # ------------------------------------------------------------
 
 @router.get("/core/company_employee_range/count", response_model=TableCountResponse)
-async def get_core_company_employee_range_count():
+async def get_core_company_employee_range_count(count: str = COUNT_MODE_QUERY):
     """Get count of records in core.company_employee_range."""
-    pool = get_pool()
-    count = await pool.fetchval("SELECT COUNT(*) FROM core.company_employee_range")
-    return TableCountResponse(schema_name="core", table_name="company_employee_range", count=count)
+    return await table_count_response("core.company_employee_range", count)
 
 
 @router.get("/core/company_employee_range", response_model=TableDataResponse)
@@ -1255,35 +1092,25 @@ async def get_core_company_employee_range(
     source: Optional[str] = Query(None, description="Filter by source"),
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.next_cursor (overrides offset)"),
 ):
     """Get records from core.company_employee_range with optional filters."""
-    pool = get_pool()
-    conditions, params, param_idx = [], [], 1
-
-    if domain:
-        conditions.append(f"domain = ${param_idx}")
-        params.append(domain)
-        param_idx += 1
-    if employee_range:
-        conditions.append(f"employee_range = ${param_idx}")
-        params.append(employee_range)
-        param_idx += 1
-    if source:
-        conditions.append(f"source = ${param_idx}")
-        params.append(source)
-        param_idx += 1
-
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-    total = await pool.fetchval(f"SELECT COUNT(*) FROM core.company_employee_range WHERE {where_clause}", *params)
-
-    rows = await pool.fetch(f"""
-        SELECT id, domain, employee_range, source, created_at, updated_at
-        FROM core.company_employee_range WHERE {where_clause}
-        ORDER BY created_at DESC LIMIT ${param_idx} OFFSET ${param_idx + 1}
-    """, *params, limit, offset)
+    async with custom_plans(get_pool()) as conn:
+        filters = Predicates()
+        filters.optional("domain = {}", domain)
+        filters.optional("employee_range = {}", employee_range)
+        filters.optional("source = {}", source)
+
+        where_clause, params = filters.where, filters.params
+        total = await conn.fetchval(f"SELECT COUNT(*) FROM core.company_employee_range WHERE {where_clause}", *params)
+
+        rows, next_cursor = await fetch_page(conn, """
+            SELECT id, domain, employee_range, source, created_at, updated_at
+            FROM core.company_employee_range
+        """, where_clause, params, ("created_at", "id"), limit=limit, offset=offset, cursor=cursor, descending=True)
 
     return TableDataResponse(schema_name="core", table_name="company_employee_range",
-        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset))
+        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset, next_cursor=next_cursor))
 
 
 # ------------------------------------------------------------
@@ -1291,11 +1118,9 @@ async def get_core_company_employee_range(
 # ------------------------------------------------------------
 
 @router.get("/core/company_funding/count", response_model=TableCountResponse)
-async def get_core_company_funding_count():
+async def get_core_company_funding_count(count: str = COUNT_MODE_QUERY):
     """Get count of records in core.company_funding."""
-    pool = get_pool()
-    count = await pool.fetchval("SELECT COUNT(*) FROM core.company_funding")
-    return TableCountResponse(schema_name="core", table_name="company_funding", count=count)
+    return await table_count_response("core.company_funding", count)
 
 
 @router.get("/core/company_funding", response_model=TableDataResponse)
@@ -1305,35 +1130,25 @@ async def get_core_company_funding(
     source: Optional[str] = Query(None, description="Filter by source"),
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.next_cursor (overrides offset)"),
 ):
     """Get records from core.company_funding with optional filters."""
-    pool = get_pool()
-    conditions, params, param_idx = [], [], 1
-
-    if domain:
-        conditions.append(f"domain = ${param_idx}")
-        params.append(domain)
-        param_idx += 1
-    if matched_funding_range:
-        conditions.append(f"matched_funding_range = ${param_idx}")
-        params.append(matched_funding_range)
-        param_idx += 1
-    if source:
-        conditions.append(f"source = ${param_idx}")
-        params.append(source)
-        param_idx += 1
-
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-    total = await pool.fetchval(f"SELECT COUNT(*) FROM core.company_funding WHERE {where_clause}", *params)
-
-    rows = await pool.fetch(f"""
-        SELECT id, domain, source, raw_funding_range, raw_funding_amount, matched_funding_range, created_at, updated_at
-        FROM core.company_funding WHERE {where_clause}
-        ORDER BY created_at DESC LIMIT ${param_idx} OFFSET ${param_idx + 1}
-    """, *params, limit, offset)
+    async with custom_plans(get_pool()) as conn:
+        filters = Predicates()
+        filters.optional("domain = {}", domain)
+        filters.optional("matched_funding_range = {}", matched_funding_range)
+        filters.optional("source = {}", source)
+
+        where_clause, params = filters.where, filters.params
+        total = await conn.fetchval(f"SELECT COUNT(*) FROM core.company_funding WHERE {where_clause}", *params)
+
+        rows, next_cursor = await fetch_page(conn, """
+            SELECT id, domain, source, raw_funding_range, raw_funding_amount, matched_funding_range, created_at, updated_at
+            FROM core.company_funding
+        """, where_clause, params, ("created_at", "id"), limit=limit, offset=offset, cursor=cursor, descending=True)
 
     return TableDataResponse(schema_name="core", table_name="company_funding",
-        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset))
+        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset, next_cursor=next_cursor))
 
 
 # ------------------------------------------------------------
@@ -1341,11 +1156,9 @@ async def get_core_company_funding(
 # ------------------------------------------------------------
 
 @router.get("/core/company_revenue/count", response_model=TableCountResponse)
-async def get_core_company_revenue_count():
+async def get_core_company_revenue_count(count: str = COUNT_MODE_QUERY):
     """Get count of records in core.company_revenue."""
-    pool = get_pool()
-    count = await pool.fetchval("SELECT COUNT(*) FROM core.company_revenue")
-    return TableCountResponse(schema_name="core", table_name="company_revenue", count=count)
+    return await table_count_response("core.company_revenue", count)
 
 
 @router.get("/core/company_revenue", response_model=TableDataResponse)
@@ -1355,35 +1168,25 @@ async def get_core_company_revenue(
     source: Optional[str] = Query(None, description="Filter by source"),
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.next_cursor (overrides offset)"),
 ):
     """Get records from core.company_revenue with optional filters."""
-    pool = get_pool()
-    conditions, params, param_idx = [], [], 1
-
-    if domain:
-        conditions.append(f"domain = ${param_idx}")
-        params.append(domain)
-        param_idx += 1
-    if matched_revenue_range:
-        conditions.append(f"matched_revenue_range = ${param_idx}")
-        params.append(matched_revenue_range)
-        param_idx += 1
-    if source:
-        conditions.append(f"source = ${param_idx}")
-        params.append(source)
-        param_idx += 1
-
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-    total = await pool.fetchval(f"SELECT COUNT(*) FROM core.company_revenue WHERE {where_clause}", *params)
-
-    rows = await pool.fetch(f"""
-        SELECT id, domain, source, raw_revenue_range, raw_revenue_amount, matched_revenue_range, created_at, updated_at
-        FROM core.company_revenue WHERE {where_clause}
-        ORDER BY created_at DESC LIMIT ${param_idx} OFFSET ${param_idx + 1}
-    """, *params, limit, offset)
+    async with custom_plans(get_pool()) as conn:
+        filters = Predicates()
+        filters.optional("domain = {}", domain)
+        filters.optional("matched_revenue_range = {}", matched_revenue_range)
+        filters.optional("source = {}", source)
+
+        where_clause, params = filters.where, filters.params
+        total = await conn.fetchval(f"SELECT COUNT(*) FROM core.company_revenue WHERE {where_clause}", *params)
+
+        rows, next_cursor = await fetch_page(conn, """
+            SELECT id, domain, source, raw_revenue_range, raw_revenue_amount, matched_revenue_range, created_at, updated_at
+            FROM core.company_revenue
+        """, where_clause, params, ("created_at", "id"), limit=limit, offset=offset, cursor=cursor, descending=True)
 
     return TableDataResponse(schema_name="core", table_name="company_revenue",
-        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset))
+        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset, next_cursor=next_cursor))
 
 
 # ------------------------------------------------------------
@@ -1391,11 +1194,9 @@ async def get_core_company_revenue(
 # ------------------------------------------------------------
 
 @router.get("/core/company_linkedin_urls/count", response_model=TableCountResponse)
-async def get_core_company_linkedin_urls_count():
+async def get_core_company_linkedin_urls_count(count: str = COUNT_MODE_QUERY):
     """Get count of records in core.company_linkedin_urls."""
-    pool = get_pool()
-    count = await pool.fetchval("SELECT COUNT(*) FROM core.company_linkedin_urls")
-    return TableCountResponse(schema_name="core", table_name="company_linkedin_urls", count=count)
+    return await table_count_response("core.company_linkedin_urls", count)
 
 
 @router.get("/core/company_linkedin_urls", response_model=TableDataResponse)
@@ -1405,35 +1206,25 @@ async def get_core_company_linkedin_urls(
     source: Optional[str] = Query(None, description="Filter by source"),
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.next_cursor (overrides offset)"),
 ):
     """Get records from core.company_linkedin_urls with optional filters."""
-    pool = get_pool()
-    conditions, params, param_idx = [], [], 1
-
-    if domain:
-        conditions.append(f"domain = ${param_idx}")
-        params.append(domain)
-        param_idx += 1
-    if linkedin_url:
-        conditions.append(f"linkedin_url ILIKE ${param_idx}")
-        params.append(f"%{linkedin_url}%")
-        param_idx += 1
-    if source:
-        conditions.append(f"source = ${param_idx}")
-        params.append(source)
-        param_idx += 1
-
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-    total = await pool.fetchval(f"SELECT COUNT(*) FROM core.company_linkedin_urls WHERE {where_clause}", *params)
-
-    rows = await pool.fetch(f"""
-        SELECT id, domain, linkedin_url, source, created_at, updated_at
-        FROM core.company_linkedin_urls WHERE {where_clause}
-        ORDER BY created_at DESC LIMIT ${param_idx} OFFSET ${param_idx + 1}
-    """, *params, limit, offset)
+    async with custom_plans(get_pool()) as conn:
+        filters = Predicates()
+        filters.optional("domain = {}", domain)
+        filters.substring("linkedin_url", linkedin_url)
+        filters.optional("source = {}", source)
+
+        where_clause, params = filters.where, filters.params
+        total = await conn.fetchval(f"SELECT COUNT(*) FROM core.company_linkedin_urls WHERE {where_clause}", *params)
+
+        rows, next_cursor = await fetch_page(conn, """
+            SELECT id, domain, linkedin_url, source, created_at, updated_at
+            FROM core.company_linkedin_urls
+        """, where_clause, params, ("created_at", "id"), limit=limit, offset=offset, cursor=cursor, descending=True)
 
     return TableDataResponse(schema_name="core", table_name="company_linkedin_urls",
-        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset))
+        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset, next_cursor=next_cursor))
 
 
 # ============================================================
@@ -1445,11 +1236,9 @@ async def get_core_company_linkedin_urls(
 # ------------------------------------------------------------
 
 @router.get("/core/person_locations/count", response_model=TableCountResponse)
-async def get_core_person_locations_count():
+async def get_core_person_locations_count(count: str = COUNT_MODE_QUERY):
     """Get count of records in core.person_locations."""
-    pool = get_pool()
-    count = await pool.fetchval("SELECT COUNT(*) FROM core.person_locations")
-    return TableCountResponse(schema_name="core", table_name="person_locations", count=count)
+    return await table_count_response("core.person_locations", count)
 
 
 @router.get("/core/person_locations", response_model=TableDataResponse)
@@ -1461,43 +1250,27 @@ async def get_core_person_locations(
     source: Optional[str] = Query(None, description="Filter by source"),
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.next_cursor (overrides offset)"),
 ):
     """Get records from core.person_locations with optional filters."""
-    pool = get_pool()
-    conditions, params, param_idx = [], [], 1
-
-    if linkedin_url:
-        conditions.append(f"linkedin_url = ${param_idx}")
-        params.append(linkedin_url)
-        param_idx += 1
-    if city:
-        conditions.append(f"city ILIKE ${param_idx}")
-        params.append(f"%{city}%")
-        param_idx += 1
-    if state:
-        conditions.append(f"state ILIKE ${param_idx}")
-        params.append(f"%{state}%")
-        param_idx += 1
-    if country:
-        conditions.append(f"country ILIKE ${param_idx}")
-        params.append(f"%{country}%")
-        param_idx += 1
-    if source:
-        conditions.append(f"source = ${param_idx}")
-        params.append(source)
-        param_idx += 1
-
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-    total = await pool.fetchval(f"SELECT COUNT(*) FROM core.person_locations WHERE {where_clause}", *params)
-
-    rows = await pool.fetch(f"""
-        SELECT id, linkedin_url, city, state, country, source, created_at, updated_at
-        FROM core.person_locations WHERE {where_clause}
-        ORDER BY created_at DESC LIMIT ${param_idx} OFFSET ${param_idx + 1}
-    """, *params, limit, offset)
+    async with custom_plans(get_pool()) as conn:
+        filters = Predicates()
+        filters.optional("linkedin_url = {}", linkedin_url)
+        filters.substring("city", city)
+        filters.substring("state", state)
+        filters.substring("country", country)
+        filters.optional("source = {}", source)
+
+        where_clause, params = filters.where, filters.params
+        total = await conn.fetchval(f"SELECT COUNT(*) FROM core.person_locations WHERE {where_clause}", *params)
+
+        rows, next_cursor = await fetch_page(conn, """
+            SELECT id, linkedin_url, city, state, country, source, created_at, updated_at
+            FROM core.person_locations
+        """, where_clause, params, ("created_at", "id"), limit=limit, offset=offset, cursor=cursor, descending=True)
 
     return TableDataResponse(schema_name="core", table_name="person_locations",
-        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset))
+        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset, next_cursor=next_cursor))
 
 
 # ------------------------------------------------------------
@@ -1505,11 +1278,9 @@ async def get_core_person_locations(
 # ------------------------------------------------------------
 
 @router.get("/core/person_job_titles/count", response_model=TableCountResponse)
-async def get_core_person_job_titles_count():
+async def get_core_person_job_titles_count(count: str = COUNT_MODE_QUERY):
     """Get count of records in core.person_job_titles."""
-    pool = get_pool()
-    count = await pool.fetchval("SELECT COUNT(*) FROM core.person_job_titles")
-    return TableCountResponse(schema_name="core", table_name="person_job_titles", count=count)
+    return await table_count_response("core.person_job_titles", count)
 
 
 @router.get("/core/person_job_titles", response_model=TableDataResponse)
@@ -1521,43 +1292,27 @@ async def get_core_person_job_titles(
     source: Optional[str] = Query(None, description="Filter by source"),
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.next_cursor (overrides offset)"),
 ):
     """Get records from core.person_job_titles with optional filters."""
-    pool = get_pool()
-    conditions, params, param_idx = [], [], 1
-
-    if linkedin_url:
-        conditions.append(f"linkedin_url = ${param_idx}")
-        params.append(linkedin_url)
-        param_idx += 1
-    if matched_cleaned_job_title:
-        conditions.append(f"matched_cleaned_job_title ILIKE ${param_idx}")
-        params.append(f"%{matched_cleaned_job_title}%")
-        param_idx += 1
-    if matched_job_function:
-        conditions.append(f"matched_job_function = ${param_idx}")
-        params.append(matched_job_function)
-        param_idx += 1
-    if matched_seniority:
-        conditions.append(f"matched_seniority = ${param_idx}")
-        params.append(matched_seniority)
-        param_idx += 1
-    if source:
-        conditions.append(f"source = ${param_idx}")
-        params.append(source)
-        param_idx += 1
-
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-    total = await pool.fetchval(f"SELECT COUNT(*) FROM core.person_job_titles WHERE {where_clause}", *params)
-
-    rows = await pool.fetch(f"""
-        SELECT id, linkedin_url, matched_cleaned_job_title, matched_job_function, matched_seniority, source, created_at, updated_at
-        FROM core.person_job_titles WHERE {where_clause}
-        ORDER BY created_at DESC LIMIT ${param_idx} OFFSET ${param_idx + 1}
-    """, *params, limit, offset)
+    async with custom_plans(get_pool()) as conn:
+        filters = Predicates()
+        filters.optional("linkedin_url = {}", linkedin_url)
+        filters.substring("matched_cleaned_job_title", matched_cleaned_job_title)
+        filters.optional("matched_job_function = {}", matched_job_function)
+        filters.optional("matched_seniority = {}", matched_seniority)
+        filters.optional("source = {}", source)
+
+        where_clause, params = filters.where, filters.params
+        total = await conn.fetchval(f"SELECT COUNT(*) FROM core.person_job_titles WHERE {where_clause}", *params)
+
+        rows, next_cursor = await fetch_page(conn, """
+            SELECT id, linkedin_url, matched_cleaned_job_title, matched_job_function, matched_seniority, source, created_at, updated_at
+            FROM core.person_job_titles
+        """, where_clause, params, ("created_at", "id"), limit=limit, offset=offset, cursor=cursor, descending=True)
 
     return TableDataResponse(schema_name="core", table_name="person_job_titles",
-        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset))
+        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset, next_cursor=next_cursor))
 
 
 # ------------------------------------------------------------
@@ -1565,11 +1320,9 @@ async def get_core_person_job_titles(
 # ------------------------------------------------------------
 
 @router.get("/core/person_tenure/count", response_model=TableCountResponse)
-async def get_core_person_tenure_count():
+async def get_core_person_tenure_count(count: str = COUNT_MODE_QUERY):
     """Get count of records in core.person_tenure."""
-    pool = get_pool()
-    count = await pool.fetchval("SELECT COUNT(*) FROM core.person_tenure")
-    return TableCountResponse(schema_name="core", table_name="person_tenure", count=count)
+    return await table_count_response("core.person_tenure", count)
 
 
 @router.get("/core/person_tenure", response_model=TableDataResponse)
@@ -1580,39 +1333,26 @@ async def get_core_person_tenure(
     source: Optional[str] = Query(None, description="Filter by source"),
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.next_cursor (overrides offset)"),
 ):
     """Get records from core.person_tenure with optional filters."""
-    pool = get_pool()
-    conditions, params, param_idx = [], [], 1
-
-    if linkedin_url:
-        conditions.append(f"linkedin_url = ${param_idx}")
-        params.append(linkedin_url)
-        param_idx += 1
-    if job_start_date_gte:
-        conditions.append(f"job_start_date >= ${param_idx}")
-        params.append(job_start_date_gte)
-        param_idx += 1
-    if job_start_date_lte:
-        conditions.append(f"job_start_date <= ${param_idx}")
-        params.append(job_start_date_lte)
-        param_idx += 1
-    if source:
-        conditions.append(f"source = ${param_idx}")
-        params.append(source)
-        param_idx += 1
-
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-    total = await pool.fetchval(f"SELECT COUNT(*) FROM core.person_tenure WHERE {where_clause}", *params)
-
-    rows = await pool.fetch(f"""
-        SELECT id, linkedin_url, job_start_date, source, created_at, updated_at
-        FROM core.person_tenure WHERE {where_clause}
-        ORDER BY created_at DESC LIMIT ${param_idx} OFFSET ${param_idx + 1}
-    """, *params, limit, offset)
+    async with custom_plans(get_pool()) as conn:
+        filters = Predicates()
+        filters.optional("linkedin_url = {}", linkedin_url)
+        filters.optional("job_start_date >= {}", job_start_date_gte)
+        filters.optional("job_start_date <= {}", job_start_date_lte)
+        filters.optional("source = {}", source)
+
+        where_clause, params = filters.where, filters.params
+        total = await conn.fetchval(f"SELECT COUNT(*) FROM core.person_tenure WHERE {where_clause}", *params)
+
+        rows, next_cursor = await fetch_page(conn, """
+            SELECT id, linkedin_url, job_start_date, source, created_at, updated_at
+            FROM core.person_tenure
+        """, where_clause, params, ("created_at", "id"), limit=limit, offset=offset, cursor=cursor, descending=True)
 
     return TableDataResponse(schema_name="core", table_name="person_tenure",
-        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset))
+        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset, next_cursor=next_cursor))
 
 
 # ------------------------------------------------------------
@@ -1620,11 +1360,9 @@ async def get_core_person_tenure(
 # ------------------------------------------------------------
 
 @router.get("/core/person_promotions/count", response_model=TableCountResponse)
-async def get_core_person_promotions_count():
+async def get_core_person_promotions_count(count: str = COUNT_MODE_QUERY):
     """Get count of records in core.person_promotions."""
-    pool = get_pool()
-    count = await pool.fetchval("SELECT COUNT(*) FROM core.person_promotions")
-    return TableCountResponse(schema_name="core", table_name="person_promotions", count=count)
+    return await table_count_response("core.person_promotions", count)
 
 
 @router.get("/core/person_promotions", response_model=TableDataResponse)
@@ -1636,43 +1374,27 @@ async def get_core_person_promotions(
     promotion_date_lte: Optional[str] = Query(None, description="Filter by promotion date <= (YYYY-MM-DD)"),
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.next_cursor (overrides offset)"),
 ):
     """Get records from core.person_promotions with optional filters."""
-    pool = get_pool()
-    conditions, params, param_idx = [], [], 1
-
-    if linkedin_url:
-        conditions.append(f"linkedin_url = ${param_idx}")
-        params.append(linkedin_url)
-        param_idx += 1
-    if company_domain:
-        conditions.append(f"company_domain = ${param_idx}")
-        params.append(company_domain)
-        param_idx += 1
-    if company_name:
-        conditions.append(f"company_name ILIKE ${param_idx}")
-        params.append(f"%{company_name}%")
-        param_idx += 1
-    if promotion_date_gte:
-        conditions.append(f"promotion_date >= ${param_idx}")
-        params.append(promotion_date_gte)
-        param_idx += 1
-    if promotion_date_lte:
-        conditions.append(f"promotion_date <= ${param_idx}")
-        params.append(promotion_date_lte)
-        param_idx += 1
-
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-    total = await pool.fetchval(f"SELECT COUNT(*) FROM core.person_promotions WHERE {where_clause}", *params)
-
-    rows = await pool.fetch(f"""
-        SELECT id, linkedin_url, company_domain, company_name, previous_title, new_title, promotion_date, created_at
-        FROM core.person_promotions WHERE {where_clause}
-        ORDER BY promotion_date DESC LIMIT ${param_idx} OFFSET ${param_idx + 1}
-    """, *params, limit, offset)
+    async with custom_plans(get_pool()) as conn:
+        filters = Predicates()
+        filters.optional("linkedin_url = {}", linkedin_url)
+        filters.optional("company_domain = {}", company_domain)
+        filters.substring("company_name", company_name)
+        filters.optional("promotion_date >= {}", promotion_date_gte)
+        filters.optional("promotion_date <= {}", promotion_date_lte)
+
+        where_clause, params = filters.where, filters.params
+        total = await conn.fetchval(f"SELECT COUNT(*) FROM core.person_promotions WHERE {where_clause}", *params)
+
+        rows, next_cursor = await fetch_page(conn, """
+            SELECT id, linkedin_url, company_domain, company_name, previous_title, new_title, promotion_date, created_at
+            FROM core.person_promotions
+        """, where_clause, params, ("promotion_date", "id"), limit=limit, offset=offset, cursor=cursor, descending=True)
 
     return TableDataResponse(schema_name="core", table_name="person_promotions",
-        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset))
+        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset, next_cursor=next_cursor))
 
 
 # ------------------------------------------------------------
@@ -1680,11 +1402,9 @@ async def get_core_person_promotions(
 # ------------------------------------------------------------
 
 @router.get("/core/person_job_start_dates/count", response_model=TableCountResponse)
-async def get_core_person_job_start_dates_count():
+async def get_core_person_job_start_dates_count(count: str = COUNT_MODE_QUERY):
     """Get count of records in core.person_job_start_dates."""
-    pool = get_pool()
-    count = await pool.fetchval("SELECT COUNT(*) FROM core.person_job_start_dates")
-    return TableCountResponse(schema_name="core", table_name="person_job_start_dates", count=count)
+    return await table_count_response("core.person_job_start_dates", count)
 
 
 @router.get("/core/person_job_start_dates", response_model=TableDataResponse)
@@ -1695,39 +1415,26 @@ async def get_core_person_job_start_dates(
     source: Optional[str] = Query(None, description="Filter by source"),
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.next_cursor (overrides offset)"),
 ):
     """Get records from core.person_job_start_dates with optional filters."""
-    pool = get_pool()
-    conditions, params, param_idx = [], [], 1
-
-    if person_linkedin_url:
-        conditions.append(f"person_linkedin_url = ${param_idx}")
-        params.append(person_linkedin_url)
-        param_idx += 1
-    if job_start_date_gte:
-        conditions.append(f"job_start_date >= ${param_idx}")
-        params.append(job_start_date_gte)
-        param_idx += 1
-    if job_start_date_lte:
-        conditions.append(f"job_start_date <= ${param_idx}")
-        params.append(job_start_date_lte)
-        param_idx += 1
-    if source:
-        conditions.append(f"source = ${param_idx}")
-        params.append(source)
-        param_idx += 1
-
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-    total = await pool.fetchval(f"SELECT COUNT(*) FROM core.person_job_start_dates WHERE {where_clause}", *params)
-
-    rows = await pool.fetch(f"""
-        SELECT id, person_linkedin_url, job_start_date, source, created_at
-        FROM core.person_job_start_dates WHERE {where_clause}
-        ORDER BY job_start_date DESC LIMIT ${param_idx} OFFSET ${param_idx + 1}
-    """, *params, limit, offset)
+    async with custom_plans(get_pool()) as conn:
+        filters = Predicates()
+        filters.optional("person_linkedin_url = {}", person_linkedin_url)
+        filters.optional("job_start_date >= {}", job_start_date_gte)
+        filters.optional("job_start_date <= {}", job_start_date_lte)
+        filters.optional("source = {}", source)
+
+        where_clause, params = filters.where, filters.params
+        total = await conn.fetchval(f"SELECT COUNT(*) FROM core.person_job_start_dates WHERE {where_clause}", *params)
+
+        rows, next_cursor = await fetch_page(conn, """
+            SELECT id, person_linkedin_url, job_start_date, source, created_at
+            FROM core.person_job_start_dates
+        """, where_clause, params, ("job_start_date", "id"), limit=limit, offset=offset, cursor=cursor, descending=True)
 
     return TableDataResponse(schema_name="core", table_name="person_job_start_dates",
-        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset))
+        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset, next_cursor=next_cursor))
 
 
 # ============================================================
@@ -1739,11 +1446,9 @@ async def get_core_person_job_start_dates(
 # ------------------------------------------------------------
 
 @router.get("/core/company_vc_backed/count", response_model=TableCountResponse)
-async def get_core_company_vc_backed_count():
+async def get_core_company_vc_backed_count(count: str = COUNT_MODE_QUERY):
     """Get count of records in core.company_vc_backed."""
-    pool = get_pool()
-    count = await pool.fetchval("SELECT COUNT(*) FROM core.company_vc_backed")
-    return TableCountResponse(schema_name="core", table_name="company_vc_backed", count=count)
+    return await table_count_response("core.company_vc_backed", count)
 
 
 @router.get("/core/company_vc_backed", response_model=TableDataResponse)
@@ -1753,35 +1458,25 @@ async def get_core_company_vc_backed(
     vc_count_lte: Optional[int] = Query(None, description="Filter by VC count <="),
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.next_cursor (overrides offset)"),
 ):
     """Get records from core.company_vc_backed with optional filters."""
-    pool = get_pool()
-    conditions, params, param_idx = [], [], 1
-
-    if domain:
-        conditions.append(f"domain = ${param_idx}")
-        params.append(domain)
-        param_idx += 1
-    if vc_count_gte is not None:
-        conditions.append(f"vc_count >= ${param_idx}")
-        params.append(vc_count_gte)
-        param_idx += 1
-    if vc_count_lte is not None:
-        conditions.append(f"vc_count <= ${param_idx}")
-        params.append(vc_count_lte)
-        param_idx += 1
-
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-    total = await pool.fetchval(f"SELECT COUNT(*) FROM core.company_vc_backed WHERE {where_clause}", *params)
-
-    rows = await pool.fetch(f"""
-        SELECT domain, vc_count, created_at
-        FROM core.company_vc_backed WHERE {where_clause}
-        ORDER BY vc_count DESC LIMIT ${param_idx} OFFSET ${param_idx + 1}
-    """, *params, limit, offset)
+    async with custom_plans(get_pool()) as conn:
+        filters = Predicates()
+        filters.optional("domain = {}", domain)
+        filters.optional("vc_count >= {}", vc_count_gte)
+        filters.optional("vc_count <= {}", vc_count_lte)
+
+        where_clause, params = filters.where, filters.params
+        total = await conn.fetchval(f"SELECT COUNT(*) FROM core.company_vc_backed WHERE {where_clause}", *params)
+
+        rows, next_cursor = await fetch_page(conn, """
+            SELECT domain, vc_count, created_at
+            FROM core.company_vc_backed
+        """, where_clause, params, ("vc_count", "domain"), limit=limit, offset=offset, cursor=cursor, descending=True)
 
     return TableDataResponse(schema_name="core", table_name="company_vc_backed",
-        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset))
+        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset, next_cursor=next_cursor))
 
 
 # ------------------------------------------------------------
@@ -1789,11 +1484,9 @@ async def get_core_company_vc_backed(
 # ------------------------------------------------------------
 
 @router.get("/core/company_vc_investments/count", response_model=TableCountResponse)
-async def get_core_company_vc_investments_count():
+async def get_core_company_vc_investments_count(count: str = COUNT_MODE_QUERY):
     """Get count of records in core.company_vc_investments."""
-    pool = get_pool()
-    count = await pool.fetchval("SELECT COUNT(*) FROM core.company_vc_investments")
-    return TableCountResponse(schema_name="core", table_name="company_vc_investments", count=count)
+    return await table_count_response("core.company_vc_investments", count)
 
 
 @router.get("/core/company_vc_investments", response_model=TableDataResponse)
@@ -1803,35 +1496,25 @@ async def get_core_company_vc_investments(
     vc_name: Optional[str] = Query(None, description="Filter by VC name (partial match)"),
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.next_cursor (overrides offset)"),
 ):
     """Get records from core.company_vc_investments with optional filters."""
-    pool = get_pool()
-    conditions, params, param_idx = [], [], 1
-
-    if company_domain:
-        conditions.append(f"company_domain = ${param_idx}")
-        params.append(company_domain)
-        param_idx += 1
-    if company_name:
-        conditions.append(f"company_name ILIKE ${param_idx}")
-        params.append(f"%{company_name}%")
-        param_idx += 1
-    if vc_name:
-        conditions.append(f"vc_name ILIKE ${param_idx}")
-        params.append(f"%{vc_name}%")
-        param_idx += 1
-
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-    total = await pool.fetchval(f"SELECT COUNT(*) FROM core.company_vc_investments WHERE {where_clause}", *params)
-
-    rows = await pool.fetch(f"""
-        SELECT id, company_domain, company_name, vc_name, created_at
-        FROM core.company_vc_investments WHERE {where_clause}
-        ORDER BY created_at DESC LIMIT ${param_idx} OFFSET ${param_idx + 1}
-    """, *params, limit, offset)
+    async with custom_plans(get_pool()) as conn:
+        filters = Predicates()
+        filters.optional("company_domain = {}", company_domain)
+        filters.substring("company_name", company_name)
+        filters.substring("vc_name", vc_name)
+
+        where_clause, params = filters.where, filters.params
+        total = await conn.fetchval(f"SELECT COUNT(*) FROM core.company_vc_investments WHERE {where_clause}", *params)
+
+        rows, next_cursor = await fetch_page(conn, """
+            SELECT id, company_domain, company_name, vc_name, created_at
+            FROM core.company_vc_investments
+        """, where_clause, params, ("created_at", "id"), limit=limit, offset=offset, cursor=cursor, descending=True)
 
     return TableDataResponse(schema_name="core", table_name="company_vc_investments",
-        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset))
+        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset, next_cursor=next_cursor))
 
 
 # ------------------------------------------------------------
@@ -1839,11 +1522,9 @@ async def get_core_company_vc_investments(
 # ------------------------------------------------------------
 
 @router.get("/core/company_vc_investors/count", response_model=TableCountResponse)
-async def get_core_company_vc_investors_count():
+async def get_core_company_vc_investors_count(count: str = COUNT_MODE_QUERY):
     """Get count of records in core.company_vc_investors."""
-    pool = get_pool()
-    count = await pool.fetchval("SELECT COUNT(*) FROM core.company_vc_investors")
-    return TableCountResponse(schema_name="core", table_name="company_vc_investors", count=count)
+    return await table_count_response("core.company_vc_investors", count)
 
 
 @router.get("/core/company_vc_investors", response_model=TableDataResponse)
@@ -1855,43 +1536,27 @@ async def get_core_company_vc_investors(
     source: Optional[str] = Query(None, description="Filter by source"),
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.next_cursor (overrides offset)"),
 ):
     """Get records from core.company_vc_investors with optional filters."""
-    pool = get_pool()
-    conditions, params, param_idx = [], [], 1
-
-    if company_domain:
-        conditions.append(f"company_domain = ${param_idx}")
-        params.append(company_domain)
-        param_idx += 1
-    if company_name:
-        conditions.append(f"company_name ILIKE ${param_idx}")
-        params.append(f"%{company_name}%")
-        param_idx += 1
-    if vc_name:
-        conditions.append(f"vc_name ILIKE ${param_idx}")
-        params.append(f"%{vc_name}%")
-        param_idx += 1
-    if vc_domain:
-        conditions.append(f"vc_domain = ${param_idx}")
-        params.append(vc_domain)
-        param_idx += 1
-    if source:
-        conditions.append(f"source = ${param_idx}")
-        params.append(source)
-        param_idx += 1
-
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-    total = await pool.fetchval(f"SELECT COUNT(*) FROM core.company_vc_investors WHERE {where_clause}", *params)
-
-    rows = await pool.fetch(f"""
-        SELECT id, company_domain, company_name, vc_name, vc_domain, source, created_at
-        FROM core.company_vc_investors WHERE {where_clause}
-        ORDER BY created_at DESC LIMIT ${param_idx} OFFSET ${param_idx + 1}
-    """, *params, limit, offset)
+    async with custom_plans(get_pool()) as conn:
+        filters = Predicates()
+        filters.optional("company_domain = {}", company_domain)
+        filters.substring("company_name", company_name)
+        filters.substring("vc_name", vc_name)
+        filters.optional("vc_domain = {}", vc_domain)
+        filters.optional("source = {}", source)
+
+        where_clause, params = filters.where, filters.params
+        total = await conn.fetchval(f"SELECT COUNT(*) FROM core.company_vc_investors WHERE {where_clause}", *params)
+
+        rows, next_cursor = await fetch_page(conn, """
+            SELECT id, company_domain, company_name, vc_name, vc_domain, source, created_at
+            FROM core.company_vc_investors
+        """, where_clause, params, ("created_at", "id"), limit=limit, offset=offset, cursor=cursor, descending=True)
 
     return TableDataResponse(schema_name="core", table_name="company_vc_investors",
-        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset))
+        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset, next_cursor=next_cursor))
 
 
 # ============================================================
@@ -1903,11 +1568,9 @@ async def get_core_company_vc_investors(
 # ------------------------------------------------------------
 
 @router.get("/core/case_study_champions/count", response_model=TableCountResponse)
-async def get_core_case_study_champions_count():
+async def get_core_case_study_champions_count(count: str = COUNT_MODE_QUERY):
     """Get count of records in core.case_study_champions."""
-    pool = get_pool()
-    count = await pool.fetchval("SELECT COUNT(*) FROM core.case_study_champions")
-    return TableCountResponse(schema_name="core", table_name="case_study_champions", count=count)
+    return await table_count_response("core.case_study_champions", count)
 
 
 @router.get("/core/case_study_champions", response_model=TableDataResponse)
@@ -1920,48 +1583,29 @@ async def get_core_case_study_champions(
     source: Optional[str] = Query(None, description="Filter by source"),
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.next_cursor (overrides offset)"),
 ):
     """Get records from core.case_study_champions with optional filters."""
-    pool = get_pool()
-    conditions, params, param_idx = [], [], 1
-
-    if full_name:
-        conditions.append(f"full_name ILIKE ${param_idx}")
-        params.append(f"%{full_name}%")
-        param_idx += 1
-    if job_title:
-        conditions.append(f"job_title ILIKE ${param_idx}")
-        params.append(f"%{job_title}%")
-        param_idx += 1
-    if company_domain:
-        conditions.append(f"company_domain = ${param_idx}")
-        params.append(company_domain)
-        param_idx += 1
-    if company_name:
-        conditions.append(f"company_name ILIKE ${param_idx}")
-        params.append(f"%{company_name}%")
-        param_idx += 1
-    if origin_company_domain:
-        conditions.append(f"origin_company_domain = ${param_idx}")
-        params.append(origin_company_domain)
-        param_idx += 1
-    if source:
-        conditions.append(f"source = ${param_idx}")
-        params.append(source)
-        param_idx += 1
-
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-    total = await pool.fetchval(f"SELECT COUNT(*) FROM core.case_study_champions WHERE {where_clause}", *params)
-
-    rows = await pool.fetch(f"""
-        SELECT id, full_name, job_title, company_name, company_domain, origin_company_domain,
-               case_study_url, source, core_person_id, core_company_id, created_at, updated_at
-        FROM core.case_study_champions WHERE {where_clause}
-        ORDER BY created_at DESC LIMIT ${param_idx} OFFSET ${param_idx + 1}
-    """, *params, limit, offset)
+    async with custom_plans(get_pool()) as conn:
+        filters = Predicates()
+        filters.substring("full_name", full_name)
+        filters.substring("job_title", job_title)
+        filters.optional("company_domain = {}", company_domain)
+        filters.substring("company_name", company_name)
+        filters.optional("origin_company_domain = {}", origin_company_domain)
+        filters.optional("source = {}", source)
+
+        where_clause, params = filters.where, filters.params
+        total = await conn.fetchval(f"SELECT COUNT(*) FROM core.case_study_champions WHERE {where_clause}", *params)
+
+        rows, next_cursor = await fetch_page(conn, """
+            SELECT id, full_name, job_title, company_name, company_domain, origin_company_domain,
+                   case_study_url, source, core_person_id, core_company_id, created_at, updated_at
+            FROM core.case_study_champions
+        """, where_clause, params, ("created_at", "id"), limit=limit, offset=offset, cursor=cursor, descending=True)
 
     return TableDataResponse(schema_name="core", table_name="case_study_champions",
-        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset))
+        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset, next_cursor=next_cursor))
 
 
 # ------------------------------------------------------------
@@ -1969,11 +1613,9 @@ async def get_core_case_study_champions(
 # ------------------------------------------------------------
 
 @router.get("/core/icp_criteria/count", response_model=TableCountResponse)
-async def get_core_icp_criteria_count():
+async def get_core_icp_criteria_count(count: str = COUNT_MODE_QUERY):
     """Get count of records in core.icp_criteria."""
-    pool = get_pool()
-    count = await pool.fetchval("SELECT COUNT(*) FROM core.icp_criteria")
-    return TableCountResponse(schema_name="core", table_name="icp_criteria", count=count)
+    return await table_count_response("core.icp_criteria", count)
 
 
 @router.get("/core/icp_criteria", response_model=TableDataResponse)
@@ -1982,33 +1624,26 @@ async def get_core_icp_criteria(
     company_name: Optional[str] = Query(None, description="Filter by company name (partial match)"),
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.next_cursor (overrides offset)"),
 ):
     """Get records from core.icp_criteria with optional filters."""
-    pool = get_pool()
-    conditions, params, param_idx = [], [], 1
-
-    if domain:
-        conditions.append(f"domain = ${param_idx}")
-        params.append(domain)
-        param_idx += 1
-    if company_name:
-        conditions.append(f"company_name ILIKE ${param_idx}")
-        params.append(f"%{company_name}%")
-        param_idx += 1
-
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-    total = await pool.fetchval(f"SELECT COUNT(*) FROM core.icp_criteria WHERE {where_clause}", *params)
-
-    rows = await pool.fetch(f"""
-        SELECT id, domain, company_name, industries, countries, employee_ranges, funding_stages,
-               job_titles, seniorities, job_functions, value_proposition, core_benefit,
-               target_customer, key_differentiator, created_at, updated_at
-        FROM core.icp_criteria WHERE {where_clause}
-        ORDER BY created_at DESC LIMIT ${param_idx} OFFSET ${param_idx + 1}
-    """, *params, limit, offset)
+    async with custom_plans(get_pool()) as conn:
+        filters = Predicates()
+        filters.optional("domain = {}", domain)
+        filters.substring("company_name", company_name)
+
+        where_clause, params = filters.where, filters.params
+        total = await conn.fetchval(f"SELECT COUNT(*) FROM core.icp_criteria WHERE {where_clause}", *params)
+
+        rows, next_cursor = await fetch_page(conn, """
+            SELECT id, domain, company_name, industries, countries, employee_ranges, funding_stages,
+                   job_titles, seniorities, job_functions, value_proposition, core_benefit,
+                   target_customer, key_differentiator, created_at, updated_at
+            FROM core.icp_criteria
+        """, where_clause, params, ("created_at", "id"), limit=limit, offset=offset, cursor=cursor, descending=True)
 
     return TableDataResponse(schema_name="core", table_name="icp_criteria",
-        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset))
+        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset, next_cursor=next_cursor))
 
 
 # ============================================================
@@ -2020,11 +1655,9 @@ async def get_core_icp_criteria(
 # ------------------------------------------------------------
 
 @router.get("/core/companies_missing_cleaned_name/count", response_model=TableCountResponse)
-async def get_core_companies_missing_cleaned_name_count():
+async def get_core_companies_missing_cleaned_name_count(count: str = COUNT_MODE_QUERY):
     """Get count of records in core.companies_missing_cleaned_name."""
-    pool = get_pool()
-    count = await pool.fetchval("SELECT COUNT(*) FROM core.companies_missing_cleaned_name")
-    return TableCountResponse(schema_name="core", table_name="companies_missing_cleaned_name", count=count)
+    return await table_count_response("core.companies_missing_cleaned_name", count)
 
 
 @router.get("/core/companies_missing_cleaned_name", response_model=TableDataResponse)
@@ -2033,31 +1666,24 @@ async def get_core_companies_missing_cleaned_name(
     name: Optional[str] = Query(None, description="Filter by name (partial match)"),
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.next_cursor (overrides offset)"),
 ):
     """Get records from core.companies_missing_cleaned_name with optional filters."""
-    pool = get_pool()
-    conditions, params, param_idx = [], [], 1
-
-    if domain:
-        conditions.append(f"domain = ${param_idx}")
-        params.append(domain)
-        param_idx += 1
-    if name:
-        conditions.append(f"name ILIKE ${param_idx}")
-        params.append(f"%{name}%")
-        param_idx += 1
-
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-    total = await pool.fetchval(f"SELECT COUNT(*) FROM core.companies_missing_cleaned_name WHERE {where_clause}", *params)
-
-    rows = await pool.fetch(f"""
-        SELECT id, name, domain, linkedin_url
-        FROM core.companies_missing_cleaned_name WHERE {where_clause}
-        ORDER BY domain LIMIT ${param_idx} OFFSET ${param_idx + 1}
-    """, *params, limit, offset)
+    async with custom_plans(get_pool()) as conn:
+        filters = Predicates()
+        filters.optional("domain = {}", domain)
+        filters.substring("name", name)
+
+        where_clause, params = filters.where, filters.params
+        total = await conn.fetchval(f"SELECT COUNT(*) FROM core.companies_missing_cleaned_name WHERE {where_clause}", *params)
+
+        rows, next_cursor = await fetch_page(conn, """
+            SELECT id, name, domain, linkedin_url
+            FROM core.companies_missing_cleaned_name
+        """, where_clause, params, ("domain", "id"), limit=limit, offset=offset, cursor=cursor)
 
     return TableDataResponse(schema_name="core", table_name="companies_missing_cleaned_name",
-        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset))
+        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset, next_cursor=next_cursor))
 
 
 # ------------------------------------------------------------
@@ -2065,11 +1691,9 @@ async def get_core_companies_missing_cleaned_name(
 # ------------------------------------------------------------
 
 @router.get("/core/companies_missing_location/count", response_model=TableCountResponse)
-async def get_core_companies_missing_location_count():
+async def get_core_companies_missing_location_count(count: str = COUNT_MODE_QUERY):
     """Get count of records in core.companies_missing_location."""
-    pool = get_pool()
-    count = await pool.fetchval("SELECT COUNT(*) FROM core.companies_missing_location")
-    return TableCountResponse(schema_name="core", table_name="companies_missing_location", count=count)
+    return await table_count_response("core.companies_missing_location", count)
 
 
 @router.get("/core/companies_missing_location", response_model=TableDataResponse)
@@ -2078,31 +1702,24 @@ async def get_core_companies_missing_location(
     name: Optional[str] = Query(None, description="Filter by name (partial match)"),
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.next_cursor (overrides offset)"),
 ):
     """Get records from core.companies_missing_location with optional filters."""
-    pool = get_pool()
-    conditions, params, param_idx = [], [], 1
-
-    if domain:
-        conditions.append(f"domain = ${param_idx}")
-        params.append(domain)
-        param_idx += 1
-    if name:
-        conditions.append(f"name ILIKE ${param_idx}")
-        params.append(f"%{name}%")
-        param_idx += 1
-
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-    total = await pool.fetchval(f"SELECT COUNT(*) FROM core.companies_missing_location WHERE {where_clause}", *params)
-
-    rows = await pool.fetch(f"""
-        SELECT id, domain, name, linkedin_url, discovery_location, salesnav_location
-        FROM core.companies_missing_location WHERE {where_clause}
-        ORDER BY domain LIMIT ${param_idx} OFFSET ${param_idx + 1}
-    """, *params, limit, offset)
+    async with custom_plans(get_pool()) as conn:
+        filters = Predicates()
+        filters.optional("domain = {}", domain)
+        filters.substring("name", name)
+
+        where_clause, params = filters.where, filters.params
+        total = await conn.fetchval(f"SELECT COUNT(*) FROM core.companies_missing_location WHERE {where_clause}", *params)
+
+        rows, next_cursor = await fetch_page(conn, """
+            SELECT id, domain, name, linkedin_url, discovery_location, salesnav_location
+            FROM core.companies_missing_location
+        """, where_clause, params, ("domain", "id"), limit=limit, offset=offset, cursor=cursor)
 
     return TableDataResponse(schema_name="core", table_name="companies_missing_location",
-        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset))
+        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset, next_cursor=next_cursor))
 
 
 # ------------------------------------------------------------
@@ -2110,11 +1727,9 @@ async def get_core_companies_missing_location(
 # ------------------------------------------------------------
 
 @router.get("/core/people_missing_country/count", response_model=TableCountResponse)
-async def get_core_people_missing_country_count():
+async def get_core_people_missing_country_count(count: str = COUNT_MODE_QUERY):
     """Get count of records in core.people_missing_country."""
-    pool = get_pool()
-    count = await pool.fetchval("SELECT COUNT(*) FROM core.people_missing_country")
-    return TableCountResponse(schema_name="core", table_name="people_missing_country", count=count)
+    return await table_count_response("core.people_missing_country", count)
 
 
 @router.get("/core/people_missing_country", response_model=TableDataResponse)
@@ -2123,31 +1738,24 @@ async def get_core_people_missing_country(
     full_name: Optional[str] = Query(None, description="Filter by full name (partial match)"),
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.next_cursor (overrides offset)"),
 ):
     """Get records from core.people_missing_country with optional filters."""
-    pool = get_pool()
-    conditions, params, param_idx = [], [], 1
-
-    if linkedin_url:
-        conditions.append(f"linkedin_url = ${param_idx}")
-        params.append(linkedin_url)
-        param_idx += 1
-    if full_name:
-        conditions.append(f"full_name ILIKE ${param_idx}")
-        params.append(f"%{full_name}%")
-        param_idx += 1
-
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-    total = await pool.fetchval(f"SELECT COUNT(*) FROM core.people_missing_country WHERE {where_clause}", *params)
-
-    rows = await pool.fetch(f"""
-        SELECT id, linkedin_url, full_name, profile_location, discovery_location, salesnav_location
-        FROM core.people_missing_country WHERE {where_clause}
-        ORDER BY linkedin_url LIMIT ${param_idx} OFFSET ${param_idx + 1}
-    """, *params, limit, offset)
+    async with custom_plans(get_pool()) as conn:
+        filters = Predicates()
+        filters.optional("linkedin_url = {}", linkedin_url)
+        filters.substring("full_name", full_name)
+
+        where_clause, params = filters.where, filters.params
+        total = await conn.fetchval(f"SELECT COUNT(*) FROM core.people_missing_country WHERE {where_clause}", *params)
+
+        rows, next_cursor = await fetch_page(conn, """
+            SELECT id, linkedin_url, full_name, profile_location, discovery_location, salesnav_location
+            FROM core.people_missing_country
+        """, where_clause, params, ("linkedin_url", "id"), limit=limit, offset=offset, cursor=cursor)
 
     return TableDataResponse(schema_name="core", table_name="people_missing_country",
-        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset))
+        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset, next_cursor=next_cursor))
 
 
 # ------------------------------------------------------------
@@ -2155,11 +1763,9 @@ async def get_core_people_missing_country(
 # ------------------------------------------------------------
 
 @router.get("/core/persons_missing_cleaned_title/count", response_model=TableCountResponse)
-async def get_core_persons_missing_cleaned_title_count():
+async def get_core_persons_missing_cleaned_title_count(count: str = COUNT_MODE_QUERY):
     """Get count of records in core.persons_missing_cleaned_title."""
-    pool = get_pool()
-    count = await pool.fetchval("SELECT COUNT(*) FROM core.persons_missing_cleaned_title")
-    return TableCountResponse(schema_name="core", table_name="persons_missing_cleaned_title", count=count)
+    return await table_count_response("core.persons_missing_cleaned_title", count)
 
 
 @router.get("/core/persons_missing_cleaned_title", response_model=TableDataResponse)
@@ -2168,31 +1774,24 @@ async def get_core_persons_missing_cleaned_title(
     raw_job_title: Optional[str] = Query(None, description="Filter by raw job title (partial match)"),
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.next_cursor (overrides offset)"),
 ):
     """Get records from core.persons_missing_cleaned_title with optional filters."""
-    pool = get_pool()
-    conditions, params, param_idx = [], [], 1
-
-    if linkedin_url:
-        conditions.append(f"linkedin_url = ${param_idx}")
-        params.append(linkedin_url)
-        param_idx += 1
-    if raw_job_title:
-        conditions.append(f"raw_job_title ILIKE ${param_idx}")
-        params.append(f"%{raw_job_title}%")
-        param_idx += 1
-
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-    total = await pool.fetchval(f"SELECT COUNT(*) FROM core.persons_missing_cleaned_title WHERE {where_clause}", *params)
-
-    rows = await pool.fetch(f"""
-        SELECT linkedin_url, raw_job_title, cleaned_job_title, matched_job_function, matched_seniority, created_at
-        FROM core.persons_missing_cleaned_title WHERE {where_clause}
-        ORDER BY created_at DESC LIMIT ${param_idx} OFFSET ${param_idx + 1}
-    """, *params, limit, offset)
+    async with custom_plans(get_pool()) as conn:
+        filters = Predicates()
+        filters.optional("linkedin_url = {}", linkedin_url)
+        filters.substring("raw_job_title", raw_job_title)
+
+        where_clause, params = filters.where, filters.params
+        total = await conn.fetchval(f"SELECT COUNT(*) FROM core.persons_missing_cleaned_title WHERE {where_clause}", *params)
+
+        rows, next_cursor = await fetch_page(conn, """
+            SELECT linkedin_url, raw_job_title, cleaned_job_title, matched_job_function, matched_seniority, created_at
+            FROM core.persons_missing_cleaned_title
+        """, where_clause, params, ("created_at", "linkedin_url"), limit=limit, offset=offset, cursor=cursor, descending=True)
 
     return TableDataResponse(schema_name="core", table_name="persons_missing_cleaned_title",
-        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset))
+        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset, next_cursor=next_cursor))
 
 
 # ------------------------------------------------------------
@@ -2200,11 +1799,9 @@ async def get_core_persons_missing_cleaned_title(
 # ------------------------------------------------------------
 
 @router.get("/core/company_people_snapshot_history/count", response_model=TableCountResponse)
-async def get_core_company_people_snapshot_history_count():
+async def get_core_company_people_snapshot_history_count(count: str = COUNT_MODE_QUERY):
     """Get count of records in core.company_people_snapshot_history."""
-    pool = get_pool()
-    count = await pool.fetchval("SELECT COUNT(*) FROM core.company_people_snapshot_history")
-    return TableCountResponse(schema_name="core", table_name="company_people_snapshot_history", count=count)
+    return await table_count_response("core.company_people_snapshot_history", count)
 
 
 @router.get("/core/company_people_snapshot_history", response_model=TableDataResponse)
@@ -2215,39 +1812,26 @@ async def get_core_company_people_snapshot_history(
     source: Optional[str] = Query(None, description="Filter by source"),
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.next_cursor (overrides offset)"),
 ):
     """Get records from core.company_people_snapshot_history with optional filters."""
-    pool = get_pool()
-    conditions, params, param_idx = [], [], 1
-
-    if company_domain:
-        conditions.append(f"company_domain = ${param_idx}")
-        params.append(company_domain)
-        param_idx += 1
-    if snapshot_date_gte:
-        conditions.append(f"snapshot_date >= ${param_idx}")
-        params.append(snapshot_date_gte)
-        param_idx += 1
-    if snapshot_date_lte:
-        conditions.append(f"snapshot_date <= ${param_idx}")
-        params.append(snapshot_date_lte)
-        param_idx += 1
-    if source:
-        conditions.append(f"source = ${param_idx}")
-        params.append(source)
-        param_idx += 1
-
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-    total = await pool.fetchval(f"SELECT COUNT(*) FROM core.company_people_snapshot_history WHERE {where_clause}", *params)
-
-    rows = await pool.fetch(f"""
-        SELECT id, company_domain, snapshot_date, total_people_count, people_added_count, people_removed_count, source, created_at
-        FROM core.company_people_snapshot_history WHERE {where_clause}
-        ORDER BY snapshot_date DESC LIMIT ${param_idx} OFFSET ${param_idx + 1}
-    """, *params, limit, offset)
+    async with custom_plans(get_pool()) as conn:
+        filters = Predicates()
+        filters.optional("company_domain = {}", company_domain)
+        filters.optional("snapshot_date >= {}", snapshot_date_gte)
+        filters.optional("snapshot_date <= {}", snapshot_date_lte)
+        filters.optional("source = {}", source)
+
+        where_clause, params = filters.where, filters.params
+        total = await conn.fetchval(f"SELECT COUNT(*) FROM core.company_people_snapshot_history WHERE {where_clause}", *params)
+
+        rows, next_cursor = await fetch_page(conn, """
+            SELECT id, company_domain, snapshot_date, total_people_count, people_added_count, people_removed_count, source, created_at
+            FROM core.company_people_snapshot_history
+        """, where_clause, params, ("snapshot_date", "id"), limit=limit, offset=offset, cursor=cursor, descending=True)
 
     return TableDataResponse(schema_name="core", table_name="company_people_snapshot_history",
-        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset))
+        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset, next_cursor=next_cursor))
 
 
 # ============================================================
@@ -2259,11 +1843,9 @@ async def get_core_company_people_snapshot_history(
 # ------------------------------------------------------------
 
 @router.get("/core/company_public/count", response_model=TableCountResponse)
-async def get_core_company_public_count():
+async def get_core_company_public_count(count: str = COUNT_MODE_QUERY):
     """Get count of records in core.company_public."""
-    pool = get_pool()
-    count = await pool.fetchval("SELECT COUNT(*) FROM core.company_public")
-    return TableCountResponse(schema_name="core", table_name="company_public", count=count)
+    return await table_count_response("core.company_public", count)
 
 
 @router.get("/core/company_public", response_model=TableDataResponse)
@@ -2272,31 +1854,24 @@ async def get_core_company_public(
     company_name: Optional[str] = Query(None, description="Filter by company name (partial match)"),
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.next_cursor (overrides offset)"),
 ):
     """Get records from core.company_public with optional filters."""
-    pool = get_pool()
-    conditions, params, param_idx = [], [], 1
-
-    if domain:
-        conditions.append(f"domain = ${param_idx}")
-        params.append(domain)
-        param_idx += 1
-    if company_name:
-        conditions.append(f"company_name ILIKE ${param_idx}")
-        params.append(f"%{company_name}%")
-        param_idx += 1
-
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-    total = await pool.fetchval(f"SELECT COUNT(*) FROM core.company_public WHERE {where_clause}", *params)
-
-    rows = await pool.fetch(f"""
-        SELECT domain, company_name, linkedin_url, created_at
-        FROM core.company_public WHERE {where_clause}
-        ORDER BY created_at DESC LIMIT ${param_idx} OFFSET ${param_idx + 1}
-    """, *params, limit, offset)
+    async with custom_plans(get_pool()) as conn:
+        filters = Predicates()
+        filters.optional("domain = {}", domain)
+        filters.substring("company_name", company_name)
+
+        where_clause, params = filters.where, filters.params
+        total = await conn.fetchval(f"SELECT COUNT(*) FROM core.company_public WHERE {where_clause}", *params)
+
+        rows, next_cursor = await fetch_page(conn, """
+            SELECT domain, company_name, linkedin_url, created_at
+            FROM core.company_public
+        """, where_clause, params, ("created_at", "domain"), limit=limit, offset=offset, cursor=cursor, descending=True)
 
     return TableDataResponse(schema_name="core", table_name="company_public",
-        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset))
+        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset, next_cursor=next_cursor))
 
 
 # ------------------------------------------------------------
@@ -2304,11 +1879,9 @@ async def get_core_company_public(
 # ------------------------------------------------------------
 
 @router.get("/core/company_employee_ranges/count", response_model=TableCountResponse)
-async def get_core_company_employee_ranges_count():
+async def get_core_company_employee_ranges_count(count: str = COUNT_MODE_QUERY):
     """Get count of records in core.company_employee_ranges."""
-    pool = get_pool()
-    count = await pool.fetchval("SELECT COUNT(*) FROM core.company_employee_ranges")
-    return TableCountResponse(schema_name="core", table_name="company_employee_ranges", count=count)
+    return await table_count_response("core.company_employee_ranges", count)
 
 
 @router.get("/core/company_employee_ranges", response_model=TableDataResponse)
@@ -2318,35 +1891,25 @@ async def get_core_company_employee_ranges(
     source: Optional[str] = Query(None, description="Filter by source"),
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.next_cursor (overrides offset)"),
 ):
     """Get records from core.company_employee_ranges with optional filters."""
-    pool = get_pool()
-    conditions, params, param_idx = [], [], 1
-
-    if domain:
-        conditions.append(f"domain = ${param_idx}")
-        params.append(domain)
-        param_idx += 1
-    if matched_employee_range:
-        conditions.append(f"matched_employee_range = ${param_idx}")
-        params.append(matched_employee_range)
-        param_idx += 1
-    if source:
-        conditions.append(f"source = ${param_idx}")
-        params.append(source)
-        param_idx += 1
-
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-    total = await pool.fetchval(f"SELECT COUNT(*) FROM core.company_employee_ranges WHERE {where_clause}", *params)
-
-    rows = await pool.fetch(f"""
-        SELECT id, domain, source, raw_size, raw_employee_count, matched_employee_range, created_at, updated_at
-        FROM core.company_employee_ranges WHERE {where_clause}
-        ORDER BY created_at DESC LIMIT ${param_idx} OFFSET ${param_idx + 1}
-    """, *params, limit, offset)
+    async with custom_plans(get_pool()) as conn:
+        filters = Predicates()
+        filters.optional("domain = {}", domain)
+        filters.optional("matched_employee_range = {}", matched_employee_range)
+        filters.optional("source = {}", source)
+
+        where_clause, params = filters.where, filters.params
+        total = await conn.fetchval(f"SELECT COUNT(*) FROM core.company_employee_ranges WHERE {where_clause}", *params)
+
+        rows, next_cursor = await fetch_page(conn, """
+            SELECT id, domain, source, raw_size, raw_employee_count, matched_employee_range, created_at, updated_at
+            FROM core.company_employee_ranges
+        """, where_clause, params, ("created_at", "id"), limit=limit, offset=offset, cursor=cursor, descending=True)
 
     return TableDataResponse(schema_name="core", table_name="company_employee_ranges",
-        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset))
+        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset, next_cursor=next_cursor))
 
 
 # ------------------------------------------------------------
@@ -2354,11 +1917,9 @@ async def get_core_company_employee_ranges(
 # ------------------------------------------------------------
 
 @router.get("/core/target_client_views/count", response_model=TableCountResponse)
-async def get_core_target_client_views_count():
+async def get_core_target_client_views_count(count: str = COUNT_MODE_QUERY):
     """Get count of records in core.target_client_views."""
-    pool = get_pool()
-    count = await pool.fetchval("SELECT COUNT(*) FROM core.target_client_views")
-    return TableCountResponse(schema_name="core", table_name="target_client_views", count=count)
+    return await table_count_response("core.target_client_views", count)
 
 
 @router.get("/core/target_client_views", response_model=TableDataResponse)
@@ -2368,35 +1929,25 @@ async def get_core_target_client_views(
     slug: Optional[str] = Query(None, description="Filter by slug"),
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.next_cursor (overrides offset)"),
 ):
     """Get records from core.target_client_views with optional filters."""
-    pool = get_pool()
-    conditions, params, param_idx = [], [], 1
-
-    if domain:
-        conditions.append(f"domain = ${param_idx}")
-        params.append(domain)
-        param_idx += 1
-    if name:
-        conditions.append(f"name ILIKE ${param_idx}")
-        params.append(f"%{name}%")
-        param_idx += 1
-    if slug:
-        conditions.append(f"slug = ${param_idx}")
-        params.append(slug)
-        param_idx += 1
-
-    where_clause = " AND ".join(conditions) if conditions else "1=1"
-    total = await pool.fetchval(f"SELECT COUNT(*) FROM core.target_client_views WHERE {where_clause}", *params)
-
-    rows = await pool.fetch(f"""
-        SELECT id, domain, name, slug, filters, endpoint, created_at, updated_at
-        FROM core.target_client_views WHERE {where_clause}
-        ORDER BY created_at DESC LIMIT ${param_idx} OFFSET ${param_idx + 1}
-    """, *params, limit, offset)
+    async with custom_plans(get_pool()) as conn:
+        filters = Predicates()
+        filters.optional("domain = {}", domain)
+        filters.substring("name", name)
+        filters.optional("slug = {}", slug)
+
+        where_clause, params = filters.where, filters.params
+        total = await conn.fetchval(f"SELECT COUNT(*) FROM core.target_client_views WHERE {where_clause}", *params)
+
+        rows, next_cursor = await fetch_page(conn, """
+            SELECT id, domain, name, slug, filters, endpoint, created_at, updated_at
+            FROM core.target_client_views
+        """, where_clause, params, ("created_at", "id"), limit=limit, offset=offset, cursor=cursor, descending=True)
 
     return TableDataResponse(schema_name="core", table_name="target_client_views",
-        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset))
+        data=[row_to_dict(row) for row in rows], meta=PaginationMeta(total=total, limit=limit, offset=offset, next_cursor=next_cursor))
 
 
 # ============================================================
@@ -2446,51 +1997,45 @@ async def get_top_vc_missing_customers(
     Get companies backed by top 70 VCs that are missing customer data.
     Returns company info along with their VC investors from the top 70 list.
     """
-    pool = get_pool()
-
-    # Build WHERE clause
-    where_conditions = ["""
-        NOT EXISTS (
-            SELECT 1 FROM core.company_customers cc
-            WHERE cc.origin_company_domain = cvi.company_domain
-        )
-    """]
-    params = []
-    param_idx = 1
-
-    if vc_domain:
-        where_conditions.append(f"tv.domain = ${param_idx}")
-        params.append(vc_domain)
-        param_idx += 1
+    async with custom_plans(get_pool()) as conn:
+        # Build WHERE clause
+        filters = Predicates()
+        filters.clauses.append("""
+            NOT EXISTS (
+                SELECT 1 FROM core.company_customers cc
+                WHERE cc.origin_company_domain = cvi.company_domain
+            )
+        """)
+        filters.optional("tv.domain = {}", vc_domain)
 
-    where_clause = " AND ".join(where_conditions)
+        where_clause, params = filters.where, filters.params
 
-    # Count query
-    count_query = f"""
-        SELECT COUNT(DISTINCT cvi.company_domain)
-        FROM core.company_vc_investors cvi
-        INNER JOIN reference.top_vcs tv ON tv.domain = cvi.vc_domain
-        WHERE {where_clause}
-    """
-    total = await pool.fetchval(count_query, *params)
-
-    # Data query - get unique companies with their top VC investors aggregated
-    data_query = f"""
-        SELECT
-            cvi.company_domain as domain,
-            cvi.company_name as name,
-            ARRAY_AGG(DISTINCT tv.name ORDER BY tv.name) as top_vc_investors,
-            ARRAY_AGG(DISTINCT tv.domain ORDER BY tv.domain) as top_vc_domains
-        FROM core.company_vc_investors cvi
-        INNER JOIN reference.top_vcs tv ON tv.domain = cvi.vc_domain
-        WHERE {where_clause}
-        GROUP BY cvi.company_domain, cvi.company_name
-        ORDER BY cvi.company_name
-        LIMIT ${param_idx} OFFSET ${param_idx + 1}
-    """
-    params.extend([limit, offset])
+        # Count query
+        count_query = f"""
+            SELECT COUNT(DISTINCT cvi.company_domain)
+            FROM core.company_vc_investors cvi
+            INNER JOIN reference.top_vcs tv ON tv.domain = cvi.vc_domain
+            WHERE {where_clause}
+        """
+        total = await conn.fetchval(count_query, *params)
+
+        # Data query - get unique companies with their top VC investors aggregated
+        data_query = f"""
+            SELECT
+                cvi.company_domain as domain,
+                cvi.company_name as name,
+                ARRAY_AGG(DISTINCT tv.name ORDER BY tv.name) as top_vc_investors,
+                ARRAY_AGG(DISTINCT tv.domain ORDER BY tv.domain) as top_vc_domains
+            FROM core.company_vc_investors cvi
+            INNER JOIN reference.top_vcs tv ON tv.domain = cvi.vc_domain
+            WHERE {where_clause}
+            GROUP BY cvi.company_domain, cvi.company_name
+            ORDER BY cvi.company_name
+            LIMIT ${len(params) + 1} OFFSET ${len(params) + 2}
+        """
+        params.extend([limit, offset])
 
-    rows = await pool.fetch(data_query, *params)
+        rows = await conn.fetch(data_query, *params)
 
     return TopVCMissingCustomersResponse(
         total=total,
@@ -2555,7 +2100,7 @@ async def get_companies_for_parallel_icp(payload: dict = {}):
 # ============================================================
 
 @router.get("/{schema_name}/{table_name}/count", response_model=TableCountResponse)
-async def get_generic_table_count(schema_name: str, table_name: str):
+async def get_generic_table_count(schema_name: str, table_name: str, count: str = COUNT_MODE_QUERY):
     """
     Generic count endpoint for any allowed table.
     This endpoint must be defined LAST so specific routes take precedence.
@@ -2568,11 +2113,4 @@ async def get_generic_table_count(schema_name: str, table_name: str):
             detail=f"Table {full_name} not in allowed list"
         )
 
-    pool = get_pool()
-    count = await pool.fetchval(f"SELECT COUNT(*) FROM {schema_name}.{table_name}")
-
-    return TableCountResponse(
-        schema_name=schema_name,
-        table_name=table_name,
-        count=count
-    )
+    return await table_count_response(full_name, count)
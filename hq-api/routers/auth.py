@@ -1,6 +1,7 @@
 from fastapi import APIRouter, HTTPException, Header, Query
 from typing import Optional, List
 from db import get_auth_pool
+import sessions
 from models import Org, User, UserWithOrg, SessionValidation, MagicLinkRequest, MagicLinkResponse, VerifyMagicLinkResponse
 import secrets
 import os
@@ -37,26 +38,27 @@ async def validate_session(authorization: Optional[str] = Header(None)):
     # Extract token from "Bearer <token>"
     token = authorization.replace("Bearer ", "") if authorization.startswith("Bearer ") else authorization
 
-    pool = get_auth_pool()
-
-    # Check session table (BetterAuth uses 'session' table)
-    row = await pool.fetchrow(
-        """
-        SELECT "userId", "expiresAt"
-        FROM public.session
-        WHERE token = $1 AND "expiresAt" > NOW()
-        """,
-        token
-    )
-
-    if not row:
-        return SessionValidation(valid=False)
+    async def load():
+        # Check session table (BetterAuth uses 'session' table)
+        row = await get_auth_pool().fetchrow(
+            """
+            SELECT "userId", "expiresAt"
+            FROM public.session
+            WHERE token = $1 AND "expiresAt" > NOW()
+            """,
+            token
+        )
+        if not row:
+            return None
+        validation = SessionValidation(
+            valid=True,
+            user_id=str(row["userId"]),
+            expires_at=row["expiresAt"].isoformat() if row["expiresAt"] else None
+        )
+        return validation, row["userId"], row["expiresAt"]
 
-    return SessionValidation(
-        valid=True,
-        user_id=str(row["userId"]),
-        expires_at=row["expiresAt"].isoformat() if row["expiresAt"] else None
-    )
+    validation = await sessions.cached_lookup("session", token, load)
+    return validation or SessionValidation(valid=False)
 
 
 @router.get("/me", response_model=UserWithOrg)
@@ -72,51 +74,76 @@ async def get_current_user(authorization: Optional[str] = Header(None)):
 
     token = authorization.replace("Bearer ", "") if authorization.startswith("Bearer ") else authorization
 
-    pool = get_auth_pool()
+    async def load():
+        pool = get_auth_pool()
 
-    # Get session and user
-    session_row = await pool.fetchrow(
-        """
-        SELECT s."userId", s."expiresAt", u.name, u.email, u."emailVerified", u.image, u."createdAt"
-        FROM public.session s
-        JOIN public."user" u ON u.id = s."userId"
-        WHERE s.token = $1 AND s."expiresAt" > NOW()
-        """,
-        token
-    )
+        # Get session and user
+        session_row = await pool.fetchrow(
+            """
+            SELECT s."userId", s."expiresAt", u.name, u.email, u."emailVerified", u.image, u."createdAt"
+            FROM public.session s
+            JOIN public."user" u ON u.id = s."userId"
+            WHERE s.token = $1 AND s."expiresAt" > NOW()
+            """,
+            token
+        )
 
-    if not session_row:
+        if not session_row:
+            return None
+
+        user = User(
+            id=str(session_row["userId"]),
+            email=session_row["email"],
+            name=session_row["name"],
+            email_verified=session_row["emailVerified"] or False,
+            avatar_url=session_row["image"],
+            is_active=True,
+            created_at=session_row["createdAt"].isoformat() if session_row["createdAt"] else None
+        )
+
+        # Get org membership
+        org_row = await pool.fetchrow(
+            """
+            SELECT o.*, ou.role
+            FROM core.org_users ou
+            JOIN core.orgs o ON o.id = ou.org_id
+            WHERE ou.user_id = $1::uuid
+            """,
+            session_row["userId"]
+        )
+
+        org = None
+        role = None
+        if org_row:
+            org_dict = row_to_dict(org_row)
+            role = org_dict.pop("role", None)
+            org = Org(**org_dict)
+
+        return UserWithOrg(user=user, org=org, role=role), session_row["userId"], session_row["expiresAt"]
+
+    current = await sessions.cached_lookup("me", token, load)
+    if current is None:
         raise HTTPException(status_code=401, detail="Invalid or expired session")
+    return current
 
-    user = User(
-        id=str(session_row["userId"]),
-        email=session_row["email"],
-        name=session_row["name"],
-        email_verified=session_row["emailVerified"] or False,
-        avatar_url=session_row["image"],
-        is_active=True,
-        created_at=session_row["createdAt"].isoformat() if session_row["createdAt"] else None
-    )
 
-    # Get org membership
-    org_row = await pool.fetchrow(
-        """
-        SELECT o.*, ou.role
-        FROM core.org_users ou
-        JOIN core.orgs o ON o.id = ou.org_id
-        WHERE ou.user_id = $1::uuid
-        """,
-        session_row["userId"]
-    )
+@router.post("/logout")
+async def logout(authorization: Optional[str] = Header(None)):
+    """
+    End a session: delete its token and drop it from the session cache.
 
-    org = None
-    role = None
-    if org_row:
-        org_dict = row_to_dict(org_row)
-        role = org_dict.pop("role", None)
-        org = Org(**org_dict)
+    Pass token in Authorization header: "Bearer <token>"
+    """
+    if not authorization:
+        raise HTTPException(status_code=401, detail="No authorization token provided")
 
-    return UserWithOrg(user=user, org=org, role=role)
+    token = authorization.replace("Bearer ", "") if authorization.startswith("Bearer ") else authorization
+
+    pool = get_auth_pool()
+    await pool.execute("DELETE FROM public.session WHERE token = $1", token)
+    sessions.invalidate_token(token)
+
+    return {"success": True}
 
 
 @router.get("/orgs", response_model=List[Org])
@@ -326,6 +353,10 @@ async def verify_magic_link(token: str = Query(...)):
         secrets.token_urlsafe(16), session_token, user_id, session_expires
     )
 
+    # New session (and possibly new org membership): drop anything cached for this user
+    sessions.invalidate_user(user_id)
+    sessions.invalidate_token(session_token)
+
     # Get user for response
     user_row = await pool.fetchrow(
         'SELECT * FROM public."user" WHERE id = $1',
@@ -2,8 +2,11 @@ import os
 import httpx
 from fastapi import APIRouter, Query, HTTPException
 from typing import Optional, List
-from db import core, extracted, get_pool
+from db import core, extracted, get_pool, execute_async
+from pagination import encode_cursor, decode_cursor
 from models import Company, CompaniesResponse, PaginationMeta
+from repositories import companies as companies_repo
+from search import COMPANY_SEARCH_COLUMNS, contains_pattern
 
 MODAL_SIMILAR_COMPANIES_URL = os.getenv(
     "MODAL_SIMILAR_COMPANIES_URL",
@@ -27,16 +30,11 @@ def apply_company_filters(query, params: dict):
     if params.get("employee_range"):
         ranges = params["employee_range"].split(",")
         query = query.in_("employee_range", ranges)
-    if params.get("city"):
-        query = query.ilike("company_city", f"%{params['city']}%")
-    if params.get("state"):
-        query = query.ilike("company_state", f"%{params['state']}%")
-    if params.get("country"):
-        query = query.ilike("company_country", f"%{params['country']}%")
+    for key, col in COMPANY_SEARCH_COLUMNS.items():
+        if params.get(key):
+            query = query.ilike(col, contains_pattern(params[key]))
     if params.get("domain"):
         query = query.eq("domain", params["domain"])
-    if params.get("name"):
-        query = query.ilike("name", f"%{params['name']}%")
     return query
 
 
@@ -51,8 +49,9 @@ async def get_companies(
     name: Optional[str] = Query(None, description="Filter by company name"),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.next_cursor; pass empty to start cursor paging. Overrides offset."),
 ):
-    """Get companies with optional filters."""
+    """Get companies with optional filters. Use `cursor` rather than `offset` for deep pages."""
     params = {
         "industry": industry,
         "employee_range": employee_range,
@@ -66,18 +65,29 @@ async def get_companies(
     # Get count
     count_query = core().from_("companies_full").select("id", count="exact", head=True)
     count_query = apply_company_filters(count_query, params)
-    count_result = count_query.execute()
+    count_result = await execute_async(count_query)
     total = count_result.count or 0
 
     # Get data
     data_query = core().from_("companies_full").select(COMPANY_COLUMNS)
     data_query = apply_company_filters(data_query, params)
-    data_query = data_query.range(offset, offset + limit - 1)
-    data_result = data_query.execute()
+    if cursor is None:
+        data_query = data_query.range(offset, offset + limit - 1)
+    else:
+        # Keyset paging on id
+        data_query = data_query.order("id")
+        if cursor:
+            data_query = data_query.gt("id", decode_cursor(cursor, 1)[0])
+        data_query = data_query.limit(limit)
+    data_result = await execute_async(data_query)
+
+    next_cursor = None
+    if cursor is not None and len(data_result.data) == limit:
+        next_cursor = encode_cursor([data_result.data[-1]["id"]])
 
     return CompaniesResponse(
         data=[Company(**row) for row in data_result.data],
-        meta=PaginationMeta(total=total, limit=limit, offset=offset)
+        meta=PaginationMeta(total=total, limit=limit, offset=offset, next_cursor=next_cursor)
     )
 
 
@@ -552,23 +562,15 @@ async def get_similar_companies(
 
     # Check cache first (unless refresh requested)
     if not refresh:
-        cached_result = (
-            extracted()
-            .from_("company_enrich_similar")
-            .select("company_name, company_domain, company_industry, company_description, similarity_score")
-            .eq("input_domain", domain)
-            .order("similarity_score", desc=True)
-            .limit(limit)
-            .execute()
-        )
+        cached = await companies_repo.fetch_similar_companies(domain, limit)
 
-        if cached_result.data and len(cached_result.data) > 0:
+        if cached:
             return {
                 "success": True,
                 "domain": domain,
                 "source": "cache",
-                "similar_companies": cached_result.data,
-                "count": len(cached_result.data),
+                "similar_companies": cached,
+                "count": len(cached),
             }
 
     # No cache or refresh requested - call Modal function
@@ -601,22 +603,14 @@ async def get_similar_companies(
                 }
 
             # Fetch the newly stored results from DB
-            fresh_result = (
-                extracted()
-                .from_("company_enrich_similar")
-                .select("company_name, company_domain, company_industry, company_description, similarity_score")
-                .eq("input_domain", domain)
-                .order("similarity_score", desc=True)
-                .limit(limit)
-                .execute()
-            )
+            fresh = await companies_repo.fetch_similar_companies(domain, limit)
 
             return {
                 "success": True,
                 "domain": domain,
                 "source": "api",
-                "similar_companies": fresh_result.data,
-                "count": len(fresh_result.data) if fresh_result.data else 0,
+                "similar_companies": fresh,
+                "count": len(fresh),
             }
 
     except httpx.TimeoutException:
@@ -982,8 +976,6 @@ async def check_company_enrichment_status(payload: dict):
 
     Returns: { "enriched": true/false, "last_enriched_at": timestamp }
     """
-    from db import get_pool, reference
-
     domain = payload.get("domain", "").lower().strip().rstrip("/")
     workflow_slug = payload.get("workflow_slug", "").strip()
 
@@ -993,22 +985,15 @@ async def check_company_enrichment_status(payload: dict):
         return {"error": "workflow_slug is required", "enriched": False}
 
     # Look up core_table from registry
-    registry_result = (
-        reference()
-        .from_("enrichment_workflow_registry")
-        .select("core_table")
-        .eq("workflow_slug", workflow_slug)
-        .limit(1)
-        .execute()
-    )
+    registry = await companies_repo.fetch_workflow_core_table(workflow_slug)
 
-    if not registry_result.data:
+    if not registry:
         return {
             "error": f"workflow_slug '{workflow_slug}' not found in registry",
             "enriched": False
         }
 
-    core_table = registry_result.data[0].get("core_table")
+    core_table = registry.get("core_table")
 
     if not core_table:
         return {
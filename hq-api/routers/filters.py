@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request, Response
 from typing import Optional, List
 from pydantic import BaseModel
-from db import supabase
+from db import supabase, execute_async
+from repositories import filters as filters_repo
+import typeahead
 
 
 router = APIRouter(prefix="/api/filters", tags=["filters"])
@@ -44,124 +46,92 @@ def reference():
     return supabase.schema("reference")
 
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison against an If-None-Match header (list or *)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    bare = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == bare for tag in if_none_match.split(","))
+
+
 @router.get("", response_model=AllFiltersResponse)
-async def get_all_filters():
+async def get_all_filters(request: Request, response: Response):
     """
     Get all filter options from reference tables.
 
     This is the canonical source of truth for frontend dropdowns.
     All values come from reference tables, not from querying data.
-    """
-    # Seniorities
-    seniorities_result = (
-        reference()
-        .from_("seniorities")
-        .select("name, sort_order")
-        .order("sort_order")
-        .execute()
-    )
-
-    # Job Functions
-    job_functions_result = (
-        reference()
-        .from_("job_functions")
-        .select("name, sort_order")
-        .order("sort_order")
-        .execute()
-    )
 
-    # Employee Ranges
-    employee_ranges_result = (
-        reference()
-        .from_("employee_ranges")
-        .select("name, min_employees, max_employees, sort_order")
-        .order("sort_order")
-        .execute()
-    )
-
-    # Industries (from company_industries)
-    industries_result = (
-        reference()
-        .from_("company_industries")
-        .select("name")
-        .order("name")
-        .execute()
-    )
-
-    # Signals
-    signals_result = (
-        reference()
-        .from_("signals")
-        .select("name, display_name, endpoint, sort_order")
-        .order("sort_order")
-        .execute()
-    )
+    Served from an in-process cache with an ETag derived from the
+    reference rows; send it back as If-None-Match to get a 304 when
+    nothing changed.
+    """
+    cached = await filters_repo.get_cached_filters()
+    headers = {"ETag": cached.etag, "Cache-Control": "no-cache"}
 
-    # Business Models
-    business_models_result = (
-        reference()
-        .from_("business_models")
-        .select("name, sort_order")
-        .order("sort_order")
-        .execute()
-    )
+    if _etag_matches(request.headers.get("if-none-match"), cached.etag):
+        return Response(status_code=304, headers=headers)
 
+    response.headers.update(headers)
+    rows = cached.rows
     return AllFiltersResponse(
-        seniorities=[FilterOption(**row) for row in seniorities_result.data],
-        job_functions=[FilterOption(**row) for row in job_functions_result.data],
-        employee_ranges=[EmployeeRangeOption(**row) for row in employee_ranges_result.data],
-        industries=[IndustryOption(**row) for row in industries_result.data],
-        signals=[SignalOption(**row) for row in signals_result.data],
-        business_models=[FilterOption(**row) for row in business_models_result.data],
+        seniorities=[FilterOption(**row) for row in rows["seniorities"]],
+        job_functions=[FilterOption(**row) for row in rows["job_functions"]],
+        employee_ranges=[EmployeeRangeOption(**row) for row in rows["employee_ranges"]],
+        industries=[IndustryOption(**row) for row in rows["industries"]],
+        signals=[SignalOption(**row) for row in rows["signals"]],
+        business_models=[FilterOption(**row) for row in rows["business_models"]],
     )
 
 
 @router.get("/seniorities", response_model=List[FilterOption])
 async def get_seniorities():
     """Get seniority levels from reference table."""
-    result = reference().from_("seniorities").select("name, sort_order").order("sort_order").execute()
+    result = await execute_async(reference().from_("seniorities").select("name, sort_order").order("sort_order"))
     return [FilterOption(**row) for row in result.data]
 
 
 @router.get("/job-functions", response_model=List[FilterOption])
 async def get_job_functions():
     """Get job functions from reference table."""
-    result = reference().from_("job_functions").select("name, sort_order").order("sort_order").execute()
+    result = await execute_async(reference().from_("job_functions").select("name, sort_order").order("sort_order"))
     return [FilterOption(**row) for row in result.data]
 
 
 @router.get("/employee-ranges", response_model=List[EmployeeRangeOption])
 async def get_employee_ranges():
     """Get employee ranges from reference table."""
-    result = reference().from_("employee_ranges").select("name, min_employees, max_employees, sort_order").order("sort_order").execute()
+    result = await execute_async(reference().from_("employee_ranges").select("name, min_employees, max_employees, sort_order").order("sort_order"))
     return [EmployeeRangeOption(**row) for row in result.data]
 
 
 @router.get("/industries", response_model=List[IndustryOption])
 async def get_industries():
     """Get industries from reference table."""
-    result = reference().from_("company_industries").select("name").order("name").execute()
+    result = await execute_async(reference().from_("company_industries").select("name").order("name"))
     return [IndustryOption(**row) for row in result.data]
 
 
 @router.get("/signals", response_model=List[SignalOption])
 async def get_signals():
     """Get signals from reference table."""
-    result = reference().from_("signals").select("name, display_name, endpoint, sort_order").order("sort_order").execute()
+    result = await execute_async(reference().from_("signals").select("name, display_name, endpoint, sort_order").order("sort_order"))
     return [SignalOption(**row) for row in result.data]
 
 
 @router.get("/business-models", response_model=List[FilterOption])
 async def get_business_models():
     """Get business models from reference table."""
-    result = reference().from_("business_models").select("name, sort_order").order("sort_order").execute()
+    result = await execute_async(reference().from_("business_models").select("name, sort_order").order("sort_order"))
     return [FilterOption(**row) for row in result.data]
 
 
 @router.get("/countries", response_model=List[dict])
 async def get_countries():
     """Get countries from reference table."""
-    result = reference().from_("countries").select("name, code").order("name").execute()
+    result = await execute_async(reference().from_("countries").select("name, code").order("name"))
     return result.data
 
 
@@ -173,16 +143,15 @@ async def get_technologies(
     """
     Get tech stack technologies from reference table.
     Used for autocomplete in the Technologies filter.
-    """
-    query = reference().from_("predictleads_technologies").select("title, technology_domain, categories")
-
-    if q:
-        query = query.ilike("title", f"%{q}%")
-
-    query = query.order("title").limit(limit)
-    result = query.execute()
 
-    return [{"name": row["title"], "domain": row.get("technology_domain"), "categories": row.get("categories")} for row in result.data]
+    Served from the in-process typeahead index: matches the start of any word
+    in the name (with one-typo fallback), most widely used first.
+    """
+    index = await typeahead.get_index("technologies")
+    return [
+        {"name": row["name"], "domain": row.get("domain"), "categories": row.get("categories")}
+        for row in index.search(q, limit)
+    ]
 
 
 @router.get("/job-titles")
@@ -193,13 +162,9 @@ async def get_job_titles(
     """
     Get normalized job titles from reference table.
     Used for autocomplete in the Hiring For filter.
-    """
-    query = reference().from_("job_titles").select("normalized_title")
-
-    if q:
-        query = query.ilike("normalized_title", f"%{q}%")
 
-    query = query.order("normalized_title").limit(limit)
-    result = query.execute()
-
-    return [{"name": row["normalized_title"]} for row in result.data]
+    Served from the in-process typeahead index: matches the start of any word
+    in the title (with one-typo fallback), most posted first.
+    """
+    index = await typeahead.get_index("job_titles")
+    return [{"name": row["name"]} for row in index.search(q, limit)]
@@ -1,8 +1,12 @@
+import os
 import csv
 import io
 import json
-from fastapi import APIRouter
-from db import get_pool
+import uuid
+import asyncio
+import itertools
+from fastapi import APIRouter, UploadFile, File, Form
+from db import get_pool, get_bulk_pool
 from routers.workflows import normalize_record
 
 router = APIRouter(prefix="/api/hq", tags=["hq"])
@@ -37,46 +41,42 @@ async def get_clients(payload: dict = {}):
     }
 
 
-@router.post("/clients/upload-csv")
-async def upload_client_csv(payload: dict):
+# Column order for COPY into the staging tables
+RAW_COPY_COLUMNS = [
+    "id", "client_domain", "first_name", "last_name", "full_name",
+    "person_linkedin_url", "person_city", "person_state", "person_country",
+    "work_email", "phone_number", "company_name", "domain",
+    "company_linkedin_url", "company_city", "company_state", "company_country",
+    "raw_payload",
+]
+NORMALIZED_COPY_COLUMNS = [
+    "raw_data_id", "client_domain",
+    "first_name", "last_name", "full_name",
+    "person_linkedin_url", "person_city", "person_state", "person_country",
+    "work_email", "phone_number",
+    "company_name", "domain", "company_linkedin_url",
+    "company_city", "company_state", "company_country",
+    "title", "status", "notes",
+]
+
+# Rows parsed + normalized per COPY round trip
+CSV_UPLOAD_BATCH_SIZE = int(os.getenv("CSV_UPLOAD_BATCH_SIZE", "5000"))
+
+
+def _parse_csv_batch(reader: csv.DictReader, client_domain: str, row_offset: int, batch_size: int):
     """
-    Upload CSV data for a client.
-
-    Payload: {
-        "client_domain": "securitypalhq.com",
-        "csv_data": "first_name,last_name,work_email,...\\nJohn,Doe,john@example.com,..."
-    }
-
-    1. Parses CSV and inserts into hq.clients_raw_data (raw, as-is)
-    2. Normalizes and inserts into hq.clients_normalized_crm_data
+    Read up to batch_size rows, returning COPY records for both tables.
 
-    Known columns are extracted to their own fields.
-    All data (including title, status, notes, extras) goes into raw_payload JSONB.
+    Raw ids are generated here so normalized rows can reference them
+    before anything is written.
     """
-    client_domain = payload.get("client_domain", "").strip()
-    csv_data = payload.get("csv_data", "").strip()
-
-    if not client_domain:
-        return {"success": False, "error": "client_domain is required"}
-    if not csv_data:
-        return {"success": False, "error": "csv_data is required"}
-
-    pool = get_pool()
-
-    # Verify client exists
-    client = await pool.fetchrow(
-        "SELECT domain FROM hq.clients WHERE domain = $1", client_domain
-    )
-    if not client:
-        return {"success": False, "error": f"Client '{client_domain}' not found in hq.clients"}
-
-    # Parse CSV
-    reader = csv.DictReader(io.StringIO(csv_data))
-    rows_inserted = 0
-    rows_normalized = 0
+    raw_records = []
+    normalized_records = []
     errors = []
+    consumed = 0
 
-    for i, row in enumerate(reader):
+    for row in itertools.islice(reader, batch_size):
+        consumed += 1
         try:
             # Extract known columns (normalize keys to lowercase/underscore)
             csv_row = {}
@@ -84,97 +84,85 @@ async def upload_client_csv(payload: dict):
                 # Normalize key: lowercase, replace spaces with underscores
                 norm_key = key.lower().strip().replace(" ", "_").replace("-", "_")
                 csv_row[norm_key] = value.strip() if value else None
-
-            # Build insert values for raw table
-            raw_values = {
-                "client_domain": client_domain,
-                "first_name": csv_row.get("first_name"),
-                "last_name": csv_row.get("last_name"),
-                "full_name": csv_row.get("full_name"),
-                "person_linkedin_url": csv_row.get("person_linkedin_url"),
-                "person_city": csv_row.get("person_city"),
-                "person_state": csv_row.get("person_state"),
-                "person_country": csv_row.get("person_country"),
-                "work_email": csv_row.get("work_email"),
-                "phone_number": csv_row.get("phone_number"),
-                "company_name": csv_row.get("company_name"),
-                "domain": csv_row.get("domain"),
-                "company_linkedin_url": csv_row.get("company_linkedin_url"),
-                "company_city": csv_row.get("company_city"),
-                "company_state": csv_row.get("company_state"),
-                "company_country": csv_row.get("company_country"),
-                "raw_payload": json.dumps(csv_row),
-            }
-
-            # 1. Insert into raw table and get the ID back
-            raw_id = await pool.fetchval("""
-                INSERT INTO hq.clients_raw_data (
-                    client_domain, first_name, last_name, full_name,
-                    person_linkedin_url, person_city, person_state, person_country,
-                    work_email, phone_number, company_name, domain,
-                    company_linkedin_url, company_city, company_state, company_country,
-                    raw_payload
-                ) VALUES (
-                    $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17
-                )
-                RETURNING id
-            """,
-                raw_values["client_domain"],
-                raw_values["first_name"],
-                raw_values["last_name"],
-                raw_values["full_name"],
-                raw_values["person_linkedin_url"],
-                raw_values["person_city"],
-                raw_values["person_state"],
-                raw_values["person_country"],
-                raw_values["work_email"],
-                raw_values["phone_number"],
-                raw_values["company_name"],
-                raw_values["domain"],
-                raw_values["company_linkedin_url"],
-                raw_values["company_city"],
-                raw_values["company_state"],
-                raw_values["company_country"],
-                raw_values["raw_payload"],
-            )
-            rows_inserted += 1
-
-            # 2. Normalize the record
-            raw_record = {
-                "id": raw_id,
-                "client_domain": client_domain,
-                "first_name": raw_values["first_name"],
-                "last_name": raw_values["last_name"],
-                "full_name": raw_values["full_name"],
-                "person_linkedin_url": raw_values["person_linkedin_url"],
-                "person_city": raw_values["person_city"],
-                "person_state": raw_values["person_state"],
-                "person_country": raw_values["person_country"],
-                "work_email": raw_values["work_email"],
-                "phone_number": raw_values["phone_number"],
-                "company_name": raw_values["company_name"],
-                "domain": raw_values["domain"],
-                "company_linkedin_url": raw_values["company_linkedin_url"],
-                "company_city": raw_values["company_city"],
-                "company_state": raw_values["company_state"],
-                "company_country": raw_values["company_country"],
-                "raw_payload": csv_row,  # Pass the dict, not JSON string
-            }
+        except Exception as e:
+            # Malformed row (e.g. more fields than headers): keep what DictReader read
+            errors.append({"row": row_offset + consumed, "error": str(e)})
+            csv_row = {str(key): value for key, value in row.items()}
+
+        raw_record = {"id": uuid.uuid4(), "client_domain": client_domain}
+        for column in RAW_COPY_COLUMNS[2:-1]:
+            raw_record[column] = csv_row.get(column)
+        raw_record["raw_payload"] = csv_row
+
+        # The raw row is always staged; a row that fails to normalize only
+        # loses its normalized record
+        raw_records.append(tuple(
+            [raw_record[c] for c in RAW_COPY_COLUMNS[:-1]] + [json.dumps(csv_row, default=str)]
+        ))
+        try:
             normalized = normalize_record(raw_record)
+            normalized_records.append(tuple(normalized[c] for c in NORMALIZED_COPY_COLUMNS))
+        except Exception as e:
+            errors.append({"row": row_offset + consumed, "error": str(e)})
+
+    return raw_records, normalized_records, errors, consumed
+
 
-            # 3. Insert into normalized table
-            await pool.execute("""
-                INSERT INTO hq.clients_normalized_crm_data (
-                    raw_data_id, client_domain,
-                    first_name, last_name, full_name,
-                    person_linkedin_url, person_city, person_state, person_country,
-                    work_email, phone_number,
-                    company_name, domain, company_linkedin_url,
-                    company_city, company_state, company_country,
-                    title, status, notes
-                ) VALUES (
-                    $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18, $19, $20
+async def _bulk_load_csv(client_domain: str, text_stream) -> dict:
+    """
+    Stream CSV rows into hq.clients_raw_data and hq.clients_normalized_crm_data.
+
+    Rows are parsed and normalized in batches off the event loop, COPY'd into
+    temp staging tables, then moved into the real tables with one
+    INSERT ... SELECT each (the normalized insert upserts on raw_data_id).
+    Runs in a single transaction, so a database error imports nothing, on a
+    bulk pool connection (db.py) so a large upload doesn't hold one of the
+    main pool's; the first batch is parsed before acquiring it.
+    """
+    reader = csv.DictReader(text_stream)
+    errors = []
+    rows_read = 0
+    batch = await asyncio.to_thread(_parse_csv_batch, reader, client_domain, rows_read, CSV_UPLOAD_BATCH_SIZE)
+
+    async with get_bulk_pool().acquire() as conn:
+        async with conn.transaction():
+            await conn.execute("""
+                CREATE TEMP TABLE stage_clients_raw_data
+                    (LIKE hq.clients_raw_data INCLUDING DEFAULTS) ON COMMIT DROP;
+                CREATE TEMP TABLE stage_clients_normalized_crm_data
+                    (LIKE hq.clients_normalized_crm_data INCLUDING DEFAULTS) ON COMMIT DROP;
+            """)
+
+            while True:
+                raw_records, normalized_records, batch_errors, consumed = batch
+                rows_read += consumed
+                errors.extend(batch_errors)
+
+                if raw_records:
+                    await conn.copy_records_to_table(
+                        "stage_clients_raw_data", columns=RAW_COPY_COLUMNS, records=raw_records
+                    )
+                if normalized_records:
+                    await conn.copy_records_to_table(
+                        "stage_clients_normalized_crm_data", columns=NORMALIZED_COPY_COLUMNS, records=normalized_records
+                    )
+
+                if consumed < CSV_UPLOAD_BATCH_SIZE:
+                    break
+                batch = await asyncio.to_thread(
+                    _parse_csv_batch, reader, client_domain, rows_read, CSV_UPLOAD_BATCH_SIZE
                 )
+
+            raw_columns = ", ".join(RAW_COPY_COLUMNS)
+            inserted = await conn.execute(f"""
+                INSERT INTO hq.clients_raw_data ({raw_columns})
+                SELECT {raw_columns} FROM stage_clients_raw_data
+            """)
+
+            normalized_columns = ", ".join(NORMALIZED_COPY_COLUMNS)
+            normalized = await conn.execute(f"""
+                INSERT INTO hq.clients_normalized_crm_data ({normalized_columns})
+                SELECT {normalized_columns} FROM stage_clients_normalized_crm_data
                 ON CONFLICT (raw_data_id) DO UPDATE SET
                     first_name = EXCLUDED.first_name,
                     last_name = EXCLUDED.last_name,
@@ -196,42 +184,92 @@ async def upload_client_csv(payload: dict):
                     notes = EXCLUDED.notes,
                     normalized_at = NOW(),
                     updated_at = NOW()
-            """,
-                normalized["raw_data_id"],
-                normalized["client_domain"],
-                normalized["first_name"],
-                normalized["last_name"],
-                normalized["full_name"],
-                normalized["person_linkedin_url"],
-                normalized["person_city"],
-                normalized["person_state"],
-                normalized["person_country"],
-                normalized["work_email"],
-                normalized["phone_number"],
-                normalized["company_name"],
-                normalized["domain"],
-                normalized["company_linkedin_url"],
-                normalized["company_city"],
-                normalized["company_state"],
-                normalized["company_country"],
-                normalized["title"],
-                normalized["status"],
-                normalized["notes"],
-            )
-            rows_normalized += 1
-
-        except Exception as e:
-            errors.append({"row": i + 1, "error": str(e)})
+            """)
 
     return {
         "success": True,
         "client_domain": client_domain,
-        "rows_inserted": rows_inserted,
-        "rows_normalized": rows_normalized,
+        # execute() returns the command tag, e.g. "INSERT 0 5000"
+        "rows_inserted": int(inserted.split()[-1]),
+        "rows_normalized": int(normalized.split()[-1]),
         "errors": errors if errors else None
     }
 
 
+async def _client_exists(client_domain: str) -> bool:
+    pool = get_pool()
+    client = await pool.fetchrow(
+        "SELECT domain FROM hq.clients WHERE domain = $1", client_domain
+    )
+    return client is not None
+
+
+@router.post("/clients/upload-csv")
+async def upload_client_csv(payload: dict):
+    """
+    Upload CSV data for a client.
+
+    Payload: {
+        "client_domain": "securitypalhq.com",
+        "csv_data": "first_name,last_name,work_email,...\\nJohn,Doe,john@example.com,..."
+    }
+
+    1. Parses CSV and inserts into hq.clients_raw_data (raw, as-is)
+    2. Normalizes and inserts into hq.clients_normalized_crm_data
+
+    Known columns are extracted to their own fields.
+    All data (including title, status, notes, extras) goes into raw_payload JSONB.
+
+    For large files use /clients/upload-csv-file, which streams a multipart upload.
+    """
+    client_domain = payload.get("client_domain", "").strip()
+    csv_data = payload.get("csv_data", "").strip()
+
+    if not client_domain:
+        return {"success": False, "error": "client_domain is required"}
+    if not csv_data:
+        return {"success": False, "error": "csv_data is required"}
+
+    # Verify client exists
+    if not await _client_exists(client_domain):
+        return {"success": False, "error": f"Client '{client_domain}' not found in hq.clients"}
+
+    try:
+        return await _bulk_load_csv(client_domain, io.StringIO(csv_data))
+    except Exception as e:
+        return {"success": False, "client_domain": client_domain, "error": str(e)}
+
+
+@router.post("/clients/upload-csv-file")
+async def upload_client_csv_file(
+    client_domain: str = Form(..., description="HQ client domain, e.g. securitypalhq.com"),
+    file: UploadFile = File(..., description="CSV export from the client's CRM"),
+):
+    """
+    Upload a client CSV as a multipart file.
+
+    Same processing and response as /clients/upload-csv, but the file is
+    read incrementally from the upload (spooled to disk by the server)
+    instead of being held in memory as one JSON string.
+    """
+    client_domain = client_domain.strip()
+    if not client_domain:
+        return {"success": False, "error": "client_domain is required"}
+
+    if not await _client_exists(client_domain):
+        return {"success": False, "error": f"Client '{client_domain}' not found in hq.clients"}
+
+    # utf-8-sig drops the BOM Excel adds to CSV exports
+    text_stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        return await _bulk_load_csv(client_domain, text_stream)
+    except Exception as e:
+        return {"success": False, "client_domain": client_domain, "error": str(e)}
+    finally:
+        # Leave the underlying upload for FastAPI to close
+        text_stream.detach()
+
+
 @router.post("/clients/raw-leads")
 async def get_raw_leads(payload: dict):
     """
@@ -0,0 +1,108 @@
+"""
+Background job endpoints.
+
+Long-running batch endpoints can be submitted as jobs instead of being
+called inline: POST /jobs/{kind} with the endpoint's usual request body
+returns a job_id immediately, and GET /jobs/{job_id} reports status,
+counters and ETA until the result is stored on the job.
+"""
+
+from uuid import UUID
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query
+from pydantic import ValidationError
+import background_jobs as jobs
+from routers import run, workflows
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+def _request_job(model, endpoint):
+    """Handler for run.py endpoints that take a pydantic request model."""
+    async def handler(payload: dict):
+        return await endpoint(model(**payload))
+    return handler
+
+
+# kind -> (request model used to validate the payload, or None for dict payloads, handler)
+JOB_KINDS = {
+    # run.py batch inference (checkpointed per domain)
+    "b2b-b2c-classify": (run.B2bB2cClassifyRequest, run.classify_b2b_b2c_openai_db_direct),
+    "description-infer-batch": (run.DescriptionDbDirectBatchRequest, run.infer_description_db_direct_batch),
+    "g2-url-infer-batch": (run.G2UrlDbDirectBatchRequest, run.infer_g2_url_db_direct_batch),
+    # run.py bulk writes / Modal backfills
+    "target-client-leads-link-batch": (run.TargetClientLeadLinkBatchRequest, run.link_target_client_leads_batch),
+    "backfill-cleaned-company-name": (run.BackfillCleanedCompanyNameRequest, run.backfill_cleaned_company_name),
+    "backfill-company-descriptions": (run.BackfillCompanyDescriptionsRequest, run.backfill_company_descriptions),
+    "backfill-person-location": (run.BackfillPersonLocationRequest, run.backfill_person_location),
+    "backfill-person-matched-location": (run.BackfillPersonMatchedLocationRequest, run.backfill_person_matched_location),
+    "backfill-parallel-to-core": (run.BackfillParallelToCoreRequest, run.backfill_parallel_to_core),
+    # workflows.py resolvers (skip records that already have a value, so re-runs resume)
+    "resolve-company-name": (None, workflows.resolve_company_name),
+    "resolve-domain-from-linkedin": (None, workflows.resolve_domain_from_linkedin),
+    "resolve-domain-from-email": (None, workflows.resolve_domain_from_email),
+    "resolve-linkedin-from-domain": (None, workflows.resolve_linkedin_from_domain),
+    "resolve-person-linkedin-from-email": (None, workflows.resolve_person_linkedin_from_email),
+    "resolve-company-location-from-domain": (None, workflows.resolve_company_location_from_domain),
+    "resolve-person-location-from-linkedin": (None, workflows.resolve_person_location_from_linkedin),
+}
+
+for _kind, (_model, _endpoint) in JOB_KINDS.items():
+    jobs.register_job(_kind, _request_job(_model, _endpoint) if _model else _endpoint)
+
+
+@router.post("/{kind}")
+async def create_job(kind: str, payload: dict = {}):
+    """
+    Queue a background job.
+
+    The body is the same payload the synchronous endpoint takes. Returns
+    the job_id to poll at GET /jobs/{job_id}.
+    """
+    if kind not in JOB_KINDS:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Unknown job kind '{kind}'. Available: {', '.join(jobs.job_kinds())}"
+        )
+
+    model = JOB_KINDS[kind][0]
+    if model:
+        try:
+            model(**payload)
+        except ValidationError as e:
+            raise HTTPException(status_code=422, detail=e.errors())
+
+    job_id = await jobs.enqueue(kind, payload)
+    return {
+        "success": True,
+        "job_id": job_id,
+        "kind": kind,
+        "status": "queued",
+        "status_url": f"/jobs/{job_id}",
+    }
+
+
+@router.get("")
+async def list_jobs(
+    status: Optional[str] = Query(None, description="queued, running, succeeded or failed"),
+    kind: Optional[str] = Query(None),
+    limit: int = Query(50, ge=1, le=500),
+):
+    """
+    Most recent jobs, newest first.
+    """
+    data = await jobs.list_jobs(status=status, kind=kind, limit=limit)
+    return {"data": data, "meta": {"total": len(data), "limit": limit}}
+
+
+@router.get("/{job_id}")
+async def get_job(job_id: UUID):
+    """
+    Job status with progress counters (total, completed, succeeded, failed,
+    outcomes) summed over every attempt, elapsed time, ETA while running, and
+    the endpoint's response once done.
+    """
+    job = await jobs.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
@@ -1,9 +1,13 @@
 from fastapi import APIRouter, Query, HTTPException
 from typing import Optional, List
 from datetime import date, datetime, timedelta
-from db import core, get_pool
+from db import core, get_pool, execute_async
+from repositories import leads as leads_repo
+from search import LEAD_SEARCH_COLUMNS, contains_pattern
+import alumni
 from models import (
     Lead, LeadsResponse, LeadsQuickResponse, PaginationMeta,
+    LeadsCountedResponse, CountedPaginationMeta,
     LeadRecentlyPromoted, LeadsRecentlyPromotedResponse,
     LeadAtVCPortfolio, LeadsAtVCPortfolioResponse,
     PastEmployerCountResponse, PastEmployerBreakdownResponse,
@@ -59,26 +63,11 @@ def apply_lead_filters(query, params: dict):
     if params.get("employee_range"):
         ranges = params["employee_range"].split(",")
         query = query.in_("employee_range", ranges)
-    if params.get("person_city"):
-        query = query.ilike("person_city", f"%{params['person_city']}%")
-    if params.get("person_state"):
-        query = query.ilike("person_state", f"%{params['person_state']}%")
-    if params.get("person_country"):
-        query = query.ilike("person_country", f"%{params['person_country']}%")
-    if params.get("company_city"):
-        query = query.ilike("company_city", f"%{params['company_city']}%")
-    if params.get("company_state"):
-        query = query.ilike("company_state", f"%{params['company_state']}%")
-    if params.get("company_country"):
-        query = query.ilike("company_country", f"%{params['company_country']}%")
+    for key, col in LEAD_SEARCH_COLUMNS.items():
+        if params.get(key):
+            query = query.ilike(col, contains_pattern(params[key]))
     if params.get("company_domain"):
         query = query.eq("company_domain", params["company_domain"])
-    if params.get("company_name"):
-        query = query.ilike("company_name", f"%{params['company_name']}%")
-    if params.get("job_title"):
-        query = query.ilike("matched_cleaned_job_title", f"%{params['job_title']}%")
-    if params.get("full_name"):
-        query = query.ilike("full_name", f"%{params['full_name']}%")
     if params.get("job_start_date_gte"):
         query = query.gte("job_start_date", params["job_start_date_gte"])
     if params.get("job_start_date_lte"):
@@ -86,7 +75,7 @@ def apply_lead_filters(query, params: dict):
     return query
 
 
-@router.get("", response_model=LeadsResponse)
+@router.get("", response_model=LeadsCountedResponse)
 async def get_leads(
     job_function: Optional[str] = Query(None, description="Filter by job function (comma-separated)"),
     seniority: Optional[str] = Query(None, description="Filter by seniority (comma-separated)"),
@@ -107,8 +96,20 @@ async def get_leads(
     business_model: Optional[str] = Query(None, description="Filter by business model: B2B, B2C, or Both"),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    count: str = Query("exact", pattern="^(exact|estimated|cached)$", description="Total count mode: exact (default), estimated (planner estimate) or cached (exact, refreshed after a TTL)"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.next_cursor; pass empty to start cursor paging. Overrides offset."),
 ):
-    """Get leads with optional filters."""
+    """
+    Get leads with optional filters.
+
+    The total is controlled by `count`: `exact` (default) runs COUNT(*);
+    `cached` reuses an exact count for the same filter set until its TTL
+    passes and flags stale values in `meta.count_stale`; `estimated` returns
+    the planner estimate.
+
+    Deep pages should use `cursor` instead of `offset`: each response carries
+    `meta.next_cursor` to pass back for the following page.
+    """
     try:
         params = {
             "job_function": job_function, "seniority": seniority, "industry": industry,
@@ -120,43 +121,20 @@ async def get_leads(
             "job_start_date_lte": str(job_start_date_lte) if job_start_date_lte else None,
         }
 
-        # Get domains matching business model filter if specified
-        business_model_domains = None
-        if business_model:
-            bm_query = core().from_("company_business_model").select("domain")
-            if business_model.upper() == "B2B":
-                bm_query = bm_query.eq("is_b2b", True)
-            elif business_model.upper() == "B2C":
-                bm_query = bm_query.eq("is_b2c", True)
-            elif business_model.upper() == "BOTH":
-                bm_query = bm_query.eq("is_b2b", True).eq("is_b2c", True)
-            bm_result = bm_query.execute()
-            business_model_domains = [row["domain"] for row in bm_result.data]
-            if not business_model_domains:
-                # No matching domains, return empty result
-                return LeadsResponse(
-                    data=[],
-                    meta=PaginationMeta(total=0, limit=limit, offset=offset)
-                )
-
-        count_query = core().from_("leads").select("person_id", count="exact", head=True)
-        count_query = apply_lead_filters(count_query, params)
-        if business_model_domains is not None:
-            count_query = count_query.in_("company_domain", business_model_domains)
-        count_result = count_query.execute()
-        total = count_result.count or 0
-
-        data_query = core().from_("leads").select(LEAD_COLUMNS)
-        data_query = apply_lead_filters(data_query, params)
-        if business_model_domains is not None:
-            data_query = data_query.in_("company_domain", business_model_domains)
-        data_query = data_query.range(offset, offset + limit - 1)
-        data_result = data_query.execute()
-
-        return LeadsResponse(
-            data=[Lead(**row) for row in data_result.data],
-            meta=PaginationMeta(total=total, limit=limit, offset=offset)
+        counted = await leads_repo.count_leads(params, business_model, mode=count)
+        rows, next_cursor = await leads_repo.fetch_leads(
+            params, business_model, limit=limit, offset=offset, cursor=cursor
+        )
+
+        return LeadsCountedResponse(
+            data=[Lead(**row) for row in rows],
+            meta=CountedPaginationMeta(
+                total=counted.total, limit=limit, offset=offset, next_cursor=next_cursor,
+                count_mode=counted.mode, count_stale=counted.stale, counted_at=counted.counted_at,
+            )
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
@@ -197,31 +175,11 @@ async def get_leads_quick(
             "job_start_date_lte": str(job_start_date_lte) if job_start_date_lte else None,
         }
 
-        # Get domains matching business model filter if specified
-        business_model_domains = None
-        if business_model:
-            bm_query = core().from_("company_business_model").select("domain")
-            if business_model.upper() == "B2B":
-                bm_query = bm_query.eq("is_b2b", True)
-            elif business_model.upper() == "B2C":
-                bm_query = bm_query.eq("is_b2c", True)
-            elif business_model.upper() == "BOTH":
-                bm_query = bm_query.eq("is_b2b", True).eq("is_b2c", True)
-            bm_result = bm_query.execute()
-            business_model_domains = [row["domain"] for row in bm_result.data]
-            if not business_model_domains:
-                return LeadsQuickResponse(data=[])
-
         # Skip count query - just fetch data directly
-        data_query = core().from_("leads").select(LEAD_COLUMNS)
-        data_query = apply_lead_filters(data_query, params)
-        if business_model_domains is not None:
-            data_query = data_query.in_("company_domain", business_model_domains)
-        data_query = data_query.limit(limit)
-        data_result = data_query.execute()
+        rows, _ = await leads_repo.fetch_leads(params, business_model, limit=limit)
 
         return LeadsQuickResponse(
-            data=[Lead(**row) for row in data_result.data]
+            data=[Lead(**row) for row in rows]
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
@@ -237,6 +195,7 @@ async def get_past_employer_count(
     Get count of people who previously worked at a specific company.
     Optionally filter by Sales Nav job function and/or person's country.
     Job function accepts Sales Nav values which map to our internal functions.
+    Served from the precomputed alumni cube (see alumni.py).
     """
     pool = get_pool()
 
@@ -247,31 +206,8 @@ async def get_past_employer_count(
     )
     domain = domain_row["domain"] if domain_row else None
 
-    # Build the count query with Sales Nav mapping
-    query = """
-        SELECT COUNT(DISTINCT pwh.linkedin_url) as count
-        FROM core.person_work_history pwh
-        LEFT JOIN core.person_locations pl ON pwh.linkedin_url = pl.linkedin_url
-        LEFT JOIN core.job_function_mapping jfm ON pwh.matched_job_function = jfm.our_job_function
-        WHERE pwh.is_current = false
-        AND pwh.company_name ILIKE $1
-    """
-    params = [company_name]
-    param_idx = 2
-
-    if job_function:
-        # Filter by Sales Nav function (which may map to multiple of our functions)
-        query += f" AND COALESCE(jfm.sales_nav_function, 'Other') = ${param_idx}"
-        params.append(job_function)
-        param_idx += 1
-
-    if country:
-        query += f" AND pl.country ILIKE ${param_idx}"
-        params.append(country)
-        param_idx += 1
-
-    result = await pool.fetchrow(query, *params)
-    count = result["count"] if result else 0
+    cell = await alumni.fetch_cell(company_name, job_function, country)
+    count = cell["alumni"] if cell else 0
 
     return PastEmployerCountResponse(
         company_name=company_name,
@@ -290,9 +226,14 @@ async def get_past_employer_preview(
     """
     Get a preview of leads who previously worked at a specific company.
     Returns their current job info. Optionally filter by Sales Nav job function and/or country.
+    Drawn from the alumni cube's sample of up to 50 alumni per cell.
     """
     pool = get_pool()
 
+    cell = await alumni.fetch_cell(company_name, job_function, country)
+    if not cell or not cell["sample_linkedin_urls"]:
+        return LeadsQuickResponse(data=[])
+
     query = """
         SELECT DISTINCT ON (l.linkedin_url)
             l.person_id, l.linkedin_url, l.linkedin_slug, l.full_name, l.linkedin_url_type,
@@ -300,30 +241,12 @@ async def get_past_employer_preview(
             l.matched_cleaned_job_title, l.matched_job_function, l.matched_seniority, l.job_start_date,
             l.company_id, l.company_domain, l.company_name, l.company_linkedin_url,
             l.company_city, l.company_state, l.company_country, l.matched_industry, l.employee_range
-        FROM core.person_work_history pwh
-        JOIN core.leads l ON pwh.linkedin_url = l.linkedin_url
-        LEFT JOIN core.person_locations pl ON pwh.linkedin_url = pl.linkedin_url
-        LEFT JOIN core.job_function_mapping jfm ON pwh.matched_job_function = jfm.our_job_function
-        WHERE pwh.is_current = false
-        AND pwh.company_name ILIKE $1
+        FROM core.leads l
+        WHERE l.linkedin_url = ANY($1)
+        ORDER BY l.linkedin_url
+        LIMIT $2
     """
-    params = [company_name]
-    param_idx = 2
-
-    if job_function:
-        query += f" AND COALESCE(jfm.sales_nav_function, 'Other') = ${param_idx}"
-        params.append(job_function)
-        param_idx += 1
-
-    if country:
-        query += f" AND pl.country ILIKE ${param_idx}"
-        params.append(country)
-        param_idx += 1
-
-    query += f" LIMIT ${param_idx}"
-    params.append(limit)
-
-    rows = await pool.fetch(query, *params)
+    rows = await pool.fetch(query, cell["sample_linkedin_urls"], limit)
 
     return LeadsQuickResponse(
         data=[Lead(**row_to_dict(row)) for row in rows]
@@ -338,6 +261,7 @@ async def get_past_employer_breakdown(
     """
     Get breakdown of people who previously worked at a company, grouped by Sales Nav job function.
     Uses mapping table to translate our job functions to Sales Nav equivalents.
+    Served from the precomputed alumni cube (see alumni.py).
     """
     pool = get_pool()
 
@@ -348,39 +272,7 @@ async def get_past_employer_breakdown(
     )
     domain = domain_row["domain"] if domain_row else None
 
-    # Build the breakdown query with Sales Nav mapping
-    if country:
-        query = """
-            SELECT
-                COALESCE(jfm.sales_nav_function, 'Other') as job_function,
-                COUNT(DISTINCT pwh.linkedin_url) as count
-            FROM core.person_work_history pwh
-            LEFT JOIN core.person_locations pl ON pwh.linkedin_url = pl.linkedin_url
-            LEFT JOIN core.job_function_mapping jfm ON pwh.matched_job_function = jfm.our_job_function
-            WHERE pwh.is_current = false
-            AND pwh.company_name ILIKE $1
-            AND pl.country ILIKE $2
-            AND pwh.matched_job_function IS NOT NULL
-            GROUP BY COALESCE(jfm.sales_nav_function, 'Other')
-            ORDER BY count DESC
-        """
-        rows = await pool.fetch(query, company_name, country)
-    else:
-        query = """
-            SELECT
-                COALESCE(jfm.sales_nav_function, 'Other') as job_function,
-                COUNT(DISTINCT pwh.linkedin_url) as count
-            FROM core.person_work_history pwh
-            LEFT JOIN core.job_function_mapping jfm ON pwh.matched_job_function = jfm.our_job_function
-            WHERE pwh.is_current = false
-            AND pwh.company_name ILIKE $1
-            AND pwh.matched_job_function IS NOT NULL
-            GROUP BY COALESCE(jfm.sales_nav_function, 'Other')
-            ORDER BY count DESC
-        """
-        rows = await pool.fetch(query, company_name)
-
-    by_job_function = {row["job_function"]: row["count"] for row in rows}
+    by_job_function = await alumni.fetch_breakdown(company_name, country)
     total = sum(by_job_function.values())
 
     return PastEmployerBreakdownResponse(
@@ -406,19 +298,11 @@ async def get_priority_companies():
     if not companies:
         return PriorityCompaniesResponse(data=[])
 
+    totals = await alumni.fetch_employer_totals([c["company_name"] for c in companies])
+
     result = []
     for company in companies:
-        # Get counts for this company
-        counts = await pool.fetchrow("""
-            SELECT
-                COUNT(DISTINCT linkedin_url) as total,
-                COUNT(DISTINCT linkedin_url) FILTER (WHERE matched_job_function = 'Engineering') as engineering,
-                COUNT(DISTINCT linkedin_url) FILTER (WHERE matched_job_function = 'Sales') as sales
-            FROM core.person_work_history
-            WHERE is_current = false
-            AND company_name ILIKE $1
-        """, company["company_name"])
-
+        counts = totals.get(company["company_name"])
         result.append(PriorityCompany(
             id=str(company["id"]),
             company_name=company["company_name"],
@@ -454,15 +338,7 @@ async def add_priority_company(body: PriorityCompanyCreate):
     """, body.company_name, domain)
 
     # Get counts
-    counts = await pool.fetchrow("""
-        SELECT
-            COUNT(DISTINCT linkedin_url) as total,
-            COUNT(DISTINCT linkedin_url) FILTER (WHERE matched_job_function = 'Engineering') as engineering,
-            COUNT(DISTINCT linkedin_url) FILTER (WHERE matched_job_function = 'Sales') as sales
-        FROM core.person_work_history
-        WHERE is_current = false
-        AND company_name ILIKE $1
-    """, body.company_name)
+    counts = (await alumni.fetch_employer_totals([body.company_name])).get(body.company_name)
 
     return PriorityCompany(
         id=str(row["id"]),
@@ -503,7 +379,7 @@ async def get_leads_recently_promoted(
     count_query = core().from_("leads_recently_promoted").select("person_id", count="exact", head=True)
     count_query = apply_lead_filters(count_query, params)
     count_query = count_query.gte("promotion_date", date_threshold)
-    count_result = count_query.execute()
+    count_result = await execute_async(count_query)
     total = count_result.count or 0
 
     data_query = core().from_("leads_recently_promoted").select(LEAD_PROMOTED_COLUMNS)
@@ -511,7 +387,7 @@ async def get_leads_recently_promoted(
     data_query = data_query.gte("promotion_date", date_threshold)
     data_query = data_query.order("promotion_date", desc=True)
     data_query = data_query.range(offset, offset + limit - 1)
-    data_result = data_query.execute()
+    data_result = await execute_async(data_query)
 
     return LeadsRecentlyPromotedResponse(
         data=[LeadRecentlyPromoted(**row) for row in data_result.data],
@@ -535,7 +411,7 @@ async def get_leads_new_in_role(
     count_query = core().from_("leads").select("person_id", count="exact", head=True)
     count_query = apply_lead_filters(count_query, params)
     count_query = count_query.gte("job_start_date", date_threshold)
-    count_result = count_query.execute()
+    count_result = await execute_async(count_query)
     total = count_result.count or 0
 
     data_query = core().from_("leads").select(LEAD_COLUMNS)
@@ -543,7 +419,7 @@ async def get_leads_new_in_role(
     data_query = data_query.gte("job_start_date", date_threshold)
     data_query = data_query.order("job_start_date", desc=True)
     data_query = data_query.range(offset, offset + limit - 1)
-    data_result = data_query.execute()
+    data_result = await execute_async(data_query)
 
     return LeadsResponse(
         data=[Lead(**row) for row in data_result.data],
@@ -566,7 +442,7 @@ async def get_leads_at_vc_portfolio(
     count_query = apply_lead_filters(count_query, params)
     if vc_name:
         count_query = count_query.eq("vc_name", vc_name)
-    count_result = count_query.execute()
+    count_result = await execute_async(count_query)
     total = count_result.count or 0
 
     data_query = core().from_("leads_at_vc_portfolio").select(LEAD_VC_COLUMNS)
@@ -574,7 +450,7 @@ async def get_leads_at_vc_portfolio(
     if vc_name:
         data_query = data_query.eq("vc_name", vc_name)
     data_query = data_query.range(offset, offset + limit - 1)
-    data_result = data_query.execute()
+    data_result = await execute_async(data_query)
 
     return LeadsAtVCPortfolioResponse(
         data=[LeadAtVCPortfolio(**row) for row in data_result.data],
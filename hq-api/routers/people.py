@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Query, HTTPException
 from typing import Optional
 from datetime import date
-from db import core, get_pool
+from db import core, get_pool, execute_async
+from pagination import encode_cursor, decode_cursor
 from models import Person, PeopleResponse, PaginationMeta, WorkHistoryEntry, PersonWorkHistoryResponse, PersonEnrichmentStatusResponse, LinkedInUrlRequest
 
 router = APIRouter(prefix="/api/people", tags=["people"])
@@ -56,8 +57,9 @@ async def get_people(
     job_start_date_lte: Optional[date] = Query(None),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from meta.next_cursor; pass empty to start cursor paging. Overrides offset."),
 ):
-    """Get people with optional filters."""
+    """Get people with optional filters. Use `cursor` rather than `offset` for deep pages."""
     try:
         params = {
             "job_function": job_function,
@@ -75,19 +77,32 @@ async def get_people(
         # Count query
         count_query = core().from_("people_full").select("id", count="exact", head=True)
         count_query = apply_person_filters(count_query, params)
-        count_result = count_query.execute()
+        count_result = await execute_async(count_query)
         total = count_result.count or 0
 
         # Data query
         data_query = core().from_("people_full").select(PERSON_COLUMNS)
         data_query = apply_person_filters(data_query, params)
-        data_query = data_query.range(offset, offset + limit - 1)
-        data_result = data_query.execute()
+        if cursor is None:
+            data_query = data_query.range(offset, offset + limit - 1)
+        else:
+            # Keyset paging on id
+            data_query = data_query.order("id")
+            if cursor:
+                data_query = data_query.gt("id", decode_cursor(cursor, 1)[0])
+            data_query = data_query.limit(limit)
+        data_result = await execute_async(data_query)
+
+        next_cursor = None
+        if cursor is not None and len(data_result.data) == limit:
+            next_cursor = encode_cursor([data_result.data[-1]["id"]])
 
         return PeopleResponse(
             data=[Person(**row) for row in data_result.data],
-            meta=PaginationMeta(total=total, limit=limit, offset=offset)
+            meta=PaginationMeta(total=total, limit=limit, offset=offset, next_cursor=next_cursor)
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
@@ -9,8 +9,9 @@ Naming convention:
 import httpx
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Literal
 from db import get_pool
+import coverage
 
 router = APIRouter(prefix="/read", tags=["read"])
 
@@ -51,6 +52,13 @@ class ClientLeadsResponse(BaseModel):
 class GTMDashboardRequest(BaseModel):
     domain: str
 
+
+class CoverageRequest(BaseModel):
+    # Domains to check; defaults to every company in public.focus_companies
+    domains: Optional[List[str]] = None
+    # "flags": {table: bool} per company; "bitset": hex bitset over `tables`
+    format: Literal["flags", "bitset"] = "flags"
+
 # =============================================================================
 # Endpoints
 # =============================================================================
@@ -140,111 +148,53 @@ async def read_client_leads(request: ClientLeadsRequest) -> ClientLeadsResponse:
 # Company Data Coverage Dashboard
 # =============================================================================
 
-# All core company tables and the column used for domain lookup
-COVERAGE_TABLES = {
-    # core.companies base record
-    "core.companies": "domain",
-    # Dimension tables using "domain"
-    "core.company_add_ons_offered": "domain",
-    "core.company_annual_commitment_required": "domain",
-    "core.company_billing_default": "domain",
-    "core.company_business_model": "domain",
-    "core.company_categories": "domain",
-    "core.company_comparison_pages": "domain",
-    "core.company_custom_pricing_mentioned": "domain",
-    "core.company_descriptions": "domain",
-    "core.company_employee_range": "domain",
-    "core.company_employee_ranges": "domain",
-    "core.company_enterprise_tier_exists": "domain",
-    "core.company_free_trial": "domain",
-    "core.company_funding": "domain",
-    "core.company_funding_rounds": "domain",
-    "core.company_google_ads": "domain",
-    "core.company_industries": "domain",
-    "core.company_job_postings": "domain",
-    "core.company_keywords": "domain",
-    "core.company_linkedin_ads": "domain",
-    "core.company_locations": "domain",
-    "core.company_meta_ads": "domain",
-    "core.company_minimum_seats": "domain",
-    "core.company_money_back_guarantee": "domain",
-    "core.company_naics_codes": "domain",
-    "core.company_names": "domain",
-    "core.company_number_of_tiers": "domain",
-    "core.company_plan_naming_style": "domain",
-    "core.company_predictleads_technologies": "domain",
-    "core.company_pricing_model": "domain",
-    "core.company_pricing_visibility": "domain",
-    "core.company_revenue": "domain",
-    "core.company_sales_motion": "domain",
-    "core.company_security_compliance_gating": "domain",
-    "core.company_social_urls": "domain",
-    "core.company_tech_on_site": "domain",
-    "core.company_types": "domain",
-    "core.company_vc_backed": "domain",
-    "core.company_webinars": "domain",
-    # Tables using "origin_company_domain"
-    "core.company_customers": "origin_company_domain",
-    # Tables using "company_domain"
-    "core.company_people_snapshot_history": "company_domain",
-    "core.company_similar_companies_preview": "company_domain",
-    "core.company_vc_investments": "company_domain",
-    "core.company_vc_investors": "company_domain",
-}
-
-
 @router.post(
     "/companies/coverage",
-    summary="Get data coverage for focus companies across all core tables",
-    description="Returns boolean flags for each core company table indicating whether data exists for each focus company.",
+    summary="Get data coverage for companies across all core tables",
+    description=(
+        "Returns, for each focus company (or each domain in the request body), which core "
+        "company tables have data for it - as boolean flags, or with format=bitset as a hex "
+        "bitset whose bit i is tables[i]."
+    ),
 )
-async def get_company_coverage():
+async def get_company_coverage(request: Optional[CoverageRequest] = None):
     """
-    Returns all companies in public.focus_companies with coverage flags
-    for every core.company_* table + core.companies.
+    Coverage for public.focus_companies, or for an arbitrary domain list,
+    across every core.company_* table + core.companies.
 
-    Direct asyncpg query — no Modal function.
+    Direct asyncpg query — no Modal function. The whole matrix is one
+    statement (see coverage.py), whatever the number of tables.
     """
-    pool = get_pool()
+    request = request or CoverageRequest()
 
-    # 1. Get focus companies
-    focus_rows = await pool.fetch(
-        "SELECT domain, company_name FROM public.focus_companies ORDER BY company_name"
-    )
-    if not focus_rows:
-        return {"success": True, "total": 0, "companies": []}
-
-    domains = [r["domain"] for r in focus_rows]
-
-    # 2. For each table, get the set of domains that exist
-    table_domain_sets = {}
-    for table_key, domain_col in COVERAGE_TABLES.items():
-        schema, table = table_key.split(".", 1)
-        rows = await pool.fetch(
-            f"SELECT DISTINCT {domain_col} AS d FROM {schema}.{table} WHERE {domain_col} = ANY($1)",
-            domains,
-        )
-        table_domain_sets[table_key] = {r["d"] for r in rows}
-
-    # 3. Assemble response
-    companies = []
-    for row in focus_rows:
-        d = row["domain"]
-        coverage = {
-            table_key: d in domain_set
-            for table_key, domain_set in table_domain_sets.items()
-        }
-        companies.append({
-            "domain": d,
-            "company_name": row["company_name"],
-            "coverage": coverage,
-        })
+    if request.domains is None:
+        companies = await coverage.fetch_focus_companies()
+    else:
+        domains = list(dict.fromkeys(d.strip().lower() for d in request.domains if d and d.strip()))
+        if len(domains) > coverage.MAX_COVERAGE_DOMAINS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"At most {coverage.MAX_COVERAGE_DOMAINS} domains per request",
+            )
+        companies = [{"domain": d, "company_name": None} for d in domains]
+
+    bitsets = await coverage.coverage_bitsets([c["domain"] for c in companies])
+
+    for company in companies:
+        bits = bitsets[company["domain"]]
+        if request.format == "bitset":
+            company["coverage"] = coverage.encode_bitset(bits)
+        else:
+            company["coverage"] = coverage.bitset_flags(bits)
 
-    return {
+    response = {
         "success": True,
         "total": len(companies),
         "companies": companies,
     }
+    if request.format == "bitset":
+        response["tables"] = coverage.COVERAGE_TABLE_KEYS
+    return response
 
 
 # =============================================================================
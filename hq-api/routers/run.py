@@ -20,6 +20,10 @@ from fastapi import APIRouter, HTTPException, UploadFile, File, Form
 from pydantic import BaseModel
 from typing import Optional, Any, List
 from db import get_pool
+from repositories import target_client as target_client_repo
+from repositories import filters as filters_repo
+from http_client import forward_to_modal, modal_post
+from batch_executor import run_batch, raise_for_upstream_status, active_batches
 
 router = APIRouter(prefix="/run", tags=["run"])
 
@@ -318,6 +322,22 @@ class SecurityGatingResponse(BaseModel):
     error: Optional[str] = None
 
 
+class PricingProfileRequest(PricingInferenceRequest):
+    attributes: Optional[List[str]] = None  # default: every pricing attribute
+    persist: bool = True
+
+
+class PricingProfileResponse(BaseModel):
+    success: bool
+    domain: Optional[str] = None
+    pricing_page_url: Optional[str] = None
+    page_from_cache: Optional[bool] = None
+    llm_ms: Optional[int] = None
+    attributes: Optional[dict] = None
+    write_errors: Optional[List[dict]] = None
+    error: Optional[str] = None
+
+
 class WebinarsRequest(BaseModel):
     domain: str
     company_name: Optional[str] = None
@@ -1941,24 +1961,8 @@ async def ingest_clay_company_firmo(request: CompanyFirmographicsRequest) -> Com
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-clay-company-firmo.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return CompanyFirmographicsResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return CompanyFirmographicsResponse(**result)
 
 
 @router.post(
@@ -1979,24 +1983,8 @@ async def ingest_clay_find_companies(request: CompanyDiscoveryRequest) -> Compan
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-clay-find-companies.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return CompanyDiscoveryResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return CompanyDiscoveryResponse(**result)
 
 
 @router.post(
@@ -2017,24 +2005,8 @@ async def ingest_company_classification(request: CompanyClassificationRequest) -
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-company-classification.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return CompanyClassificationResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return CompanyClassificationResponse(**result)
 
 
 @router.post(
@@ -2054,24 +2026,8 @@ async def infer_annual_commitment(request: PricingInferenceRequest) -> AnnualCom
     """
     modal_url = f"{MODAL_BASE_URL}-infer-annual-commitment.modal.run"
 
-    async with httpx.AsyncClient(timeout=90.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return AnnualCommitmentResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=90.0)
+    return AnnualCommitmentResponse(**result)
 
 
 @router.post(
@@ -2091,24 +2047,8 @@ async def infer_billing_default(request: PricingInferenceRequest) -> BillingDefa
     """
     modal_url = f"{MODAL_BASE_URL}-infer-billing-default.modal.run"
 
-    async with httpx.AsyncClient(timeout=90.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return BillingDefaultResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=90.0)
+    return BillingDefaultResponse(**result)
 
 
 @router.post(
@@ -2126,24 +2066,8 @@ async def infer_company_country(request: CountryInferenceRequest) -> CountryInfe
     """
     modal_url = f"{MODAL_BASE_URL}-infer-company-country.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return CountryInferenceResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return CountryInferenceResponse(**result)
 
 
 @router.post(
@@ -2163,24 +2087,8 @@ async def infer_company_employee_range(request: EmployeeRangeInferenceRequest) -
     """
     modal_url = f"{MODAL_BASE_URL}-infer-company-employee-range.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return EmployeeRangeInferenceResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return EmployeeRangeInferenceResponse(**result)
 
 
 @router.post(
@@ -2198,24 +2106,8 @@ async def infer_company_industry(request: IndustryInferenceRequest) -> IndustryI
     """
     modal_url = f"{MODAL_BASE_URL}-infer-company-industry.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return IndustryInferenceResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return IndustryInferenceResponse(**result)
 
 
 @router.post(
@@ -2233,24 +2125,8 @@ async def infer_company_linkedin_url(request: LinkedInUrlInferenceRequest) -> Li
     """
     modal_url = f"{MODAL_BASE_URL}-infer-company-linkedin-url.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return LinkedInUrlInferenceResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return LinkedInUrlInferenceResponse(**result)
 
 
 @router.post(
@@ -2270,24 +2146,8 @@ async def infer_comparison_page_exists(request: ComparisonPageRequest) -> Compar
     """
     modal_url = f"{MODAL_BASE_URL}-infer-comparison-page-exists.modal.run"
 
-    async with httpx.AsyncClient(timeout=90.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return ComparisonPageResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=90.0)
+    return ComparisonPageResponse(**result)
 
 
 @router.post(
@@ -2307,24 +2167,8 @@ async def infer_crunchbase_domain(request: CrunchbaseUrlRequest) -> CrunchbaseUr
     """
     modal_url = f"{MODAL_BASE_URL}-infer-crunchbase-domain.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return CrunchbaseUrlResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return CrunchbaseUrlResponse(**result)
 
 
 @router.post(
@@ -2344,24 +2188,8 @@ async def infer_enterprise_tier_exists(request: PricingInferenceRequest) -> Ente
     """
     modal_url = f"{MODAL_BASE_URL}-infer-enterprise-tier-exists.modal.run"
 
-    async with httpx.AsyncClient(timeout=90.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return EnterpriseTierResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=90.0)
+    return EnterpriseTierResponse(**result)
 
 
 @router.post(
@@ -2381,24 +2209,8 @@ async def infer_free_trial(request: PricingInferenceRequest) -> FreeTrialRespons
     """
     modal_url = f"{MODAL_BASE_URL}-infer-free-trial.modal.run"
 
-    async with httpx.AsyncClient(timeout=90.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return FreeTrialResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=90.0)
+    return FreeTrialResponse(**result)
 
 
 @router.post(
@@ -2418,24 +2230,8 @@ async def infer_minimum_seats(request: PricingInferenceRequest) -> MinimumSeatsR
     """
     modal_url = f"{MODAL_BASE_URL}-infer-minimum-seats.modal.run"
 
-    async with httpx.AsyncClient(timeout=90.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return MinimumSeatsResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=90.0)
+    return MinimumSeatsResponse(**result)
 
 
 @router.post(
@@ -2455,24 +2251,8 @@ async def infer_money_back_guarantee(request: PricingInferenceRequest) -> MoneyB
     """
     modal_url = f"{MODAL_BASE_URL}-infer-money-back-guarantee.modal.run"
 
-    async with httpx.AsyncClient(timeout=90.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return MoneyBackResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=90.0)
+    return MoneyBackResponse(**result)
 
 
 @router.post(
@@ -2492,24 +2272,8 @@ async def infer_number_of_tiers(request: PricingInferenceRequest) -> NumberOfTie
     """
     modal_url = f"{MODAL_BASE_URL}-infer-number-of-tiers.modal.run"
 
-    async with httpx.AsyncClient(timeout=90.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return NumberOfTiersResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=90.0)
+    return NumberOfTiersResponse(**result)
 
 
 @router.post(
@@ -2529,24 +2293,8 @@ async def infer_plan_naming_style(request: PricingInferenceRequest) -> PlanNamin
     """
     modal_url = f"{MODAL_BASE_URL}-infer-plan-naming-style.modal.run"
 
-    async with httpx.AsyncClient(timeout=90.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return PlanNamingStyleResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=90.0)
+    return PlanNamingStyleResponse(**result)
 
 
 @router.post(
@@ -2566,24 +2314,8 @@ async def infer_pricing_model(request: PricingInferenceRequest) -> PricingModelR
     """
     modal_url = f"{MODAL_BASE_URL}-infer-pricing-model.modal.run"
 
-    async with httpx.AsyncClient(timeout=90.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return PricingModelResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=90.0)
+    return PricingModelResponse(**result)
 
 
 @router.post(
@@ -2603,24 +2335,8 @@ async def infer_pricing_visibility(request: PricingInferenceRequest) -> PricingV
     """
     modal_url = f"{MODAL_BASE_URL}-infer-pricing-visibility.modal.run"
 
-    async with httpx.AsyncClient(timeout=90.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return PricingVisibilityResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=90.0)
+    return PricingVisibilityResponse(**result)
 
 
 @router.post(
@@ -2641,24 +2357,8 @@ async def infer_sales_motion(request: PricingInferenceRequest) -> SalesMotionRes
     """
     modal_url = f"{MODAL_BASE_URL}-infer-sales-motion.modal.run"
 
-    async with httpx.AsyncClient(timeout=90.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return SalesMotionResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=90.0)
+    return SalesMotionResponse(**result)
 
 
 @router.post(
@@ -2678,24 +2378,34 @@ async def infer_security_gating(request: PricingInferenceRequest) -> SecurityGat
     """
     modal_url = f"{MODAL_BASE_URL}-infer-security-gating.modal.run"
 
-    async with httpx.AsyncClient(timeout=90.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return SecurityGatingResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=90.0)
+    return SecurityGatingResponse(**result)
+
+
+@router.post(
+    "/companies/gemini/pricing-profile/infer",
+    response_model=PricingProfileResponse,
+    summary="Infer every pricing attribute in one call",
+    description="Wrapper for Modal function: infer_pricing_profile"
+)
+async def infer_pricing_profile(request: PricingProfileRequest) -> PricingProfileResponse:
+    """
+    Analyze a company's pricing page and classify all pricing attributes
+    (free trial, pricing model, visibility, sales motion, billing default,
+    tiers, add-ons, enterprise tier, security gating, annual commitment,
+    plan naming, custom pricing, money back guarantee, minimum seats) with
+    a single Gemini call.
+
+    Writes the same raw/extracted/core tables as the per-attribute
+    endpoints unless persist is false.
+
+    Modal function: infer_pricing_profile
+    Modal URL: https://bencrane--hq-master-data-ingest-infer-pricing-profile.modal.run
+    """
+    modal_url = f"{MODAL_BASE_URL}-infer-pricing-profile.modal.run"
+
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=120.0)
+    return PricingProfileResponse(**result)
 
 
 @router.post(
@@ -2715,24 +2425,8 @@ async def infer_webinars(request: WebinarsRequest) -> WebinarsResponse:
     """
     modal_url = f"{MODAL_BASE_URL}-infer-webinars.modal.run"
 
-    async with httpx.AsyncClient(timeout=90.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return WebinarsResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=90.0)
+    return WebinarsResponse(**result)
 
 
 @router.post(
@@ -2752,24 +2446,8 @@ async def ingest_leadmagic_company(request: LeadMagicCompanyRequest) -> LeadMagi
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-leadmagic-company.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return LeadMagicCompanyResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return LeadMagicCompanyResponse(**result)
 
 
 @router.post(
@@ -2789,24 +2467,8 @@ async def ingest_linkedin_ads(request: LinkedInAdsRequest) -> LinkedInAdsRespons
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-linkedin-ads.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return LinkedInAdsResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return LinkedInAdsResponse(**result)
 
 
 @router.post(
@@ -2826,24 +2488,8 @@ async def ingest_meta_ads(request: MetaAdsRequest) -> MetaAdsResponse:
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-meta-ads.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return MetaAdsResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return MetaAdsResponse(**result)
 
 
 @router.post(
@@ -2863,24 +2509,8 @@ async def ingest_google_ads(request: GoogleAdsRequest) -> GoogleAdsResponse:
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-google-ads.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return GoogleAdsResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return GoogleAdsResponse(**result)
 
 
 @router.post(
@@ -2900,24 +2530,8 @@ async def ingest_predictleads_techstack(request: PredictLeadsTechRequest) -> Pre
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-predictleads-techstack.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return PredictLeadsTechResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return PredictLeadsTechResponse(**result)
 
 
 @router.post(
@@ -2937,24 +2551,8 @@ async def ingest_builtwith(request: BuiltWithRequest) -> BuiltWithResponse:
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-builtwith.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return BuiltWithResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return BuiltWithResponse(**result)
 
 
 @router.post(
@@ -2974,24 +2572,8 @@ async def has_raised_vc(request: HasRaisedVCRequest) -> HasRaisedVCResponse:
     """
     modal_url = f"{MODAL_BASE_URL}-has-raised-vc.modal.run"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return HasRaisedVCResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=30.0)
+    return HasRaisedVCResponse(**result)
 
 
 @router.post(
@@ -3011,24 +2593,8 @@ async def infer_add_ons_offered(request: PricingInferenceRequest) -> AddOnsOffer
     """
     modal_url = f"{MODAL_BASE_URL}-infer-add-ons-offered.modal.run"
 
-    async with httpx.AsyncClient(timeout=90.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return AddOnsOfferedResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=90.0)
+    return AddOnsOfferedResponse(**result)
 
 
 @router.post(
@@ -3048,24 +2614,8 @@ async def ingest_cleaned_company_name(request: CleanedCompanyNameRequest) -> Cle
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-cleaned-company-name.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return CleanedCompanyNameResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return CleanedCompanyNameResponse(**result)
 
 
 @router.post(
@@ -3086,24 +2636,8 @@ async def ingest_icp_fit_criterion(request: ICPFitCriterionRequest) -> ICPFitCri
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-icp-fit-criterion.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return ICPFitCriterionResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return ICPFitCriterionResponse(**result)
 
 
 @router.post(
@@ -3123,24 +2657,8 @@ async def ingest_icp_industries(request: ICPIndustriesRequest) -> ICPIndustriesR
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-icp-industries.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return ICPIndustriesResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return ICPIndustriesResponse(**result)
 
 
 @router.post(
@@ -3160,24 +2678,8 @@ async def ingest_icp_job_titles(request: ICPJobTitlesRequest) -> ICPJobTitlesRes
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-icp-job-titles.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return ICPJobTitlesResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return ICPJobTitlesResponse(**result)
 
 
 @router.post(
@@ -3197,24 +2699,8 @@ async def ingest_icp_value_proposition(request: ICPValuePropositionRequest) -> I
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-icp-value-proposition.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return ICPValuePropositionResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return ICPValuePropositionResponse(**result)
 
 
 @router.post(
@@ -3234,24 +2720,8 @@ async def ingest_icp_verdict(request: ICPVerdictRequest) -> ICPVerdictResponse:
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-icp-verdict.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return ICPVerdictResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return ICPVerdictResponse(**result)
 
 
 @router.post(
@@ -3272,24 +2742,8 @@ async def ingest_job_posting(request: JobPostingRequest) -> JobPostingResponse:
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-job-posting.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return JobPostingResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return JobPostingResponse(**result)
 
 
 @router.post(
@@ -3309,24 +2763,8 @@ async def ingest_manual_comp_customer(request: ManualCompanyCustomerRequest) ->
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-manual-comp-customer.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return ManualCompanyCustomerResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return ManualCompanyCustomerResponse(**result)
 
 
 @router.post(
@@ -3344,24 +2782,8 @@ async def ingest_public_company(request: PublicCompanyRequest) -> PublicCompanyR
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-public-company.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return PublicCompanyResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return PublicCompanyResponse(**result)
 
 
 @router.post(
@@ -3382,24 +2804,8 @@ async def ingest_core_company_simple(request: CoreCompanySimpleRequest) -> CoreC
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-core-company-simple.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return CoreCompanySimpleResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return CoreCompanySimpleResponse(**result)
 
 
 @router.post(
@@ -3419,24 +2825,8 @@ async def ingest_case_study_buyers(request: CaseStudyBuyersRequest) -> CaseStudy
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-case-study-buyers.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return CaseStudyBuyersResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return CaseStudyBuyersResponse(**result)
 
 
 @router.post(
@@ -3456,24 +2846,8 @@ async def ingest_case_study_extraction(request: CaseStudyExtractionRequest) -> C
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-case-study-extraction.modal.run"
 
-    async with httpx.AsyncClient(timeout=120.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return CaseStudyExtractionResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=120.0)
+    return CaseStudyExtractionResponse(**result)
 
 
 @router.post(
@@ -3493,24 +2867,8 @@ async def ingest_salesnav_company(request: SalesNavCompanyRequest) -> SalesNavCo
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-salesnav-company.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return SalesNavCompanyResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return SalesNavCompanyResponse(**result)
 
 
 @router.post(
@@ -3530,24 +2888,8 @@ async def ingest_cb_vc_portfolio(request: CbVcPortfolioRequest) -> CbVcPortfolio
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-cb-vc-portfolio.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return CbVcPortfolioResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return CbVcPortfolioResponse(**result)
 
 
 @router.post(
@@ -3567,24 +2909,8 @@ async def ingest_company_vc_investors(request: CompanyVCInvestorsRequest) -> Com
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-company-vc-investors.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return CompanyVCInvestorsResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return CompanyVCInvestorsResponse(**result)
 
 
 @router.post(
@@ -3605,24 +2931,8 @@ async def ingest_all_comp_customers(request: CompanyCustomerRequest) -> CompanyC
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-all-comp-customers.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return CompanyCustomerResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return CompanyCustomerResponse(**result)
 
 
 @router.post(
@@ -3643,24 +2953,8 @@ async def ingest_company_customers_v2(request: CompanyCustomersV2Request) -> Com
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-company-customers-v2.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return CompanyCustomersV2Response(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return CompanyCustomersV2Response(**result)
 
 
 @router.post(
@@ -3678,24 +2972,8 @@ async def ingest_company_customers_structured(request: CompanyCustomersStructure
     """
     modal_url = "https://bencrane--hq-master-data-ingest-ingest-company-customers-85468a.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return CompanyCustomersV2Response(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return CompanyCustomersV2Response(**result)
 
 
 @router.post(
@@ -3716,24 +2994,8 @@ async def ingest_company_customers_claygent(request: CompanyCustomersClaygentReq
     """
     modal_url = "https://bencrane--hq-master-data-ingest-ingest-company-customers-a12938.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return CompanyCustomersV2Response(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return CompanyCustomersV2Response(**result)
 
 
 @router.post(
@@ -3751,24 +3013,8 @@ async def ingest_company_address_parsing(request: CompanyAddressRequest) -> Comp
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-company-address-parsing.modal.run"
 
-    async with httpx.AsyncClient(timeout=90.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return CompanyAddressResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=90.0)
+    return CompanyAddressResponse(**result)
 
 
 @router.post(
@@ -3786,24 +3032,8 @@ async def lookup_company_customers(request: CompanyCustomersLookupRequest) -> Co
     """
     modal_url = f"{MODAL_BASE_URL}-lookup-company-customers.modal.run"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return CompanyCustomersLookupResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=30.0)
+    return CompanyCustomersLookupResponse(**result)
 
 
 @router.post(
@@ -3821,24 +3051,8 @@ async def lookup_company_business_model(request: CompanyBusinessModelLookupReque
     """
     modal_url = f"{MODAL_BASE_URL}-lookup-company-business-model.modal.run"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return CompanyBusinessModelLookupResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=30.0)
+    return CompanyBusinessModelLookupResponse(**result)
 
 
 @router.post(
@@ -3856,24 +3070,8 @@ async def lookup_similar_companies(request: SimilarCompaniesLookupRequest) -> Si
     """
     modal_url = f"{MODAL_BASE_URL}-lookup-similar-companies.modal.run"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return SimilarCompaniesLookupResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=30.0)
+    return SimilarCompaniesLookupResponse(**result)
 
 
 @router.post(
@@ -3891,24 +3089,8 @@ async def lookup_similar_companies_list(request: SimilarCompaniesListRequest) ->
     """
     modal_url = f"{MODAL_BASE_URL}-lookup-similar-companies-list.modal.run"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return SimilarCompaniesListResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=30.0)
+    return SimilarCompaniesListResponse(**result)
 
 
 @router.post(
@@ -3926,24 +3108,8 @@ async def ingest_companyenrich_similar_preview_results(data: dict) -> CompanyEnr
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-companyenrich-sim-cbc297.modal.run"
 
-    async with httpx.AsyncClient(timeout=120.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=data
-            )
-            response.raise_for_status()
-            return CompanyEnrichSimilarPreviewResultsResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, data, timeout=120.0)
+    return CompanyEnrichSimilarPreviewResultsResponse(**result)
 
 
 @router.post(
@@ -3961,24 +3127,8 @@ async def lookup_company_description(request: CompanyDescriptionLookupRequest) -
     """
     modal_url = f"{MODAL_BASE_URL}-lookup-company-description.modal.run"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return CompanyDescriptionLookupResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=30.0)
+    return CompanyDescriptionLookupResponse(**result)
 
 
 @router.post(
@@ -3998,24 +3148,8 @@ async def lookup_company_icp(request: CompanyICPLookupRequest) -> CompanyICPLook
     """
     modal_url = f"{MODAL_BASE_URL}-lookup-company-icp.modal.run"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return CompanyICPLookupResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=30.0)
+    return CompanyICPLookupResponse(**result)
 
 
 @router.post(
@@ -4035,24 +3169,8 @@ async def ingest_clay_signal_job_posting(request: ClaySignalJobPostingRequest) -
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-clay-signal-job-posting.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return ClaySignalJobPostingResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return ClaySignalJobPostingResponse(**result)
 
 
 # =============================================================================
@@ -4076,24 +3194,8 @@ async def lookup_job_title(request: JobTitleLookupRequest) -> JobTitleLookupResp
     """
     modal_url = f"{MODAL_BASE_URL}-lookup-job-title.modal.run"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return JobTitleLookupResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=30.0)
+    return JobTitleLookupResponse(**result)
 
 
 @router.post(
@@ -4113,24 +3215,8 @@ async def lookup_person_location(request: PersonLocationLookupRequest) -> Person
     """
     modal_url = f"{MODAL_BASE_URL}-lookup-person-location.modal.run"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return PersonLocationLookupResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=30.0)
+    return PersonLocationLookupResponse(**result)
 
 
 @router.post(
@@ -4151,24 +3237,8 @@ async def ingest_clay_find_people(request: PersonDiscoveryRequest) -> PersonInge
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-clay-find-people.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return PersonIngestResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return PersonIngestResponse(**result)
 
 
 @router.post(
@@ -4188,24 +3258,8 @@ async def ingest_email_anymailfinder(request: AnyMailFinderRequest) -> AnyMailFi
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-email-anymailfinder.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return AnyMailFinderResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return AnyMailFinderResponse(**result)
 
 
 @router.post(
@@ -4225,24 +3279,8 @@ async def ingest_email_icypeas(request: IcypeasRequest) -> IcypeasResponse:
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-email-icypeas.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return IcypeasResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return IcypeasResponse(**result)
 
 
 @router.post(
@@ -4262,24 +3300,8 @@ async def ingest_email_leadmagic(request: LeadMagicEmailRequest) -> LeadMagicEma
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-email-leadmagic.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return LeadMagicEmailResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return LeadMagicEmailResponse(**result)
 
 
 @router.post(
@@ -4299,24 +3321,8 @@ async def ingest_salesnav_person(request: SalesNavPersonRequest) -> SalesNavPers
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-salesnav-person.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return SalesNavPersonResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return SalesNavPersonResponse(**result)
 
 
 @router.post(
@@ -4336,24 +3342,8 @@ async def ingest_signal_job_change(request: SignalJobChangeRequest) -> SignalJob
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-signal-job-change.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return SignalJobChangeResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return SignalJobChangeResponse(**result)
 
 
 @router.post(
@@ -4373,24 +3363,8 @@ async def ingest_signal_job_posting(request: SignalJobPostingRequest) -> SignalJ
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-signal-job-posting.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return SignalJobPostingResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return SignalJobPostingResponse(**result)
 
 
 @router.post(
@@ -4410,24 +3384,8 @@ async def ingest_signal_promotion(request: SignalPromotionRequest) -> SignalProm
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-signal-promotion.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return SignalPromotionResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return SignalPromotionResponse(**result)
 
 
 @router.post(
@@ -4447,24 +3405,8 @@ async def ingest_clay_signal_job_change(request: ClaySignalJobChangeRequest) ->
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-clay-signal-job-change.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return ClaySignalJobChangeResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return ClaySignalJobChangeResponse(**result)
 
 
 @router.post(
@@ -4484,24 +3426,8 @@ async def ingest_clay_person_profile(request: ClayPersonProfileRequest) -> ClayP
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-clay-person-profile.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return ClayPersonProfileResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return ClayPersonProfileResponse(**result)
 
 
 @router.post(
@@ -4521,24 +3447,8 @@ async def ingest_clay_signal_new_hire(request: ClaySignalNewHireRequest) -> Clay
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-clay-signal-new-hire.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return ClaySignalNewHireResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return ClaySignalNewHireResponse(**result)
 
 
 @router.post(
@@ -4558,24 +3468,8 @@ async def ingest_clay_signal_promotion(request: ClaySignalPromotionRequest) -> C
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-clay-signal-promotion.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return ClaySignalPromotionResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return ClaySignalPromotionResponse(**result)
 
 
 @router.post(
@@ -4595,24 +3489,8 @@ async def ingest_ppl_title_enrich(request: PersonTitleEnrichmentRequest) -> Pers
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-ppl-title-enrich.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return PersonTitleEnrichmentResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return PersonTitleEnrichmentResponse(**result)
 
 
 @router.post(
@@ -4632,24 +3510,8 @@ async def lookup_salesnav_company_location(request: CompanyLocationLookupRequest
     """
     modal_url = "https://bencrane--hq-master-data-ingest-lookup-salesnav-company--1838bd.modal.run"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return CompanyLocationLookupResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=30.0)
+    return CompanyLocationLookupResponse(**result)
 
 
 @router.post(
@@ -4669,24 +3531,8 @@ async def lookup_salesnav_location(request: SalesnavLocationLookupRequest) -> Sa
     """
     modal_url = f"{MODAL_BASE_URL}-lookup-salesnav-location.modal.run"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return SalesnavLocationLookupResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=30.0)
+    return SalesnavLocationLookupResponse(**result)
 
 
 @router.post(
@@ -4707,24 +3553,8 @@ async def process_similar_companies_queue(request: ProcessSimilarCompaniesQueueR
     """
     modal_url = f"{MODAL_BASE_URL}-process-similar-companies-queue.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return ProcessSimilarCompaniesQueueResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return ProcessSimilarCompaniesQueueResponse(**result)
 
 
 @router.post(
@@ -4742,24 +3572,8 @@ async def update_staging_company_linkedin(request: StagingCompanyLinkedInRequest
     """
     modal_url = "https://bencrane--hq-master-data-ingest-update-vc-domain.modal.run"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return StagingCompanyLinkedInResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=30.0)
+    return StagingCompanyLinkedInResponse(**result)
 
 
 @router.post(
@@ -4777,24 +3591,8 @@ async def update_vc_domain(request: VCDomainUpdateRequest) -> VCDomainUpdateResp
     """
     modal_url = "https://bencrane--hq-master-data-ingest-upsert-core-company.modal.run"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return VCDomainUpdateResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=30.0)
+    return VCDomainUpdateResponse(**result)
 
 
 @router.post(
@@ -4814,24 +3612,8 @@ async def upsert_core_company(request: CoreCompanyUpsertRequest) -> CoreCompanyU
     """
     modal_url = f"{MODAL_BASE_URL}-upsert-core-company.modal.run"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return CoreCompanyUpsertResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=30.0)
+    return CoreCompanyUpsertResponse(**result)
 
 
 @router.post(
@@ -4852,24 +3634,8 @@ async def upsert_core_company_full(request: CoreCompanyFullUpsertRequest) -> Cor
     """
     modal_url = f"{MODAL_BASE_URL}-upsert-core-company-full.modal.run"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return CoreCompanyFullUpsertResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=30.0)
+    return CoreCompanyFullUpsertResponse(**result)
 
 
 @router.post(
@@ -4887,24 +3653,8 @@ async def upsert_icp_criteria(request: ICPCriteriaUpsertRequest) -> ICPCriteriaU
     """
     modal_url = f"{MODAL_BASE_URL}-upsert-icp-criteria.modal.run"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return ICPCriteriaUpsertResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=30.0)
+    return ICPCriteriaUpsertResponse(**result)
 
 
 @router.post(
@@ -4924,24 +3674,8 @@ async def backfill_cleaned_company_name(request: BackfillCleanedCompanyNameReque
     """
     modal_url = f"{MODAL_BASE_URL}-backfill-cleaned-company-name.modal.run"
 
-    async with httpx.AsyncClient(timeout=600.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return BackfillCleanedCompanyNameResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=600.0)
+    return BackfillCleanedCompanyNameResponse(**result)
 
 
 @router.post(
@@ -4962,24 +3696,8 @@ async def backfill_company_descriptions(request: BackfillCompanyDescriptionsRequ
     """
     modal_url = f"{MODAL_BASE_URL}-backfill-company-descriptions.modal.run"
 
-    async with httpx.AsyncClient(timeout=600.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return BackfillCompanyDescriptionsResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=600.0)
+    return BackfillCompanyDescriptionsResponse(**result)
 
 
 @router.post(
@@ -4999,24 +3717,8 @@ async def backfill_person_location(request: BackfillPersonLocationRequest) -> Ba
     """
     modal_url = f"{MODAL_BASE_URL}-backfill-person-location.modal.run"
 
-    async with httpx.AsyncClient(timeout=600.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return BackfillPersonLocationResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=600.0)
+    return BackfillPersonLocationResponse(**result)
 
 
 @router.post(
@@ -5036,24 +3738,8 @@ async def backfill_person_matched_location(request: BackfillPersonMatchedLocatio
     """
     modal_url = "https://bencrane--hq-master-data-ingest-backfill-person-matched--f1e270.modal.run"
 
-    async with httpx.AsyncClient(timeout=1800.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return BackfillPersonMatchedLocationResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=1800.0)
+    return BackfillPersonMatchedLocationResponse(**result)
 
 
 @router.post(
@@ -5073,29 +3759,29 @@ async def ingest_company_ticker(request: CompanyTickerIngestRequest) -> CompanyT
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-company-ticker.modal.run"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json={
-                    "domain": request.domain,
-                    "ticker_payload": request.ticker_payload,
-                    "clay_table_url": request.clay_table_url,
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
-            return CompanyTickerIngestResponse(**data)
-        except httpx.HTTPStatusError as e:
-            return CompanyTickerIngestResponse(
-                success=False,
-                error=f"Modal function error: {e.response.text}"
-            )
-        except Exception as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    try:
+        response = await modal_post(
+            modal_url,
+            json={
+                "domain": request.domain,
+                "ticker_payload": request.ticker_payload,
+                "clay_table_url": request.clay_table_url,
+            },
+            timeout=30.0,
+        )
+        response.raise_for_status()
+        data = response.json()
+        return CompanyTickerIngestResponse(**data)
+    except httpx.HTTPStatusError as e:
+        return CompanyTickerIngestResponse(
+            success=False,
+            error=f"Modal function error: {e.response.text}"
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Failed to reach Modal function: {str(e)}"
+        )
 
 
 @router.post(
@@ -5161,42 +3847,42 @@ async def fetch_sec_financials(request: SECFinancialsIngestRequest) -> SECFinanc
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-sec-financials.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json={"domain": request.domain}
-            )
-            result = response.json()
-
-            latest = result.get("latest_period")
-            latest_period = None
-            if latest:
-                latest_period = SECFinancialsLatestPeriod(
-                    period_end=latest.get("period_end"),
-                    fiscal_year=latest.get("fiscal_year"),
-                    fiscal_period=latest.get("fiscal_period"),
-                    revenue=latest.get("revenue"),
-                    net_income=latest.get("net_income"),
-                )
-
-            return SECFinancialsIngestResponse(
-                success=result.get("success", False),
-                domain=result.get("domain"),
-                cik=result.get("cik"),
-                ticker=result.get("ticker"),
-                sec_company_name=result.get("sec_company_name"),
-                raw_payload_id=result.get("raw_payload_id"),
-                periods_extracted=result.get("periods_extracted"),
-                latest_period=latest_period,
-                error=result.get("error"),
-            )
-        except Exception as e:
-            return SECFinancialsIngestResponse(
-                success=False,
-                domain=request.domain,
-                error=str(e),
-            )
+    try:
+        response = await modal_post(
+            modal_url,
+            json={"domain": request.domain},
+            timeout=60.0,
+        )
+        result = response.json()
+
+        latest = result.get("latest_period")
+        latest_period = None
+        if latest:
+            latest_period = SECFinancialsLatestPeriod(
+                period_end=latest.get("period_end"),
+                fiscal_year=latest.get("fiscal_year"),
+                fiscal_period=latest.get("fiscal_period"),
+                revenue=latest.get("revenue"),
+                net_income=latest.get("net_income"),
+            )
+
+        return SECFinancialsIngestResponse(
+            success=result.get("success", False),
+            domain=result.get("domain"),
+            cik=result.get("cik"),
+            ticker=result.get("ticker"),
+            sec_company_name=result.get("sec_company_name"),
+            raw_payload_id=result.get("raw_payload_id"),
+            periods_extracted=result.get("periods_extracted"),
+            latest_period=latest_period,
+            error=result.get("error"),
+        )
+    except Exception as e:
+        return SECFinancialsIngestResponse(
+            success=False,
+            domain=request.domain,
+            error=str(e),
+        )
 
 
 @router.post(
@@ -5221,51 +3907,51 @@ async def fetch_sec_filings(request: SECFilingsRequest) -> SECFilingsResponse:
     """
     modal_url = f"{MODAL_BASE_URL}-fetch-sec-filings.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json={"domain": request.domain}
-            )
-            result = response.json()
-
-            # Parse filings into typed models
-            filings_data = None
-            if result.get("filings"):
-                raw_filings = result["filings"]
-
-                def parse_filing(f: dict) -> SECFilingInfo:
-                    return SECFilingInfo(
-                        filing_date=f.get("filing_date"),
-                        report_date=f.get("report_date"),
-                        accession_number=f.get("accession_number"),
-                        document_url=f.get("document_url"),
-                        items=f.get("items"),
-                    )
-
-                filings_data = SECFilingsData(
-                    latest_10q=parse_filing(raw_filings["latest_10q"]) if raw_filings.get("latest_10q") else None,
-                    latest_10k=parse_filing(raw_filings["latest_10k"]) if raw_filings.get("latest_10k") else None,
-                    recent_8k_executive_changes=[parse_filing(f) for f in raw_filings.get("recent_8k_executive_changes", [])],
-                    recent_8k_earnings=[parse_filing(f) for f in raw_filings.get("recent_8k_earnings", [])],
-                    recent_8k_material_contracts=[parse_filing(f) for f in raw_filings.get("recent_8k_material_contracts", [])],
+    try:
+        response = await modal_post(
+            modal_url,
+            json={"domain": request.domain},
+            timeout=60.0,
+        )
+        result = response.json()
+
+        # Parse filings into typed models
+        filings_data = None
+        if result.get("filings"):
+            raw_filings = result["filings"]
+
+            def parse_filing(f: dict) -> SECFilingInfo:
+                return SECFilingInfo(
+                    filing_date=f.get("filing_date"),
+                    report_date=f.get("report_date"),
+                    accession_number=f.get("accession_number"),
+                    document_url=f.get("document_url"),
+                    items=f.get("items"),
                 )
 
-            return SECFilingsResponse(
-                success=result.get("success", False),
-                domain=result.get("domain"),
-                cik=result.get("cik"),
-                ticker=result.get("ticker"),
-                company_name=result.get("company_name"),
-                filings=filings_data,
-                error=result.get("error"),
-            )
-        except Exception as e:
-            return SECFilingsResponse(
-                success=False,
-                domain=request.domain,
-                error=str(e),
-            )
+            filings_data = SECFilingsData(
+                latest_10q=parse_filing(raw_filings["latest_10q"]) if raw_filings.get("latest_10q") else None,
+                latest_10k=parse_filing(raw_filings["latest_10k"]) if raw_filings.get("latest_10k") else None,
+                recent_8k_executive_changes=[parse_filing(f) for f in raw_filings.get("recent_8k_executive_changes", [])],
+                recent_8k_earnings=[parse_filing(f) for f in raw_filings.get("recent_8k_earnings", [])],
+                recent_8k_material_contracts=[parse_filing(f) for f in raw_filings.get("recent_8k_material_contracts", [])],
+            )
+
+        return SECFilingsResponse(
+            success=result.get("success", False),
+            domain=result.get("domain"),
+            cik=result.get("cik"),
+            ticker=result.get("ticker"),
+            company_name=result.get("company_name"),
+            filings=filings_data,
+            error=result.get("error"),
+        )
+    except Exception as e:
+        return SECFilingsResponse(
+            success=False,
+            domain=request.domain,
+            error=str(e),
+        )
 
 
 @router.post(
@@ -5721,10 +4407,9 @@ async def link_target_client_leads_batch(request: TargetClientLeadLinkBatchReque
     Link a batch of existing enriched data to target client leads for demos.
 
     Ideal for CSV imports where work_email matches existing core.people records.
-    Looks up each lead by email/linkedin, then creates target_client.leads with FKs.
+    Resolves all emails/linkedin URLs/domains with array lookups, then inserts
+    every matched lead with one COPY in a single transaction.
     """
-    pool = get_pool()
-
     target_client_domain = request.target_client_domain.lower().strip() if request.target_client_domain else None
     if not target_client_domain:
         return TargetClientLeadLinkBatchResponse(success=False, error="target_client_domain is required")
@@ -5732,132 +4417,29 @@ async def link_target_client_leads_batch(request: TargetClientLeadLinkBatchReque
     if not request.leads:
         return TargetClientLeadLinkBatchResponse(success=False, error="No leads provided")
 
-    results = []
-    linked = 0
-    failed = 0
-
-    for idx, lead in enumerate(request.leads):
-        try:
-            company_domain = lead.company_domain.lower().strip().rstrip("/") if lead.company_domain else None
-            person_linkedin_url = lead.person_linkedin_url.strip() if lead.person_linkedin_url else None
-            person_email = lead.person_email.lower().strip() if lead.person_email else None
-
-            # Look up core_company_id
-            core_company_id = None
-            company_name = None
-            company_linkedin_url = None
-            company_found = False
-            if company_domain:
-                company_lookup = await pool.fetchrow(
-                    "SELECT id, name, linkedin_url FROM core.companies WHERE domain = $1 LIMIT 1",
-                    company_domain
-                )
-                if company_lookup:
-                    core_company_id = company_lookup["id"]
-                    company_name = company_lookup["name"]
-                    company_linkedin_url = company_lookup["linkedin_url"]
-                    company_found = True
-
-            # Look up core_person_id - prefer email for CSV imports
-            core_person_id = None
-            first_name = lead.first_name
-            last_name = lead.last_name
-            full_name = lead.full_name
-            work_email = person_email
-            person_found = False
-
-            if person_email:
-                person_lookup = await pool.fetchrow(
-                    "SELECT id, first_name, last_name, full_name, linkedin_url, work_email, company_domain FROM core.people WHERE work_email = $1 LIMIT 1",
-                    person_email
-                )
-                if person_lookup:
-                    core_person_id = person_lookup["id"]
-                    first_name = first_name or person_lookup["first_name"]
-                    last_name = last_name or person_lookup["last_name"]
-                    full_name = full_name or person_lookup["full_name"]
-                    person_linkedin_url = person_linkedin_url or person_lookup["linkedin_url"]
-                    # Also grab company_domain from person if not provided
-                    if not company_domain and person_lookup["company_domain"]:
-                        company_domain = person_lookup["company_domain"]
-                        # Try to look up company now
-                        company_lookup = await pool.fetchrow(
-                            "SELECT id, name, linkedin_url FROM core.companies WHERE domain = $1 LIMIT 1",
-                            company_domain
-                        )
-                        if company_lookup:
-                            core_company_id = company_lookup["id"]
-                            company_name = company_lookup["name"]
-                            company_linkedin_url = company_lookup["linkedin_url"]
-                            company_found = True
-                    person_found = True
-
-            if not core_person_id and person_linkedin_url:
-                person_lookup = await pool.fetchrow(
-                    "SELECT id, first_name, last_name, full_name, work_email FROM core.people WHERE linkedin_url = $1 LIMIT 1",
-                    person_linkedin_url
-                )
-                if person_lookup:
-                    core_person_id = person_lookup["id"]
-                    first_name = first_name or person_lookup["first_name"]
-                    last_name = last_name or person_lookup["last_name"]
-                    full_name = full_name or person_lookup["full_name"]
-                    work_email = work_email or person_lookup["work_email"]
-                    person_found = True
-
-            # Must find at least person for CSV import
-            if not core_person_id:
-                results.append(TargetClientLeadLinkBatchResultItem(
-                    index=idx,
-                    success=False,
-                    error="No matching person found in core.people",
-                    company_found=company_found,
-                    person_found=False
-                ))
-                failed += 1
-                continue
-
-            # Insert into target_client.leads with FKs
-            lead_row = await pool.fetchrow("""
-                INSERT INTO target_client.leads (
-                    target_client_domain, first_name, last_name, full_name,
-                    person_linkedin_url, work_email, company_domain,
-                    company_name, company_linkedin_url, source,
-                    form_id, form_title, core_company_id, core_person_id
-                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14)
-                RETURNING id
-            """,
-                target_client_domain, first_name, last_name, full_name,
-                person_linkedin_url, work_email, company_domain,
-                company_name, company_linkedin_url, request.source,
-                request.form_id, request.form_title, core_company_id, core_person_id
-            )
-            lead_id = str(lead_row["id"])
-
-            results.append(TargetClientLeadLinkBatchResultItem(
-                index=idx,
-                success=True,
-                lead_id=lead_id,
-                core_company_id=str(core_company_id) if core_company_id else None,
-                core_person_id=str(core_person_id) if core_person_id else None,
-                company_found=company_found,
-                person_found=person_found
-            ))
-            linked += 1
+    try:
+        rows = await target_client_repo.link_leads_batch(
+            target_client_domain,
+            request.leads,
+            source=request.source,
+            form_id=request.form_id,
+            form_title=request.form_title,
+        )
+    except Exception as e:
+        return TargetClientLeadLinkBatchResponse(
+            success=False,
+            total=len(request.leads),
+            error=str(e)
+        )
 
-        except Exception as e:
-            results.append(TargetClientLeadLinkBatchResultItem(
-                index=idx,
-                success=False,
-                error=str(e)
-            ))
-            failed += 1
+    results = [TargetClientLeadLinkBatchResultItem(**row) for row in rows]
+    linked = sum(1 for r in results if r.success)
 
     return TargetClientLeadLinkBatchResponse(
         success=True,
         total=len(request.leads),
         linked=linked,
-        failed=failed,
+        failed=len(results) - linked,
         results=results
     )
 
@@ -5898,6 +4480,7 @@ async def update_job_title_lookup(request: JobTitleUpdateRequest) -> JobTitleUpd
             latest_title, cleaned_job_title, request.seniority_level,
             request.job_function, request.status
         )
+        filters_repo.invalidate_filters_cache()
 
         return JobTitleUpdateResponse(
             success=True,
@@ -5951,6 +4534,7 @@ async def update_location_lookup(request: LocationUpdateRequest) -> LocationUpda
             location_name, request.city, request.state, request.country,
             has_city, has_state, has_country
         )
+        filters_repo.invalidate_filters_cache()
 
         return LocationUpdateResponse(
             success=True,
@@ -6009,41 +4593,41 @@ async def ingest_linkedin_job_video(
         video_content = await video.read()
 
         # Forward to Modal endpoint as multipart form data
-        async with httpx.AsyncClient(timeout=300.0) as client:
-            files = {"video": (video.filename, video_content, video.content_type or "video/mp4")}
-            data = {}
-            if search_query:
-                data["search_query"] = search_query
-            if search_date:
-                data["search_date"] = search_date
-            if linkedin_search_url:
-                data["linkedin_search_url"] = linkedin_search_url
-
-            response = await client.post(
-                MODAL_LINKEDIN_JOB_VIDEO_URL,
-                files=files,
-                data=data,
-            )
-
-            if response.status_code != 200:
-                return LinkedInJobVideoResponse(
-                    success=False,
-                    error=f"Modal endpoint returned {response.status_code}: {response.text}"
-                )
-
-            result = response.json()
+        files = {"video": (video.filename, video_content, video.content_type or "video/mp4")}
+        data = {}
+        if search_query:
+            data["search_query"] = search_query
+        if search_date:
+            data["search_date"] = search_date
+        if linkedin_search_url:
+            data["linkedin_search_url"] = linkedin_search_url
+
+        response = await modal_post(
+            MODAL_LINKEDIN_JOB_VIDEO_URL,
+            files=files,
+            data=data,
+            timeout=300.0,
+        )
 
+        if response.status_code != 200:
             return LinkedInJobVideoResponse(
-                success=result.get("success", False),
-                raw_video_id=result.get("raw_video_id"),
-                video_filename=result.get("video_filename"),
-                video_duration_seconds=result.get("video_duration_seconds"),
-                frames_extracted=result.get("frames_extracted"),
-                jobs_extracted=result.get("jobs_extracted"),
-                tokens_used=result.get("tokens_used"),
-                error=result.get("error"),
+                success=False,
+                error=f"Modal endpoint returned {response.status_code}: {response.text}"
             )
 
+        result = response.json()
+
+        return LinkedInJobVideoResponse(
+            success=result.get("success", False),
+            raw_video_id=result.get("raw_video_id"),
+            video_filename=result.get("video_filename"),
+            video_duration_seconds=result.get("video_duration_seconds"),
+            frames_extracted=result.get("frames_extracted"),
+            jobs_extracted=result.get("jobs_extracted"),
+            tokens_used=result.get("tokens_used"),
+            error=result.get("error"),
+        )
+
     except httpx.TimeoutException:
         return LinkedInJobVideoResponse(success=False, error="Request timed out - video processing may take up to 5 minutes")
     except Exception as e:
@@ -6169,9 +4753,8 @@ async def case_study_urls_to_clay(request: dict):
     Body: { "webhook_url": "...", "batch_id": "..." (optional) }
     """
     modal_url = f"{MODAL_BASE_URL}-send-case-study-urls-to-clay.modal.run"
-    async with httpx.AsyncClient(timeout=660.0) as client:
-        resp = await client.post(modal_url, json=request)
-        return resp.json()
+    resp = await modal_post(modal_url, json=request, timeout=660.0)
+    return resp.json()
 
 
 # =============================================================================
@@ -6194,9 +4777,8 @@ async def send_client_leads_to_clay(request: dict):
     Modal URL: https://bencrane--hq-master-data-ingest-send-client-leads-to-clay.modal.run
     """
     modal_url = f"{MODAL_BASE_URL}-send-client-leads-to-clay.modal.run"
-    async with httpx.AsyncClient(timeout=660.0) as client:
-        resp = await client.post(modal_url, json=request)
-        return resp.json()
+    resp = await modal_post(modal_url, json=request, timeout=660.0)
+    return resp.json()
 
 
 @router.post(
@@ -6215,24 +4797,8 @@ async def resolve_customer_domain(request: ResolveCustomerDomainRequest) -> Reso
     """
     modal_url = f"{MODAL_BASE_URL}-resolve-customer-domain.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return ResolveCustomerDomainResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return ResolveCustomerDomainResponse(**result)
 
 
 @router.post(
@@ -6247,9 +4813,8 @@ async def unresolved_customers_to_clay(request: dict):
     Body: { "webhook_url": "...", "limit": 100 (optional) }
     """
     modal_url = f"{MODAL_BASE_URL}-send-unresolved-customer-74dc0a.modal.run"
-    async with httpx.AsyncClient(timeout=660.0) as client:
-        resp = await client.post(modal_url, json=request)
-        return resp.json()
+    resp = await modal_post(modal_url, json=request, timeout=660.0)
+    return resp.json()
 
 
 @router.post(
@@ -6264,9 +4829,8 @@ async def lookup_case_study_details(request: dict):
     Body: { "case_study_url": "https://..." }
     """
     modal_url = f"{MODAL_BASE_URL}-lookup-case-study-details.modal.run"
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        resp = await client.post(modal_url, json=request)
-        return resp.json()
+    resp = await modal_post(modal_url, json=request, timeout=30.0)
+    return resp.json()
 
 
 # =============================================================================
@@ -6344,26 +4908,26 @@ async def ingest_companyenrich(request: CompanyEnrichRequest) -> CompanyEnrichRe
     and funding rounds to extracted.companyenrich_funding_rounds.
     """
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                MODAL_COMPANYENRICH_URL,
-                json=request.model_dump(),
-            )
-
-            if response.status_code != 200:
-                return CompanyEnrichResponse(
-                    success=False,
-                    error=f"Modal returned {response.status_code}: {response.text}"
-                )
+        response = await modal_post(
+            MODAL_COMPANYENRICH_URL,
+            json=request.model_dump(),
+            timeout=60.0,
+        )
 
-            result = response.json()
+        if response.status_code != 200:
             return CompanyEnrichResponse(
-                success=result.get("success", False),
-                raw_id=result.get("raw_id"),
-                extracted_id=result.get("extracted_id"),
-                funding_rounds_processed=result.get("funding_rounds_processed"),
-                error=result.get("error"),
+                success=False,
+                error=f"Modal returned {response.status_code}: {response.text}"
             )
+
+        result = response.json()
+        return CompanyEnrichResponse(
+            success=result.get("success", False),
+            raw_id=result.get("raw_id"),
+            extracted_id=result.get("extracted_id"),
+            funding_rounds_processed=result.get("funding_rounds_processed"),
+            error=result.get("error"),
+        )
     except Exception as e:
         return CompanyEnrichResponse(success=False, error=str(e))
 
@@ -6468,65 +5032,48 @@ async def classify_b2b_b2c_openai_db_direct(request: B2bB2cClassifyRequest) -> B
     """, domain_list)
     already_classified = {r["domain"] for r in existing}
 
-    # Process records
+    # Skip already-classified and description-less records before fanning out
     records_evaluated = len(domains_to_process)
-    fields_updated = 0
     records_already_classified = 0
-    records_classified_by_ai = 0
     records_missing_description = 0
-    errors = []
-
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        for record in domains_to_process:
-            domain = record["domain"]
-            company_name = record["company_name"] or domain
-            description = record["description"]
-
-            try:
-                # Skip if already classified
-                if domain in already_classified:
-                    records_already_classified += 1
-                    continue
-
-                # Skip if no description
-                if not description:
-                    records_missing_description += 1
-                    continue
-
-                # Call Modal function
-                response = await client.post(
-                    MODAL_CLASSIFY_B2B_B2C_URL,
-                    json={
-                        "domain": domain,
-                        "company_name": company_name,
-                        "description": description,
-                        "model": request.model,
-                        "workflow_source": WORKFLOW_SOURCE_B2B_B2C
-                    }
-                )
-
-                if response.status_code != 200:
-                    errors.append({"domain": domain, "error": f"Modal returned {response.status_code}"})
-                    continue
-
-                result = response.json()
-                if result.get("success"):
-                    fields_updated += 1
-                    records_classified_by_ai += 1
-                else:
-                    errors.append({"domain": domain, "error": result.get("error", "Unknown error")})
+    to_classify = []
+    for record in domains_to_process:
+        if record["domain"] in already_classified:
+            records_already_classified += 1
+        elif not record["description"]:
+            records_missing_description += 1
+        else:
+            to_classify.append(record)
+
+    async def classify(record) -> str:
+        domain = record["domain"]
+        response = await modal_post(
+            MODAL_CLASSIFY_B2B_B2C_URL,
+            json={
+                "domain": domain,
+                "company_name": record["company_name"] or domain,
+                "description": record["description"],
+                "model": request.model,
+                "workflow_source": WORKFLOW_SOURCE_B2B_B2C
+            },
+            timeout=60.0,
+        )
+        raise_for_upstream_status(response)
+        result = response.json()
+        if not result.get("success"):
+            raise Exception(result.get("error", "Unknown error"))
+        return "classified"
 
-            except Exception as e:
-                errors.append({"domain": domain, "error": str(e)})
+    batch = await run_batch("b2b-b2c/classify", to_classify, classify, provider="openai")
 
     return B2bB2cClassifyResponse(
         success=True,
         records_evaluated=records_evaluated,
-        fields_updated=fields_updated,
+        fields_updated=batch.count("classified"),
         records_already_classified=records_already_classified,
-        records_classified_by_ai=records_classified_by_ai,
+        records_classified_by_ai=batch.count("classified"),
         records_missing_description=records_missing_description,
-        errors=errors if errors else None
+        errors=batch.errors if batch.errors else None
     )
 
 
@@ -6618,33 +5165,33 @@ async def ingest_linkedin_ads_db_direct(request: LinkedInAdsDbDirectRequest) ->
 
     # Call Modal function
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                MODAL_LINKEDIN_ADS_DB_DIRECT_URL,
-                json={
-                    "domain": domain,
-                    "linkedin_ads_payload": request.linkedin_ads_payload,
-                    "workflow_source": WORKFLOW_SOURCE_LINKEDIN_ADS
-                }
-            )
-
-            if response.status_code != 200:
-                return LinkedInAdsDbDirectResponse(
-                    success=False,
-                    domain=domain,
-                    error=f"Modal returned {response.status_code}: {response.text}"
-                )
+        response = await modal_post(
+            MODAL_LINKEDIN_ADS_DB_DIRECT_URL,
+            json={
+                "domain": domain,
+                "linkedin_ads_payload": request.linkedin_ads_payload,
+                "workflow_source": WORKFLOW_SOURCE_LINKEDIN_ADS
+            },
+            timeout=60.0,
+        )
 
-            result = response.json()
+        if response.status_code != 200:
             return LinkedInAdsDbDirectResponse(
-                success=result.get("success", False),
+                success=False,
                 domain=domain,
-                raw_payload_id=result.get("raw_payload_id"),
-                ads_extracted=result.get("ads_extracted"),
-                total_ads=result.get("total_ads"),
-                is_running_ads=result.get("is_running_ads"),
-                error=result.get("error")
+                error=f"Modal returned {response.status_code}: {response.text}"
             )
+
+        result = response.json()
+        return LinkedInAdsDbDirectResponse(
+            success=result.get("success", False),
+            domain=domain,
+            raw_payload_id=result.get("raw_payload_id"),
+            ads_extracted=result.get("ads_extracted"),
+            total_ads=result.get("total_ads"),
+            is_running_ads=result.get("is_running_ads"),
+            error=result.get("error")
+        )
     except Exception as e:
         return LinkedInAdsDbDirectResponse(
             success=False,
@@ -6742,34 +5289,34 @@ async def ingest_meta_ads_db_direct(request: MetaAdsDbDirectRequest) -> MetaAdsD
 
     # Call Modal function
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                MODAL_META_ADS_DB_DIRECT_URL,
-                json={
-                    "domain": domain,
-                    "meta_ads_payload": request.meta_ads_payload,
-                    "workflow_source": WORKFLOW_SOURCE_META_ADS
-                }
-            )
-
-            if response.status_code != 200:
-                return MetaAdsDbDirectResponse(
-                    success=False,
-                    domain=domain,
-                    error=f"Modal returned {response.status_code}: {response.text}"
-                )
+        response = await modal_post(
+            MODAL_META_ADS_DB_DIRECT_URL,
+            json={
+                "domain": domain,
+                "meta_ads_payload": request.meta_ads_payload,
+                "workflow_source": WORKFLOW_SOURCE_META_ADS
+            },
+            timeout=60.0,
+        )
 
-            result = response.json()
+        if response.status_code != 200:
             return MetaAdsDbDirectResponse(
-                success=result.get("success", False),
+                success=False,
                 domain=domain,
-                raw_payload_id=result.get("raw_payload_id"),
-                ads_extracted=result.get("ads_extracted"),
-                total_ads=result.get("total_ads"),
-                is_running_ads=result.get("is_running_ads"),
-                platforms=result.get("platforms"),
-                error=result.get("error")
+                error=f"Modal returned {response.status_code}: {response.text}"
             )
+
+        result = response.json()
+        return MetaAdsDbDirectResponse(
+            success=result.get("success", False),
+            domain=domain,
+            raw_payload_id=result.get("raw_payload_id"),
+            ads_extracted=result.get("ads_extracted"),
+            total_ads=result.get("total_ads"),
+            is_running_ads=result.get("is_running_ads"),
+            platforms=result.get("platforms"),
+            error=result.get("error")
+        )
     except Exception as e:
         return MetaAdsDbDirectResponse(
             success=False,
@@ -6866,33 +5413,33 @@ async def ingest_google_ads_db_direct(request: GoogleAdsDbDirectRequest) -> Goog
 
     # Call Modal function
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                MODAL_GOOGLE_ADS_DB_DIRECT_URL,
-                json={
-                    "domain": domain,
-                    "google_ads_payload": request.google_ads_payload,
-                    "workflow_source": WORKFLOW_SOURCE_GOOGLE_ADS
-                }
-            )
-
-            if response.status_code != 200:
-                return GoogleAdsDbDirectResponse(
-                    success=False,
-                    domain=domain,
-                    error=f"Modal returned {response.status_code}: {response.text}"
-                )
+        response = await modal_post(
+            MODAL_GOOGLE_ADS_DB_DIRECT_URL,
+            json={
+                "domain": domain,
+                "google_ads_payload": request.google_ads_payload,
+                "workflow_source": WORKFLOW_SOURCE_GOOGLE_ADS
+            },
+            timeout=60.0,
+        )
 
-            result = response.json()
+        if response.status_code != 200:
             return GoogleAdsDbDirectResponse(
-                success=result.get("success", False),
+                success=False,
                 domain=domain,
-                raw_payload_id=result.get("raw_payload_id"),
-                ads_extracted=result.get("ads_extracted"),
-                total_ads=result.get("total_ads"),
-                is_running_ads=result.get("is_running_ads"),
-                error=result.get("error")
+                error=f"Modal returned {response.status_code}: {response.text}"
             )
+
+        result = response.json()
+        return GoogleAdsDbDirectResponse(
+            success=result.get("success", False),
+            domain=domain,
+            raw_payload_id=result.get("raw_payload_id"),
+            ads_extracted=result.get("ads_extracted"),
+            total_ads=result.get("total_ads"),
+            is_running_ads=result.get("is_running_ads"),
+            error=result.get("error")
+        )
     except Exception as e:
         return GoogleAdsDbDirectResponse(
             success=False,
@@ -7014,32 +5561,32 @@ async def infer_description_db_direct(request: DescriptionDbDirectRequest) -> De
 
     # Call Modal function
     try:
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(
-                MODAL_DESCRIPTION_DB_DIRECT_URL,
-                json={
-                    "domain": domain,
-                    "company_name": company_name or domain,
-                    "company_linkedin_url": company_linkedin_url,
-                    "workflow_source": WORKFLOW_SOURCE_DESCRIPTION
-                }
-            )
-
-            if response.status_code != 200:
-                return DescriptionDbDirectResponse(
-                    success=False,
-                    domain=domain,
-                    error=f"Modal returned {response.status_code}: {response.text}"
-                )
+        response = await modal_post(
+            MODAL_DESCRIPTION_DB_DIRECT_URL,
+            json={
+                "domain": domain,
+                "company_name": company_name or domain,
+                "company_linkedin_url": company_linkedin_url,
+                "workflow_source": WORKFLOW_SOURCE_DESCRIPTION
+            },
+            timeout=120.0,
+        )
 
-            result = response.json()
+        if response.status_code != 200:
             return DescriptionDbDirectResponse(
-                success=result.get("success", False),
+                success=False,
                 domain=domain,
-                description=result.get("description"),
-                tagline=result.get("tagline"),
-                error=result.get("error")
+                error=f"Modal returned {response.status_code}: {response.text}"
             )
+
+        result = response.json()
+        return DescriptionDbDirectResponse(
+            success=result.get("success", False),
+            domain=domain,
+            description=result.get("description"),
+            tagline=result.get("tagline"),
+            error=result.get("error")
+        )
     except Exception as e:
         return DescriptionDbDirectResponse(
             success=False,
@@ -7114,55 +5661,37 @@ async def infer_description_db_direct_batch(request: DescriptionDbDirectBatchReq
     else:
         already_have_description = set()
 
-    # Process records
     records_evaluated = len(domains_to_process)
-    fields_updated = 0
-    records_already_had_value = 0
-    records_inferred = 0
-    errors = []
-
-    async with httpx.AsyncClient(timeout=120.0) as client:
-        for record in domains_to_process:
-            domain = record["domain"]
-            company_name = record["company_name"] or domain
-            company_linkedin_url = record["company_linkedin_url"]
-
-            try:
-                if domain in already_have_description:
-                    records_already_had_value += 1
-                    continue
-
-                response = await client.post(
-                    MODAL_DESCRIPTION_DB_DIRECT_URL,
-                    json={
-                        "domain": domain,
-                        "company_name": company_name,
-                        "company_linkedin_url": company_linkedin_url,
-                        "workflow_source": WORKFLOW_SOURCE_DESCRIPTION
-                    }
-                )
-
-                if response.status_code != 200:
-                    errors.append({"domain": domain, "error": f"Modal returned {response.status_code}"})
-                    continue
-
-                result = response.json()
-                if result.get("success"):
-                    fields_updated += 1
-                    records_inferred += 1
-                else:
-                    errors.append({"domain": domain, "error": result.get("error", "Unknown error")})
+    to_infer = [r for r in domains_to_process if r["domain"] not in already_have_description]
+    records_already_had_value = records_evaluated - len(to_infer)
+
+    async def infer(record) -> str:
+        domain = record["domain"]
+        response = await modal_post(
+            MODAL_DESCRIPTION_DB_DIRECT_URL,
+            json={
+                "domain": domain,
+                "company_name": record["company_name"] or domain,
+                "company_linkedin_url": record["company_linkedin_url"],
+                "workflow_source": WORKFLOW_SOURCE_DESCRIPTION
+            },
+            timeout=120.0,
+        )
+        raise_for_upstream_status(response)
+        result = response.json()
+        if not result.get("success"):
+            raise Exception(result.get("error", "Unknown error"))
+        return "inferred"
 
-            except Exception as e:
-                errors.append({"domain": domain, "error": str(e)})
+    batch = await run_batch("description/infer", to_infer, infer, provider="parallel")
 
     return DescriptionDbDirectBatchResponse(
         success=True,
         records_evaluated=records_evaluated,
-        fields_updated=fields_updated,
+        fields_updated=batch.count("inferred"),
         records_already_had_value=records_already_had_value,
-        records_inferred=records_inferred,
-        errors=errors if errors else None
+        records_inferred=batch.count("inferred"),
+        errors=batch.errors if batch.errors else None
     )
 
 
@@ -7258,35 +5787,35 @@ async def infer_g2_url_db_direct(request: G2UrlDbDirectRequest) -> G2UrlDbDirect
 
     # Call Modal function
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            # Use cleaned_company_name if provided, otherwise company_name
-            search_name = request.cleaned_company_name if request.cleaned_company_name else request.company_name
-
-            response = await client.post(
-                MODAL_G2_URL_DB_DIRECT_URL,
-                json={
-                    "domain": domain,
-                    "company_name": request.company_name,
-                    "cleaned_company_name": request.cleaned_company_name,
-                    "workflow_source": WORKFLOW_SOURCE_G2_URL
-                }
-            )
-
-            if response.status_code != 200:
-                return G2UrlDbDirectResponse(
-                    success=False,
-                    domain=domain,
-                    error=f"Modal returned {response.status_code}: {response.text}"
-                )
+        # Use cleaned_company_name if provided, otherwise company_name
+        search_name = request.cleaned_company_name if request.cleaned_company_name else request.company_name
+
+        response = await modal_post(
+            MODAL_G2_URL_DB_DIRECT_URL,
+            json={
+                "domain": domain,
+                "company_name": request.company_name,
+                "cleaned_company_name": request.cleaned_company_name,
+                "workflow_source": WORKFLOW_SOURCE_G2_URL
+            },
+            timeout=60.0,
+        )
 
-            result = response.json()
+        if response.status_code != 200:
             return G2UrlDbDirectResponse(
-                success=result.get("success", False),
+                success=False,
                 domain=domain,
-                g2_url=result.get("g2_url"),
-                error=result.get("error")
+                error=f"Modal returned {response.status_code}: {response.text}"
             )
 
+        result = response.json()
+        return G2UrlDbDirectResponse(
+            success=result.get("success", False),
+            domain=domain,
+            g2_url=result.get("g2_url"),
+            error=result.get("error")
+        )
+
     except Exception as e:
         return G2UrlDbDirectResponse(
             success=False,
@@ -7361,55 +5890,56 @@ async def infer_g2_url_db_direct_batch(request: G2UrlDbDirectBatchRequest) -> G2
     else:
         already_have_g2 = set()
 
-    # Process records
     records_evaluated = len(domains_to_process)
-    fields_updated = 0
-    records_already_had_value = 0
-    errors = []
-
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        for record in domains_to_process:
-            domain = record["domain"]
-            company_name = record["company_name"] or domain
-            cleaned_company_name = record.get("cleaned_company_name")
-
-            try:
-                if domain in already_have_g2:
-                    records_already_had_value += 1
-                    continue
-
-                response = await client.post(
-                    MODAL_G2_URL_DB_DIRECT_URL,
-                    json={
-                        "domain": domain,
-                        "company_name": company_name,
-                        "cleaned_company_name": cleaned_company_name,
-                        "workflow_source": WORKFLOW_SOURCE_G2_URL
-                    }
-                )
-
-                if response.status_code != 200:
-                    errors.append({"domain": domain, "error": f"Modal returned {response.status_code}"})
-                    continue
-
-                result = response.json()
-                if result.get("success"):
-                    fields_updated += 1
-                else:
-                    errors.append({"domain": domain, "error": result.get("error", "Unknown error")})
+    to_infer = [r for r in domains_to_process if r["domain"] not in already_have_g2]
+    records_already_had_value = records_evaluated - len(to_infer)
+
+    async def infer(record) -> str:
+        domain = record["domain"]
+        response = await modal_post(
+            MODAL_G2_URL_DB_DIRECT_URL,
+            json={
+                "domain": domain,
+                "company_name": record["company_name"] or domain,
+                "cleaned_company_name": record.get("cleaned_company_name"),
+                "workflow_source": WORKFLOW_SOURCE_G2_URL
+            },
+            timeout=60.0,
+        )
+        raise_for_upstream_status(response)
+        result = response.json()
+        if not result.get("success"):
+            raise Exception(result.get("error", "Unknown error"))
+        return "updated"
 
-            except Exception as e:
-                errors.append({"domain": domain, "error": str(e)})
+    batch = await run_batch("g2-url/infer", to_infer, infer, provider="parallel")
 
     return G2UrlDbDirectBatchResponse(
         success=True,
         records_evaluated=records_evaluated,
-        fields_updated=fields_updated,
+        fields_updated=batch.count("updated"),
         records_already_had_value=records_already_had_value,
-        errors=errors if errors else None
+        errors=batch.errors if batch.errors else None
     )
 
 
+# =============================================================================
+# Batch Progress
+# =============================================================================
+
+@router.get(
+    "/batches/active",
+    summary="Progress of running db-direct batches",
+    description="Live counters (completed, succeeded, failed, retries, in_flight, rate) for every batch currently running in this process."
+)
+async def get_active_batches():
+    """
+    Progress counters for in-flight batch endpoints.
+    """
+    batches = active_batches()
+    return {"batches": batches, "count": len(batches)}
+
+
 # =============================================================================
 # G2 Insights Extraction (Gemini) - DB Direct
 # =============================================================================
@@ -7463,36 +5993,36 @@ async def extract_g2_insights_db_direct(request: G2InsightsDbDirectRequest) -> G
     domain = request.domain.lower().strip()
 
     try:
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(
-                MODAL_G2_INSIGHTS_DB_DIRECT_URL,
-                json={
-                    "domain": domain,
-                    "g2_url": request.g2_url,
-                    "workflow_source": WORKFLOW_SOURCE_G2_INSIGHTS
-                }
-            )
-
-            if response.status_code != 200:
-                return G2InsightsDbDirectResponse(
-                    success=False,
-                    domain=domain,
-                    error=f"Modal returned {response.status_code}: {response.text}"
-                )
+        response = await modal_post(
+            MODAL_G2_INSIGHTS_DB_DIRECT_URL,
+            json={
+                "domain": domain,
+                "g2_url": request.g2_url,
+                "workflow_source": WORKFLOW_SOURCE_G2_INSIGHTS
+            },
+            timeout=120.0,
+        )
 
-            result = response.json()
+        if response.status_code != 200:
             return G2InsightsDbDirectResponse(
-                success=result.get("success", False),
+                success=False,
                 domain=domain,
-                g2_url=result.get("g2_url"),
-                overall_rating=result.get("overall_rating"),
-                total_reviews=result.get("total_reviews"),
-                top_complaints=result.get("top_complaints"),
-                top_praise=result.get("top_praise"),
-                negative_quotes=result.get("negative_quotes"),
-                error=result.get("error")
+                error=f"Modal returned {response.status_code}: {response.text}"
             )
 
+        result = response.json()
+        return G2InsightsDbDirectResponse(
+            success=result.get("success", False),
+            domain=domain,
+            g2_url=result.get("g2_url"),
+            overall_rating=result.get("overall_rating"),
+            total_reviews=result.get("total_reviews"),
+            top_complaints=result.get("top_complaints"),
+            top_praise=result.get("top_praise"),
+            negative_quotes=result.get("negative_quotes"),
+            error=result.get("error")
+        )
+
     except Exception as e:
         return G2InsightsDbDirectResponse(
             success=False,
@@ -7600,33 +6130,33 @@ async def infer_revenue_db_direct(request: RevenueDbDirectRequest) -> RevenueDbD
 
     # Call Modal function
     try:
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(
-                MODAL_REVENUE_DB_DIRECT_URL,
-                json={
-                    "domain": domain,
-                    "company_name": company_name or domain,
-                    "company_linkedin_url": company_linkedin_url,
-                    "workflow_source": WORKFLOW_SOURCE_REVENUE
-                }
-            )
-
-            if response.status_code != 200:
-                return RevenueDbDirectResponse(
-                    success=False,
-                    domain=domain,
-                    error=f"Modal returned {response.status_code}: {response.text}"
-                )
+        response = await modal_post(
+            MODAL_REVENUE_DB_DIRECT_URL,
+            json={
+                "domain": domain,
+                "company_name": company_name or domain,
+                "company_linkedin_url": company_linkedin_url,
+                "workflow_source": WORKFLOW_SOURCE_REVENUE
+            },
+            timeout=120.0,
+        )
 
-            result = response.json()
+        if response.status_code != 200:
             return RevenueDbDirectResponse(
-                success=result.get("success", False),
+                success=False,
                 domain=domain,
-                annual_revenue_usd=result.get("annual_revenue_usd"),
-                revenue_range=result.get("revenue_range"),
-                confidence=result.get("confidence"),
-                error=result.get("error")
+                error=f"Modal returned {response.status_code}: {response.text}"
             )
+
+        result = response.json()
+        return RevenueDbDirectResponse(
+            success=result.get("success", False),
+            domain=domain,
+            annual_revenue_usd=result.get("annual_revenue_usd"),
+            revenue_range=result.get("revenue_range"),
+            confidence=result.get("confidence"),
+            error=result.get("error")
+        )
     except Exception as e:
         return RevenueDbDirectResponse(
             success=False,
@@ -7734,33 +6264,33 @@ async def infer_funding_db_direct(request: FundingDbDirectRequest) -> FundingDbD
 
     # Call Modal function
     try:
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(
-                MODAL_FUNDING_DB_DIRECT_URL,
-                json={
-                    "domain": domain,
-                    "company_name": company_name or domain,
-                    "company_linkedin_url": company_linkedin_url,
-                    "workflow_source": WORKFLOW_SOURCE_FUNDING
-                }
-            )
-
-            if response.status_code != 200:
-                return FundingDbDirectResponse(
-                    success=False,
-                    domain=domain,
-                    error=f"Modal returned {response.status_code}: {response.text}"
-                )
+        response = await modal_post(
+            MODAL_FUNDING_DB_DIRECT_URL,
+            json={
+                "domain": domain,
+                "company_name": company_name or domain,
+                "company_linkedin_url": company_linkedin_url,
+                "workflow_source": WORKFLOW_SOURCE_FUNDING
+            },
+            timeout=120.0,
+        )
 
-            result = response.json()
+        if response.status_code != 200:
             return FundingDbDirectResponse(
-                success=result.get("success", False),
+                success=False,
                 domain=domain,
-                total_funding_usd=result.get("total_funding_usd"),
-                funding_range=result.get("funding_range"),
-                confidence=result.get("confidence"),
-                error=result.get("error")
+                error=f"Modal returned {response.status_code}: {response.text}"
             )
+
+        result = response.json()
+        return FundingDbDirectResponse(
+            success=result.get("success", False),
+            domain=domain,
+            total_funding_usd=result.get("total_funding_usd"),
+            funding_range=result.get("funding_range"),
+            confidence=result.get("confidence"),
+            error=result.get("error")
+        )
     except Exception as e:
         return FundingDbDirectResponse(
             success=False,
@@ -7866,33 +6396,33 @@ async def infer_employees_db_direct(request: EmployeesDbDirectRequest) -> Employ
 
     # Call Modal function
     try:
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(
-                MODAL_EMPLOYEES_DB_DIRECT_URL,
-                json={
-                    "domain": domain,
-                    "company_name": company_name or domain,
-                    "company_linkedin_url": company_linkedin_url,
-                    "workflow_source": WORKFLOW_SOURCE_EMPLOYEES
-                }
-            )
-
-            if response.status_code != 200:
-                return EmployeesDbDirectResponse(
-                    success=False,
-                    domain=domain,
-                    error=f"Modal returned {response.status_code}: {response.text}"
-                )
+        response = await modal_post(
+            MODAL_EMPLOYEES_DB_DIRECT_URL,
+            json={
+                "domain": domain,
+                "company_name": company_name or domain,
+                "company_linkedin_url": company_linkedin_url,
+                "workflow_source": WORKFLOW_SOURCE_EMPLOYEES
+            },
+            timeout=120.0,
+        )
 
-            result = response.json()
+        if response.status_code != 200:
             return EmployeesDbDirectResponse(
-                success=result.get("success", False),
+                success=False,
                 domain=domain,
-                employee_count=result.get("employee_count"),
-                employee_range=result.get("employee_range"),
-                confidence=result.get("confidence"),
-                error=result.get("error")
+                error=f"Modal returned {response.status_code}: {response.text}"
             )
+
+        result = response.json()
+        return EmployeesDbDirectResponse(
+            success=result.get("success", False),
+            domain=domain,
+            employee_count=result.get("employee_count"),
+            employee_range=result.get("employee_range"),
+            confidence=result.get("confidence"),
+            error=result.get("error")
+        )
     except Exception as e:
         return EmployeesDbDirectResponse(
             success=False,
@@ -8006,33 +6536,33 @@ async def infer_last_funding_date_db_direct(request: LastFundingDateDbDirectRequ
 
     # Call Modal function
     try:
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(
-                MODAL_LAST_FUNDING_DATE_DB_DIRECT_URL,
-                json={
-                    "domain": domain,
-                    "company_name": company_name or domain,
-                    "company_linkedin_url": company_linkedin_url,
-                    "workflow_source": WORKFLOW_SOURCE_LAST_FUNDING_DATE
-                }
-            )
-
-            if response.status_code != 200:
-                return LastFundingDateDbDirectResponse(
-                    success=False,
-                    domain=domain,
-                    error=f"Modal returned {response.status_code}: {response.text}"
-                )
+        response = await modal_post(
+            MODAL_LAST_FUNDING_DATE_DB_DIRECT_URL,
+            json={
+                "domain": domain,
+                "company_name": company_name or domain,
+                "company_linkedin_url": company_linkedin_url,
+                "workflow_source": WORKFLOW_SOURCE_LAST_FUNDING_DATE
+            },
+            timeout=120.0,
+        )
 
-            result = response.json()
+        if response.status_code != 200:
             return LastFundingDateDbDirectResponse(
-                success=result.get("success", False),
+                success=False,
                 domain=domain,
-                last_funding_date=result.get("last_funding_date"),
-                funding_type=result.get("funding_type"),
-                confidence=result.get("confidence"),
-                error=result.get("error")
+                error=f"Modal returned {response.status_code}: {response.text}"
             )
+
+        result = response.json()
+        return LastFundingDateDbDirectResponse(
+            success=result.get("success", False),
+            domain=domain,
+            last_funding_date=result.get("last_funding_date"),
+            funding_type=result.get("funding_type"),
+            confidence=result.get("confidence"),
+            error=result.get("error")
+        )
     except Exception as e:
         return LastFundingDateDbDirectResponse(
             success=False,
@@ -8106,20 +6636,20 @@ async def parallel_hq_location(request: ParallelHqLocationRequest) -> ParallelHq
     Infer company HQ location using Parallel AI Task API.
     Writes directly to core.company_parallel_locations.
     """
-    async with httpx.AsyncClient(timeout=180.0) as client:
-        try:
-            response = await client.post(
-                MODAL_PARALLEL_HQ_LOCATION_URL,
-                json=request.model_dump(exclude_none=True)
-            )
-            result = response.json()
-            return ParallelHqLocationResponse(**result)
-        except Exception as e:
-            return ParallelHqLocationResponse(
-                success=False,
-                domain=request.domain,
-                error=str(e)
-            )
+    try:
+        response = await modal_post(
+            MODAL_PARALLEL_HQ_LOCATION_URL,
+            json=request.model_dump(exclude_none=True),
+            timeout=180.0,
+        )
+        result = response.json()
+        return ParallelHqLocationResponse(**result)
+    except Exception as e:
+        return ParallelHqLocationResponse(
+            success=False,
+            domain=request.domain,
+            error=str(e)
+        )
 
 
 @router.post(
@@ -8133,20 +6663,20 @@ async def parallel_industry(request: ParallelIndustryRequest) -> ParallelIndustr
     Infer company industry using Parallel AI Task API.
     Writes directly to core.company_parallel_industries.
     """
-    async with httpx.AsyncClient(timeout=180.0) as client:
-        try:
-            response = await client.post(
-                MODAL_PARALLEL_INDUSTRY_URL,
-                json=request.model_dump(exclude_none=True)
-            )
-            result = response.json()
-            return ParallelIndustryResponse(**result)
-        except Exception as e:
-            return ParallelIndustryResponse(
-                success=False,
-                domain=request.domain,
-                error=str(e)
-            )
+    try:
+        response = await modal_post(
+            MODAL_PARALLEL_INDUSTRY_URL,
+            json=request.model_dump(exclude_none=True),
+            timeout=180.0,
+        )
+        result = response.json()
+        return ParallelIndustryResponse(**result)
+    except Exception as e:
+        return ParallelIndustryResponse(
+            success=False,
+            domain=request.domain,
+            error=str(e)
+        )
 
 
 @router.post(
@@ -8160,20 +6690,20 @@ async def parallel_competitors(request: ParallelCompetitorsRequest) -> ParallelC
     Infer company competitors using Parallel AI Task API.
     Writes directly to core.company_parallel_competitors.
     """
-    async with httpx.AsyncClient(timeout=180.0) as client:
-        try:
-            response = await client.post(
-                MODAL_PARALLEL_COMPETITORS_URL,
-                json=request.model_dump(exclude_none=True)
-            )
-            result = response.json()
-            return ParallelCompetitorsResponse(**result)
-        except Exception as e:
-            return ParallelCompetitorsResponse(
-                success=False,
-                domain=request.domain,
-                error=str(e)
-            )
+    try:
+        response = await modal_post(
+            MODAL_PARALLEL_COMPETITORS_URL,
+            json=request.model_dump(exclude_none=True),
+            timeout=180.0,
+        )
+        result = response.json()
+        return ParallelCompetitorsResponse(**result)
+    except Exception as e:
+        return ParallelCompetitorsResponse(
+            success=False,
+            domain=request.domain,
+            error=str(e)
+        )
 
 
 @router.post(
@@ -8194,24 +6724,8 @@ async def backfill_parallel_to_core(request: BackfillParallelToCoreRequest) -> B
     """
     modal_url = f"{MODAL_BASE_URL}-backfill-parallel-to-core.modal.run"
 
-    async with httpx.AsyncClient(timeout=600.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return BackfillParallelToCoreResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=600.0)
+    return BackfillParallelToCoreResponse(**result)
 
 
 @router.post(
@@ -8231,24 +6745,8 @@ async def lookup_case_study_champions(request: CaseStudyChampionsLookupRequest)
     """
     modal_url = f"{MODAL_BASE_URL}-lookup-case-study-champions.modal.run"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return CaseStudyChampionsLookupResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=30.0)
+    return CaseStudyChampionsLookupResponse(**result)
 
 
 @router.post(
@@ -8268,24 +6766,8 @@ async def lookup_champions_detailed(request: ChampionsDetailedLookupRequest) ->
     """
     modal_url = f"{MODAL_BASE_URL}-lookup-champions-detailed.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return ChampionsDetailedLookupResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return ChampionsDetailedLookupResponse(**result)
 
 
 @router.post(
@@ -8305,24 +6787,8 @@ async def lookup_alumni(request: AlumniLookupRequest) -> AlumniLookupResponse:
     """
     modal_url = f"{MODAL_BASE_URL}-lookup-alumni.modal.run"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return AlumniLookupResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True))
+    return AlumniLookupResponse(**result)
 
 
 # =============================================================================
@@ -8356,21 +6822,5 @@ async def ingest_salesnav_job_title_normalized(request: SalesnavJobTitleNormaliz
     """
     modal_url = f"{MODAL_BASE_URL}-ingest-salesnav-job-titl-4664ce.modal.run"
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.post(
-                modal_url,
-                json=request.model_dump(exclude_none=True)
-            )
-            response.raise_for_status()
-            return SalesnavJobTitleNormalizedResponse(**response.json())
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(
-                status_code=e.response.status_code,
-                detail=f"Modal function error: {e.response.text}"
-            )
-        except httpx.RequestError as e:
-            raise HTTPException(
-                status_code=503,
-                detail=f"Failed to reach Modal function: {str(e)}"
-            )
+    result = await forward_to_modal(modal_url, request.model_dump(exclude_none=True), timeout=30.0)
+    return SalesnavJobTitleNormalizedResponse(**result)
@@ -4,6 +4,7 @@ import json
 import httpx
 from fastapi import APIRouter
 from db import get_pool
+from batch_executor import track_progress
 
 MODAL_SEARCH_PARALLEL_AI_URL = os.getenv(
     "MODAL_SEARCH_PARALLEL_AI_URL",
@@ -436,7 +437,7 @@ async def resolve_company_name(payload: dict):
     """, record_ids_list)
     already_cleaned = {row["id"]: row["cleaned_company_name"] for row in existing_cleaned}
 
-    for record in rows:
+    async for record in track_progress(rows, errors):
         try:
             record_id = record["id"]
             domain = record["domain"]
@@ -576,7 +577,7 @@ async def resolve_domain_from_linkedin(payload: dict):
     records_no_match = 0
     errors = []
 
-    for record in rows:
+    async for record in track_progress(rows, errors):
         try:
             record_id = record["id"]
             linkedin_url = record["company_linkedin_url"]
@@ -695,7 +696,7 @@ async def resolve_domain_from_email(payload: dict):
     records_from_extraction = 0
     errors = []
 
-    for record in rows:
+    async for record in track_progress(rows, errors):
         try:
             record_id = record["id"]
             work_email = record["work_email"]
@@ -816,7 +817,7 @@ async def resolve_linkedin_from_domain(payload: dict):
     records_no_match = 0
     errors = []
 
-    for record in rows:
+    async for record in track_progress(rows, errors):
         try:
             record_id = record["id"]
             domain = record["domain"]
@@ -928,7 +929,7 @@ async def resolve_person_linkedin_from_email(payload: dict):
     records_no_match = 0
     errors = []
 
-    for record in rows:
+    async for record in track_progress(rows, errors):
         try:
             record_id = record["id"]
             work_email = record["work_email"]
@@ -1054,7 +1055,7 @@ async def resolve_company_location_from_domain(payload: dict):
     records_all_fields_had_value = 0
     errors = []
 
-    for record in rows:
+    async for record in track_progress(rows, errors):
         try:
             record_id = record["id"]
             domain = record["domain"]
@@ -1193,7 +1194,7 @@ async def resolve_person_location_from_linkedin(payload: dict):
     records_all_fields_had_value = 0
     errors = []
 
-    for record in rows:
+    async for record in track_progress(rows, errors):
         try:
             record_id = record["id"]
             linkedin_url = record["person_linkedin_url"]
@@ -0,0 +1,174 @@
+"""
+Compare job-board listing latency: the old five-join enrichment query vs
+the core.company_card projection.
+
+Runs directly against Postgres. The card query is built with the same
+repositories.job_boards helpers /job-boards/jobs/{domain} uses; the legacy
+query is kept inline below for comparison. Each filter combination fetches
+one page (default 200 rows, the endpoint maximum) plus its total count, the
+way the endpoint does, and reports p50/p95 over the runs.
+
+Usage:
+    DATABASE_URL=postgres://... python scripts/bench_company_card.py \
+        [--board example-jobs.com] [--limit 200] [--runs 30] \
+        [--country "United States"] [--seniority Senior] [--employee-range "51-200"] [--days-ago 30]
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import statistics
+
+import asyncpg
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from repositories.job_boards import JOB_LISTING_COLUMNS, job_listing_where  # noqa: E402
+
+LEGACY_COLUMNS = JOB_LISTING_COLUMNS.split("cc.company_description")[0] + """
+    cd.description as company_description,
+    cd.tagline as company_tagline,
+    cr.raw_revenue_amount as company_revenue,
+    cr.raw_revenue_range as company_revenue_range,
+    cf.raw_funding_amount as company_funding,
+    cf.raw_funding_range as company_funding_range,
+    ce.employee_range as company_employee_range,
+    cfr.funding_type as company_last_funding_type,
+    cfr.investors as company_investors
+"""
+
+LEGACY_JOINS = """
+    LEFT JOIN core.company_descriptions cd ON jp.domain = cd.domain
+    LEFT JOIN core.company_revenue cr ON jp.domain = cr.domain
+    LEFT JOIN core.company_funding cf ON jp.domain = cf.domain
+    LEFT JOIN core.company_employee_range ce ON jp.domain = ce.domain
+    LEFT JOIN LATERAL (
+        SELECT funding_type, investors
+        FROM core.company_funding_rounds
+        WHERE domain = jp.domain
+        ORDER BY funding_date DESC NULLS LAST
+        LIMIT 1
+    ) cfr ON true
+"""
+
+
+def legacy_queries(job_functions: list, filters: dict, limit: int):
+    where, params = job_listing_where(job_functions, filters)
+    where = where.replace("cc.company_employee_range", "ce.employee_range")
+    page_sql = f"""
+        SELECT {LEGACY_COLUMNS}
+        FROM core.company_job_postings jp
+        {LEGACY_JOINS}
+        WHERE {where}
+        ORDER BY jp.posted_at DESC NULLS LAST, jp.created_at DESC
+        LIMIT {limit} OFFSET 0
+    """
+    count_sql = f"""
+        SELECT COUNT(*) FROM core.company_job_postings jp
+        LEFT JOIN core.company_employee_range ce ON jp.domain = ce.domain
+        WHERE {where}
+    """
+    return page_sql, count_sql, params
+
+
+def card_queries(job_functions: list, filters: dict, limit: int):
+    where, params = job_listing_where(job_functions, filters)
+    page_sql = f"""
+        SELECT {JOB_LISTING_COLUMNS}
+        FROM core.company_job_postings jp
+        LEFT JOIN core.company_card cc ON cc.domain = jp.domain
+        WHERE {where}
+        ORDER BY jp.posted_at DESC NULLS LAST, jp.created_at DESC
+        LIMIT {limit} OFFSET 0
+    """
+    count_sql = f"""
+        SELECT COUNT(*) FROM core.company_job_postings jp
+        LEFT JOIN core.company_card cc ON cc.domain = jp.domain
+        WHERE {where}
+    """
+    return page_sql, count_sql, params
+
+
+async def timed(pool, queries, runs: int) -> list:
+    page_sql, count_sql, params = queries
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        await pool.fetch(page_sql, *params)
+        await pool.fetchval(count_sql, *params)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def p95(samples: list) -> float:
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--board", help="reference.job_board_domains domain (default: first active board)")
+    parser.add_argument("--limit", type=int, default=200)
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--country", default="United States")
+    parser.add_argument("--seniority", default="Senior")
+    parser.add_argument("--employee-range", default="51-200")
+    parser.add_argument("--days-ago", type=int, default=30)
+    args = parser.parse_args()
+
+    scenarios = [
+        ("no filters", {}),
+        ("country", {"country": args.country}),
+        ("seniority", {"seniority": args.seniority}),
+        ("employee_range", {"employee_range": args.employee_range}),
+        ("days_ago", {"days_ago": args.days_ago}),
+        ("all", {
+            "country": args.country,
+            "seniority": args.seniority,
+            "employee_range": args.employee_range,
+            "days_ago": args.days_ago,
+        }),
+    ]
+
+    pool = await asyncpg.create_pool(os.environ["DATABASE_URL"], min_size=1, max_size=2)
+    try:
+        if args.board:
+            board = await pool.fetchrow(
+                "SELECT domain, job_functions FROM reference.job_board_domains WHERE domain = $1", args.board
+            )
+        else:
+            board = await pool.fetchrow(
+                "SELECT domain, job_functions FROM reference.job_board_domains WHERE is_active ORDER BY domain LIMIT 1"
+            )
+        if board is None:
+            print("no matching job board in reference.job_board_domains")
+            return
+        job_functions = board["job_functions"]
+        if isinstance(job_functions, str):
+            job_functions = json.loads(job_functions)
+
+        results = []
+        for label, filters in scenarios:
+            # One untimed pass each to warm caches
+            legacy = legacy_queries(job_functions, filters, args.limit)
+            card = card_queries(job_functions, filters, args.limit)
+            await timed(pool, legacy, 1)
+            await timed(pool, card, 1)
+            results.append((label, await timed(pool, legacy, args.runs), await timed(pool, card, args.runs)))
+    finally:
+        await pool.close()
+
+    print(f"{board['domain']} ({', '.join(job_functions)}), limit {args.limit}, {args.runs} runs, page + count")
+    print(f"  {'filters':<16} {'legacy p50':>11} {'legacy p95':>11} {'card p50':>11} {'card p95':>11}")
+    for label, legacy, card in results:
+        print(
+            f"  {label:<16} {statistics.median(legacy):9.2f}ms {p95(legacy):9.2f}ms "
+            f"{statistics.median(card):9.2f}ms {p95(card):9.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,85 @@
+"""
+Compare OFFSET vs keyset (cursor) pagination latency at page 1 and a deep page.
+
+Runs directly against Postgres through the same pagination.fetch_page helper
+the admin table browsers use. The deep-page cursor is found once up front
+(untimed), then each mode is timed over several runs.
+
+Usage:
+    DATABASE_URL=postgres://... python scripts/bench_keyset_pagination.py \
+        [--table core.person_work_history] [--keys created_at,id] [--page 10000] [--limit 50] [--runs 5]
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+import statistics
+
+import asyncpg
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from pagination import fetch_page, cursor_from_row, order_by  # noqa: E402
+
+
+async def timed(coro_fn, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        await coro_fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--table", default="core.person_work_history")
+    parser.add_argument("--keys", default="created_at,id")
+    parser.add_argument("--ascending", action="store_true")
+    parser.add_argument("--page", type=int, default=10000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    keys = tuple(args.keys.split(","))
+    descending = not args.ascending
+    select_sql = f"SELECT * FROM {args.table}"
+    deep_offset = (args.page - 1) * args.limit
+
+    pool = await asyncpg.create_pool(os.environ["DATABASE_URL"], min_size=1, max_size=2)
+    try:
+        # Cursor pointing at the last row of the page before the deep page
+        anchor = await pool.fetchrow(
+            f"SELECT {', '.join(keys)} FROM {args.table} ORDER BY {order_by(keys, descending)} "
+            f"OFFSET $1 LIMIT 1",
+            deep_offset - 1,
+        )
+        if anchor is None:
+            print(f"{args.table} has fewer than {deep_offset} rows; lower --page")
+            return
+        deep_cursor = cursor_from_row(anchor, keys)
+
+        def page(offset=0, cursor=None):
+            return lambda: fetch_page(
+                pool, select_sql, "TRUE", [], keys, limit=args.limit,
+                offset=offset, cursor=cursor, descending=descending,
+            )
+
+        results = [
+            ("offset  page 1", await timed(page(offset=0), args.runs)),
+            (f"offset  page {args.page}", await timed(page(offset=deep_offset), args.runs)),
+            ("keyset  page 1", await timed(page(cursor=""), args.runs)),
+            (f"keyset  page {args.page}", await timed(page(cursor=deep_cursor), args.runs)),
+        ]
+    finally:
+        await pool.close()
+
+    print(f"{args.table} ordered by ({', '.join(keys)}){' DESC' if descending else ''}, limit {args.limit}, median of {args.runs}")
+    for label, ms in results:
+        print(f"  {label:<20} {ms:9.2f}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+"""
+Concurrency benchmark for /api/leads/quick against a running hq-api.
+
+Fires N requests with C in flight and, at the same time, probes /health
+in a loop. When a handler blocks the event loop (sync supabase .execute()),
+/health latency climbs to the duration of the slowest leads query; on the
+asyncpg/thread-pool path it stays flat.
+
+Run once on the old build and once on the new one to compare.
+
+Usage:
+    python scripts/bench_leads_concurrency.py [--base-url http://localhost:8000] [--requests 200] [--concurrency 200]
+"""
+
+import time
+import asyncio
+import argparse
+import statistics
+
+import httpx
+
+DEFAULT_PARAMS = {"job_function": "Engineering", "limit": 50}
+
+
+def pct(samples: list, p: float) -> float:
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * p))]
+
+
+async def probe_health(client: httpx.AsyncClient, stop: asyncio.Event, samples: list):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await client.get("/health")
+        samples.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(0.05)
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--path", default="/api/leads/quick")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=200)
+    args = parser.parse_args()
+
+    limits = httpx.Limits(max_connections=args.concurrency + 1)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=120.0, limits=limits) as client:
+        sem = asyncio.Semaphore(args.concurrency)
+        latencies = []
+        failures = 0
+
+        async def one():
+            nonlocal failures
+            async with sem:
+                start = time.perf_counter()
+                response = await client.get(args.path, params=DEFAULT_PARAMS)
+                latencies.append((time.perf_counter() - start) * 1000)
+                if response.status_code != 200:
+                    failures += 1
+
+        stop = asyncio.Event()
+        health = []
+        prober = asyncio.create_task(probe_health(client, stop, health))
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(args.requests)))
+        wall = time.perf_counter() - start
+
+        stop.set()
+        await prober
+
+    print(f"{args.path}: {args.requests} requests, {args.concurrency} in flight, {failures} non-200")
+    print(f"  throughput  {args.requests / wall:8.1f} req/s   wall {wall:6.2f}s")
+    print(f"  latency     p50={statistics.median(latencies):8.1f}ms  p99={pct(latencies, 0.99):8.1f}ms")
+    if health:
+        print(f"  /health     p50={statistics.median(health):8.1f}ms  max={max(health):8.1f}ms  ({len(health)} probes)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
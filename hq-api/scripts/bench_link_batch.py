@@ -0,0 +1,71 @@
+"""
+Benchmark the set-based /target-client/leads/link-batch path.
+
+Builds N leads from real core.people work emails (plus a share of misses),
+runs repositories.target_client.link_leads_batch once and reports wall time,
+then deletes the rows it inserted.
+
+Uses the .env DATABASE_URL, so point it at a local Postgres.
+
+Usage:
+    python scripts/bench_link_batch.py [--leads 10000] [--miss-rate 0.1]
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import db  # noqa: E402
+from repositories import target_client as target_client_repo  # noqa: E402
+from routers.run import TargetClientLeadLinkBatchItem  # noqa: E402
+
+BENCH_TARGET_DOMAIN = "bench-link-batch.invalid"
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--leads", type=int, default=10000)
+    parser.add_argument("--miss-rate", type=float, default=0.1, help="Share of leads with no core.people match")
+    args = parser.parse_args()
+
+    await db.init_pool()
+    pool = db.get_pool()
+    try:
+        hits = int(args.leads * (1 - args.miss_rate))
+        rows = await pool.fetch("""
+            SELECT work_email, linkedin_url
+            FROM core.people
+            WHERE work_email IS NOT NULL
+            LIMIT $1
+        """, hits)
+        leads = [
+            TargetClientLeadLinkBatchItem(person_email=r["work_email"], person_linkedin_url=r["linkedin_url"])
+            for r in rows
+        ]
+        leads += [
+            TargetClientLeadLinkBatchItem(person_email=f"nobody-{i}@{BENCH_TARGET_DOMAIN}")
+            for i in range(args.leads - len(leads))
+        ]
+
+        start = time.perf_counter()
+        results = await target_client_repo.link_leads_batch(
+            BENCH_TARGET_DOMAIN, leads, source="bench", form_id=None, form_title=None
+        )
+        wall = time.perf_counter() - start
+
+        linked = sum(1 for r in results if r["success"])
+        print(f"link_leads_batch: {len(leads)} leads, {linked} linked, {len(leads) - linked} unmatched")
+        print(f"  wall {wall:6.2f}s   {len(leads) / wall:9.1f} leads/s")
+    finally:
+        await pool.execute(
+            "DELETE FROM target_client.leads WHERE target_client_domain = $1", BENCH_TARGET_DOMAIN
+        )
+        await db.close_pool()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,123 @@
+"""
+Benchmark the Modal proxy path: per-request httpx client vs the shared pooled client.
+
+Starts a local stub server that answers every POST with a small JSON body,
+then runs N sequential and N concurrent proxied calls through each mode and
+prints p50/p99 latency.
+
+Usage:
+    python scripts/bench_modal_proxy.py [--requests 1000] [--concurrency 100] [--delay-ms 0]
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import statistics
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import http_client  # noqa: E402
+
+STUB_BODY = json.dumps({"success": True, "domain": "example.com"}).encode()
+
+
+async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, delay: float):
+    """Minimal HTTP/1.1 keep-alive responder."""
+    try:
+        while True:
+            headers = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in headers.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            if length:
+                await reader.readexactly(length)
+            if delay:
+                await asyncio.sleep(delay)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\n"
+                b"Content-Type: application/json\r\n"
+                b"Content-Length: " + str(len(STUB_BODY)).encode() + b"\r\n"
+                b"Connection: keep-alive\r\n\r\n" + STUB_BODY
+            )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionResetError):
+        pass
+    finally:
+        writer.close()
+
+
+async def per_request_call(url: str, payload: dict) -> dict:
+    """Old behaviour: a fresh AsyncClient for every proxied call."""
+    async with httpx.AsyncClient(timeout=60.0) as client:
+        response = await client.post(url, json=payload)
+        response.raise_for_status()
+        return response.json()
+
+
+async def pooled_call(url: str, payload: dict) -> dict:
+    return await http_client.forward_to_modal(url, payload)
+
+
+async def timed(fn, url: str, payload: dict) -> float:
+    start = time.perf_counter()
+    await fn(url, payload)
+    return (time.perf_counter() - start) * 1000
+
+
+async def run_sequential(fn, url: str, n: int) -> list:
+    return [await timed(fn, url, {"i": i}) for i in range(n)]
+
+
+async def run_concurrent(fn, url: str, n: int, concurrency: int) -> list:
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> float:
+        async with sem:
+            return await timed(fn, url, {"i": i})
+
+    return await asyncio.gather(*(one(i) for i in range(n)))
+
+
+def summarize(label: str, samples: list, wall: float):
+    samples = sorted(samples)
+    p50 = statistics.median(samples)
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    print(f"{label:<34} p50={p50:7.2f}ms  p99={p99:7.2f}ms  wall={wall:6.2f}s  rps={len(samples) / wall:8.1f}")
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--delay-ms", type=float, default=0.0, help="Simulated upstream work per call")
+    args = parser.parse_args()
+
+    delay = args.delay_ms / 1000
+    server = await asyncio.start_server(lambda r, w: _handle(r, w, delay), "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    url = f"http://127.0.0.1:{port}/stub"
+
+    await http_client.init_http_client()
+    try:
+        for label, fn in (("per-request client", per_request_call), ("shared pooled client", pooled_call)):
+            start = time.perf_counter()
+            samples = await run_sequential(fn, url, args.requests)
+            summarize(f"{label} / sequential", samples, time.perf_counter() - start)
+
+            start = time.perf_counter()
+            samples = await run_concurrent(fn, url, args.requests, args.concurrency)
+            summarize(f"{label} / concurrent", samples, time.perf_counter() - start)
+    finally:
+        await http_client.close_http_client()
+        server.close()
+        await server.wait_closed()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,212 @@
+"""
+Compare planning and prepare overhead of the job-board listing query built
+the old way (a predicate only for each filter set, so one statement per
+filter combination) against the canonical sqlbuilder form (every predicate
+present, NULL when unset).
+
+Runs directly against Postgres. Filter values are sampled from the board's
+postings; each simulated request sets each filter with probability --rate.
+
+    planning    EXPLAIN (SUMMARY) planning time of the page query for the
+                same requests in both forms
+    replay      page + count for --requests requests on one connection per
+                form, run like the hq-api sqlbuilder endpoints (asyncpg's default
+                statement cache, sqlbuilder.custom_plans):
+                distinct statements, statement cache hit rate (counted by the
+                metrics.py tracker behind hq_db_statement_cache_total) and
+                p50/p95 latency
+
+Usage:
+    DATABASE_URL=postgres://... python scripts/bench_sql_builder.py \
+        [--board example-jobs.com] [--requests 2000] [--plans 50] [--rate 0.3] [--limit 50] [--seed 1]
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import statistics
+
+import asyncpg
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import metrics  # noqa: E402
+from repositories.job_boards import JOB_LISTING_COLUMNS, POSTED_WITHIN_DAYS, job_listing_where  # noqa: E402
+from search import JOB_POSTING_SEARCH_COLUMNS, contains_pattern, contains_clause  # noqa: E402
+from sqlbuilder import custom_plans  # noqa: E402
+
+
+def legacy_where(job_functions: list, filters: dict):
+    """job_listing_where before sqlbuilder: only the filters that are set."""
+    clauses = ["jp.job_function = ANY($1::text[])"]
+    params = [job_functions]
+    for key, column in JOB_POSTING_SEARCH_COLUMNS.items():
+        if filters.get(key):
+            params.append(contains_pattern(filters[key]))
+            clauses.append(contains_clause(f"jp.{column}", f"${len(params)}"))
+    if filters.get("employee_range"):
+        params.append(filters["employee_range"])
+        clauses.append(f"cc.company_employee_range = ${len(params)}")
+    if filters.get("days_ago"):
+        params.append(filters["days_ago"])
+        clauses.append(f"jp.posted_at >= NOW() - make_interval(days => ${len(params)})")
+    return " AND ".join(clauses), params
+
+
+def queries(where: str, params: list, limit: int, count_join: bool):
+    page_sql = f"""
+        SELECT {JOB_LISTING_COLUMNS}
+        FROM core.company_job_postings jp
+        LEFT JOIN core.company_card cc ON cc.domain = jp.domain
+        WHERE {where}
+        ORDER BY jp.posted_at DESC NULLS LAST, jp.created_at DESC
+        LIMIT {limit}
+    """
+    card_join = "LEFT JOIN core.company_card cc ON cc.domain = jp.domain" if count_join else ""
+    count_sql = f"""
+        SELECT COUNT(*) FROM core.company_job_postings jp
+        {card_join}
+        WHERE {where}
+    """
+    return page_sql, count_sql, params
+
+
+def legacy_queries(job_functions: list, filters: dict, limit: int):
+    where, params = legacy_where(job_functions, filters)
+    return queries(where, params, limit, bool(filters.get("employee_range")))
+
+
+def canonical_queries(job_functions: list, filters: dict, limit: int):
+    where, params = job_listing_where(job_functions, filters)
+    return queries(where, params, limit, True)
+
+
+async def sample_values(pool, job_functions: list) -> dict:
+    values = {}
+    for key, column in JOB_POSTING_SEARCH_COLUMNS.items():
+        rows = await pool.fetch(f"""
+            SELECT {column} AS v FROM core.company_job_postings
+            WHERE job_function = ANY($1::text[]) AND {column} IS NOT NULL
+            GROUP BY {column} ORDER BY COUNT(*) DESC LIMIT 20
+        """, job_functions)
+        values[key] = [r["v"] for r in rows]
+    rows = await pool.fetch("""
+        SELECT company_employee_range AS v FROM core.company_card
+        WHERE company_employee_range IS NOT NULL
+        GROUP BY company_employee_range ORDER BY COUNT(*) DESC LIMIT 10
+    """)
+    values["employee_range"] = [r["v"] for r in rows]
+    values["days_ago"] = list(POSTED_WITHIN_DAYS)
+    return {k: v for k, v in values.items() if v}
+
+
+def random_filters(rng: random.Random, values: dict, rate: float) -> dict:
+    return {k: rng.choice(v) for k, v in values.items() if rng.random() < rate}
+
+
+async def planning_ms(conn, sql: str, params: list) -> float:
+    plan = await conn.fetchval(f"EXPLAIN (SUMMARY, FORMAT JSON) {sql}", *params)
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Planning Time"]
+
+
+async def replay(label: str, build, requests: list, job_functions: list, limit: int):
+    async def track(conn):
+        conn.add_query_logger(metrics._statement_cache_tracker(conn, label))
+
+    # One connection, so the statement cache counts match a single hq-api connection
+    pool = await asyncpg.create_pool(
+        os.environ["DATABASE_URL"],
+        min_size=1,
+        max_size=1,
+        connection_class=metrics.InstrumentedConnection,
+        init=track,
+    )
+    statements, samples = set(), []
+    try:
+        for filters in requests:
+            page_sql, count_sql, params = build(job_functions, filters, limit)
+            statements.update((page_sql, count_sql))
+            start = time.perf_counter()
+            async with custom_plans(pool) as conn:
+                await conn.fetch(page_sql, *params)
+                await conn.fetchval(count_sql, *params)
+            samples.append((time.perf_counter() - start) * 1000)
+    finally:
+        await pool.close()
+    hits = metrics.STATEMENT_CACHE.get((label, "hit"), 0)
+    misses = metrics.STATEMENT_CACHE.get((label, "miss"), 0)
+    return len(statements), hits / max(1, hits + misses), samples
+
+
+def p95(samples: list) -> float:
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--board", help="reference.job_board_domains domain (default: first active board)")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--plans", type=int, default=50, help="requests to EXPLAIN for planning time")
+    parser.add_argument("--rate", type=float, default=0.3, help="probability each filter is set")
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    pool = await asyncpg.create_pool(os.environ["DATABASE_URL"], min_size=1, max_size=2)
+    try:
+        if args.board:
+            board = await pool.fetchrow(
+                "SELECT domain, job_functions FROM reference.job_board_domains WHERE domain = $1", args.board
+            )
+        else:
+            board = await pool.fetchrow(
+                "SELECT domain, job_functions FROM reference.job_board_domains WHERE is_active ORDER BY domain LIMIT 1"
+            )
+        if board is None:
+            print("no matching job board in reference.job_board_domains")
+            return
+        job_functions = board["job_functions"]
+        if isinstance(job_functions, str):
+            job_functions = json.loads(job_functions)
+
+        values = await sample_values(pool, job_functions)
+        rng = random.Random(args.seed)
+        requests = [random_filters(rng, values, args.rate) for _ in range(args.requests)]
+
+        legacy_plan, canonical_plan = [], []
+        async with pool.acquire() as conn:
+            for filters in requests[:args.plans]:
+                page_sql, _, params = legacy_queries(job_functions, filters, args.limit)
+                legacy_plan.append(await planning_ms(conn, page_sql, params))
+                page_sql, _, params = canonical_queries(job_functions, filters, args.limit)
+                canonical_plan.append(await planning_ms(conn, page_sql, params))
+    finally:
+        await pool.close()
+
+    # Untimed pass to warm shared buffers, then one fresh connection per form
+    await replay("warmup", canonical_queries, requests[:50], job_functions, args.limit)
+    legacy = await replay("legacy", legacy_queries, requests, job_functions, args.limit)
+    canonical = await replay("canonical", canonical_queries, requests, job_functions, args.limit)
+
+    print(f"{board['domain']} ({', '.join(job_functions)}), {args.requests} requests, "
+          f"filters {', '.join(values)} each set with p={args.rate}, limit {args.limit}")
+    print(f"  planning (page query, {len(legacy_plan)} requests): "
+          f"legacy p50 {statistics.median(legacy_plan):.3f}ms p95 {p95(legacy_plan):.3f}ms, "
+          f"canonical p50 {statistics.median(canonical_plan):.3f}ms p95 {p95(canonical_plan):.3f}ms")
+    print(f"  {'form':<10} {'statements':>10} {'cache hit':>10} {'p50':>10} {'p95':>10} {'total':>10}")
+    for label, (statements, hit_rate, samples) in (("legacy", legacy), ("canonical", canonical)):
+        print(
+            f"  {label:<10} {statements:>10} {hit_rate:>9.1%} {statistics.median(samples):8.2f}ms "
+            f"{p95(samples):8.2f}ms {sum(samples) / 1000:9.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,187 @@
+"""
+Measure substring filter latency on a leads-shaped table with and without
+pg_trgm GIN indexes.
+
+Seeds a scratch table (bench_search.leads, ~5M synthetic rows by default)
+with the text columns the lead filters search, builds the same trigram
+indexes as supabase/migrations/20261018_trigram_search.sql, then times each
+filter in search.LEAD_SEARCH_COLUMNS two ways in the same session: with the
+planner free to use the index, and with index scans disabled (the old
+sequential-scan behavior). Each filter runs a 50-row page and a COUNT(*),
+the two queries /api/leads issues.
+
+The scratch schema is dropped at the end unless --keep is given; --reuse
+skips seeding when a previous --keep run left the table in place.
+
+Usage:
+    DATABASE_URL=postgres://... python scripts/bench_trigram_search.py \
+        [--rows 5000000] [--runs 5] [--keep] [--reuse]
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+import statistics
+
+import asyncpg
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from search import LEAD_SEARCH_COLUMNS, contains_pattern, contains_clause  # noqa: E402
+
+TABLE = "bench_search.leads"
+SEED_BATCH = 500_000
+
+# filter -> term typed into the dashboard
+TERMS = {
+    "person_city": "francisco",
+    "person_state": "carolina",
+    "person_country": "kingdom",
+    "company_city": "york",
+    "company_state": "texas",
+    "company_country": "germany",
+    "company_name": "globex",
+    "job_title": "revenue",
+    "full_name": "okafor",
+}
+
+SEED_SQL = f"""
+    INSERT INTO {TABLE}
+    SELECT
+        g,
+        f.first || ' ' || l.last,
+        p.city, p.state, p.country,
+        c.city, c.state, c.country,
+        n.word || ' ' || substr(md5(g::text), 1, 6) || n.suffix,
+        t.level || ' ' || t.role
+    -- Each LATERAL references g so it is re-evaluated (fresh random()) per row
+    FROM generate_series($1::bigint, $2::bigint) g
+    CROSS JOIN LATERAL (SELECT (ARRAY['Maria','James','Wei','Aisha','Lucas','Priya','Noah','Sofia','Chen','Olivia','Mateo','Fatima'])[1 + floor(random() * 12)::int] AS first WHERE g > 0) f
+    CROSS JOIN LATERAL (SELECT (ARRAY['Smith','Garcia','Nguyen','Okafor','Muller','Patel','Kim','Rossi','Silva','Cohen','Novak','Tanaka'])[1 + floor(random() * 12)::int] AS last WHERE g > 0) l
+    CROSS JOIN LATERAL (SELECT * FROM (VALUES
+        ('San Francisco', 'California', 'United States'),
+        ('New York', 'New York', 'United States'),
+        ('Austin', 'Texas', 'United States'),
+        ('Charlotte', 'North Carolina', 'United States'),
+        ('Seattle', 'Washington', 'United States'),
+        ('London', 'England', 'United Kingdom'),
+        ('Berlin', 'Berlin', 'Germany'),
+        ('Munich', 'Bavaria', 'Germany'),
+        ('Toronto', 'Ontario', 'Canada'),
+        ('Paris', 'Ile-de-France', 'France'),
+        ('Sydney', 'New South Wales', 'Australia'),
+        ('Bangalore', 'Karnataka', 'India')
+    ) v(city, state, country) WHERE g > 0 OFFSET floor(random() * 12)::int LIMIT 1) p
+    CROSS JOIN LATERAL (SELECT * FROM (VALUES
+        ('San Francisco', 'California', 'United States'),
+        ('New York', 'New York', 'United States'),
+        ('Austin', 'Texas', 'United States'),
+        ('Boston', 'Massachusetts', 'United States'),
+        ('London', 'England', 'United Kingdom'),
+        ('Berlin', 'Berlin', 'Germany'),
+        ('Toronto', 'Ontario', 'Canada'),
+        ('Singapore', 'Singapore', 'Singapore')
+    ) v(city, state, country) WHERE g > 0 OFFSET floor(random() * 8)::int LIMIT 1) c
+    CROSS JOIN LATERAL (SELECT
+        (ARRAY['Acme','Globex','Initech','Umbrella','Stark','Wayne','Hooli','Vandelay','Cyberdyne','Soylent'])[1 + floor(random() * 10)::int] AS word,
+        (ARRAY[' Inc',' Labs',' Systems',' Group',' Technologies'])[1 + floor(random() * 5)::int] AS suffix
+        WHERE g > 0
+    ) n
+    CROSS JOIN LATERAL (SELECT
+        (ARRAY['Senior','Staff','Head of','VP','Director of','Junior','Lead'])[1 + floor(random() * 7)::int] AS level,
+        (ARRAY['Software Engineer','Revenue Operations','Account Executive','Product Manager','Data Scientist','Marketing','Customer Success','Finance'])[1 + floor(random() * 8)::int] AS role
+        WHERE g > 0
+    ) t
+"""
+
+
+async def seed(conn, rows: int):
+    await conn.execute("CREATE SCHEMA IF NOT EXISTS bench_search")
+    await conn.execute(f"DROP TABLE IF EXISTS {TABLE}")
+    await conn.execute(f"""
+        CREATE UNLOGGED TABLE {TABLE} (
+            person_id BIGINT PRIMARY KEY,
+            full_name TEXT,
+            person_city TEXT, person_state TEXT, person_country TEXT,
+            company_city TEXT, company_state TEXT, company_country TEXT,
+            company_name TEXT,
+            matched_cleaned_job_title TEXT
+        )
+    """)
+    for start in range(1, rows + 1, SEED_BATCH):
+        end = min(rows, start + SEED_BATCH - 1)
+        await conn.execute(SEED_SQL, start, end)
+        print(f"  seeded {end:,}/{rows:,}", file=sys.stderr)
+
+    await conn.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA extensions")
+    for column in LEAD_SEARCH_COLUMNS.values():
+        started = time.perf_counter()
+        await conn.execute(
+            f"CREATE INDEX ON {TABLE} USING gin ({column} extensions.gin_trgm_ops)"
+        )
+        print(f"  indexed {column} in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    await conn.execute(f"ANALYZE {TABLE}")
+
+
+async def timed(conn, sql: str, args: list, runs: int, use_index: bool) -> float:
+    samples = []
+    for _ in range(runs):
+        async with conn.transaction():
+            if not use_index:
+                await conn.execute("SET LOCAL enable_bitmapscan = off")
+                await conn.execute("SET LOCAL enable_indexscan = off")
+            start = time.perf_counter()
+            await conn.fetch(sql, *args)
+            samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--keep", action="store_true", help="leave bench_search.leads in place")
+    parser.add_argument("--reuse", action="store_true", help="skip seeding if bench_search.leads exists")
+    args = parser.parse_args()
+
+    conn = await asyncpg.connect(os.environ["DATABASE_URL"])
+    try:
+        exists = await conn.fetchval("SELECT to_regclass($1) IS NOT NULL", TABLE)
+        if not (args.reuse and exists):
+            print(f"seeding {args.rows:,} rows into {TABLE}", file=sys.stderr)
+            await seed(conn, args.rows)
+        total = await conn.fetchval(f"SELECT COUNT(*) FROM {TABLE}")
+
+        results = []
+        for key, column in LEAD_SEARCH_COLUMNS.items():
+            where = contains_clause(column, "$1")
+            pattern = [contains_pattern(TERMS[key])]
+            page_sql = f"SELECT person_id FROM {TABLE} WHERE {where} LIMIT 50"
+            count_sql = f"SELECT COUNT(*) FROM {TABLE} WHERE {where}"
+            matches = await conn.fetchval(count_sql, *pattern)
+            results.append((
+                key, TERMS[key], matches,
+                await timed(conn, page_sql, pattern, args.runs, use_index=False),
+                await timed(conn, page_sql, pattern, args.runs, use_index=True),
+                await timed(conn, count_sql, pattern, args.runs, use_index=False),
+                await timed(conn, count_sql, pattern, args.runs, use_index=True),
+            ))
+
+        if not args.keep:
+            await conn.execute("DROP SCHEMA bench_search CASCADE")
+    finally:
+        await conn.close()
+
+    print(f"{TABLE}: {total:,} rows, median of {args.runs}")
+    print(f"  {'filter':<16} {'term':<10} {'matches':>10} {'page scan':>11} {'page trgm':>11} {'count scan':>11} {'count trgm':>11}")
+    for key, term, matches, page_scan, page_trgm, count_scan, count_trgm in results:
+        print(
+            f"  {key:<16} {term:<10} {matches:>10,} {page_scan:9.2f}ms {page_trgm:9.2f}ms "
+            f"{count_scan:9.2f}ms {count_trgm:9.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,138 @@
+"""
+Benchmark typeahead lookups against the 10k queries/sec target.
+
+Builds a TypeaheadIndex from synthetic technology-like names (or, with
+--from-db, from the live technologies / job_titles sources), then replays a
+keystroke-shaped query stream: prefixes of 1-8 characters of names drawn by
+weight, a share of them with one typo. Reports build time, throughput and
+per-query latency with the result memo disabled (every query computed) and
+enabled (repeat prefixes served from the memo).
+
+Usage:
+    python scripts/bench_typeahead.py [--values 50000] [--queries 100000] [--typo-rate 0.1] [--limit 50]
+    DATABASE_URL=postgres://... python scripts/bench_typeahead.py --from-db technologies
+"""
+
+import os
+import sys
+import time
+import random
+import asyncio
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import db  # noqa: E402
+import typeahead  # noqa: E402
+from typeahead import TypeaheadIndex  # noqa: E402
+
+WORDS = [
+    "cloud", "data", "analytics", "sales", "force", "snow", "flake", "stream", "hub", "spot",
+    "google", "tag", "manager", "react", "node", "python", "engineer", "platform", "security",
+    "identity", "payments", "marketing", "automation", "customer", "success", "revenue",
+    "operations", "design", "mobile", "search", "vector", "graph", "edge", "network", "monitor",
+]
+
+
+def synthetic_entries(count: int, rng: random.Random) -> list:
+    entries = []
+    for i in range(count):
+        words = rng.sample(WORDS, rng.randint(1, 3))
+        name = " ".join(w.capitalize() for w in words) + f" {i:x}"
+        # Long-tailed usage counts, like companies per technology
+        entries.append({"name": name, "weight": int(rng.paretovariate(1.2) * 10)})
+    return entries
+
+
+def typo(text: str, rng: random.Random) -> str:
+    if len(text) < 3:
+        return text
+    i = rng.randrange(1, len(text))
+    kind = rng.choice(("drop", "swap", "replace"))
+    if kind == "drop":
+        return text[:i] + text[i + 1:]
+    if kind == "swap" and i + 1 < len(text):
+        return text[:i] + text[i + 1] + text[i] + text[i + 2:]
+    return text[:i] + rng.choice("abcdefghijklmnopqrstuvwxyz") + text[i + 1:]
+
+
+def query_stream(entries: list, count: int, typo_rate: float, rng: random.Random) -> list:
+    weights = [max(e.get("weight") or 0, 1) for e in entries]
+    picks = rng.choices(entries, weights=weights, k=count)
+    queries = []
+    for entry in picks:
+        words = entry["name"].split()
+        word = " ".join(words[rng.randrange(len(words)):])
+        q = word[:rng.randint(1, 8)]
+        if rng.random() < typo_rate:
+            q = typo(q, rng)
+        queries.append(q)
+    return queries
+
+
+def run(index: TypeaheadIndex, queries: list, limit: int) -> dict:
+    samples = []
+    started = time.perf_counter()
+    for q in queries:
+        t0 = time.perf_counter_ns()
+        index.search(q, limit)
+        samples.append(time.perf_counter_ns() - t0)
+    elapsed = time.perf_counter() - started
+    samples.sort()
+    return {
+        "qps": len(queries) / elapsed,
+        "p50_us": statistics.median(samples) / 1000,
+        "p99_us": samples[int(len(samples) * 0.99)] / 1000,
+        "max_us": samples[-1] / 1000,
+    }
+
+
+async def load_from_db(name: str) -> list:
+    await db.init_pool()
+    try:
+        return await typeahead.TYPEAHEAD_SOURCES[name]()
+    finally:
+        await db.close_pool()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--values", type=int, default=50000, help="synthetic values to index")
+    parser.add_argument("--from-db", choices=sorted(typeahead.TYPEAHEAD_SOURCES), help="index a live source instead")
+    parser.add_argument("--queries", type=int, default=100000)
+    parser.add_argument("--typo-rate", type=float, default=0.1)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--target-qps", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    if args.from_db:
+        entries = asyncio.run(load_from_db(args.from_db))
+        source = args.from_db
+    else:
+        entries = synthetic_entries(args.values, rng)
+        source = "synthetic"
+    queries = query_stream(entries, args.queries, args.typo_rate, rng)
+
+    memo_entries = typeahead.TYPEAHEAD_MEMO_ENTRIES
+    results = []
+    for label, memo in (("no memo", 0), ("memo", memo_entries)):
+        typeahead.TYPEAHEAD_MEMO_ENTRIES = memo
+        index = TypeaheadIndex(entries)
+        results.append((label, index.build_ms, run(index, queries, args.limit)))
+    typeahead.TYPEAHEAD_MEMO_ENTRIES = memo_entries
+
+    print(f"{source}: {len(entries):,} values, {len(index.keys):,} keys, "
+          f"{args.queries:,} queries ({args.typo_rate:.0%} with a typo), limit {args.limit}")
+    for label, build_ms, r in results:
+        verdict = "ok" if r["qps"] >= args.target_qps else f"below {args.target_qps:,}/s"
+        print(
+            f"  {label:<8} build {build_ms:8.1f}ms  {r['qps']:10,.0f} q/s  "
+            f"p50 {r['p50_us']:7.1f}us  p99 {r['p99_us']:8.1f}us  max {r['max_us']:9.1f}us  {verdict}"
+        )
+
+
+if __name__ == "__main__":
+    main()
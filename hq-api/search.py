@@ -0,0 +1,65 @@
+"""
+Substring ("contains") search for the free-text filters on leads, companies
+and job boards.
+
+Every contains filter builds its pattern here, so they all reach Postgres as
+`column ILIKE '%term%'` - the shape the pg_trgm GIN indexes from
+supabase/migrations/20261018_trigram_search.sql serve instead of a
+sequential scan. Terms are normalized (trimmed, inner whitespace collapsed)
+and LIKE metacharacters in them are escaped, so a term always matches
+literally.
+
+Trigram indexes only narrow the scan for terms of TRIGRAM_MIN_LENGTH or more
+characters; shorter terms still match correctly but the planner will
+usually fall back to a scan.
+"""
+
+import re
+
+TRIGRAM_MIN_LENGTH = 3
+
+# filter name -> column, per relation, for the indexed contains filters
+LEAD_SEARCH_COLUMNS = {
+    "person_city": "person_city",
+    "person_state": "person_state",
+    "person_country": "person_country",
+    "company_city": "company_city",
+    "company_state": "company_state",
+    "company_country": "company_country",
+    "company_name": "company_name",
+    "job_title": "matched_cleaned_job_title",
+    "full_name": "full_name",
+}
+
+COMPANY_SEARCH_COLUMNS = {
+    "city": "company_city",
+    "state": "company_state",
+    "country": "company_country",
+    "name": "name",
+}
+
+JOB_POSTING_SEARCH_COLUMNS = {
+    "city": "city",
+    "state": "state",
+    "country": "country",
+    "seniority": "seniority",
+    "employment_type": "employment_type",
+}
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_term(term: str) -> str:
+    """Trim and collapse whitespace in a search term."""
+    return _WHITESPACE.sub(" ", term).strip()
+
+
+def contains_pattern(term: str) -> str:
+    """ILIKE pattern matching `term` anywhere in the value, case-insensitively."""
+    escaped = normalize_term(term).replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def contains_clause(column: str, placeholder: str) -> str:
+    """SQL predicate for a contains filter; bind contains_pattern(term) to placeholder."""
+    return f"{column} ILIKE {placeholder}"
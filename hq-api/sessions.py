@@ -0,0 +1,137 @@
+"""
+In-process cache for session token lookups against the auth database.
+
+Every page load validates its bearer token several times (/api/auth/session,
+/api/auth/me), and each check used to take a connection from the small auth
+pool. Lookups are now cached per token hash (raw tokens are never held) in a
+bounded LRU:
+
+    valid sessions   - until min(session expiresAt, now + SESSION_CACHE_TTL_SECONDS)
+    invalid tokens   - for SESSION_CACHE_NEGATIVE_TTL_SECONDS, so a stale or
+                       forged token can't hammer the pool either
+
+The TTL bounds how long a session revoked outside this API (e.g. by the auth
+frontend) keeps validating here. Logout and magic-link verification go
+through this API and invalidate the affected entries directly.
+"""
+
+import os
+import time
+import asyncio
+import hashlib
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+SESSION_CACHE_TTL_SECONDS = int(os.getenv("SESSION_CACHE_TTL_SECONDS", "60"))
+SESSION_CACHE_NEGATIVE_TTL_SECONDS = int(os.getenv("SESSION_CACHE_NEGATIVE_TTL_SECONDS", "10"))
+SESSION_CACHE_MAX_ENTRIES = int(os.getenv("SESSION_CACHE_MAX_ENTRIES", "10000"))
+
+# A loader returns (value, user_id, expires_at) for a valid session, or None
+Loader = Callable[[], Awaitable[Optional[Tuple[Any, str, Optional[datetime]]]]]
+
+# (kind, token hash) -> (value or None, monotonic expiry, user_id or None)
+_cache: "OrderedDict[Tuple[str, str], Tuple[Any, float, Optional[str]]]" = OrderedDict()
+# user_id -> cache keys, for invalidating every token of a user
+_by_user: Dict[str, Set[Tuple[str, str]]] = {}
+# cache key -> task, so concurrent misses for one token share a lookup
+_inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+_kinds: Set[str] = set()
+# Bumped by every invalidation; a lookup that started before one isn't stored
+_generation = 0
+
+
+def token_hash(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _ttl(expires_at: Optional[datetime]) -> float:
+    """Seconds to cache a valid session: the configured TTL, capped at its expiry."""
+    if expires_at is None:
+        return SESSION_CACHE_TTL_SECONDS
+    if expires_at.tzinfo is None:
+        # Session timestamps are written in UTC without a zone
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    remaining = (expires_at - datetime.now(timezone.utc)).total_seconds()
+    return max(0.0, min(SESSION_CACHE_TTL_SECONDS, remaining))
+
+
+def _drop(key: Tuple[str, str]):
+    entry = _cache.pop(key, None)
+    if entry and entry[2] is not None:
+        keys = _by_user.get(entry[2])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                _by_user.pop(entry[2], None)
+
+
+def _store(key: Tuple[str, str], value: Any, ttl: float, user_id: Optional[str]):
+    _drop(key)
+    if ttl <= 0:
+        return
+    _cache[key] = (value, time.monotonic() + ttl, user_id)
+    if user_id is not None:
+        _by_user.setdefault(user_id, set()).add(key)
+    while len(_cache) > SESSION_CACHE_MAX_ENTRIES:
+        _drop(next(iter(_cache)))
+
+
+async def cached_lookup(kind: str, token: str, load: Loader) -> Optional[Any]:
+    """
+    The value `load` returns for this token (None when the session is invalid),
+    served from the cache while the entry is fresh. `kind` separates lookups
+    of different shape for the same token (e.g. "session" and "me").
+    """
+    key = (kind, token_hash(token))
+    _kinds.add(kind)
+    entry = _cache.get(key)
+    if entry is not None:
+        if entry[1] > time.monotonic():
+            _cache.move_to_end(key)
+            return entry[0]
+        _drop(key)
+
+    task = _inflight.get(key)
+    if task is None:
+        generation = _generation
+
+        async def run():
+            try:
+                loaded = await load()
+                if loaded is None:
+                    if generation == _generation:
+                        _store(key, None, SESSION_CACHE_NEGATIVE_TTL_SECONDS, None)
+                    return None
+                value, user_id, expires_at = loaded
+                if generation == _generation:
+                    _store(key, value, _ttl(expires_at), str(user_id))
+                return value
+            finally:
+                _inflight.pop(key, None)
+
+        task = asyncio.create_task(run())
+        _inflight[key] = task
+    return await asyncio.shield(task)
+
+
+def invalidate_token(token: str):
+    """Forget every cached lookup for a token (logout, newly issued token)."""
+    global _generation
+    _generation += 1
+    digest = token_hash(token)
+    for kind in _kinds:
+        _drop((kind, digest))
+
+
+def invalidate_user(user_id: str):
+    """Forget cached lookups for all of a user's tokens (e.g. org membership changed)."""
+    global _generation
+    _generation += 1
+    for key in list(_by_user.get(str(user_id), ())):
+        _drop(key)
+
+
+def clear():
+    _cache.clear()
+    _by_user.clear()
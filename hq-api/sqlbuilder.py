@@ -0,0 +1,74 @@
+"""
+WHERE-clause builder with stable SQL text.
+
+Filter endpoints used to append a predicate only for the filters a request
+set, so every combination of filters was a different statement: the admin
+table browsers alone could issue 2^n variants each, and every variant missed
+asyncpg's per-connection statement cache (100 entries) and paid a
+Parse/Describe round trip plus a fresh plan.
+
+Predicates always emits every optional predicate, with a parameter that
+switches it off when bound to NULL:
+
+    (domain = $2 OR $2 IS NULL)
+
+so an endpoint has one statement shape whatever the request filters on, and
+it is prepared once per connection. The expression comes before the IS NULL
+test so Postgres deduces the parameter's type from the column before it sees
+the bare `$n IS NULL`.
+
+A generic plan can't fold `$n IS NULL` away, so it could neither use an
+index on a filtered column (e.g. the trigram GIN indexes behind ILIKE) nor
+drop a LEFT JOIN that only an unset filter references; Postgres may switch a
+cached statement to one after five executions. Run these statements inside
+custom_plans(), which sets plan_cache_mode = force_custom_plan for its
+transaction only: every execution is planned with its values, folding unset
+predicates to true, and the statement cache still saves the Parse round
+trip. Other statements keep the default plan caching.
+scripts/bench_sql_builder.py measures planning and prepare time for both
+forms.
+"""
+
+from contextlib import asynccontextmanager
+from typing import List, Optional
+from search import contains_pattern
+
+
+@asynccontextmanager
+async def custom_plans(pool):
+    """A connection from `pool` in a transaction that plans every statement with its parameter values."""
+    async with pool.acquire() as conn:
+        async with conn.transaction():
+            await conn.execute("SET LOCAL plan_cache_mode = force_custom_plan")
+            yield conn
+
+
+class Predicates:
+    """AND-ed predicates and their parameters, numbered $1, $2, ... in order."""
+
+    def __init__(self):
+        self.clauses: List[str] = []
+        self.params: list = []
+
+    def _bind(self, value) -> str:
+        self.params.append(value)
+        return f"${len(self.params)}"
+
+    def require(self, template: str, value):
+        """Always-applied predicate; `{}` in the template is the value's placeholder."""
+        self.clauses.append(template.format(self._bind(value)))
+
+    def optional(self, template: str, value):
+        """Predicate applied unless the value is None or an empty string."""
+        if isinstance(value, str) and not value:
+            value = None
+        placeholder = self._bind(value)
+        self.clauses.append(f"({template.format(placeholder)} OR {placeholder} IS NULL)")
+
+    def substring(self, column: str, term: Optional[str]):
+        """Optional case-insensitive substring match; `%`, `_` and `\\` in the term match literally."""
+        self.optional(f"{column} ILIKE {{}}", contains_pattern(term) if term else None)
+
+    @property
+    def where(self) -> str:
+        return " AND ".join(self.clauses) if self.clauses else "1=1"
@@ -0,0 +1,268 @@
+"""
+In-process typeahead for the filter dropdowns (technologies, job titles).
+
+Each source's values are loaded from Postgres with a frequency weight
+(companies using a technology, postings for a title) and indexed as a
+sorted array of word-start keys: "Software Engineer" is stored under
+"software engineer" and "engineer", so a query matches the start of any
+word. A prefix lookup is two bisects; results are ranked by whether the
+match is at the start of the value, then by weight. Prefixes matching more
+than HEAVY_PREFIX_KEYS keys (short, common ones) are ranked at build time.
+
+When a query of FUZZY_MIN_LENGTH+ characters matches nothing, prefixes one
+edit away (a dropped, extra, swapped or mistyped character) are tried
+instead.
+
+Indexes are built on first use and rebuilt every TYPEAHEAD_REFRESH_SECONDS
+by a task started in the app lifespan; a failed rebuild keeps serving the
+previous index.
+"""
+
+import os
+import re
+import time
+import heapq
+import asyncio
+from bisect import bisect_left
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Optional
+from repositories import filters as filters_repo
+
+TYPEAHEAD_REFRESH_SECONDS = int(os.getenv("TYPEAHEAD_REFRESH_SECONDS", "900"))
+TYPEAHEAD_MEMO_ENTRIES = int(os.getenv("TYPEAHEAD_MEMO_ENTRIES", "4096"))
+
+# Prefixes matching more keys than this get their ranked results precomputed
+HEAVY_PREFIX_KEYS = 256
+MAX_RESULTS = 200
+FUZZY_MIN_LENGTH = 4
+
+# Match tiers, best first
+TIER_START, TIER_WORD, TIER_FUZZY = 0, 1, 2
+
+_WHITESPACE = re.compile(r"\s+")
+_WORD = re.compile(r"\w+")
+
+
+def normalize(text: str) -> str:
+    return _WHITESPACE.sub(" ", text).strip().casefold()
+
+
+class TypeaheadIndex:
+    """Sorted word-start keys over a list of weighted entries ({"name", "weight", ...})."""
+
+    def __init__(self, entries: List[dict]):
+        started = time.perf_counter()
+        # Global rank: heaviest first, then alphabetical
+        self.entries = sorted(entries, key=lambda e: (-(e.get("weight") or 0), normalize(e["name"])))
+        n = len(self.entries)
+
+        keyed = []
+        for rank, entry in enumerate(self.entries):
+            name = normalize(entry["name"])
+            for match in _WORD.finditer(name):
+                tier = TIER_START if match.start() == 0 else TIER_WORD
+                keyed.append((name[match.start():], tier * n + rank))
+            if not name[:1].isalnum() and name:
+                # Values starting with punctuation (".NET") still match from the start
+                keyed.append((name, rank))
+        keyed.sort()
+
+        self.keys = [key for key, _ in keyed]
+        # Lower is better: tier * len(entries) + rank
+        self.scores = [score for _, score in keyed]
+
+        self.heavy = self._rank_heavy_prefixes()
+
+        self.built_at = datetime.now(timezone.utc)
+        self.build_ms = round((time.perf_counter() - started) * 1000, 1)
+        self._memo: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _unique(self, scores, limit: int) -> List[int]:
+        """Entry indexes for ascending scores, each entry once, best tier kept."""
+        n = len(self.entries) or 1
+        seen, out = set(), []
+        for score in scores:
+            rank = score % n
+            if rank not in seen:
+                seen.add(rank)
+                out.append(score)
+                if len(out) == limit:
+                    break
+        return out
+
+    def _rank_heavy_prefixes(self) -> Dict[str, List[int]]:
+        """Ranked results for every prefix whose key range is too wide to rank per query."""
+        heavy = {}
+        stack = [("", 0, len(self.keys))]
+        while stack:
+            prefix, lo, hi = stack.pop()
+            if hi - lo <= HEAVY_PREFIX_KEYS:
+                continue
+            if prefix:
+                heavy[prefix] = self._unique(heapq.nsmallest(MAX_RESULTS * 2, self.scores[lo:hi]), MAX_RESULTS)
+            depth = len(prefix)
+            # Split the range by the next character
+            while lo < hi:
+                key = self.keys[lo]
+                if len(key) <= depth:
+                    lo += 1
+                    continue
+                child = key[:depth + 1]
+                child_hi = bisect_left(self.keys, child + "\U0010ffff", lo, hi)
+                stack.append((child, lo, child_hi))
+                lo = child_hi
+        return heavy
+
+    def _range(self, prefix: str):
+        lo = bisect_left(self.keys, prefix)
+        hi = bisect_left(self.keys, prefix + "\U0010ffff", lo)
+        return lo, hi
+
+    def _prefix_scores(self, prefix: str, limit: int) -> List[int]:
+        ranked = self.heavy.get(prefix)
+        if ranked is not None:
+            return ranked[:limit]
+        lo, hi = self._range(prefix)
+        return self._unique(sorted(self.scores[lo:hi]), limit)
+
+    def _next_chars(self, prefix: str):
+        """Distinct characters that follow `prefix` in some key."""
+        lo, hi = self._range(prefix)
+        depth = len(prefix)
+        while lo < hi:
+            key = self.keys[lo]
+            if len(key) > depth:
+                char = key[depth]
+                yield char
+                lo = bisect_left(self.keys, prefix + chr(ord(char) + 1), lo, hi)
+            else:
+                lo += 1
+
+    def _matched_length(self, q: str) -> int:
+        """Length of the longest prefix of q that some key starts with."""
+        lo, hi = 0, len(q)
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            start, end = self._range(q[:mid])
+            if start < end:
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo
+
+    def _fuzzy_variants(self, q: str):
+        """Prefixes one edit away from q (first character kept as typed)."""
+        variants = set()
+        # The edit has to sit within or just past the part of q that still matches
+        for i in range(1, min(len(q), self._matched_length(q) + 1)):
+            variants.add(q[:i] + q[i + 1:])                       # extra character
+            if i + 1 < len(q):
+                variants.add(q[:i] + q[i + 1] + q[i] + q[i + 2:])  # swapped pair
+            for char in self._next_chars(q[:i]):
+                variants.add(q[:i] + char + q[i + 1:])            # mistyped character
+                variants.add(q[:i] + char + q[i:])                # dropped character
+        variants.discard(q)
+        return variants
+
+    def search(self, q: Optional[str], limit: int = 50, fuzzy: bool = True) -> List[dict]:
+        """Best `limit` entries whose words start with q (most frequent first when q is empty)."""
+        limit = min(limit, MAX_RESULTS)
+        q = normalize(q or "")
+        if not q:
+            return self.entries[:limit]
+
+        memo_key = (q, limit, fuzzy)
+        cached = self._memo.get(memo_key)
+        if cached is not None:
+            self._memo.move_to_end(memo_key)
+            return cached
+
+        n = len(self.entries) or 1
+        scores = self._prefix_scores(q, limit)
+        if fuzzy and not scores and len(q) >= FUZZY_MIN_LENGTH:
+            ranks = set()
+            for variant in self._fuzzy_variants(q):
+                ranks.update(score % n for score in self._prefix_scores(variant, limit))
+            scores = sorted(TIER_FUZZY * n + rank for rank in ranks)[:limit]
+
+        result = [self.entries[score % n] for score in scores]
+        self._memo[memo_key] = result
+        if len(self._memo) > TYPEAHEAD_MEMO_ENTRIES:
+            self._memo.popitem(last=False)
+        return result
+
+
+# index name -> loader returning [{"name", "weight", ...}]
+TYPEAHEAD_SOURCES: Dict[str, Callable[[], Awaitable[List[dict]]]] = {
+    "technologies": filters_repo.fetch_technology_entries,
+    "job_titles": filters_repo.fetch_job_title_entries,
+}
+
+_indexes: Dict[str, TypeaheadIndex] = {}
+# name -> build task, so concurrent cold requests share one load
+_inflight: Dict[str, asyncio.Task] = {}
+_refresher: Optional[asyncio.Task] = None
+
+
+async def build_index(name: str) -> TypeaheadIndex:
+    """Load a source and swap in a freshly built index for it."""
+    entries = await TYPEAHEAD_SOURCES[name]()
+    # Sorting and bucketing is CPU-bound; keep it off the event loop
+    index = await asyncio.to_thread(TypeaheadIndex, entries)
+    _indexes[name] = index
+    print(f"[TYPEAHEAD] built {name}: {len(index)} values in {index.build_ms}ms")
+    return index
+
+
+def _build_in_background(name: str) -> asyncio.Task:
+    task = _inflight.get(name)
+    if task is None:
+        async def run():
+            try:
+                return await build_index(name)
+            finally:
+                _inflight.pop(name, None)
+
+        task = asyncio.create_task(run())
+        _inflight[name] = task
+    return task
+
+
+async def get_index(name: str) -> TypeaheadIndex:
+    """The current index for a source, building it on first use."""
+    index = _indexes.get(name)
+    if index is not None:
+        return index
+    return await asyncio.shield(_build_in_background(name))
+
+
+async def _refresh_loop():
+    while True:
+        for name in TYPEAHEAD_SOURCES:
+            try:
+                await _build_in_background(name)
+            except Exception as e:
+                print(f"[TYPEAHEAD] refresh failed for {name}: {e}")
+        await asyncio.sleep(TYPEAHEAD_REFRESH_SECONDS)
+
+
+async def start_refresh():
+    """Start the periodic rebuild task (builds every index once right away)."""
+    global _refresher
+    if _refresher is None:
+        _refresher = asyncio.create_task(_refresh_loop())
+
+
+async def stop_refresh():
+    global _refresher
+    if _refresher is not None:
+        _refresher.cancel()
+        try:
+            await _refresher
+        except asyncio.CancelledError:
+            pass
+        _refresher = None
@@ -142,6 +142,7 @@ from ingest.custom_pricing_mentioned import infer_custom_pricing_mentioned
 from ingest.money_back_guarantee import infer_money_back_guarantee
 from ingest.comparison_page_exists import infer_comparison_page_exists
 from ingest.minimum_seats import infer_minimum_seats
+from ingest.pricing_profile import infer_pricing_profile
 from ingest.webinars import infer_webinars
 from ingest.discover_pricing_page import discover_pricing_page_url
 from ingest.discover_g2_page import discover_g2_page_gemini
@@ -206,6 +207,9 @@ import extraction.icp_industries
 import extraction.icp_job_titles
 import extraction.icp_value_proposition
 import extraction.icp_fit_criterion
+import extraction.reference_cache
+import extraction.pricing_page_cache
+import extraction.pricing_profile
 
 # Import prompts module so Modal mounts it
 import prompts.sec_filings
@@ -334,6 +338,7 @@ __all__ = [
     "infer_money_back_guarantee",
     "infer_comparison_page_exists",
     "infer_minimum_seats",
+    "infer_pricing_profile",
     "infer_webinars",
     "discover_pricing_page_url",
     "discover_g2_page_gemini",
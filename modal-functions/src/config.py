@@ -1,9 +1,14 @@
 """
 Shared Modal App Configuration
 
-This module defines the Modal app and image that all endpoint modules use.
+This module defines the Modal app and image that all endpoint modules use,
+plus container-scoped database clients shared by their handlers.
 """
 
+import os
+import threading
+from contextlib import contextmanager
+
 import modal
 
 # Define the app - single source of truth
@@ -30,3 +35,71 @@ image = (
     )
     .add_local_python_source("config", "ingest", "extraction", "icp", "read")
 )
+
+
+# =============================================================================
+# Container-scoped database clients
+#
+# Created lazily on first use and reused by every request the container
+# serves, instead of building a client (and a new connection) per request.
+# Imports stay inside the functions so deploying from a machine without
+# supabase/psycopg2 installed still works.
+# =============================================================================
+
+PG_POOL_MIN_CONN = int(os.getenv("PG_POOL_MIN_CONN", "1"))
+PG_POOL_MAX_CONN = int(os.getenv("PG_POOL_MAX_CONN", "10"))
+
+_supabase_client = None
+_pg_pools: dict = {}
+_client_lock = threading.Lock()
+
+
+def get_supabase():
+    """Shared Supabase client for this container (service key)."""
+    global _supabase_client
+    if _supabase_client is None:
+        with _client_lock:
+            if _supabase_client is None:
+                from supabase import create_client
+
+                _supabase_client = create_client(
+                    os.environ["SUPABASE_URL"], os.environ["SUPABASE_SERVICE_KEY"]
+                )
+    return _supabase_client
+
+
+def get_pg_pool(dsn: str = None):
+    """Shared psycopg2 connection pool for a DSN (defaults to DATABASE_URL)."""
+    dsn = dsn or os.getenv("DATABASE_URL")
+    if not dsn:
+        raise ValueError("DATABASE_URL is not configured")
+    pool = _pg_pools.get(dsn)
+    if pool is None:
+        with _client_lock:
+            pool = _pg_pools.get(dsn)
+            if pool is None:
+                from psycopg2.pool import ThreadedConnectionPool
+
+                pool = ThreadedConnectionPool(PG_POOL_MIN_CONN, PG_POOL_MAX_CONN, dsn)
+                _pg_pools[dsn] = pool
+    return pool
+
+
+@contextmanager
+def pg_connection(dsn: str = None):
+    """
+    Borrow a pooled connection. Any open transaction is rolled back before
+    the connection goes back to the pool, so commit explicitly (or use
+    `with conn:`) to keep writes.
+    """
+    pool = get_pg_pool(dsn)
+    conn = pool.getconn()
+    try:
+        yield conn
+    finally:
+        if not conn.closed:
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+        pool.putconn(conn, close=bool(conn.closed))
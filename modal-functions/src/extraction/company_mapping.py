@@ -5,10 +5,13 @@ Maps extracted company data against lookup tables:
 - Location → reference.location_parsed
 - Industry → reference.industry_lookup
 - Company Name → extracted.cleaned_company_names
+
+Lookups are served from the warm-container reference_cache.
 """
 
 from typing import Optional
 from supabase import Client
+from extraction import reference_cache
 
 
 def map_company_discovery(
@@ -43,16 +46,8 @@ def map_company_discovery(
 
     # 1. Match location against reference.location_parsed
     if location:
-        location_result = (
-            supabase.schema("reference")
-            .from_("location_parsed")
-            .select("city, state, country, source")
-            .eq("raw_location", location)
-            .limit(1)
-            .execute()
-        )
-        if location_result.data:
-            match = location_result.data[0]
+        match = reference_cache.locations.get(supabase, location)
+        if match:
             matched_city = match.get("city")
             matched_state = match.get("state")
             matched_country = match.get("country")
@@ -60,29 +55,15 @@ def map_company_discovery(
 
     # 2. Match industry against reference.industry_lookup
     if industry:
-        industry_result = (
-            supabase.schema("reference")
-            .from_("industry_lookup")
-            .select("industry_cleaned")
-            .eq("industry_raw", industry)
-            .limit(1)
-            .execute()
-        )
-        if industry_result.data:
-            matched_industry = industry_result.data[0].get("industry_cleaned")
+        match = reference_cache.industries.get(supabase, industry)
+        if match:
+            matched_industry = match.get("industry_cleaned")
 
     # 3. Match company name against extracted.cleaned_company_names (by domain)
     if domain:
-        name_result = (
-            supabase.schema("extracted")
-            .from_("cleaned_company_names")
-            .select("cleaned_company_name")
-            .eq("domain", domain)
-            .limit(1)
-            .execute()
-        )
-        if name_result.data:
-            matched_company_name = name_result.data[0].get("cleaned_company_name")
+        match = reference_cache.cleaned_company_names.get(supabase, domain)
+        if match:
+            matched_company_name = match.get("cleaned_company_name")
 
     # 4. Upsert to mapped.company_discovery
     mapped_data = {
@@ -4,10 +4,13 @@ Person Mapping Functions
 Maps extracted person data against lookup tables:
 - Location → reference.location_parsed
 - Job Title → reference.job_title_parsed
+
+Lookups are served from the warm-container reference_cache.
 """
 
 from typing import Optional
 from supabase import Client
+from extraction import reference_cache
 
 
 def map_person_discovery(
@@ -42,16 +45,8 @@ def map_person_discovery(
 
     # 1. Match location against reference.location_parsed
     if location:
-        location_result = (
-            supabase.schema("reference")
-            .from_("location_parsed")
-            .select("city, state, country, source")
-            .eq("raw_location", location)
-            .limit(1)
-            .execute()
-        )
-        if location_result.data:
-            match = location_result.data[0]
+        match = reference_cache.locations.get(supabase, location)
+        if match:
             matched_city = match.get("city")
             matched_state = match.get("state")
             matched_country = match.get("country")
@@ -59,16 +54,8 @@ def map_person_discovery(
 
     # 2. Match job title against reference.job_title_parsed
     if job_title:
-        job_title_result = (
-            supabase.schema("reference")
-            .from_("job_title_parsed")
-            .select("cleaned_job_title, seniority, job_function, source")
-            .eq("raw_job_title", job_title)
-            .limit(1)
-            .execute()
-        )
-        if job_title_result.data:
-            match = job_title_result.data[0]
+        match = reference_cache.job_titles.get(supabase, job_title)
+        if match:
             matched_cleaned_job_title = match.get("cleaned_job_title")
             matched_seniority = match.get("seniority")
             matched_job_function = match.get("job_function")
@@ -0,0 +1,277 @@
+"""
+Pricing Page Cache
+
+Fetch-once store for pricing pages shared by every pricing inference
+endpoint (free_trial, pricing_model, number_of_tiers, ...). Each page is kept
+in raw.pricing_page_cache as raw HTML plus the extracted text the prompts
+use, keyed by normalized URL:
+- fresh rows (validated within PRICING_PAGE_CACHE_TTL_SECONDS) are served
+  without touching the site
+- stale rows are revalidated with If-None-Match / If-Modified-Since; a 304
+  (or a 200 whose HTML hashes the same) only bumps validated_at
+- misses are fetched once and written back for the other inferences; the
+  fetch is single-flight across containers: the caller holding the URL's
+  lease in raw.pricing_page_fetch_leases fetches, concurrent callers poll
+  for the row it writes (and take over if the lease is released or expires)
+
+Pages are also memoized in-process so a warm container answering several
+inferences for the same company reads the row at most once per TTL.
+"""
+
+import os
+import time
+import hashlib
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from supabase import Client
+
+PRICING_PAGE_CACHE_TTL_SECONDS = int(os.getenv("PRICING_PAGE_CACHE_TTL_SECONDS", "86400"))
+FETCH_TIMEOUT_SECONDS = 15
+# Long enough for the fetch, text extraction and write-back
+FETCH_LEASE_SECONDS = FETCH_TIMEOUT_SECONDS + 15
+LEASE_POLL_SECONDS = 0.5
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+# Elements stripped before extracting text (same set the endpoints used)
+STRIP_TAGS = ["script", "style", "nav", "footer", "header"]
+
+
+class PricingPageFetchError(Exception):
+    """The page could not be fetched and nothing usable is cached."""
+
+
+@dataclass
+class PricingPage:
+    url: str
+    final_url: str
+    html: str
+    text: str
+    content_hash: str
+    fetched_at: str
+    from_cache: bool
+
+
+def normalize_url(url: str) -> str:
+    """Cache key: lowercase scheme/host, no fragment, default port or trailing slash, sorted query."""
+    url = url.strip()
+    if "://" not in url:
+        url = f"https://{url}"
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and (scheme, parts.port) not in (("http", 80), ("https", 443)):
+        host = f"{host}:{parts.port}"
+    path = parts.path.rstrip("/") or "/"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+def extract_text(html: str) -> str:
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup(STRIP_TAGS):
+        tag.decompose()
+    return soup.get_text(separator=" ", strip=True)
+
+
+def _hash(html: str) -> str:
+    return hashlib.sha256(html.encode("utf-8", errors="replace")).hexdigest()
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _age_seconds(timestamp: Optional[str]) -> float:
+    if not timestamp:
+        return float("inf")
+    validated = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    return (_now() - validated).total_seconds()
+
+
+def _to_page(row: dict, from_cache: bool) -> PricingPage:
+    return PricingPage(
+        url=row["url"],
+        final_url=row.get("final_url") or row["url"],
+        html=row["html"],
+        text=row["page_text"],
+        content_hash=row["content_hash"],
+        fetched_at=row["fetched_at"],
+        from_cache=from_cache,
+    )
+
+
+_memo: dict = {}
+_memo_lock = threading.Lock()
+
+
+def _remember(key: str, row: dict):
+    with _memo_lock:
+        _memo[key] = row
+
+
+def _read_row(supabase: Client, key: str) -> Optional[dict]:
+    result = (
+        supabase.schema("raw")
+        .from_("pricing_page_cache")
+        .select("*")
+        .eq("url_key", key)
+        .limit(1)
+        .execute()
+    )
+    if not result.data:
+        return None
+    row = result.data[0]
+    _remember(key, row)
+    return row
+
+
+def _load_row(supabase: Client, key: str, ttl: int) -> Optional[dict]:
+    with _memo_lock:
+        row = _memo.get(key)
+    # A stale memo may already have been revalidated by another container
+    if row is not None and _age_seconds(row.get("validated_at")) <= ttl:
+        return row
+    return _read_row(supabase, key)
+
+
+def _claim_fetch(supabase: Client, key: str) -> Optional[str]:
+    """Lease id if this caller may fetch the page now, None while another caller holds the lease."""
+    result = supabase.rpc(
+        "claim_pricing_page_fetch",
+        {"p_url_key": key, "p_lease_seconds": FETCH_LEASE_SECONDS},
+    ).execute()
+    return result.data or None
+
+
+def _release_fetch(supabase: Client, key: str, lease_id: str):
+    try:
+        supabase.schema("raw").from_("pricing_page_fetch_leases").delete().eq(
+            "url_key", key
+        ).eq("lease_id", lease_id).execute()
+    except Exception as e:
+        # The lease expires on its own
+        print(f"[PRICING_PAGE_CACHE] Failed to release fetch lease for {key}: {e}")
+
+
+def _await_fetch(supabase: Client, key: str, ttl: int):
+    """
+    Wait while another caller fetches the page. Returns (row, None) once a
+    row validated within ttl (or since the wait began) appears, or
+    (None, lease_id) when the lease frees up and this caller should fetch.
+    """
+    started = time.monotonic()
+    deadline = started + 2 * FETCH_LEASE_SECONDS
+    while time.monotonic() < deadline:
+        time.sleep(LEASE_POLL_SECONDS)
+        row = _read_row(supabase, key)
+        if row and _age_seconds(row.get("validated_at")) <= max(ttl, time.monotonic() - started):
+            return row, None
+        lease_id = _claim_fetch(supabase, key)
+        if lease_id:
+            return None, lease_id
+    # Leases expire well before this; fetch without one rather than fail
+    return None, None
+
+
+def _touch(supabase: Client, key: str, row: dict) -> dict:
+    row = {**row, "validated_at": _now().isoformat()}
+    supabase.schema("raw").from_("pricing_page_cache").update(
+        {"validated_at": row["validated_at"]}
+    ).eq("url_key", key).execute()
+    _remember(key, row)
+    return row
+
+
+def _fetch(url: str, cached: Optional[dict]):
+    import requests
+
+    headers = {"User-Agent": USER_AGENT}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    try:
+        return requests.get(url, headers=headers, timeout=FETCH_TIMEOUT_SECONDS, allow_redirects=True)
+    except requests.exceptions.Timeout:
+        raise PricingPageFetchError("Pricing page fetch timeout")
+    except requests.exceptions.ConnectionError:
+        raise PricingPageFetchError("Pricing page connection error")
+
+
+def get_pricing_page(supabase: Client, url: str, max_age_seconds: Optional[int] = None) -> PricingPage:
+    """
+    Pricing page HTML and text for url, fetching it only when the cached
+    copy is missing or stale. Raises PricingPageFetchError when the page
+    cannot be fetched and there is no cached copy to fall back on.
+    """
+    key = normalize_url(url)
+    ttl = PRICING_PAGE_CACHE_TTL_SECONDS if max_age_seconds is None else max_age_seconds
+
+    cached = _load_row(supabase, key, ttl)
+    if cached and _age_seconds(cached.get("validated_at")) <= ttl:
+        return _to_page(cached, from_cache=True)
+
+    lease_id = _claim_fetch(supabase, key)
+    if lease_id is None:
+        row, lease_id = _await_fetch(supabase, key, ttl)
+        if row is not None:
+            return _to_page(row, from_cache=True)
+    else:
+        # Another caller may have written the row between our read and the claim
+        row = _read_row(supabase, key)
+        if row and _age_seconds(row.get("validated_at")) <= ttl:
+            _release_fetch(supabase, key, lease_id)
+            return _to_page(row, from_cache=True)
+        cached = row or cached
+
+    try:
+        return _fetch_and_store(supabase, url, key, cached)
+    finally:
+        if lease_id:
+            _release_fetch(supabase, key, lease_id)
+
+
+def _fetch_and_store(supabase: Client, url: str, key: str, cached: Optional[dict]) -> PricingPage:
+    try:
+        response = _fetch(url, cached)
+    except PricingPageFetchError:
+        if cached:
+            # Serve the stale copy rather than failing the inference
+            return _to_page(cached, from_cache=True)
+        raise
+
+    if response.status_code == 304 and cached:
+        return _to_page(_touch(supabase, key, cached), from_cache=True)
+
+    if response.status_code != 200:
+        raise PricingPageFetchError(f"Failed to fetch pricing page: HTTP {response.status_code}")
+
+    html = response.text
+    content_hash = _hash(html)
+    if cached and cached["content_hash"] == content_hash:
+        return _to_page(_touch(supabase, key, cached), from_cache=True)
+
+    now = _now().isoformat()
+    row = {
+        "url_key": key,
+        "url": url,
+        "final_url": response.url,
+        "status_code": response.status_code,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "content_hash": content_hash,
+        "html": html,
+        "page_text": extract_text(html),
+        "fetched_at": now,
+        "validated_at": now,
+    }
+    supabase.schema("raw").from_("pricing_page_cache").upsert(row, on_conflict="url_key").execute()
+    _remember(key, row)
+    return _to_page(row, from_cache=False)
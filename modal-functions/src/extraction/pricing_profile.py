@@ -0,0 +1,293 @@
+"""
+Pricing Profile Extraction
+
+Attribute specs, prompt, parsing and storage for the fused pricing profile
+inference: one Gemini call classifies every pricing attribute the
+per-attribute endpoints (free_trial, pricing_model, sales_motion, ...)
+classify one at a time, and the results are written to the same tables
+those endpoints write:
+- raw.<attribute>_payloads
+- extracted.company_<attribute>
+- core.company_<attribute>  (upsert on domain)
+"""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+# attribute -> classification guidance (taken from the per-attribute prompts), allowed values,
+# and the value the per-attribute endpoint stores when the model's answer is missing,
+# invalid or unparseable ("unknown", or "no" for the must-choose yes/no attributes)
+PRICING_ATTRIBUTES = {
+    "free_trial": {
+        "values": ["yes", "no", "demo_only"],
+        "default": "unknown",
+        "guidance": """Does the company offer a free trial?
+- yes: Company offers a free trial (self-serve, can start without talking to sales)
+- no: No free trial offered (must pay upfront or no self-serve option)
+- demo_only: Only offers demos or sales calls, no self-serve free trial""",
+    },
+    "pricing_model": {
+        "values": ["seat_based", "usage_based", "flat", "tiered", "custom", "multiple"],
+        "default": "unknown",
+        "guidance": """Pricing model:
+- seat_based: Per user/seat pricing (e.g., $10/user/month)
+- usage_based: Pay for what you use (e.g., API calls, storage, transactions)
+- flat: Single flat rate for the product
+- tiered: Multiple tiers with different features at different price points
+- custom: Custom/enterprise pricing only, no standard pricing shown
+- multiple: Combination of pricing models (e.g., base fee + per seat + usage)""",
+    },
+    "pricing_visibility": {
+        "values": ["public", "hidden", "partial"],
+        "default": "unknown",
+        "guidance": """Pricing visibility:
+- public: Full pricing is publicly visible (specific dollar amounts, all tiers shown)
+- hidden: No pricing shown, must contact sales or request a quote
+- partial: Some pricing shown but not complete (e.g., "starting at $X", only some tiers priced, or "contact us for enterprise")""",
+    },
+    "sales_motion": {
+        "values": ["self_serve", "sales_led", "hybrid"],
+        "default": "unknown",
+        "guidance": """Sales motion:
+- self_serve: Customers can sign up, see pricing, and pay online without talking to sales
+- sales_led: Customers must contact sales, book a demo, or request a quote to get pricing
+- hybrid: Company offers both self-serve options AND sales-assisted options
+Also set contact_sales_cta:
+- yes: Page has "Contact Sales", "Talk to Sales", "Contact Us", "Get a Demo", "Book a Demo", or similar CTA
+- no: No contact sales CTA visible""",
+        "extra": {"contact_sales_cta": ["yes", "no"]},
+    },
+    "billing_default": {
+        "values": ["monthly", "annual", "both_annual_emphasized", "both_monthly_emphasized"],
+        "default": "unknown",
+        "guidance": """Default billing period:
+- monthly: Only monthly billing shown, or monthly is the default/emphasized option
+- annual: Only annual billing shown, or annual is the default/emphasized option
+- both_annual_emphasized: Both options available but annual is pre-selected, highlighted, or shows "save X%" prominently
+- both_monthly_emphasized: Both options available but monthly is pre-selected or shown first without annual emphasis""",
+    },
+    "number_of_tiers": {
+        "values": ["1", "2", "3", "4+"],
+        "default": "unknown",
+        "guidance": """Number of distinct pricing tiers (e.g., Free, Starter, Pro, Enterprise). Do NOT count "Contact Sales" or "Custom" as a tier unless it has a specific price. List the tier names in the explanation.
+- 1: Single tier/plan
+- 2: Two tiers
+- 3: Three tiers
+- 4+: Four or more tiers""",
+    },
+    "add_ons_offered": {
+        "values": ["yes", "no", "unclear"],
+        "default": "unknown",
+        "guidance": """Are add-ons offered? Add-ons are optional features, modules, or extras purchased separately on top of a base plan (e.g., extra storage, premium support, additional integrations, API access as add-on).
+- yes: Add-ons or optional extras are clearly offered
+- no: No add-ons mentioned, all features are included in the tiers
+- unclear: Cannot determine from the pricing page content""",
+    },
+    "enterprise_tier_exists": {
+        "values": ["yes", "no"],
+        "default": "no",
+        "guidance": """Does an enterprise tier exist? An enterprise tier is typically labeled "Enterprise", "Business", "Company", "Team", or similar, and often has "Contact Sales", "Contact Us", or custom pricing.
+- yes: An enterprise tier or custom pricing option for larger customers exists
+- no: No enterprise tier or custom pricing option visible
+You must choose yes or no. If uncertain, lean toward no.""",
+    },
+    "security_compliance_gating": {
+        "values": ["yes", "no", "not_mentioned"],
+        "default": "unknown",
+        "guidance": """Are security/compliance features gated to higher tiers? These include SSO, SAML, SOC2, HIPAA, GDPR compliance, audit logs, RBAC, custom security reviews, dedicated support, SLAs, etc.
+- yes: Security/compliance features are clearly gated to higher tiers (e.g., SSO only on Enterprise)
+- no: Security/compliance features are available on all tiers or included in base plan
+- not_mentioned: Pricing page doesn't discuss security/compliance features""",
+    },
+    "annual_commitment_required": {
+        "values": ["yes", "no", "unclear"],
+        "default": "unknown",
+        "guidance": """Is an annual commitment required? Indicators: "Annual contract required", "Billed annually only", "Minimum 12-month commitment", only annual pricing shown; a monthly option suggests no annual commitment.
+- yes: Annual commitment is clearly required (no month-to-month option)
+- no: Month-to-month option is available, no annual commitment required
+- unclear: Commitment terms are not mentioned on the pricing page""",
+    },
+    "plan_naming_style": {
+        "values": ["generic", "persona_based", "feature_based", "other"],
+        "default": "unknown",
+        "guidance": """Plan naming style (list the plan names in the explanation):
+- generic: Standard tier names like "Free", "Basic", "Starter", "Pro", "Plus", "Premium", "Enterprise", "Growth"
+- persona_based: Named after target users like "Individual", "Team", "Business", "Developer", "Agency", "Freelancer", "Small Business"
+- feature_based: Named after key features or capabilities like "Analytics", "Automation", "Scale", "Core", "Complete"
+- other: Creative, branded, or unique names that don't fit above categories""",
+    },
+    "custom_pricing_mentioned": {
+        "values": ["yes", "no"],
+        "default": "no",
+        "guidance": """Is custom pricing mentioned? Look for "Custom pricing", "Contact sales", "Contact us for pricing", "Get a quote", "Request pricing", "Talk to sales", "Custom plan", "Tailored pricing".
+- yes: Custom pricing or contact sales option is mentioned
+- no: No custom pricing mentioned, only fixed pricing shown
+You must choose yes or no.""",
+    },
+    "money_back_guarantee": {
+        "values": ["yes", "no"],
+        "default": "no",
+        "guidance": """Is a money back guarantee offered? Look for "Money back guarantee", "30-day guarantee", "Full refund", "Risk-free", "Satisfaction guaranteed", "No questions asked refund".
+- yes: Money back guarantee or refund policy is mentioned
+- no: No money back guarantee mentioned
+You must choose yes or no.""",
+    },
+    "minimum_seats": {
+        "values": ["yes", "no", "not_mentioned"],
+        "default": "unknown",
+        "guidance": """Are minimum seats/users required? Look for "Minimum X seats", "Starts at X users", "Minimum purchase of X licenses", "X seat minimum", "Billed for minimum of X users".
+- yes: Minimum seats/users requirement is mentioned
+- no: Single user/seat purchase is explicitly allowed
+- not_mentioned: No mention of seat minimums either way""",
+    },
+}
+
+
+def build_prompt(company_context: str, pricing_page_url: str, page_text: str, attributes: List[str]) -> str:
+    sections = "\n\n".join(
+        f"{i}. {attribute}\n{PRICING_ATTRIBUTES[attribute]['guidance']}"
+        for i, attribute in enumerate(attributes, 1)
+    )
+    shape = {}
+    for attribute in attributes:
+        spec = PRICING_ATTRIBUTES[attribute]
+        entry = {"value": "|".join(spec["values"])}
+        for field, values in spec.get("extra", {}).items():
+            entry[field] = "|".join(values)
+        entry["explanation"] = "1-2 sentence explanation"
+        shape[attribute] = entry
+
+    return f"""Analyze this pricing page content and classify each pricing attribute below.
+
+{company_context}
+Pricing Page URL: {pricing_page_url}
+
+Pricing Page Content:
+{page_text}
+
+Classify each attribute as ONE of its listed values:
+
+{sections}
+
+Respond in this exact JSON format:
+{json.dumps(shape, indent=2)}
+
+Only return the JSON, nothing else."""
+
+
+def _normalize(value, allowed: List[str], default: str) -> str:
+    value = str(value if value is not None else "").lower().strip()
+    return value if value in allowed else default
+
+
+def _profile(data: dict, attributes: List[str], explanation: str = "") -> dict:
+    profile = {}
+    for attribute in attributes:
+        spec = PRICING_ATTRIBUTES[attribute]
+        entry = data.get(attribute) or {}
+        if not isinstance(entry, dict):
+            entry = {"value": entry}
+        result = {"value": _normalize(entry.get("value"), spec["values"], spec["default"])}
+        for field, values in spec.get("extra", {}).items():
+            # Extra fields (contact_sales_cta) fall back to "unknown" like sales_motion's
+            result[field] = _normalize(entry.get(field), values, "unknown")
+        result["explanation"] = entry.get("explanation", explanation)
+        profile[attribute] = result
+    return profile
+
+
+def parse_response(response_text: str, attributes: List[str]) -> dict:
+    """
+    {attribute: {"value", "explanation", ...extra}} with values outside the
+    allowed set mapped to the attribute's default, as the per-attribute
+    endpoints do. Raises json.JSONDecodeError if the response isn't JSON.
+    """
+    response_text = response_text.strip()
+    if response_text.startswith("```"):
+        response_text = response_text.split("```")[1]
+        if response_text.startswith("json"):
+            response_text = response_text[4:]
+    data = json.loads(response_text.strip())
+    return _profile(data if isinstance(data, dict) else {}, attributes)
+
+
+def default_profile(response_text: str, attributes: List[str]) -> dict:
+    """
+    Profile for an unparseable response: every attribute at its default with
+    the response text as the explanation, as the per-attribute endpoints store.
+    """
+    return _profile({}, attributes, explanation=response_text)
+
+
+def _store_attribute(
+    supabase,
+    attribute: str,
+    result: dict,
+    domain: str,
+    pricing_page_url: str,
+    company_name: Optional[str],
+    payload: dict,
+) -> str:
+    raw_insert = (
+        supabase.schema("raw")
+        .from_(f"{attribute}_payloads")
+        .insert({
+            "domain": domain,
+            "pricing_page_url": pricing_page_url,
+            "company_name": company_name,
+            "payload": payload,
+        })
+        .execute()
+    )
+    raw_payload_id = raw_insert.data[0]["id"]
+
+    values = {attribute: result["value"]}
+    for field in PRICING_ATTRIBUTES[attribute].get("extra", {}):
+        values[field] = result[field]
+
+    supabase.schema("extracted").from_(f"company_{attribute}").insert({
+        "raw_payload_id": raw_payload_id,
+        "domain": domain,
+        "pricing_page_url": pricing_page_url,
+        **values,
+        "explanation": result["explanation"],
+    }).execute()
+
+    supabase.schema("core").from_(f"company_{attribute}").upsert({
+        "domain": domain,
+        **values,
+        "explanation": result["explanation"],
+        "last_checked_at": "now()",
+    }, on_conflict="domain").execute()
+
+    return str(raw_payload_id)
+
+
+def store_pricing_profile(
+    supabase,
+    profile: dict,
+    domain: str,
+    pricing_page_url: str,
+    company_name: Optional[str],
+    payload: dict,
+) -> List[dict]:
+    """
+    Write every attribute to its raw/extracted/core tables (attributes in
+    parallel). Sets raw_payload_id on each profile entry; returns
+    [{"attribute", "error"}] for attributes whose writes failed.
+    """
+    def store(attribute):
+        profile[attribute]["raw_payload_id"] = _store_attribute(
+            supabase, attribute, profile[attribute], domain, pricing_page_url, company_name, payload
+        )
+
+    errors = []
+    with ThreadPoolExecutor(max_workers=len(profile) or 1) as pool:
+        futures = {attribute: pool.submit(store, attribute) for attribute in profile}
+        for attribute, future in futures.items():
+            try:
+                future.result()
+            except Exception as e:
+                errors.append({"attribute": attribute, "error": str(e)})
+    return errors
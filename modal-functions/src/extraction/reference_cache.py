@@ -0,0 +1,180 @@
+"""
+Reference Table Cache
+
+Warm-container, in-process copies of the lookup tables used by the mapping
+functions:
+- reference.location_parsed       (raw_location  → city/state/country)
+- reference.industry_lookup       (industry_raw  → industry_cleaned)
+- reference.job_title_parsed      (raw_job_title → cleaned title/seniority/function)
+- extracted.cleaned_company_names (domain        → cleaned_company_name)
+
+Each table is loaded once per container, then refreshed incrementally
+(rows whose updated_at is newer than the newest one seen) every
+REFERENCE_CACHE_REFRESH_SECONDS, with a full reload every
+REFERENCE_CACHE_FULL_RELOAD_SECONDS. Lookups between refreshes are plain
+dict reads with no network I/O.
+
+Staleness: an inserted or updated row is seen within
+REFERENCE_CACHE_REFRESH_SECONDS. Deleted rows, and rows committed with an
+updated_at older than the watermark (a long transaction), are only picked up
+by the next full reload, so within REFERENCE_CACHE_FULL_RELOAD_SECONDS.
+industry_lookup has no updated_at and is always fully reloaded.
+"""
+
+import os
+import time
+import threading
+from typing import Optional
+from supabase import Client
+
+REFERENCE_CACHE_REFRESH_SECONDS = int(os.getenv("REFERENCE_CACHE_REFRESH_SECONDS", "300"))
+REFERENCE_CACHE_FULL_RELOAD_SECONDS = int(os.getenv("REFERENCE_CACHE_FULL_RELOAD_SECONDS", "3600"))
+PAGE_SIZE = 1000
+
+
+class ReferenceTable:
+    """One lookup table held as {key: row}."""
+
+    def __init__(
+        self,
+        schema: str,
+        table: str,
+        key_column: str,
+        columns: list,
+        watermark_column: Optional[str] = "updated_at",
+        unique_key: bool = False,
+        order_column: Optional[str] = "created_at",
+        tiebreak_column: Optional[str] = "id",
+    ):
+        self.schema = schema
+        self.table = table
+        self.key_column = key_column
+        self.columns = columns
+        self.watermark_column = watermark_column
+        # Unique keys take the newest row; otherwise the first row by
+        # (order_column, tiebreak_column) wins, like the .eq().limit(1)
+        # queries this replaces, and a refreshed copy of it replaces it
+        self.unique_key = unique_key
+        self.order_column = order_column
+        # Bulk-loaded rows share one timestamp, so pages also order by this
+        self.tiebreak_column = tiebreak_column
+
+        self._rows: dict = {}
+        self._watermark: Optional[str] = None
+        self._loaded_at: Optional[float] = None
+        self._full_loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def _select(self) -> str:
+        columns = [self.key_column] + self.columns
+        for column in (self.watermark_column, self.order_column, self.tiebreak_column):
+            if column and column not in columns:
+                columns.append(column)
+        return ", ".join(columns)
+
+    def _fetch(self, supabase: Client, since: Optional[str]) -> list:
+        rows = []
+        start = 0
+        while True:
+            query = supabase.schema(self.schema).from_(self.table).select(self._select())
+            if since and self.watermark_column:
+                query = query.gt(self.watermark_column, since)
+            query = query.order(self.watermark_column or self.key_column)
+            if self.tiebreak_column:
+                query = query.order(self.tiebreak_column)
+            page = query.range(start, start + PAGE_SIZE - 1).execute().data or []
+            rows.extend(page)
+            if len(page) < PAGE_SIZE:
+                return rows
+            start += PAGE_SIZE
+
+    def _precedes(self, row: dict, current: dict) -> bool:
+        """Whether row should replace current for a non-unique key."""
+        if self.tiebreak_column and row.get(self.tiebreak_column) == current.get(self.tiebreak_column):
+            return True  # newer version of the same row
+        if not self.order_column:
+            return False
+        return (
+            (row.get(self.order_column) or "", str(row.get(self.tiebreak_column) or ""))
+            < (current.get(self.order_column) or "", str(current.get(self.tiebreak_column) or ""))
+        )
+
+    def _apply(self, rows: list, target: dict):
+        for row in rows:
+            key = row.get(self.key_column)
+            if key is None:
+                continue
+            current = target.get(key)
+            if self.unique_key or current is None or self._precedes(row, current):
+                target[key] = row
+            watermark = row.get(self.watermark_column) if self.watermark_column else None
+            if watermark and (self._watermark is None or watermark > self._watermark):
+                self._watermark = watermark
+
+    def _is_stale(self) -> bool:
+        return self._loaded_at is None or time.monotonic() - self._loaded_at > REFERENCE_CACHE_REFRESH_SECONDS
+
+    def _refresh_locked(self, supabase: Client, full: bool):
+        now = time.monotonic()
+        full = (
+            full
+            or self._full_loaded_at is None
+            or not self.watermark_column
+            or now - self._full_loaded_at > REFERENCE_CACHE_FULL_RELOAD_SECONDS
+        )
+        if full:
+            # Build the new copy aside so readers never see a half-loaded table
+            rows = self._fetch(supabase, since=None)
+            fresh: dict = {}
+            self._watermark = None
+            self._apply(rows, fresh)
+            self._rows = fresh
+            self._full_loaded_at = now
+        else:
+            self._apply(self._fetch(supabase, since=self._watermark), self._rows)
+        self._loaded_at = now
+
+    def refresh(self, supabase: Client, full: bool = False):
+        """Load the table, or only rows newer than the last load."""
+        with self._lock:
+            self._refresh_locked(supabase, full)
+
+    def _ensure_fresh(self, supabase: Client):
+        if not self._is_stale():
+            return
+        with self._lock:
+            # Another thread may have refreshed while we waited for the lock
+            if self._is_stale():
+                self._refresh_locked(supabase, full=False)
+
+    def get(self, supabase: Client, key: Optional[str]) -> Optional[dict]:
+        """Row for key, or None. Only touches the network on load/refresh."""
+        if not key:
+            return None
+        self._ensure_fresh(supabase)
+        return self._rows.get(key)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+
+locations = ReferenceTable(
+    "reference", "location_parsed", "raw_location",
+    ["city", "state", "country", "source"],
+)
+industries = ReferenceTable(
+    "reference", "industry_lookup", "industry_raw",
+    ["industry_cleaned"],
+    watermark_column=None,
+    order_column=None,
+    tiebreak_column=None,
+)
+job_titles = ReferenceTable(
+    "reference", "job_title_parsed", "raw_job_title",
+    ["cleaned_job_title", "seniority", "job_function", "source"],
+)
+cleaned_company_names = ReferenceTable(
+    "extracted", "cleaned_company_names", "domain",
+    ["cleaned_company_name"],
+    unique_key=True,
+)
@@ -19,7 +19,8 @@ Returns:
 
 import os
 import modal
-from config import app, image
+from config import app, image, get_supabase
+from extraction.pricing_page_cache import get_pricing_page, PricingPageFetchError
 
 
 @app.function(
@@ -32,15 +33,10 @@ from config import app, image
 )
 @modal.fastapi_endpoint(method="POST")
 def infer_add_ons_offered(request: dict) -> dict:
-    import requests
-    from bs4 import BeautifulSoup
     import google.generativeai as genai
-    from supabase import create_client
 
     genai.configure(api_key=os.environ["GEMINI_API_KEY"])
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         domain = request.get("domain", "").lower().strip()
@@ -67,30 +63,19 @@ def infer_add_ons_offered(request: dict) -> dict:
         )
         raw_payload_id = raw_insert.data[0]["id"]
 
-        # 2. Fetch pricing page content
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
-
+        # 2. Fetch pricing page content (shared cache - one fetch per page across pricing inferences)
         try:
-            response = requests.get(pricing_page_url, headers=headers, timeout=15, allow_redirects=True)
-            if response.status_code != 200:
-                return {
-                    "success": False,
-                    "error": f"Failed to fetch pricing page: HTTP {response.status_code}",
-                    "domain": domain,
-                    "raw_payload_id": str(raw_payload_id),
-                }
-        except requests.exceptions.Timeout:
-            return {"success": False, "error": "Pricing page fetch timeout", "domain": domain}
-        except requests.exceptions.ConnectionError:
-            return {"success": False, "error": "Pricing page connection error", "domain": domain}
-
-        # Parse HTML and extract text
-        soup = BeautifulSoup(response.text, "html.parser")
-        for script in soup(["script", "style", "nav", "footer", "header"]):
-            script.decompose()
-        page_text = soup.get_text(separator=" ", strip=True)[:8000]
+            page = get_pricing_page(supabase, pricing_page_url)
+        except PricingPageFetchError as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "domain": domain,
+                "raw_payload_id": str(raw_payload_id),
+            }
+
+        # Truncate to avoid token limits
+        page_text = page.text[:8000]
 
         # 3. Send to Gemini for classification
         company_context = f"Company: {company_name}" if company_name else f"Domain: {domain}"
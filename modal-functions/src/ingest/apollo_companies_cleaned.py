@@ -2,12 +2,11 @@
 Apollo Companies Cleaned - Receives cleaned company data from Clay
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class ApolloCompaniesCleanedRequest(BaseModel):
@@ -33,11 +32,7 @@ def ingest_apollo_companies_cleaned(request: ApolloCompaniesCleanedRequest) -> d
     """
     Ingest cleaned Apollo company data from Clay.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         data = {
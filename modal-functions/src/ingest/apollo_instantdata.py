@@ -6,12 +6,11 @@ Simple approach: one row per record, no deduplication at insert time.
 Dedupe at query time using views or DISTINCT ON.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class ApolloInstantDataRequest(BaseModel):
@@ -49,11 +48,7 @@ def extract_apollo_instantdata(request: ApolloInstantDataRequest) -> dict:
 
     Simple INSERT (no deduplication). Each record keeps its scrape_settings_id.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     person_id = None
     company_id = None
@@ -2,12 +2,11 @@
 Apollo People Cleaned - Receives cleaned person data from Clay
 """
 
-import os
 import modal
 from pydantic import BaseModel, Field
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class ApolloPeopleCleanedRequest(BaseModel):
@@ -43,11 +42,7 @@ def ingest_apollo_people_cleaned(request: ApolloPeopleCleanedRequest) -> dict:
     """
     Ingest cleaned Apollo person data from Clay.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         data = {
@@ -4,12 +4,11 @@ Apollo Scrape Ingestion Endpoint
 Ingests person/company data from Apollo scrapes.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class ApolloScrapeRequest(BaseModel):
@@ -85,11 +84,7 @@ def ingest_apollo_scrape(request: ApolloScrapeRequest) -> dict:
     Ingest Apollo scrape data.
     Stores raw payload, then extracts key fields.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Build raw payload from all fields
@@ -11,7 +11,7 @@ import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class AssessICPFitRequest(BaseModel):
@@ -88,7 +88,6 @@ def assess_icp_fit(request: AssessICPFitRequest) -> dict:
     Uses Gemini 3 Flash with web browsing/grounding.
     """
     import google.generativeai as genai
-    from supabase import create_client
 
     # Initialize Gemini
     api_key = os.environ.get("GEMINI_API_KEY")
@@ -135,9 +134,7 @@ def assess_icp_fit(request: AssessICPFitRequest) -> dict:
         company_name = result.get("companyName", request.company_name)
 
         # Store in Supabase
-        supabase_url = os.environ["SUPABASE_URL"]
-        supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-        supabase = create_client(supabase_url, supabase_key)
+        supabase = get_supabase()
 
         supabase.schema("core").table("icp_verdicts").upsert(
             {
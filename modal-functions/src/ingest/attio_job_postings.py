@@ -8,7 +8,7 @@ Tracks synced records in core.attio_job_postings_sync.
 import os
 import modal
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 @app.function(
@@ -27,13 +27,10 @@ def sync_job_postings_to_attio(request: dict = None) -> dict:
     Call repeatedly until remaining = 0.
     """
     import requests
-    from supabase import create_client
 
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
     attio_token = os.environ["ATTIO_ACCESS_TOKEN"]
 
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     headers = {
         "Authorization": f"Bearer {attio_token}",
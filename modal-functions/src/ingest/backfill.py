@@ -7,13 +7,12 @@ Backfill Endpoints - batch update extracted tables from reference lookups
 v2: Removed RPC, uses standard Supabase client methods only
 """
 
-import os
 import modal
 from datetime import datetime
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class BackfillPersonLocationRequest(BaseModel):
@@ -42,11 +41,7 @@ def backfill_person_location(request: BackfillPersonLocationRequest) -> dict:
         - dry_run=True: count of matchable records + sample
         - dry_run=False: count of updated records
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Get all lookup entries (paginate to get all, not just default 1000)
@@ -204,11 +199,7 @@ def backfill_person_matched_location(request: BackfillMatchedLocationRequest) ->
         1. dry_run=True to see total count
         2. dry_run=False, limit=50000 (repeat until done)
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Get all lookup entries (paginate to get all)
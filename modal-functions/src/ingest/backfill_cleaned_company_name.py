@@ -2,12 +2,11 @@
 Backfill cleaned_name column in core.companies from extracted.cleaned_company_names
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class BackfillRequest(BaseModel):
@@ -27,11 +26,7 @@ def backfill_cleaned_company_name(request: BackfillRequest) -> dict:
 
     Processes in batches to avoid timeouts.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     total_updated = 0
     batches_processed = 0
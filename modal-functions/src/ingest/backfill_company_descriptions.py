@@ -9,12 +9,11 @@ Coalesces descriptions from multiple sources with priority:
 See: docs/modal/workflows/backfill-company-descriptions.md
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class BackfillCompanyDescriptionsRequest(BaseModel):
@@ -35,11 +34,7 @@ def backfill_company_descriptions(request: BackfillCompanyDescriptionsRequest) -
     2. company_firmographics.description
     3. company_discovery.description
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         source_counts = {
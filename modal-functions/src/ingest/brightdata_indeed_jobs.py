@@ -11,7 +11,7 @@ from uuid import uuid4
 
 import modal
 
-from config import app, image
+from config import app, image, pg_connection
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
@@ -26,7 +26,6 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 )
 @modal.fastapi_endpoint(method="POST")
 def ingest_brightdata_indeed_jobs(records: list[dict], metadata: dict | None = None) -> dict:
-    import psycopg2
     from psycopg2.extras import Json, execute_values
 
     if not DATABASE_URL:
@@ -38,8 +37,7 @@ def ingest_brightdata_indeed_jobs(records: list[dict], metadata: dict | None = N
     batch_id = uuid4()
     metadata_payload = metadata if isinstance(metadata, dict) else {}
 
-    conn = psycopg2.connect(DATABASE_URL)
-    try:
+    with pg_connection(DATABASE_URL) as conn:
         with conn:
             with conn.cursor() as cur:
                 cur.execute(
@@ -171,5 +169,3 @@ def ingest_brightdata_indeed_jobs(records: list[dict], metadata: dict | None = N
             "records_processed": len(records),
             "source": "indeed",
         }
-    finally:
-        conn.close()
@@ -12,7 +12,7 @@ from uuid import uuid4
 
 import modal
 
-from config import app, image
+from config import app, image, pg_connection
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
@@ -36,7 +36,6 @@ def _parse_iso_timestamptz(value: str | None) -> datetime | None:
 )
 @modal.fastapi_endpoint(method="POST")
 def ingest_brightdata_linkedin_jobs(records: list[dict], metadata: dict | None = None) -> dict:
-    import psycopg2
     from psycopg2.extras import Json, execute_values
 
     if not DATABASE_URL:
@@ -48,8 +47,7 @@ def ingest_brightdata_linkedin_jobs(records: list[dict], metadata: dict | None =
     batch_id = uuid4()
     metadata_payload = metadata if isinstance(metadata, dict) else {}
 
-    conn = psycopg2.connect(DATABASE_URL)
-    try:
+    with pg_connection(DATABASE_URL) as conn:
         with conn:
             with conn.cursor() as cur:
                 cur.execute(
@@ -201,5 +199,3 @@ def ingest_brightdata_linkedin_jobs(records: list[dict], metadata: dict | None =
             "records_processed": len(records),
             "source": "linkedin",
         }
-    finally:
-        conn.close()
@@ -10,7 +10,7 @@ import os
 
 import modal
 
-from config import app, image
+from config import app, image, pg_connection
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
@@ -158,7 +158,6 @@ def validate_job_posting_active(
     job_title: str,
     company_name: str | None = None,
 ) -> dict:
-    import psycopg2
 
     if not DATABASE_URL:
         raise ValueError("DATABASE_URL is not configured")
@@ -172,8 +171,7 @@ def validate_job_posting_active(
     if not job_title_norm:
         raise ValueError("job_title is required")
 
-    conn = psycopg2.connect(DATABASE_URL)
-    try:
+    with pg_connection(DATABASE_URL) as conn:
         with conn.cursor() as cur:
             indeed_stats = _query_indeed_matches(
                 cur=cur,
@@ -219,5 +217,3 @@ def validate_job_posting_active(
             "validation_result": validation_result,
             "confidence": confidence,
         }
-    finally:
-        conn.close()
@@ -13,10 +13,9 @@ Expects:
 }
 """
 
-import os
 import json
 import modal
-from config import app, image
+from config import app, image, get_supabase
 
 
 @app.function(
@@ -25,11 +24,7 @@ from config import app, image
 )
 @modal.fastapi_endpoint(method="POST")
 def ingest_builtwith(request: dict) -> dict:
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         domain = request.get("domain", "").lower().strip()
@@ -10,7 +10,7 @@ import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 
 from extraction.case_study import extract_case_study_details, extract_case_study_champions
 
@@ -93,12 +93,9 @@ def ingest_case_study_extraction(request: CaseStudyExtractionRequest) -> dict:
     Extract case study details using Gemini 3 Flash.
     Stores raw Gemini response, then extracts to case_study_details and case_study_champions.
     """
-    from supabase import create_client
     import google.generativeai as genai
 
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     gemini_api_key = os.environ["GEMINI_API_KEY"]
     genai.configure(api_key=gemini_api_key)
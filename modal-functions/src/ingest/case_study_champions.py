@@ -4,12 +4,11 @@ Case Study Buyers Ingest
 Ingests the payload from extract_case_study_buyer and stores in raw + extracted tables.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional, List, Any
 
-from config import app, image
+from config import app, image, get_supabase
 from extraction.case_study_champions import extract_case_study_buyers
 
 
@@ -44,11 +43,7 @@ def ingest_case_study_buyers(request: CaseStudyBuyersRequest) -> dict:
     Ingest case study buyers payload.
     Stores raw payload, then extracts each person to flattened table.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Build raw payload
@@ -4,12 +4,11 @@ CB VC Portfolio Data Ingest
 Ingests Crunchbase VC portfolio company data and stores in raw + extracted tables.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 from extraction.cb_vc_portfolio import extract_cb_vc_portfolio
 
 
@@ -58,11 +57,7 @@ def ingest_cb_vc_portfolio(request: CbVcPortfolioRequest) -> dict:
     Ingest CB VC portfolio data.
     Stores raw payload, then extracts one row per VC to extracted table.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Store raw payload
@@ -5,11 +5,10 @@ Receives domains that Clay processed for customer data.
 Used to reconcile what Clay sent vs what's in the database.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import List, Optional
-from config import app, image
+from config import app, image, get_supabase
 
 
 class AuditRequest(BaseModel):
@@ -24,11 +23,7 @@ class AuditRequest(BaseModel):
 )
 @modal.fastapi_endpoint(method="POST")
 def ingest_clay_customers_audit(request: AuditRequest) -> dict:
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Handle single domain or list
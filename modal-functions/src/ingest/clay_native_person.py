@@ -16,12 +16,11 @@ Populates:
 - core.person_past_employer (past employers)
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional, List
 
-from config import app, image
+from config import app, image, get_supabase
 from extraction.person import (
     extract_person_profile,
     extract_person_experience,
@@ -148,11 +147,7 @@ def ingest_clay_native_person(request: ClayNativePersonRequest) -> dict:
     Stores raw payload, extracts to profile/experience/education,
     and populates core tables.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         return process_single_person(supabase, request.payload)
@@ -178,11 +173,7 @@ def ingest_clay_native_person_batch(request: ClayNativePersonBatchRequest) -> di
     Each payload must have 'url' field containing LinkedIn URL.
     Processes all payloads and returns results for each.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     results = []
     success_count = 0
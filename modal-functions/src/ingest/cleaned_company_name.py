@@ -5,12 +5,11 @@ Receives cleaned company names from Clay and stores them as a canonical referenc
 Used to avoid messy names like "WUNDERGROUND LLC" in favor of "Wunderground".
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class CleanedCompanyNameRequest(BaseModel):
@@ -36,11 +35,7 @@ def ingest_cleaned_company_name(request: CleanedCompanyNameRequest) -> dict:
         - original_company_name: the messy original name
         - cleaned_company_name: the canonical cleaned name
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # 1. Insert into raw table
@@ -9,14 +9,13 @@ Company Ingestion Endpoints
 - ingest_clay_find_co_lctn_prsd: Discovery company data with pre-parsed location
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional, Any
 from datetime import datetime
 
 # Import app and image from config
-from config import app, image
+from config import app, image, get_supabase
 
 from extraction.company import (
     extract_company_firmographics,
@@ -85,11 +84,7 @@ def ingest_clay_company_firmo(request: CompanyIngestRequest) -> dict:
     Ingest enriched company payload (clay-company-firmographics workflow).
     Stores raw payload, then extracts to company_firmographics table.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Look up workflow in registry
@@ -149,11 +144,7 @@ def ingest_clay_find_companies(request: CompanyDiscoveryRequest) -> dict:
     Ingest company discovery payload (clay-find-companies workflow).
     Stores raw payload, then extracts to company_discovery table.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Look up workflow in registry
@@ -240,11 +231,7 @@ def ingest_all_comp_customers(request: CompanyCustomerRequest) -> dict:
     Ingest customer research payload from Claygent (claygent-get-all-company-customers workflow).
     Stores raw payload, then extracts company customers to individual rows.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Look up workflow in registry
@@ -308,11 +295,7 @@ def upsert_core_company(request: CoreCompanyRequest) -> dict:
     Upsert a company to core.companies.
     Simple direct insert/update on domain.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         data = {
@@ -349,11 +332,7 @@ def ingest_manual_comp_customer(request: ManualCompanyCustomerRequest) -> dict:
     Ingest manually-sourced company customer data (manual-company-customers workflow).
     Data is already flattened, no extraction needed.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Look up workflow in registry
@@ -411,11 +390,7 @@ def ingest_clay_find_co_lctn_prsd(request: CompanyDiscoveryLocationParsedRequest
     Location parsing done in Clay via Gemini before sending to this endpoint.
     Stores raw payload + parsed location, then extracts to company_discovery_location_parsed table.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Look up workflow in registry
@@ -16,7 +16,7 @@ import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 from extraction.company_address import extract_company_address
 
 
@@ -149,11 +149,7 @@ def ingest_company_address_parsing(request: CompanyAddressRequest) -> dict:
     2. Call Gemini to parse the address
     3. Store extracted data (with AI-parsed fields)
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Parse headcount to int
@@ -4,12 +4,11 @@ Company Canonical Ingestion Endpoint
 Upserts canonical company data (cleaned name, linkedin_url) to core.company_canonical.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class CompanyCanonicalRequest(BaseModel):
@@ -34,11 +33,7 @@ def ingest_company_canonical(request: CompanyCanonicalRequest) -> dict:
 
     Upserts on domain. Only overwrites fields if provided (non-null).
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         domain = request.domain.lower().strip()
@@ -16,9 +16,8 @@ Expects:
 }
 """
 
-import os
 import modal
-from config import app, image
+from config import app, image, get_supabase
 
 
 @app.function(
@@ -27,11 +26,7 @@ from config import app, image
 )
 @modal.fastapi_endpoint(method="POST")
 def ingest_company_classification(request: dict) -> dict:
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         domain = request.get("domain", "").lower().strip()
@@ -24,13 +24,12 @@ Expects:
 }
 """
 
-import os
 import re
 import modal
 from pydantic import BaseModel
 from typing import Optional, List, Any
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 def normalize_domain(domain: str) -> str:
@@ -70,11 +69,7 @@ def ingest_company_competitors_research(request: CompanyCompetitorsResearchReque
 
     Uses domain as unique key for upserting.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         domain = normalize_domain(request.domain)
@@ -18,13 +18,12 @@ Expected payload from Clay:
 }
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional, List, Any
 from datetime import datetime
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class ClaygentOutput(BaseModel):
@@ -54,11 +53,7 @@ def ingest_company_customers_claygent(request: CompanyCustomersClaygentRequest)
     Ingest Claygent customers output from Clay webhook.
     Stores raw payload and extracts individual customer names.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     # Get claygent output from either field name
     claygent = request.claygent_output or request.customers_claygent
@@ -5,12 +5,11 @@ Check if we have customers_of data for a given company domain.
 Returns count and domain coverage stats.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class CustomerStatusRequest(BaseModel):
@@ -33,11 +32,7 @@ def get_company_customers_status(request: CustomerStatusRequest) -> dict:
     - customers_without_domain: count without domain
     - domain_coverage_pct: percentage with domains
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Get all customers for this domain
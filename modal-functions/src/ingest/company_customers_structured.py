@@ -13,10 +13,9 @@ Expects flat payload:
 }
 """
 
-import os
 import re
 import modal
-from config import app, image
+from config import app, image, get_supabase
 
 
 def normalize_domain(raw: str) -> str:
@@ -35,11 +34,7 @@ def normalize_domain(raw: str) -> str:
 )
 @modal.fastapi_endpoint(method="POST")
 def ingest_company_customers_structured(request: dict) -> dict:
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         domain = normalize_domain(request.get("origin_company_domain", ""))
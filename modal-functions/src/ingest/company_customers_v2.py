@@ -5,12 +5,11 @@ Receives webhooks from Clay tables containing structured customer output.
 Handles empty customers arrays gracefully.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional, List
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class CustomerItem(BaseModel):
@@ -45,11 +44,7 @@ def ingest_company_customers_v2(request: CompanyCustomersV2Request) -> dict:
     Ingest structured customers output from Clay webhook.
     Handles empty customers arrays - stores raw, extracts 0 customers.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     claygent = request.claygent_output or request.customers_claygent
 
@@ -18,7 +18,7 @@ from pydantic import BaseModel
 from typing import Optional, List
 from datetime import datetime
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class SimilarCompaniesRequest(BaseModel):
@@ -58,12 +58,9 @@ def process_similar_companies_batch(
     Background worker that processes all domains for a batch.
     Called via .spawn() from the batch endpoint.
     """
-    from supabase import create_client
 
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
     companyenrich_key = os.environ["COMPANYENRICH_API_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     processed = 0
     errors = []
@@ -118,11 +115,7 @@ def find_similar_companies_batch(request: SimilarCompaniesRequest) -> dict:
     Create a batch and spawn async processing.
     Returns immediately with batch_id - frontend should poll for status.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Create batch record with 'pending' status
@@ -178,11 +171,7 @@ def get_similar_companies_batch_status(request: BatchStatusRequest) -> dict:
     Check the status of a batch.
     Returns progress and results when completed.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Get batch record
@@ -251,12 +240,9 @@ def find_similar_companies_single(request: SingleDomainRequest) -> dict:
     """
     Find similar companies for a single domain (synchronous).
     """
-    from supabase import create_client
 
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
     companyenrich_key = os.environ["COMPANYENRICH_API_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         result = _process_single_domain(
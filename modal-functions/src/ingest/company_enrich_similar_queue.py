@@ -13,7 +13,7 @@ from pydantic import BaseModel
 from typing import Optional, List
 from datetime import datetime
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class ProcessQueueRequest(BaseModel):
@@ -47,12 +47,9 @@ def process_queue_batch_worker(
     Background worker that processes a batch from the queue.
     Calls webhook when done.
     """
-    from supabase import create_client
 
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
     companyenrich_key = os.environ["COMPANYENRICH_API_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     processed = 0
     errors = []
@@ -215,11 +212,7 @@ def process_similar_companies_queue(request: ProcessQueueRequest) -> dict:
     Returns immediately with batch_id.
     Calls webhook_url when done (if provided).
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Get next batch_size pending items from queue
@@ -299,11 +292,7 @@ def get_similar_companies_queue_status(request: QueueStatusRequest) -> dict:
     """
     Get queue status - how many pending, processing, done, error.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Count by status
@@ -4,12 +4,11 @@ Public Companies Ingest Endpoint
 Simple endpoint to add known public companies.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class PublicCompanyRequest(BaseModel):
@@ -27,11 +26,7 @@ def ingest_public_company(request: PublicCompanyRequest) -> dict:
     """
     Add a known public company to core.company_public.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Clean domain
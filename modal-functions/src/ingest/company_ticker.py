@@ -13,10 +13,9 @@ Expects:
 Fetches CIK from SEC and stores ticker + CIK in reference.sec_company_info.
 """
 
-import os
 import modal
 import httpx
-from config import app, image
+from config import app, image, get_supabase
 
 # SEC bulk file URL - maps all tickers to CIKs
 SEC_TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
@@ -58,11 +57,7 @@ def fetch_cik_from_sec(ticker: str) -> dict:
 )
 @modal.fastapi_endpoint(method="POST")
 def ingest_company_ticker(request: dict) -> dict:
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         domain = request.get("domain", "").lower().strip()
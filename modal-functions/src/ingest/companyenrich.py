@@ -5,13 +5,12 @@ Ingests company enrichment data from companyenrich.com.
 Stores raw payload and extracts to multiple breakout tables.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional, List
 from datetime import datetime
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class CompanyEnrichRequest(BaseModel):
@@ -68,11 +67,7 @@ def ingest_companyenrich(request: CompanyEnrichRequest) -> dict:
     - companyenrich_location
     - companyenrich_subsidiaries
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         payload = request.raw_payload or {}
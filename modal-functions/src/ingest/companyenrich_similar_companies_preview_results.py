@@ -7,12 +7,11 @@ extracts full company profiles to dedicated extracted tables,
 and conditionally writes to core tables for new domains.
 """
 
-import os
 import modal
 from datetime import datetime
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 SOURCE = "companyenrich-similar-preview"
@@ -34,11 +33,7 @@ def parse_datetime(dt_str: Optional[str]) -> Optional[str]:
 )
 @modal.fastapi_endpoint(method="POST")
 def ingest_companyenrich_similar_preview_results(data: dict) -> dict:
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     input_domain = data.get("input_domain", "").lower().strip()
     if not input_domain:
@@ -23,7 +23,7 @@ Returns:
 
 import os
 import modal
-from config import app, image
+from config import app, image, get_supabase
 
 
 @app.function(
@@ -39,12 +39,9 @@ def infer_comparison_page_exists(request: dict) -> dict:
     import requests
     from bs4 import BeautifulSoup
     import google.generativeai as genai
-    from supabase import create_client
 
     genai.configure(api_key=os.environ["GEMINI_API_KEY"])
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         domain = request.get("domain", "").lower().strip()
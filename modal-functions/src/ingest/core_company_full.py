@@ -9,13 +9,12 @@ Accepts enriched company data and upserts to all core dimension tables:
 - core.company_linkedin_urls
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
 from datetime import datetime
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class CoreCompanyFullRequest(BaseModel):
@@ -39,11 +38,7 @@ def upsert_core_company_full(request: CoreCompanyFullRequest) -> dict:
     """
     Upsert enriched company data to all core dimension tables.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     now = datetime.utcnow().isoformat()
     results = {}
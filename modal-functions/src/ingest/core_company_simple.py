@@ -4,12 +4,11 @@ Core Company Simple Ingestion Endpoint
 Upserts company data directly to core.companies table.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class CoreCompanySimpleRequest(BaseModel):
@@ -29,11 +28,7 @@ def ingest_core_company_simple(request: CoreCompanySimpleRequest) -> dict:
     If domain exists, updates name and linkedin_url.
     If domain doesn't exist, inserts new record.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         data = {
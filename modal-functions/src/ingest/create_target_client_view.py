@@ -4,12 +4,11 @@ Create Target Client View Endpoint
 Auto-generates a saved view from ICP data for a given domain.
 """
 
-import os
 import re
 import modal
 from pydantic import BaseModel
 from typing import Optional
-from config import app, image
+from config import app, image, get_supabase
 
 
 class CreateTargetClientViewRequest(BaseModel):
@@ -40,11 +39,7 @@ def create_target_client_view(request: CreateTargetClientViewRequest) -> dict:
     3. Saves to core.target_client_views
     4. Returns shareable slug
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Get company name
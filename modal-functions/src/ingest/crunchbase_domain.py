@@ -10,7 +10,7 @@ import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 from extraction.crunchbase_domain import extract_crunchbase_domain
 
 
@@ -68,12 +68,9 @@ def infer_crunchbase_domain(request: CrunchbaseDomainRequest) -> dict:
     """
     Infer company domain from Crunchbase data using Gemini 3 Flash.
     """
-    from supabase import create_client
     import google.generativeai as genai
 
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     gemini_api_key = os.environ["GEMINI_API_KEY"]
     genai.configure(api_key=gemini_api_key)
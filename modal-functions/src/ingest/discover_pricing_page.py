@@ -21,7 +21,7 @@ Returns:
 
 import os
 import modal
-from config import app, image
+from config import app, image, get_supabase
 
 
 @app.function(
@@ -37,14 +37,11 @@ def discover_pricing_page_url(request: dict) -> dict:
     import requests
     from bs4 import BeautifulSoup
     import google.generativeai as genai
-    from supabase import create_client
     import re
 
     # Setup clients
     genai.configure(api_key=os.environ["GEMINI_API_KEY"])
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         domain = request.get("domain", "").lower().strip()
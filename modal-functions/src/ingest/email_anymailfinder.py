@@ -8,12 +8,11 @@ Provider: AnyMailFinder
 Entity Type: Person (email)
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 from extraction.email_anymailfinder import extract_email_anymailfinder
 
 
@@ -49,11 +48,7 @@ def ingest_email_anymailfinder(request: AnyMailFinderRequest) -> dict:
     - reference.email_structure_by_domain (email patterns)
     - reference.email_to_person (email -> linkedin mapping)
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Look up workflow in registry
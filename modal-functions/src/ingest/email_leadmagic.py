@@ -8,12 +8,11 @@ Provider: LeadMagic
 Entity Type: Person (email)
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 from extraction.email_leadmagic import extract_email_leadmagic
 
 
@@ -47,11 +46,7 @@ def ingest_email_leadmagic(request: LeadMagicRequest) -> dict:
     Stores raw payload, extracts to extracted.email_leadmagic,
     and updates reference.email_to_person.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Look up workflow in registry
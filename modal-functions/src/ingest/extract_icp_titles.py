@@ -13,7 +13,7 @@ from typing import Any, Optional
 import modal
 from pydantic import BaseModel, Field, field_validator
 
-from config import app, image
+from config import app, image, get_supabase
 
 HAIKU_MODEL = "claude-haiku-4-5-20251001"
 INPUT_COST_PER_MTOK = 0.80
@@ -164,7 +164,6 @@ def _persist_normalized(
 @modal.fastapi_endpoint(method="POST", label="extract-icp-titles")
 def extract_icp_titles(request: ExtractICPTitlesRequest) -> dict:
     import anthropic
-    from supabase import create_client
 
     parsed_input = _parse_raw_output(request.raw_parallel_output)
     parsed_input["company_domain"] = request.company_domain
@@ -207,7 +206,7 @@ def extract_icp_titles(request: ExtractICPTitlesRequest) -> dict:
     company_domain = result.get("company_domain", request.company_domain)
     company_name = result.get("company_name")
 
-    supabase = create_client(os.environ["SUPABASE_URL"], os.environ["SUPABASE_SERVICE_KEY"])
+    supabase = get_supabase()
     normalized_id = _persist_normalized(
         supabase=supabase,
         company_domain=company_domain,
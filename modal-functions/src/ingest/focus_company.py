@@ -5,9 +5,8 @@ Receives a company domain (and optional name) from Clay
 and upserts it into public.focus_companies.
 """
 
-import os
 import modal
-from config import app, image
+from config import app, image, get_supabase
 
 
 @app.function(
@@ -16,11 +15,7 @@ from config import app, image
 )
 @modal.fastapi_endpoint(method="POST")
 def ingest_focus_company(request: dict) -> dict:
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     domain = (request.get("domain") or "").lower().strip().rstrip("/")
     if not domain:
@@ -27,10 +27,9 @@ Returns:
 }
 """
 
-import os
 import re
 import modal
-from config import app, image
+from config import app, image, get_supabase
 
 
 def extract_g2_product_slug(g2_url: str) -> str:
@@ -119,11 +118,7 @@ def normalize_domain(domain: str) -> str:
 )
 @modal.fastapi_endpoint(method="POST")
 def ingest_g2_page_scrape_zenrows(request: dict) -> dict:
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         domain = normalize_domain(request.get("domain", ""))
@@ -5,12 +5,11 @@ Simple endpoint that checks if a company has raised VC funding.
 Looks up the company domain in extracted.vc_portfolio.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class HasRaisedVCRequest(BaseModel):
@@ -27,11 +26,7 @@ def has_raised_vc(request: HasRaisedVCRequest) -> dict:
     Check if a company has raised VC funding.
     Returns has_raised_vc boolean and VC details if found.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Normalize domain (lowercase, strip whitespace)
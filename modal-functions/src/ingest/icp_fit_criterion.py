@@ -4,11 +4,10 @@ ICP Fit Criterion Ingest Endpoint
 Ingests primary fit criterion for a company.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
-from config import app, image
+from config import app, image, get_supabase
 
 
 class ICPFitCriterionRequest(BaseModel):
@@ -38,12 +37,9 @@ def ingest_icp_fit_criterion(request: ICPFitCriterionRequest) -> dict:
     2. Extracts fit criterion fields
     3. Stores extracted data
     """
-    from supabase import create_client
     from extraction.icp_fit_criterion import extract_icp_fit_criterion
 
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Store raw payload
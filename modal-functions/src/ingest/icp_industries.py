@@ -8,7 +8,7 @@ import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
-from config import app, image
+from config import app, image, get_supabase
 
 
 class ICPIndustriesRequest(BaseModel):
@@ -38,13 +38,10 @@ def ingest_icp_industries(request: ICPIndustriesRequest) -> dict:
     2. Extracts industries and matches to canonical industries using GPT
     3. Stores extracted/matched data
     """
-    from supabase import create_client
     from extraction.icp_industries import extract_and_match_icp_industries
 
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
     openai_api_key = os.environ["OPENAI_API_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Store raw payload
@@ -4,11 +4,10 @@ ICP Job Titles Ingest Endpoint
 Ingests target ICP job titles for a company, normalizes camelCase to human-readable format.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
-from config import app, image
+from config import app, image, get_supabase
 
 
 class ICPJobTitlesRequest(BaseModel):
@@ -38,12 +37,9 @@ def ingest_icp_job_titles(request: ICPJobTitlesRequest) -> dict:
     2. Extracts and normalizes job titles (camelCase -> human-readable)
     3. Stores extracted data
     """
-    from supabase import create_client
     from extraction.icp_job_titles import extract_icp_job_titles
 
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Store raw payload
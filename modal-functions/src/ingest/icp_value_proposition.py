@@ -4,11 +4,10 @@ ICP Value Proposition Ingest Endpoint
 Ingests core value proposition for a company.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
-from config import app, image
+from config import app, image, get_supabase
 
 
 class ICPValuePropositionRequest(BaseModel):
@@ -38,12 +37,9 @@ def ingest_icp_value_proposition(request: ICPValuePropositionRequest) -> dict:
     2. Extracts value proposition fields
     3. Stores extracted data
     """
-    from supabase import create_client
     from extraction.icp_value_proposition import extract_icp_value_proposition
 
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Store raw payload
@@ -5,12 +5,11 @@ Modal endpoint for receiving ICP verdict payloads from Clay.
 Stores raw payload, then extracts normalized data.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class ICPVerdictRequest(BaseModel):
@@ -41,12 +40,9 @@ def ingest_icp_verdict(request: ICPVerdictRequest) -> dict:
     1. Stores raw payload in raw.icp_verdict_payloads
     2. Calls extraction to normalize into extracted.icp_verdict
     """
-    from supabase import create_client
     from extraction.icp_verdict import extract_icp_verdict
 
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Build the payload from all verdict-related fields
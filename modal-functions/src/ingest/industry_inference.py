@@ -10,7 +10,7 @@ import modal
 from pydantic import BaseModel
 from typing import Optional, List
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class IndustryInferenceRequest(BaseModel):
@@ -32,13 +32,10 @@ def infer_company_industry(request: IndustryInferenceRequest) -> dict:
     Infer company industry using Gemini, then match against reference industries.
     """
     import google.generativeai as genai
-    from supabase import create_client
 
     # Setup clients
     genai.configure(api_key=os.environ["GEMINI_API_KEY"])
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Build prompt for Gemini
@@ -19,9 +19,8 @@ Returns:
 }
 """
 
-import os
 import modal
-from config import app, image
+from config import app, image, get_supabase
 
 
 @app.function(
@@ -33,11 +32,7 @@ from config import app, image
 )
 @modal.fastapi_endpoint(method="POST")
 def ingest_company_description(request: dict) -> dict:
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         domain = request.get("domain", "").strip().lower()
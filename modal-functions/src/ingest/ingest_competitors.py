@@ -15,10 +15,9 @@ Expects:
 }
 """
 
-import os
 import re
 import modal
-from config import app, image
+from config import app, image, get_supabase
 
 
 def normalize_domain(domain: str) -> str:
@@ -41,11 +40,7 @@ def normalize_domain(domain: str) -> str:
 )
 @modal.fastapi_endpoint(method="POST")
 def ingest_competitors(request: dict) -> dict:
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         origin_domain = normalize_domain(request.get("domain", ""))
@@ -25,9 +25,8 @@ Returns:
 }
 """
 
-import os
 import modal
-from config import app, image
+from config import app, image, get_supabase
 
 
 @app.function(
@@ -39,11 +38,7 @@ from config import app, image
 )
 @modal.fastapi_endpoint(method="POST")
 def ingest_orphan_customer_domain(request: dict) -> dict:
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         customer_company_name = request.get("customer_company_name", "").strip()
@@ -4,11 +4,10 @@ Job Title Parsed Ingest
 Stores raw job title -> cleaned job title mappings in the canonical reference table.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
-from config import app, image
+from config import app, image, get_supabase
 
 
 class JobTitleParsedRequest(BaseModel):
@@ -28,11 +27,7 @@ def ingest_job_title_parsed(request: JobTitleParsedRequest) -> dict:
     """
     Upsert a job title mapping to reference.job_title_parsed.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         data = {
@@ -4,12 +4,11 @@ LeadMagic Company Enrichment Ingestion Endpoint
 Ingests company enrichment data from LeadMagic.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional, Any
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class LeadMagicCompanyRequest(BaseModel):
@@ -39,11 +38,7 @@ def ingest_leadmagic_company(request: LeadMagicCompanyRequest) -> dict:
     Ingest LeadMagic company enrichment data.
     Stores raw payload, then extracts key fields.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Store raw payload
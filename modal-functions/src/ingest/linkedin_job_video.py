@@ -10,7 +10,7 @@ import os
 import modal
 from fastapi import UploadFile, File, Form
 from typing import Optional
-from config import app, image
+from config import app, image, get_supabase
 
 
 @app.function(
@@ -44,7 +44,6 @@ async def ingest_linkedin_job_video(
     Returns:
         Success response with raw_video_id and job count
     """
-    from supabase import create_client
     from openai import OpenAI
     from extraction.linkedin_job_video import (
         extract_frames_from_video,
@@ -52,9 +51,7 @@ async def ingest_linkedin_job_video(
         deduplicate_jobs,
     )
 
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     openai_api_key = os.environ["OPENAI_API_KEY"]
     openai_client = OpenAI(api_key=openai_api_key)
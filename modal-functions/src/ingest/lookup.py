@@ -9,12 +9,11 @@ Lookup Endpoints - query reference tables without storage/AI
 - ingest_clay_person_location_lookup: Insert location into clay_find_people_location_lookup
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class PersonLocationLookupRequest(BaseModel):
@@ -31,11 +30,7 @@ def lookup_person_location(request: PersonLocationLookupRequest) -> dict:
     Check if location_name exists in reference.location_lookup (Clay find-people).
     Returns match_status=True with city/state/country if found, False otherwise.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         result = (
@@ -99,11 +94,7 @@ def lookup_salesnav_location(request: LocationLookupRequest) -> dict:
     Check if location_raw exists in reference.salesnav_location_lookup.
     Returns match_status=True with city/state/country if found, False otherwise.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         result = (
@@ -156,11 +147,7 @@ def lookup_salesnav_company_location(request: CompanyLocationLookupRequest) -> d
     Check if registered_address_raw exists in reference.salesnav_company_location_lookup.
     Returns match_status=True with city/state/country if found, False otherwise.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         result = (
@@ -213,11 +200,7 @@ def lookup_job_title(request: JobTitleLookupRequest) -> dict:
     Check if job_title exists in reference.job_title_lookup.
     Returns match_status=True with cleaned_job_title/seniority_level/job_function if found.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         result = (
@@ -269,11 +252,7 @@ def ingest_clay_company_location_lookup(request: ClayCompanyLocationIngestReques
     """
     Insert/upsert location into reference.clay_find_companies_location_lookup.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         result = (
@@ -319,11 +298,7 @@ def ingest_clay_person_location_lookup(request: ClayPersonLocationIngestRequest)
     """
     Insert/upsert location into reference.clay_find_people_location_lookup.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         result = (
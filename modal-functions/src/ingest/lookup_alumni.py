@@ -5,10 +5,9 @@ Returns people who used to work at a given company, including their current
 employer details and past job title.
 """
 
-import os
 import modal
 from pydantic import BaseModel
-from config import app, image
+from config import app, image, get_supabase
 
 # Batch size for IN queries to avoid URL length limits
 BATCH_SIZE = 100
@@ -44,11 +43,7 @@ def lookup_alumni(request: AlumniLookupRequest) -> dict:
     Lookup alumni (former employees) of a company by domain.
     Returns people who previously worked at the company with their current job info.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # 1. Get alumni from person_past_employer
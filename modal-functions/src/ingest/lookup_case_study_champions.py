@@ -4,11 +4,10 @@ Case Study Champions Lookup Endpoint
 Returns champions (buyers/users featured in case studies) for a given vendor domain.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
-from config import app, image
+from config import app, image, get_supabase
 
 
 class ChampionsLookupRequest(BaseModel):
@@ -26,11 +25,7 @@ def lookup_case_study_champions(request: ChampionsLookupRequest) -> dict:
     Lookup case study champions by vendor domain.
     Returns champions featured in the vendor's case studies.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Get champions for this vendor
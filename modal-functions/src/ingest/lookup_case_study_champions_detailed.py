@@ -4,11 +4,10 @@ Case Study Champions Detailed Lookup Endpoint
 Returns champions with testimonials for a given vendor domain.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
-from config import app, image
+from config import app, image, pg_connection
 
 
 class ChampionsDetailedLookupRequest(BaseModel):
@@ -29,49 +28,44 @@ def lookup_champions_detailed(request: ChampionsDetailedLookupRequest) -> dict:
     Lookup case study champions with testimonials by vendor domain.
     Joins core.case_study_champions with extracted.parallel_case_study_champions for testimonials.
     """
-    import psycopg2
-
     try:
-        conn = psycopg2.connect(DATABASE_URL)
-        cur = conn.cursor()
-
-        # Query champions with testimonials
-        query = """
-            SELECT
-                csc.full_name,
-                csc.job_title,
-                csc.company_name,
-                csc.company_domain,
-                csc.case_study_url,
-                csc.source,
-                pcc.testimonial,
-                cf.linkedin_url as company_linkedin_url
-            FROM core.case_study_champions csc
-            LEFT JOIN extracted.parallel_case_study_champions pcc
-                ON LOWER(TRIM(csc.full_name)) = LOWER(TRIM(pcc.full_name))
-                AND csc.company_domain = pcc.customer_company_domain
-            LEFT JOIN core.companies_full cf
-                ON csc.company_domain = cf.domain
-            WHERE csc.origin_company_domain = %s
-        """
-        cur.execute(query, (request.domain,))
-        rows = cur.fetchall()
+        with pg_connection(DATABASE_URL) as conn:
+            cur = conn.cursor()
 
-        champions = []
-        for row in rows:
-            champions.append({
-                "full_name": row[0],
-                "job_title": row[1],
-                "company_name": row[2],
-                "company_domain": row[3],
-                "case_study_url": row[4],
-                "source": row[5],
-                "testimonial": row[6],
-                "company_linkedin_url": row[7],
-            })
+            # Query champions with testimonials
+            query = """
+                SELECT
+                    csc.full_name,
+                    csc.job_title,
+                    csc.company_name,
+                    csc.company_domain,
+                    csc.case_study_url,
+                    csc.source,
+                    pcc.testimonial,
+                    cf.linkedin_url as company_linkedin_url
+                FROM core.case_study_champions csc
+                LEFT JOIN extracted.parallel_case_study_champions pcc
+                    ON LOWER(TRIM(csc.full_name)) = LOWER(TRIM(pcc.full_name))
+                    AND csc.company_domain = pcc.customer_company_domain
+                LEFT JOIN core.companies_full cf
+                    ON csc.company_domain = cf.domain
+                WHERE csc.origin_company_domain = %s
+            """
+            cur.execute(query, (request.domain,))
+            rows = cur.fetchall()
 
-        cur.close()
-        conn.close()
+            champions = []
+            for row in rows:
+                champions.append({
+                    "full_name": row[0],
+                    "job_title": row[1],
+                    "company_name": row[2],
+                    "company_domain": row[3],
+                    "case_study_url": row[4],
+                    "source": row[5],
+                    "testimonial": row[6],
+                    "company_linkedin_url": row[7],
+                })
 
         return {
             "success": True,
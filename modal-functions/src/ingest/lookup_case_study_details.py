@@ -4,10 +4,9 @@ Case Study Details Lookup Endpoint
 Check if a case study URL has already been extracted.
 """
 
-import os
 import modal
 from pydantic import BaseModel
-from config import app, image
+from config import app, image, get_supabase
 
 
 class CaseStudyDetailsLookupRequest(BaseModel):
@@ -20,11 +19,7 @@ class CaseStudyDetailsLookupRequest(BaseModel):
 )
 @modal.fastapi_endpoint(method="POST")
 def lookup_case_study_details(request: CaseStudyDetailsLookupRequest) -> dict:
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         result = (
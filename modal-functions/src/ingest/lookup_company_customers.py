@@ -5,10 +5,9 @@ Returns customer companies for a given domain, including customer LinkedIn URLs.
 v2 - Uses core.companies_full for LinkedIn URLs.
 """
 
-import os
 import modal
 from pydantic import BaseModel
-from config import app, image
+from config import app, image, get_supabase
 
 
 class CompanyCustomersLookupRequest(BaseModel):
@@ -26,11 +25,7 @@ def lookup_company_customers(request: CompanyCustomersLookupRequest) -> dict:
     Lookup customer companies by domain.
     Includes customer LinkedIn URL if available.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Get customers
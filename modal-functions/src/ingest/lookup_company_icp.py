@@ -5,10 +5,9 @@ Returns company ICP criteria for filtering leads.
 Reads from core.icp_criteria first, falls back to extracted tables.
 """
 
-import os
 import modal
 from pydantic import BaseModel
-from config import app, image
+from config import app, image, get_supabase
 
 
 class CompanyICPLookupRequest(BaseModel):
@@ -26,11 +25,7 @@ def lookup_company_icp(request: CompanyICPLookupRequest) -> dict:
     Lookup company ICP data by domain.
     Checks core.icp_criteria first, falls back to extracted tables.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Try core.icp_criteria first (unified table)
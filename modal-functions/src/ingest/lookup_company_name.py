@@ -4,10 +4,9 @@ Company Name Lookup Endpoint
 Returns company name for a given domain.
 """
 
-import os
 import modal
 from pydantic import BaseModel
-from config import app, image
+from config import app, image, get_supabase
 
 
 class CompanyNameLookupRequest(BaseModel):
@@ -24,11 +23,7 @@ def lookup_company_name(request: CompanyNameLookupRequest) -> dict:
     """
     Lookup company name by domain.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         result = (
@@ -4,12 +4,11 @@ Nostra Ecom Companies Ingestion Endpoint
 Ingests company data from old Nostra ecom companies list.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class NostraEcomCompanyRequest(BaseModel):
@@ -40,11 +39,7 @@ def ingest_nostra_ecom_company(request: NostraEcomCompanyRequest) -> dict:
     Ingest Nostra ecom company data.
     Stores raw payload, then extracts to nostra_ecom_companies.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Build raw payload
@@ -4,12 +4,11 @@ Nostra Ecom People Ingestion Endpoint
 Ingests people data from old Nostra ecom companies list.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class NostraEcomPersonRequest(BaseModel):
@@ -40,11 +39,7 @@ def ingest_nostra_ecom_person(request: NostraEcomPersonRequest) -> dict:
     Ingest Nostra ecom person data.
     Stores raw payload, then extracts to nostra_ecom_people.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Build raw payload
@@ -12,7 +12,7 @@ import modal
 import requests
 from pydantic import BaseModel, Field, field_validator
 
-from config import app, image
+from config import app, image, get_supabase
 
 PRO_COST_PER_RUN = 0.10
 PARALLEL_BASE_URL = "https://api.parallel.ai/v1"
@@ -458,10 +458,9 @@ def _submit_run_and_insert_raw(
     timeout=3600,
 )
 def _parallel_icp_job_titles_background(request_payload: dict) -> dict:
-    from supabase import create_client
 
     request = ParallelICPJobTitlesRequest(**request_payload)
-    supabase = create_client(os.environ["SUPABASE_URL"], os.environ["SUPABASE_SERVICE_KEY"])
+    supabase = get_supabase()
     api_key = os.environ.get("PARALLEL_API_KEY")
     if not api_key:
         raise ValueError("PARALLEL_API_KEY not found in environment")
@@ -520,9 +519,7 @@ def _parallel_icp_job_titles_background(request_payload: dict) -> dict:
 )
 @modal.fastapi_endpoint(method="POST", label="icp-titles-start")
 def parallel_icp_job_titles_start(request: ParallelICPJobTitlesRequest) -> dict:
-    from supabase import create_client
-
-    supabase = create_client(os.environ["SUPABASE_URL"], os.environ["SUPABASE_SERVICE_KEY"])
+    supabase = get_supabase()
     api_key = os.environ.get("PARALLEL_API_KEY")
     if not api_key:
         raise ValueError("PARALLEL_API_KEY not found in environment")
@@ -565,9 +562,7 @@ def parallel_icp_job_titles_start(request: ParallelICPJobTitlesRequest) -> dict:
 )
 @modal.fastapi_endpoint(method="POST", label="icp-titles-finalize")
 def parallel_icp_job_titles_finalize(request: ParallelICPJobTitlesFinalizeRequest) -> dict:
-    from supabase import create_client
-
-    supabase = create_client(os.environ["SUPABASE_URL"], os.environ["SUPABASE_SERVICE_KEY"])
+    supabase = get_supabase()
     api_key = os.environ.get("PARALLEL_API_KEY")
     if not api_key:
         raise ValueError("PARALLEL_API_KEY not found in environment")
@@ -686,9 +681,7 @@ def parallel_icp_job_titles_trigger(request: ParallelICPJobTitlesTriggerRequest)
     Trigger.dev-oriented blocking endpoint.
     Submits to Parallel, waits for completion, and persists raw + extracted rows.
     """
-    from supabase import create_client
-
-    supabase = create_client(os.environ["SUPABASE_URL"], os.environ["SUPABASE_SERVICE_KEY"])
+    supabase = get_supabase()
     api_key = os.environ.get("PARALLEL_API_KEY")
     if not api_key:
         raise ValueError("PARALLEL_API_KEY not found in environment")
@@ -12,7 +12,7 @@ Writes results directly to core.company_parallel_* tables.
 import os
 import time
 import modal
-from config import app, image
+from config import app, image, get_supabase
 
 
 def call_parallel_task_api(input_data: dict, task_spec: dict, timeout_seconds: int = 120) -> dict:
@@ -88,13 +88,8 @@ def call_parallel_task_api(input_data: dict, task_spec: dict, timeout_seconds: i
 
 
 def get_db_connection():
-    """Get Supabase connection."""
-    from supabase import create_client
-    url = os.environ.get("SUPABASE_URL")
-    key = os.environ.get("SUPABASE_SERVICE_KEY")
-    if not url or not key:
-        raise ValueError("SUPABASE_URL and SUPABASE_SERVICE_KEY required")
-    return create_client(url, key)
+    """Get the container's shared Supabase client."""
+    return get_supabase()
 
 
 # =============================================================================
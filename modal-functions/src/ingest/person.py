@@ -7,12 +7,11 @@ Person Ingestion Endpoints
 - ingest_ppl_title_enrich: Person data with title enrichment (seniority, job function)
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 from extraction.person import (
     extract_person_profile,
     extract_person_experience,
@@ -93,11 +92,7 @@ def ingest_clay_person_profile(request: PersonIngestRequest) -> dict:
     Ingest enriched person payload (clay-person-profile workflow).
     Stores raw payload, then extracts to person_profile, person_experience, person_education.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Look up workflow in registry
@@ -199,11 +194,7 @@ def ingest_clay_find_people(request: PersonDiscoveryRequest) -> dict:
     Ingest person discovery payload (clay-find-people workflow).
     Stores raw payload, then extracts to person_discovery table.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Look up workflow in registry
@@ -288,11 +279,7 @@ def ingest_clay_find_ppl_lctn_prsd(request: PersonDiscoveryLocationParsedRequest
     Location parsing done in Clay via Gemini before sending to this endpoint.
     Stores raw payload + parsed location, then extracts to person_discovery_location_parsed table.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Look up workflow in registry
@@ -357,11 +344,7 @@ def ingest_ppl_title_enrich(request: PersonTitleEnrichmentRequest) -> dict:
     Ingest person data with title enrichment (seniority_level, job_function, cleaned_job_title).
     Stores raw payload, then extracts to person_title_enrichment table.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Build raw payload from request
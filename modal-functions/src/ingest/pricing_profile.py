@@ -0,0 +1,131 @@
+"""
+Pricing Profile Inference
+
+Uses a single Gemini call to classify every pricing attribute of a company's
+pricing page (free trial, pricing model, sales motion, billing default, ...)
+instead of one call per attribute. Writes the same raw/extracted/core tables
+as the per-attribute infer_* endpoints.
+
+Expects:
+{
+  "company_name": "Example Inc",
+  "domain": "example.com",
+  "pricing_page_url": "https://example.com/pricing",
+  "attributes": ["free_trial", "pricing_model"],   (optional, default all)
+  "persist": true                                  (optional, default true)
+}
+
+Returns:
+{
+  "success": true,
+  "domain": "example.com",
+  "parse_failed": false,   (true: Gemini's answer wasn't JSON, every attribute stored at its default)
+  "attributes": {
+    "free_trial": {"value": "yes", "explanation": "...", "raw_payload_id": "..."},
+    "sales_motion": {"value": "hybrid", "contact_sales_cta": "yes", "explanation": "...", "raw_payload_id": "..."},
+    ...
+  }
+}
+"""
+
+import os
+import time
+import modal
+from config import app, image, get_supabase
+from extraction.pricing_page_cache import get_pricing_page, PricingPageFetchError
+from extraction.pricing_profile import (
+    PRICING_ATTRIBUTES, build_prompt, parse_response, default_profile, store_pricing_profile,
+)
+
+
+@app.function(
+    image=image,
+    timeout=120,
+    secrets=[
+        modal.Secret.from_name("supabase-credentials"),
+        modal.Secret.from_name("gemini-secret"),
+    ],
+)
+@modal.fastapi_endpoint(method="POST")
+def infer_pricing_profile(request: dict) -> dict:
+    import json
+    import google.generativeai as genai
+
+    # Setup clients
+    genai.configure(api_key=os.environ["GEMINI_API_KEY"])
+    supabase = get_supabase()
+
+    try:
+        domain = request.get("domain", "").lower().strip()
+        pricing_page_url = request.get("pricing_page_url", "").strip()
+        company_name = request.get("company_name", "")
+        attributes = request.get("attributes") or list(PRICING_ATTRIBUTES)
+        persist = request.get("persist", True)
+
+        if not domain:
+            return {"success": False, "error": "No domain provided"}
+
+        if not pricing_page_url:
+            return {"success": False, "error": "No pricing_page_url provided"}
+
+        unknown = [a for a in attributes if a not in PRICING_ATTRIBUTES]
+        if unknown:
+            return {"success": False, "error": f"Unknown attributes: {', '.join(unknown)}", "domain": domain}
+
+        # 1. Fetch pricing page content (shared cache)
+        started = time.perf_counter()
+        try:
+            page = get_pricing_page(supabase, pricing_page_url)
+        except PricingPageFetchError as e:
+            return {"success": False, "error": str(e), "domain": domain}
+        page_ms = round((time.perf_counter() - started) * 1000)
+
+        # Truncate to avoid token limits
+        page_text = page.text[:8000]
+
+        # 2. One Gemini call for every attribute
+        company_context = f"Company: {company_name}" if company_name else f"Domain: {domain}"
+        prompt = build_prompt(company_context, pricing_page_url, page_text, attributes)
+
+        started = time.perf_counter()
+        model = genai.GenerativeModel("gemini-3-flash-preview")
+        gemini_response = model.generate_content(
+            prompt,
+            generation_config={"response_mime_type": "application/json"},
+        )
+        llm_ms = round((time.perf_counter() - started) * 1000)
+
+        # An unparseable response stores each attribute's default, like the
+        # per-attribute endpoints
+        parse_failed = False
+        try:
+            profile = parse_response(gemini_response.text, attributes)
+        except json.JSONDecodeError:
+            profile = default_profile(gemini_response.text.strip(), attributes)
+            parse_failed = True
+
+        # 3. Write each attribute to its raw/extracted/core tables
+        write_errors = []
+        if persist:
+            write_errors = store_pricing_profile(
+                supabase, profile, domain, pricing_page_url, company_name, request
+            )
+
+        return {
+            "success": True,
+            "domain": domain,
+            "pricing_page_url": pricing_page_url,
+            "page_from_cache": page.from_cache,
+            "page_ms": page_ms,
+            "llm_ms": llm_ms,
+            "parse_failed": parse_failed,
+            "attributes": profile,
+            "write_errors": write_errors,
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "domain": request.get("domain", "unknown"),
+        }
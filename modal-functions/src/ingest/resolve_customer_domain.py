@@ -11,7 +11,7 @@ import json
 import modal
 from pydantic import BaseModel
 from typing import Optional
-from config import app, image
+from config import app, image, get_supabase
 
 
 class ResolveCustomerDomainRequest(BaseModel):
@@ -56,12 +56,9 @@ Return ONLY valid JSON:
 )
 @modal.fastapi_endpoint(method="POST")
 def resolve_customer_domain(request: ResolveCustomerDomainRequest) -> dict:
-    from supabase import create_client
     import google.generativeai as genai
 
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     gemini_api_key = os.environ["GEMINI_API_KEY"]
     genai.configure(api_key=gemini_api_key)
@@ -29,7 +29,7 @@ Returns:
 import os
 import json
 import modal
-from config import app, image
+from config import app, image, get_supabase
 
 
 PROMPT_TEMPLATE = """You are a B2B company identification expert. Find the website domain for a company given its name and business context.
@@ -74,14 +74,11 @@ PROMPT_TEMPLATE = """You are a B2B company identification expert. Find the websi
 )
 @modal.fastapi_endpoint(method="POST")
 def resolve_orphan_customer_domain(request: dict) -> dict:
-    from supabase import create_client
     import google.generativeai as genai
 
     genai.configure(api_key=os.environ["GEMINI_API_KEY"])
 
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         customer_company_name = request.get("customer_company_name", "").strip()
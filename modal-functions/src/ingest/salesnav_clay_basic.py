@@ -20,11 +20,10 @@ Note: SalesNav LinkedIn URLs are hashed/sales-specific, NOT real profile URLs.
 We store them with linkedin_url_type = 'salesnav'.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class SalesNavClayBasicRequest(BaseModel):
@@ -42,7 +41,6 @@ def ingest_salesnav_clay_basic(request: SalesNavClayBasicRequest) -> dict:
     Ingest SalesNav person data from Clay webhook.
     No past employer tracking - just current employer data.
     """
-    from supabase import create_client
     from extraction.salesnav_clay import (
         extract_salesnav_clay_person,
         extract_salesnav_clay_company,
@@ -51,9 +49,7 @@ def ingest_salesnav_clay_basic(request: SalesNavClayBasicRequest) -> dict:
         parse_job_start_date,
     )
 
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     result = {
         "success": False,
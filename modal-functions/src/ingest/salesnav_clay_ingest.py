@@ -20,12 +20,11 @@ Note: SalesNav LinkedIn URLs are hashed/sales-specific, NOT real profile URLs.
 We store them with linkedin_url_type = 'salesnav'.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class SalesNavClayRequest(BaseModel):
@@ -43,7 +42,6 @@ def ingest_salesnav_clay(request: SalesNavClayRequest) -> dict:
     """
     Ingest SalesNav person data from Clay webhook.
     """
-    from supabase import create_client
     from extraction.salesnav_clay import (
         extract_salesnav_clay_person,
         extract_salesnav_clay_company,
@@ -52,9 +50,7 @@ def ingest_salesnav_clay(request: SalesNavClayRequest) -> dict:
         parse_job_start_date,
     )
 
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     result = {
         "success": False,
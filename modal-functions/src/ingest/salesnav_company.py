@@ -4,12 +4,11 @@ SalesNav Company Ingestion Endpoint
 Ingests company data from SalesNav scrapes.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class SalesNavCompanyRequest(BaseModel):
@@ -52,11 +51,7 @@ def ingest_salesnav_company(request: SalesNavCompanyRequest) -> dict:
     Ingest SalesNav company data.
     Stores raw payload, then extracts to salesnav_scrapes_companies.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Build raw payload from request
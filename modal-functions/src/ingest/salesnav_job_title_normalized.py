@@ -4,10 +4,9 @@ SalesNav Job Title Normalized Ingest
 Stores raw job title -> normalized (SalesNav-friendly) job title mappings.
 """
 
-import os
 import modal
 from pydantic import BaseModel
-from config import app, image
+from config import app, image, get_supabase
 
 
 class SalesnavJobTitleNormalizedRequest(BaseModel):
@@ -24,11 +23,7 @@ def ingest_salesnav_job_title_normalized(request: SalesnavJobTitleNormalizedRequ
     """
     Upsert a job title normalization mapping.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         result = (
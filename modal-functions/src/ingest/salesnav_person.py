@@ -5,12 +5,11 @@ Ingests person data from SalesNav scrapes.
 Location is matched against reference.salesnav_location_lookup table.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 from extraction.salesnav_person import extract_salesnav_person
 
 
@@ -73,11 +72,7 @@ def ingest_salesnav_person(request: SalesNavPersonRequest) -> dict:
     Matches location against reference.salesnav_location_lookup.
     Stores raw payload, then extracts to salesnav_scrapes_person.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Build raw payload
@@ -8,11 +8,10 @@ Populates:
 - core.person_past_employer (past jobs for alumni lookup)
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional, List
-from config import app, image
+from config import app, image, get_supabase
 
 
 class WorkHistoryEntry(BaseModel):
@@ -69,11 +68,7 @@ def ingest_salesnav_person_full(request: SalesNavPersonFullRequest) -> dict:
     2. Upserts work history to core.person_work_history
     3. Inserts past employers to core.person_past_employer (for alumni lookup)
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         linkedin_url = normalize_null(request.linkedin_url)
@@ -15,10 +15,9 @@ Returns filtered filings:
 - Document URLs for each filing
 """
 
-import os
 import modal
 import httpx
-from config import app, image
+from config import app, image, get_supabase
 from typing import Optional
 
 # SEC Submissions API
@@ -163,11 +162,7 @@ def fetch_sec_filings(request: dict) -> dict:
     - Latest 10-K (annual report)
     - Recent 8-Ks with executive changes, earnings, material contracts
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         domain = request.get("domain", "").lower().strip()
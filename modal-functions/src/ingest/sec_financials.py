@@ -11,10 +11,9 @@ Expects:
 Looks up CIK from existing ticker data, fetches financials, stores raw + extracted.
 """
 
-import os
 import modal
 import httpx
-from config import app, image
+from config import app, image, get_supabase
 from datetime import datetime
 
 # SEC CompanyFacts API - returns structured XBRL data
@@ -127,11 +126,7 @@ def extract_financial_metrics(facts: dict) -> list:
 )
 @modal.fastapi_endpoint(method="POST")
 def ingest_sec_financials(request: dict) -> dict:
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         domain = request.get("domain", "").lower().strip()
@@ -6,11 +6,10 @@ and sends them to a Clay webhook at 10 records/second.
 Marks each row as sent_to_clay after successful send.
 """
 
-import os
 import time
 import modal
 import requests
-from config import app, image
+from config import app, image, get_supabase
 
 
 @app.function(
@@ -20,11 +19,7 @@ from config import app, image
 )
 @modal.fastapi_endpoint(method="POST")
 def send_case_study_urls_to_clay(request: dict) -> dict:
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     webhook_url = request.get("webhook_url")
     batch_id = request.get("batch_id")
@@ -7,11 +7,10 @@ and sends each to two Clay webhooks at ~10 records/second:
   2. Companies table — company_name, domain, company_linkedin_url (deduplicated)
 """
 
-import os
 import time
 import modal
 import requests
-from config import app, image
+from config import app, image, get_supabase
 
 
 CLAY_PEOPLE_WEBHOOK_URL = "https://api.clay.com/v3/sources/webhook/pull-in-data-from-a-webhook-c457c170-b2bf-4e66-83f5-83eda8f27092"
@@ -25,11 +24,7 @@ CLAY_COMPANIES_WEBHOOK_URL = "https://api.clay.com/v3/sources/webhook/pull-in-da
 )
 @modal.fastapi_endpoint(method="POST")
 def send_client_leads_to_clay(request: dict) -> dict:
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     client_domain = (request.get("client_domain") or "").lower().strip()
     if not client_domain:
@@ -5,11 +5,10 @@ Reads company customers with no domain and no case study URL
 from core.company_customers and sends them to a Clay webhook at 10 records/second.
 """
 
-import os
 import time
 import modal
 import requests
-from config import app, image
+from config import app, image, get_supabase
 
 
 @app.function(
@@ -19,11 +18,7 @@ from config import app, image
 )
 @modal.fastapi_endpoint(method="POST")
 def send_unresolved_customers_to_clay(request: dict) -> dict:
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     webhook_url = request.get("webhook_url")
     limit = request.get("limit")
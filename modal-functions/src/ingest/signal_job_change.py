@@ -9,12 +9,11 @@ Required Input: person_linkedin_url
 Output: confidence, previous_company_linkedin_url, new_company_*, start_date_at_new_job
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 from extraction.signal_job_change import extract_job_change_signal
 
 
@@ -53,11 +52,7 @@ def ingest_clay_signal_job_change(request: JobChangeSignalRequest) -> dict:
     Ingest Clay "Job Change" signal payload.
     Stores raw payload, then extracts to extracted.clay_job_change table.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Look up signal in registry
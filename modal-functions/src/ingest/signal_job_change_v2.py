@@ -7,12 +7,11 @@ Detects when a person changes companies.
 Endpoint: POST /ingest-signal-job-change
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 from extraction.signal_job_change_v2 import extract_signal_job_change
 
 
@@ -38,11 +37,7 @@ def ingest_signal_job_change(request: SignalJobChangeRequest) -> dict:
     Ingest job change signal payload.
     Stores raw payload, then extracts to extracted.signal_job_change table.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         raw = request.raw_job_change_payload
@@ -9,12 +9,11 @@ Required Input: company_linkedin_url
 Output: company_name, job_title, location, company_domain, job_linkedin_url, posted_at, etc.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional, Any
 
-from config import app, image
+from config import app, image, get_supabase
 from extraction.signal_job_posting import extract_job_posting_signal
 
 
@@ -47,11 +46,7 @@ def ingest_clay_signal_job_posting(request: JobPostingSignalRequest) -> dict:
     Ingest Clay "Job Posting" signal payload.
     Stores raw payload, then extracts to extracted.clay_job_posting table.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Look up signal in registry
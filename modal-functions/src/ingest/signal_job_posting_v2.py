@@ -7,12 +7,11 @@ Detects new job postings at monitored companies.
 Endpoint: POST /ingest-signal-job-posting
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional, Any
 
-from config import app, image
+from config import app, image, get_supabase
 from extraction.signal_job_posting_v2 import extract_signal_job_posting
 
 
@@ -38,11 +37,7 @@ def ingest_signal_job_posting(request: SignalJobPostingRequest) -> dict:
     Ingest job posting signal payload.
     Stores raw payload, then extracts to extracted.signal_job_posting table.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         raw = request.raw_job_post_data_payload
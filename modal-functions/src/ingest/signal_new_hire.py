@@ -9,12 +9,11 @@ Required Input: company_domain OR company_linkedin_url
 Output: company_name, person_linkedin_url
 """
 
-import os
 import modal
 from pydantic import BaseModel, model_validator
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 from extraction.signal_new_hire import extract_new_hire_signal
 
 
@@ -50,11 +49,7 @@ def ingest_clay_signal_new_hire(request: NewHireSignalRequest) -> dict:
     Ingest Clay "New Hire" signal payload.
     Stores raw payload, then extracts to extracted.clay_new_hire table.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Look up signal in registry
@@ -9,12 +9,11 @@ Required Input: company_domain
 Output: event, company_record, company_domains, news_url, news_title, publish_date, description
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional, Any
 
-from config import app, image
+from config import app, image, get_supabase
 from extraction.signal_news_fundraising import extract_news_fundraising_signal
 
 
@@ -47,11 +46,7 @@ def ingest_clay_signal_news_fundraising(request: NewsFundraisingSignalRequest) -
     Ingest Clay "News & Fundraising" signal payload.
     Stores raw payload, then extracts to extracted.clay_news_fundraising table.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Look up signal in registry
@@ -9,12 +9,11 @@ Required Input: person_linkedin_url
 Output: confidence, previous_title, new_title, start_date_with_new_title
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 from extraction.signal_promotion import extract_promotion_signal
 
 
@@ -50,11 +49,7 @@ def ingest_clay_signal_promotion(request: PromotionSignalRequest) -> dict:
     Ingest Clay "Promotion" signal payload.
     Stores raw payload, then extracts to extracted.clay_promotion table.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Look up signal in registry
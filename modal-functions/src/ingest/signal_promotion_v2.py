@@ -7,12 +7,11 @@ Detects when a person gets promoted (title change within same company).
 Endpoint: POST /ingest-signal-promotion
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 from extraction.signal_promotion_v2 import extract_signal_promotion
 
 
@@ -37,11 +36,7 @@ def ingest_signal_promotion(request: SignalPromotionRequest) -> dict:
     Ingest promotion signal payload.
     Stores raw payload, then extracts to extracted.signal_promotion table.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         raw = request.raw_promotion_payload
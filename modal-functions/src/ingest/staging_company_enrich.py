@@ -4,12 +4,11 @@ Staging Company Enrich
 Updates company_linkedin_url on staging.companies_to_enrich records.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class StagingCompanyEnrichRequest(BaseModel):
@@ -27,11 +26,7 @@ def update_staging_company_linkedin(request: StagingCompanyEnrichRequest) -> dic
     """
     Update company_linkedin_url for a staging company by domain.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         update_data = {}
@@ -4,11 +4,10 @@ Upsert ICP Criteria Endpoint
 Upserts ICP filter criteria for a company to core.icp_criteria.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
-from config import app, image
+from config import app, image, get_supabase
 
 
 class UpsertICPCriteriaRequest(BaseModel):
@@ -43,11 +42,7 @@ def upsert_icp_criteria(request: UpsertICPCriteriaRequest) -> dict:
     """
     Upsert ICP criteria for a company.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         record = {
@@ -4,9 +4,8 @@ Validate Export Title Endpoint
 Simple endpoint to check if an export_title matches a scrape settings record.
 """
 
-import os
 import modal
-from config import app, image
+from config import app, image, get_supabase
 
 
 @app.function(
@@ -21,11 +20,7 @@ def validate_export_title(payload: dict) -> dict:
     Input: {"export_title": "..."}
     Output: {"matched": true/false, "scrape_settings_id": "...", "koolkit_title": "..."}
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     export_title = payload.get("export_title", "").strip()
     if not export_title:
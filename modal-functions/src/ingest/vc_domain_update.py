@@ -4,11 +4,10 @@ VC Domain Update Endpoint
 Update the domain field for a VC firm by name.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class VCDomainUpdateRequest(BaseModel):
@@ -25,11 +24,7 @@ def update_vc_domain(request: VCDomainUpdateRequest) -> dict:
     """
     Update the domain for a VC firm by matching on name.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         result = (
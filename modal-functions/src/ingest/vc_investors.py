@@ -5,12 +5,11 @@ Ingest endpoint for company VC investor data from Clay.
 Receives a company with up to 12 VC co-investors and explodes them into normalized rows.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 from extraction.vc_investors import extract_company_vc_investors
 
 
@@ -47,11 +46,7 @@ def ingest_company_vc_investors(request: CompanyVCInvestorsRequest) -> dict:
     2. Stores raw payload
     3. Extracts each VC to individual rows
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Look up workflow in registry
@@ -5,12 +5,11 @@ Stores portfolio company data and matches to crunchbase_domain_inference
 to populate linkedin_company_url for companies missing it.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class VCPortfolioRequest(BaseModel):
@@ -44,11 +43,7 @@ def ingest_vc_portfolio(request: VCPortfolioRequest) -> dict:
     3. Attempts to match company_name to crunchbase_domain_inference
     4. If matched, updates linkedin_company_url on crunchbase_domain_inference
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Build raw payload
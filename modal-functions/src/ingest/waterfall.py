@@ -2,7 +2,6 @@
 Email Waterfall Enrichment - Fire-and-forget relay to Clay webhooks
 """
 
-import os
 import asyncio
 from datetime import datetime
 from typing import List
@@ -10,7 +9,7 @@ from typing import List
 from pydantic import BaseModel
 import modal
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class EmailWaterfallRequest(BaseModel):
@@ -28,11 +27,7 @@ def command_center_email_enrichment(request: EmailWaterfallRequest) -> dict:
     Fire-and-forget endpoint to send records to Clay webhook at rate-limited pace.
     Returns immediately with job_id for tracking.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Create job record
@@ -75,11 +70,7 @@ async def process_waterfall_batch(job_id: str, records: List[dict], clay_webhook
     Background worker that sends records to Clay at 8/sec rate limit.
     """
     import httpx
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     # Update job to processing
     supabase.schema("raw").from_("email_waterfall_jobs").update({
@@ -121,11 +112,7 @@ def get_email_job(job_id: str) -> dict:
     """
     Check status of an email waterfall job.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         result = (
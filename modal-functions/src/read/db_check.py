@@ -4,9 +4,8 @@ Read DB Check Endpoint
 Checks if a domain exists in a specific schema and table.
 """
 
-import os
 import modal
-from config import app, image
+from config import app, image, get_supabase
 
 @app.function(
     image=image,
@@ -14,11 +13,7 @@ from config import app, image
 )
 @modal.fastapi_endpoint(method="POST")
 def read_db_check_existence(request: dict) -> dict:
-    from supabase import create_client, Client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    client: Client = create_client(supabase_url, supabase_key)
+    client = get_supabase()
 
     domain = request.get("domain", "").lower().strip()
     schema_name = request.get("schema_name", "").lower().strip()
@@ -5,11 +5,10 @@ Returns leads affiliated with a client domain, joined with
 enriched data from core tables (job title, location, company country, etc.).
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
-from config import app, image
+from config import app, image, get_supabase
 
 
 class LookupClientLeadsRequest(BaseModel):
@@ -24,11 +23,7 @@ class LookupClientLeadsRequest(BaseModel):
 )
 @modal.fastapi_endpoint(method="POST")
 def lookup_client_leads(request: LookupClientLeadsRequest) -> dict:
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Get leads for this client
@@ -4,10 +4,9 @@ Lookup Company Business Model Endpoint
 Returns B2B/B2C classification for a company from core.company_business_model.
 """
 
-import os
 import modal
 from pydantic import BaseModel
-from config import app, image
+from config import app, image, get_supabase
 
 
 class CompanyBusinessModelLookupRequest(BaseModel):
@@ -20,11 +19,7 @@ class CompanyBusinessModelLookupRequest(BaseModel):
 )
 @modal.fastapi_endpoint(method="POST")
 def lookup_company_business_model(request: CompanyBusinessModelLookupRequest) -> dict:
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         result = (
@@ -4,9 +4,8 @@ Lookup Company Canonical
 Returns cleaned_name and linkedin_url for a given domain.
 """
 
-import os
 import modal
-from config import app, image
+from config import app, image, get_supabase
 
 
 @app.function(
@@ -21,11 +20,7 @@ def lookup_company_canonical(request: dict) -> dict:
     Input: {"domain": "datadoghq.com"}
     Output: {"domain": "...", "cleaned_name": "...", "linkedin_url": "..."}
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     domain = request.get("domain", "").lower().strip()
 
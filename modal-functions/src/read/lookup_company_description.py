@@ -4,11 +4,10 @@ Lookup Company Description Endpoint
 Returns description and tagline for a company from core.company_descriptions.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
-from config import app, image
+from config import app, image, get_supabase
 
 
 class CompanyDescriptionLookupRequest(BaseModel):
@@ -21,11 +20,7 @@ class CompanyDescriptionLookupRequest(BaseModel):
 )
 @modal.fastapi_endpoint(method="POST")
 def lookup_company_description(request: CompanyDescriptionLookupRequest) -> dict:
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         result = (
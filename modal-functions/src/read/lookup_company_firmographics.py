@@ -4,10 +4,9 @@ Lookup Company Firmographics Endpoint
 Returns description and industry for a company from extracted.company_firmographics.
 """
 
-import os
 import modal
 from pydantic import BaseModel
-from config import app, image
+from config import app, image, get_supabase
 
 
 class CompanyFirmographicsRequest(BaseModel):
@@ -20,11 +19,7 @@ class CompanyFirmographicsRequest(BaseModel):
 )
 @modal.fastapi_endpoint(method="POST")
 def lookup_company_firmographics(request: CompanyFirmographicsRequest) -> dict:
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     domain = request.domain.lower().strip()
 
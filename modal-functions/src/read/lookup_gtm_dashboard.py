@@ -6,12 +6,11 @@ Returns all data needed for a GTM dashboard for a given seller domain:
 - Alumni leads with firmographics and GTM briefs
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional, List, Any
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class GTMDashboardRequest(BaseModel):
@@ -32,11 +31,7 @@ def lookup_gtm_dashboard(request: GTMDashboardRequest) -> dict:
         - customers: list of company customers
         - alumni_leads: list of alumni leads with firmographics and GTM briefs
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         domain = request.domain.lower().strip()
@@ -7,12 +7,11 @@ worked at a company that was a customer of the seller.
 Returns the past job title, company name, and domain if found.
 """
 
-import os
 import modal
 from pydantic import BaseModel
 from typing import Optional
 
-from config import app, image
+from config import app, image, get_supabase
 
 
 class PastCustomerEmploymentRequest(BaseModel):
@@ -37,11 +36,7 @@ def lookup_past_customer_employment(request: PastCustomerEmploymentRequest) -> d
     Returns:
         past_job_title, past_company_name, past_company_domain if found
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         # Normalize inputs
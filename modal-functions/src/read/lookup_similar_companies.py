@@ -4,10 +4,9 @@ Lookup Similar Companies Preview Endpoint
 Checks if similar companies have been generated for a given domain.
 """
 
-import os
 import modal
 from pydantic import BaseModel
-from config import app, image
+from config import app, image, get_supabase
 
 
 class SimilarCompaniesLookupRequest(BaseModel):
@@ -20,11 +19,7 @@ class SimilarCompaniesLookupRequest(BaseModel):
 )
 @modal.fastapi_endpoint(method="POST")
 def lookup_similar_companies(request: SimilarCompaniesLookupRequest) -> dict:
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         result = (
@@ -4,10 +4,9 @@ Lookup Similar Companies List Endpoint
 Returns the list of similar companies for a given domain with LinkedIn URLs.
 """
 
-import os
 import modal
 from pydantic import BaseModel
-from config import app, image
+from config import app, image, get_supabase
 
 
 class SimilarCompaniesListRequest(BaseModel):
@@ -24,11 +23,7 @@ def lookup_similar_companies_list(request: SimilarCompaniesListRequest) -> dict:
     Lookup similar companies for a domain.
     Returns company name, domain, LinkedIn URL, and similarity score.
     """
-    from supabase import create_client
-
-    supabase_url = os.environ["SUPABASE_URL"]
-    supabase_key = os.environ["SUPABASE_SERVICE_KEY"]
-    supabase = create_client(supabase_url, supabase_key)
+    supabase = get_supabase()
 
     try:
         domain = request.domain.lower().strip()
@@ -0,0 +1,95 @@
+"""
+Benchmark per-record lookup latency for company/person mapping:
+one PostgREST query per field (old path) vs the warm reference_cache.
+
+Samples real keys from each lookup table (plus some misses), then times the
+lookups a single map_company_discovery + map_person_discovery call makes
+(location, industry, cleaned company name, job title) both ways. The cache
+load itself is timed separately, since a warm container pays it once.
+
+Usage:
+    SUPABASE_URL=... SUPABASE_SERVICE_KEY=... python scripts/bench_reference_cache.py [--records 200]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import statistics
+
+from supabase import create_client
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "modal-functions", "src"))
+
+from extraction import reference_cache  # noqa: E402
+
+
+def sample_keys(table: reference_cache.ReferenceTable, n: int) -> list:
+    keys = random.sample(list(table._rows), min(n, len(table)))
+    # ~10% misses, which the old path still paid a round trip for
+    keys += [f"__bench_miss_{i}" for i in range(max(1, n // 10))]
+    random.shuffle(keys)
+    return keys[:n]
+
+
+def uncached_lookup(supabase, table: reference_cache.ReferenceTable, key: str):
+    result = (
+        supabase.schema(table.schema)
+        .from_(table.table)
+        .select(", ".join(table.columns))
+        .eq(table.key_column, key)
+        .limit(1)
+        .execute()
+    )
+    return result.data[0] if result.data else None
+
+
+def pct(samples: list, p: float) -> float:
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * p))]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=200)
+    args = parser.parse_args()
+
+    supabase = create_client(os.environ["SUPABASE_URL"], os.environ["SUPABASE_SERVICE_KEY"])
+    tables = [
+        reference_cache.locations,
+        reference_cache.industries,
+        reference_cache.cleaned_company_names,
+        reference_cache.job_titles,
+    ]
+
+    for table in tables:
+        start = time.perf_counter()
+        table.refresh(supabase, full=True)
+        print(f"load {table.schema}.{table.table:<24} {len(table):8d} rows  {time.perf_counter() - start:6.2f}s")
+
+    records = [
+        {table.table: key for table, key in zip(tables, keys)}
+        for keys in zip(*(sample_keys(table, args.records) for table in tables))
+    ]
+
+    uncached = []
+    cached = []
+    for record in records:
+        start = time.perf_counter()
+        for table in tables:
+            uncached_lookup(supabase, table, record[table.table])
+        uncached.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        for table in tables:
+            table.get(supabase, record[table.table])
+        cached.append((time.perf_counter() - start) * 1000)
+
+    print(f"\nper-record lookups ({len(tables)} fields, {len(records)} records)")
+    print(f"  per-field query  p50={statistics.median(uncached):9.3f}ms  p99={pct(uncached, 0.99):9.3f}ms")
+    print(f"  reference_cache  p50={statistics.median(cached):9.3f}ms  p99={pct(cached, 0.99):9.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""
+Side-by-side harness: fused infer_pricing_profile vs the 14 per-attribute
+pricing inference endpoints.
+
+Record mode calls both paths for every fixture company and saves the raw
+responses and latencies; report mode (the default when --recordings exists
+and --record is not given) recomputes the comparison from a recording
+without touching the network, so prompt changes can be judged against the
+same baseline. The checked-in fixtures/pricing_profile_recordings.json is a
+synthetic placeholder (made-up values and latencies, marked "synthetic") so
+the report runs offline; record over it before drawing conclusions.
+
+Per fixture, the per-attribute endpoints are called concurrently (the way a
+caller fanning out would) and the fused endpoint once with persist=false.
+Note the per-attribute endpoints always write their tables.
+
+Both paths read the pricing page through the shared page cache, so whichever
+runs first pays the page fetch. The order alternates between fixtures and
+latency is reported per order, alongside the fused endpoint's own page time
+(page_ms) for cold and cached pages.
+
+Reports:
+    - latency: fused call vs per-attribute wall time and summed call time,
+      overall and by which path ran first; fused page fetch time
+    - agreement: % of companies where the fused value matches the
+      per-attribute value, per attribute and overall
+    - the disagreements themselves (--show-diffs)
+
+Usage:
+    python scripts/compare_pricing_profile.py --record [--fixtures scripts/fixtures/pricing_profile_domains.json]
+    python scripts/compare_pricing_profile.py [--recordings scripts/fixtures/pricing_profile_recordings.json] [--show-diffs]
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import statistics
+
+import httpx
+
+MODAL_BASE_URL = os.getenv("MODAL_BASE_URL", "https://bencrane--hq-master-data-ingest")
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+# attribute -> per-attribute Modal function slug
+ATTRIBUTE_ENDPOINTS = {
+    "free_trial": "infer-free-trial",
+    "pricing_model": "infer-pricing-model",
+    "pricing_visibility": "infer-pricing-visibility",
+    "sales_motion": "infer-sales-motion",
+    "billing_default": "infer-billing-default",
+    "number_of_tiers": "infer-number-of-tiers",
+    "add_ons_offered": "infer-add-ons-offered",
+    "enterprise_tier_exists": "infer-enterprise-tier-exists",
+    "security_compliance_gating": "infer-security-gating",
+    "annual_commitment_required": "infer-annual-commitment",
+    "plan_naming_style": "infer-plan-naming-style",
+    "custom_pricing_mentioned": "infer-custom-pricing-mentioned",
+    "money_back_guarantee": "infer-money-back-guarantee",
+    "minimum_seats": "infer-minimum-seats",
+}
+
+
+async def timed_post(client: httpx.AsyncClient, slug: str, payload: dict) -> dict:
+    start = time.perf_counter()
+    try:
+        response = await client.post(f"{MODAL_BASE_URL}-{slug}.modal.run", json=payload)
+        body = response.json() if response.status_code == 200 else {"success": False, "error": f"HTTP {response.status_code}"}
+    except httpx.HTTPError as e:
+        body = {"success": False, "error": str(e) or type(e).__name__}
+    return {"ms": round((time.perf_counter() - start) * 1000), "response": body}
+
+
+async def record_one(client: httpx.AsyncClient, fixture: dict, fused_first: bool) -> dict:
+    payload = {k: fixture[k] for k in ("domain", "company_name", "pricing_page_url") if fixture.get(k)}
+
+    async def per_attribute():
+        start = time.perf_counter()
+        calls = await asyncio.gather(*(
+            timed_post(client, slug, payload) for slug in ATTRIBUTE_ENDPOINTS.values()
+        ))
+        return calls, round((time.perf_counter() - start) * 1000)
+
+    if fused_first:
+        fused = await timed_post(client, "infer-pricing-profile", {**payload, "persist": False})
+        calls, per_attribute_wall_ms = await per_attribute()
+    else:
+        calls, per_attribute_wall_ms = await per_attribute()
+        fused = await timed_post(client, "infer-pricing-profile", {**payload, "persist": False})
+
+    return {
+        "fixture": fixture,
+        "order": "fused_first" if fused_first else "per_attribute_first",
+        "per_attribute": dict(zip(ATTRIBUTE_ENDPOINTS, calls)),
+        "per_attribute_wall_ms": per_attribute_wall_ms,
+        "fused": fused,
+    }
+
+
+async def record(fixtures: list, concurrency: int) -> list:
+    sem = asyncio.Semaphore(concurrency)
+    async with httpx.AsyncClient(timeout=180.0) as client:
+        async def run(i, fixture):
+            async with sem:
+                print(f"  {fixture['domain']}", file=sys.stderr)
+                return await record_one(client, fixture, fused_first=i % 2 == 0)
+        return await asyncio.gather(*(run(i, f) for i, f in enumerate(fixtures)))
+
+
+def per_attribute_value(attribute: str, call: dict):
+    response = call["response"]
+    if not response.get("success"):
+        return None
+    return response.get(attribute)
+
+
+def fused_value(attribute: str, recording: dict):
+    response = recording["fused"]["response"]
+    if not response.get("success"):
+        return None
+    return (response.get("attributes") or {}).get(attribute, {}).get("value")
+
+
+def pct(samples: list, p: float) -> float:
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * p))]
+
+
+def latency_lines(recordings: list):
+    fused_ms = [r["fused"]["ms"] for r in recordings]
+    wall_ms = [r["per_attribute_wall_ms"] for r in recordings]
+    summed_ms = [sum(c["ms"] for c in r["per_attribute"].values()) for r in recordings]
+    print(f"  fused (1 call)              p50={statistics.median(fused_ms):8.0f}ms  p99={pct(fused_ms, 0.99):8.0f}ms")
+    print(f"  per-attribute wall (14 ||)  p50={statistics.median(wall_ms):8.0f}ms  p99={pct(wall_ms, 0.99):8.0f}ms")
+    print(f"  per-attribute summed        p50={statistics.median(summed_ms):8.0f}ms  p99={pct(summed_ms, 0.99):8.0f}ms")
+
+
+def report(recordings: list, show_diffs: bool):
+    print(f"latency over {len(recordings)} companies")
+    latency_lines(recordings)
+
+    # Recordings from before the order alternated all ran per-attribute first
+    for order, label in (("fused_first", "fused first (fused fetches the page)"),
+                         ("per_attribute_first", "per-attribute first (fused finds the page cached)")):
+        group = [r for r in recordings if r.get("order", "per_attribute_first") == order]
+        if group:
+            print(f"\n{label}, {len(group)} companies")
+            latency_lines(group)
+
+    print("\nfused page time (page_ms)")
+    for from_cache, label in ((False, "page fetched"), (True, "page cached")):
+        page_ms = [
+            r["fused"]["response"]["page_ms"] for r in recordings
+            if r["fused"]["response"].get("page_from_cache") is from_cache
+            and r["fused"]["response"].get("page_ms") is not None
+        ]
+        if page_ms:
+            print(f"  {label + f' ({len(page_ms)})':<27} p50={statistics.median(page_ms):8.0f}ms  p99={pct(page_ms, 0.99):8.0f}ms")
+
+    print("\nagreement (fused value == per-attribute value)")
+    total_compared = total_agree = 0
+    diffs = []
+    for attribute in ATTRIBUTE_ENDPOINTS:
+        compared = agree = 0
+        for r in recordings:
+            expected = per_attribute_value(attribute, r["per_attribute"][attribute])
+            actual = fused_value(attribute, r)
+            if expected is None or actual is None:
+                continue
+            compared += 1
+            if expected == actual:
+                agree += 1
+            else:
+                diffs.append((r["fixture"]["domain"], attribute, expected, actual))
+        total_compared += compared
+        total_agree += agree
+        rate = f"{agree / compared:7.1%}" if compared else "    n/a"
+        print(f"  {attribute:<28} {rate}  ({agree}/{compared})")
+    overall = f"{total_agree / total_compared:.1%}" if total_compared else "n/a"
+    print(f"  {'overall':<28} {overall:>7}  ({total_agree}/{total_compared})")
+
+    failures = sum(1 for r in recordings if not r["fused"]["response"].get("success"))
+    if failures:
+        print(f"\nfused call failed for {failures} companies")
+
+    if show_diffs and diffs:
+        print("\ndisagreements (domain, attribute, per-attribute, fused)")
+        for domain, attribute, expected, actual in diffs:
+            print(f"  {domain:<24} {attribute:<28} {expected!s:<24} {actual}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fixtures", default=os.path.join(FIXTURES_DIR, "pricing_profile_domains.json"))
+    parser.add_argument("--recordings", default=os.path.join(FIXTURES_DIR, "pricing_profile_recordings.json"))
+    parser.add_argument("--record", action="store_true", help="call the live endpoints and overwrite --recordings")
+    parser.add_argument("--concurrency", type=int, default=2, help="companies recorded at once")
+    parser.add_argument("--show-diffs", action="store_true")
+    args = parser.parse_args()
+
+    if args.record:
+        with open(args.fixtures) as f:
+            fixtures = json.load(f)
+        print(f"recording {len(fixtures)} companies", file=sys.stderr)
+        recordings = asyncio.run(record(fixtures, args.concurrency))
+        with open(args.recordings, "w") as f:
+            json.dump({"synthetic": False, "recordings": recordings}, f, indent=2)
+        print(f"wrote {args.recordings}\n", file=sys.stderr)
+    else:
+        if not os.path.exists(args.recordings):
+            parser.error(f"{args.recordings} not found - run with --record first")
+        with open(args.recordings) as f:
+            recordings = json.load(f)
+        # Older recordings are a bare list
+        if isinstance(recordings, dict):
+            if recordings.get("synthetic"):
+                print(f"note: {args.recordings} is synthetic - {recordings.get('note', '')}\n", file=sys.stderr)
+            recordings = recordings["recordings"]
+
+    report(recordings, args.show_diffs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+-- HQ API background jobs
+-- Long-running batch endpoints run as jobs: POST returns a job_id, workers in
+-- hq-api claim queued jobs, checkpoint per-record progress, and resume
+-- interrupted jobs (stale heartbeat) from the last checkpoint.
+
+CREATE TABLE IF NOT EXISTS hq.api_jobs (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    kind TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',  -- queued, running, succeeded, failed
+    payload JSONB NOT NULL DEFAULT '{}'::jsonb,
+
+    -- Progress counters (total is NULL until the job knows its size)
+    total INTEGER,
+    completed INTEGER NOT NULL DEFAULT 0,
+    succeeded INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0,
+
+    result JSONB,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,  -- 1 + number of resumes
+
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    started_at TIMESTAMPTZ,
+    heartbeat_at TIMESTAMPTZ,
+    finished_at TIMESTAMPTZ
+);
+
+CREATE INDEX IF NOT EXISTS idx_hq_api_jobs_claim ON hq.api_jobs(status, created_at);
+CREATE INDEX IF NOT EXISTS idx_hq_api_jobs_created ON hq.api_jobs(created_at DESC);
+
+-- Per-record checkpoints; a resumed job skips every item_key already here
+CREATE TABLE IF NOT EXISTS hq.api_job_items (
+    job_id UUID NOT NULL REFERENCES hq.api_jobs(id) ON DELETE CASCADE,
+    item_key TEXT NOT NULL,
+    outcome TEXT,  -- worker outcome label, NULL when the record failed
+    error TEXT,
+    finished_at TIMESTAMPTZ DEFAULT NOW(),
+    PRIMARY KEY (job_id, item_key)
+);
+
+-- Grant permissions
+GRANT ALL ON hq.api_jobs TO service_role;
+GRANT ALL ON hq.api_job_items TO service_role;
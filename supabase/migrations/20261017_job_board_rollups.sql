@@ -0,0 +1,184 @@
+-- Migration: Job Board Rollups
+-- Created: 2026-10-17
+-- Purpose: Precomputed per-job-board counts for /job-boards/jobs/{domain}/stats and /filters,
+--          so those endpoints read a few indexed rows instead of GROUP BY scans over
+--          core.company_job_postings on every page view.
+
+-- One row per (job board, dimension, value). Dimensions:
+--   city, state, country, seniority, employment_type, employee_range,
+--   location   (COALESCE(city, state, country, 'Unknown'), for top locations)
+--   company    (posting domain, for top/unique companies)
+--   posted_day (posted_at::date as YYYY-MM-DD, or 'unknown'; age buckets are summed from these at read time)
+CREATE TABLE IF NOT EXISTS core.job_board_rollups (
+    board_domain TEXT NOT NULL,
+    dimension TEXT NOT NULL,
+    value TEXT NOT NULL,
+    job_count BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (board_domain, dimension, value)
+);
+
+CREATE INDEX IF NOT EXISTS idx_job_board_rollups_top
+    ON core.job_board_rollups (board_domain, dimension, job_count DESC);
+
+-- Per-board totals and refresh bookkeeping
+CREATE TABLE IF NOT EXISTS core.job_board_rollup_state (
+    board_domain TEXT PRIMARY KEY,
+    job_functions JSONB NOT NULL,
+    total_jobs BIGINT NOT NULL DEFAULT 0,
+    min_salary NUMERIC,
+    max_salary NUMERIC,
+    watermark TIMESTAMPTZ,          -- postings created at or before this are folded into the rollup
+    rebuilt_at TIMESTAMPTZ,         -- last full rebuild
+    refreshed_at TIMESTAMPTZ        -- last incremental or full refresh
+);
+
+-- Incremental refreshes scan only postings newer than the watermark
+CREATE INDEX IF NOT EXISTS idx_company_job_postings_function_created_at
+    ON core.company_job_postings (job_function, created_at);
+
+
+-- Fold postings created since the board's watermark into its rollup, or rebuild it from
+-- scratch when p_full is set, the board has no rollup yet, its job_functions changed, or
+-- the last rebuild is older than p_rebuild_after_seconds (deletes, edited postings and
+-- employee range changes are only picked up by rebuilds).
+--
+-- created_at is stamped when a posting's transaction starts, not when it commits, so a
+-- posting can become visible with a created_at below a watermark already taken. Only
+-- postings created more than p_commit_lag_seconds ago are folded, and the watermark is set
+-- to that bound rather than to the newest created_at seen; a writer transaction open
+-- longer than the lag can still be missed until the next rebuild.
+-- Returns the new refreshed_at, or NULL if the board is unknown or another session is
+-- already refreshing it.
+DROP FUNCTION IF EXISTS core.refresh_job_board_rollup(TEXT, BOOLEAN, INTEGER);
+
+CREATE OR REPLACE FUNCTION core.refresh_job_board_rollup(
+    p_board_domain TEXT,
+    p_full BOOLEAN DEFAULT false,
+    p_rebuild_after_seconds INTEGER DEFAULT 86400,
+    p_commit_lag_seconds INTEGER DEFAULT 300
+)
+RETURNS TIMESTAMPTZ
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_functions JSONB;
+    v_state core.job_board_rollup_state%ROWTYPE;
+    v_since TIMESTAMPTZ;
+    v_now TIMESTAMPTZ := clock_timestamp();
+    v_bound TIMESTAMPTZ := clock_timestamp() - make_interval(secs => p_commit_lag_seconds);
+    v_count BIGINT;
+    v_min_salary NUMERIC;
+    v_max_salary NUMERIC;
+BEGIN
+    IF NOT pg_try_advisory_xact_lock(hashtext('job_board_rollup:' || p_board_domain)) THEN
+        RETURN NULL;
+    END IF;
+
+    SELECT job_functions INTO v_functions
+    FROM reference.job_board_domains
+    WHERE domain = p_board_domain;
+
+    IF v_functions IS NULL THEN
+        RETURN NULL;
+    END IF;
+
+    SELECT * INTO v_state
+    FROM core.job_board_rollup_state
+    WHERE board_domain = p_board_domain;
+
+    IF p_full
+        OR NOT FOUND
+        OR v_state.job_functions IS DISTINCT FROM v_functions
+        OR v_state.rebuilt_at IS NULL
+        OR v_state.rebuilt_at < v_now - make_interval(secs => p_rebuild_after_seconds)
+    THEN
+        DELETE FROM core.job_board_rollups WHERE board_domain = p_board_domain;
+
+        INSERT INTO core.job_board_rollup_state (board_domain, job_functions, total_jobs, rebuilt_at)
+        VALUES (p_board_domain, v_functions, 0, v_now)
+        ON CONFLICT (board_domain) DO UPDATE SET
+            job_functions = EXCLUDED.job_functions,
+            total_jobs = 0,
+            min_salary = NULL,
+            max_salary = NULL,
+            watermark = NULL,
+            rebuilt_at = EXCLUDED.rebuilt_at;
+
+        v_since := NULL;
+    ELSE
+        v_since := v_state.watermark;
+    END IF;
+
+    DROP TABLE IF EXISTS pg_temp.job_board_delta;
+    CREATE TEMP TABLE job_board_delta ON COMMIT DROP AS
+    SELECT
+        jp.domain,
+        jp.city,
+        jp.state,
+        jp.country,
+        jp.seniority,
+        jp.employment_type,
+        ce.employee_range,
+        jp.posted_at,
+        jp.created_at,
+        jp.salary_min,
+        jp.salary_max
+    FROM core.company_job_postings jp
+    LEFT JOIN LATERAL (
+        SELECT employee_range
+        FROM core.company_employee_range
+        WHERE domain = jp.domain
+        LIMIT 1
+    ) ce ON true
+    WHERE jp.job_function IN (SELECT jsonb_array_elements_text(v_functions))
+      AND (
+          (jp.created_at <= v_bound AND (v_since IS NULL OR jp.created_at > v_since))
+          -- Postings without a created_at can't be ordered against the watermark; rebuilds count them
+          OR (v_since IS NULL AND jp.created_at IS NULL)
+      );
+
+    INSERT INTO core.job_board_rollups (board_domain, dimension, value, job_count)
+    SELECT p_board_domain, d.dimension, d.value, COUNT(*)
+    FROM job_board_delta jd
+    CROSS JOIN LATERAL (VALUES
+        ('city', jd.city),
+        ('state', jd.state),
+        ('country', jd.country),
+        ('seniority', jd.seniority),
+        ('employment_type', jd.employment_type),
+        ('employee_range', jd.employee_range),
+        ('location', COALESCE(jd.city, jd.state, jd.country, 'Unknown')),
+        ('company', jd.domain),
+        ('posted_day', COALESCE(jd.posted_at::date::text, 'unknown'))
+    ) AS d(dimension, value)
+    WHERE d.value IS NOT NULL
+    GROUP BY d.dimension, d.value
+    ON CONFLICT (board_domain, dimension, value) DO UPDATE SET
+        job_count = core.job_board_rollups.job_count + EXCLUDED.job_count;
+
+    SELECT
+        COUNT(*),
+        MIN(salary_min) FILTER (WHERE salary_min IS NOT NULL AND salary_max IS NOT NULL),
+        MAX(salary_max) FILTER (WHERE salary_min IS NOT NULL AND salary_max IS NOT NULL)
+    INTO v_count, v_min_salary, v_max_salary
+    FROM job_board_delta;
+
+    UPDATE core.job_board_rollup_state SET
+        total_jobs = total_jobs + v_count,
+        min_salary = LEAST(min_salary, v_min_salary),
+        max_salary = GREATEST(max_salary, v_max_salary),
+        watermark = GREATEST(watermark, v_bound),
+        refreshed_at = v_now
+    WHERE board_domain = p_board_domain;
+
+    DROP TABLE IF EXISTS pg_temp.job_board_delta;
+
+    RETURN v_now;
+END;
+$$;
+
+-- Permissions
+GRANT SELECT ON core.job_board_rollups TO anon, authenticated;
+GRANT SELECT ON core.job_board_rollup_state TO anon, authenticated;
+GRANT ALL ON core.job_board_rollups TO service_role;
+GRANT ALL ON core.job_board_rollup_state TO service_role;
@@ -0,0 +1,50 @@
+-- Migration: Pricing Page Cache
+-- Created: 2026-10-17
+-- Purpose: Fetch-once store of pricing pages (HTML + extracted text) shared by the pricing inference endpoints
+
+CREATE TABLE IF NOT EXISTS raw.pricing_page_cache (
+    url_key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    final_url TEXT,
+    status_code INTEGER,
+    etag TEXT,
+    last_modified TEXT,
+    content_hash TEXT NOT NULL,
+    html TEXT NOT NULL,
+    page_text TEXT NOT NULL,
+    fetched_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    validated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- Indexes
+CREATE INDEX IF NOT EXISTS idx_pricing_page_cache_validated_at ON raw.pricing_page_cache(validated_at);
+CREATE INDEX IF NOT EXISTS idx_pricing_page_cache_content_hash ON raw.pricing_page_cache(content_hash);
+
+-- Single-flight fetches: the first caller to miss (or find a stale row) takes a lease on
+-- the URL and fetches; concurrent callers wait for its row instead of fetching too.
+-- A lease expires on its own if its holder dies mid-fetch.
+CREATE TABLE IF NOT EXISTS raw.pricing_page_fetch_leases (
+    url_key TEXT PRIMARY KEY,
+    lease_id UUID NOT NULL,
+    leased_until TIMESTAMPTZ NOT NULL
+);
+
+-- Returns a lease id when the caller now holds the fetch lease for p_url_key, NULL when
+-- another caller holds an unexpired one.
+CREATE OR REPLACE FUNCTION public.claim_pricing_page_fetch(p_url_key TEXT, p_lease_seconds INTEGER)
+RETURNS UUID
+LANGUAGE sql
+AS $$
+    INSERT INTO raw.pricing_page_fetch_leases (url_key, lease_id, leased_until)
+    VALUES (p_url_key, gen_random_uuid(), now() + make_interval(secs => p_lease_seconds))
+    ON CONFLICT (url_key) DO UPDATE
+        SET lease_id = EXCLUDED.lease_id,
+            leased_until = EXCLUDED.leased_until
+        WHERE raw.pricing_page_fetch_leases.leased_until < now()
+    RETURNING lease_id
+$$;
+
+-- Permissions
+GRANT ALL ON raw.pricing_page_cache TO service_role;
+GRANT ALL ON raw.pricing_page_fetch_leases TO service_role;
+GRANT EXECUTE ON FUNCTION public.claim_pricing_page_fetch(TEXT, INTEGER) TO service_role;
@@ -0,0 +1,215 @@
+-- Migration: Company Card Projection
+-- Created: 2026-10-18
+-- Purpose: One row per company with the enrichment fields job-board listings show
+--          (description, revenue, funding, employee range, latest funding round), so
+--          /job-boards/jobs/{domain} joins a single primary-keyed table instead of five
+--          enrichment tables plus a per-row LATERAL over core.company_funding_rounds.
+--          Statement-level triggers on the source tables keep cards current for every
+--          writer (Modal ingest functions, backfills, manual fixes) without app changes.
+
+-- Card contents for every company present in any source table. Each source contributes
+-- at most one row per domain; the latest funding round wins.
+CREATE OR REPLACE VIEW core.company_card_source AS
+SELECT
+    d.domain,
+    cd.description AS company_description,
+    cd.tagline AS company_tagline,
+    cr.raw_revenue_amount AS company_revenue,
+    cr.raw_revenue_range AS company_revenue_range,
+    cf.raw_funding_amount AS company_funding,
+    cf.raw_funding_range AS company_funding_range,
+    ce.employee_range AS company_employee_range,
+    cfr.funding_type AS company_last_funding_type,
+    cfr.investors AS company_investors
+FROM (
+    SELECT domain FROM core.company_descriptions
+    UNION
+    SELECT domain FROM core.company_revenue
+    UNION
+    SELECT domain FROM core.company_funding
+    UNION
+    SELECT domain FROM core.company_employee_range
+    UNION
+    SELECT domain FROM core.company_funding_rounds
+) d
+LEFT JOIN LATERAL (
+    SELECT description, tagline FROM core.company_descriptions WHERE domain = d.domain LIMIT 1
+) cd ON true
+LEFT JOIN LATERAL (
+    SELECT raw_revenue_amount, raw_revenue_range FROM core.company_revenue WHERE domain = d.domain LIMIT 1
+) cr ON true
+LEFT JOIN LATERAL (
+    SELECT raw_funding_amount, raw_funding_range FROM core.company_funding WHERE domain = d.domain LIMIT 1
+) cf ON true
+LEFT JOIN LATERAL (
+    SELECT employee_range FROM core.company_employee_range WHERE domain = d.domain LIMIT 1
+) ce ON true
+LEFT JOIN LATERAL (
+    SELECT funding_type, investors
+    FROM core.company_funding_rounds
+    WHERE domain = d.domain
+    ORDER BY funding_date DESC NULLS LAST
+    LIMIT 1
+) cfr ON true
+WHERE d.domain IS NOT NULL;
+
+CREATE TABLE IF NOT EXISTS core.company_card AS
+SELECT * FROM core.company_card_source
+WITH NO DATA;
+
+ALTER TABLE core.company_card ADD COLUMN IF NOT EXISTS refreshed_at TIMESTAMPTZ NOT NULL DEFAULT now();
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint
+        WHERE conrelid = 'core.company_card'::regclass AND contype = 'p'
+    ) THEN
+        ALTER TABLE core.company_card ADD PRIMARY KEY (domain);
+    END IF;
+END;
+$$;
+
+-- Indexes
+CREATE INDEX IF NOT EXISTS idx_company_card_employee_range
+    ON core.company_card (company_employee_range);
+
+
+-- Recompute the cards for the given domains from the source tables, dropping cards
+-- whose domain no longer appears in any of them.
+--
+-- Each card is recomputed from every source table, so two transactions writing different
+-- source tables for the same domain would otherwise race: each upserts from a snapshot
+-- without the other's uncommitted write, and the later upsert puts back the stale value.
+-- The per-domain advisory locks (taken in sorted order, held until commit) serialize
+-- them, and the upsert runs as a separate statement after the locks are granted, so under
+-- READ COMMITTED its snapshot includes whatever the previous holder committed.
+CREATE OR REPLACE FUNCTION core.refresh_company_cards(p_domains TEXT[])
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_domain TEXT;
+BEGIN
+    IF p_domains IS NULL OR cardinality(p_domains) = 0 THEN
+        RETURN;
+    END IF;
+
+    FOR v_domain IN SELECT DISTINCT d FROM unnest(p_domains) AS d WHERE d IS NOT NULL ORDER BY d LOOP
+        PERFORM pg_advisory_xact_lock(hashtext('company_card:' || v_domain));
+    END LOOP;
+
+    INSERT INTO core.company_card (
+        domain,
+        company_description,
+        company_tagline,
+        company_revenue,
+        company_revenue_range,
+        company_funding,
+        company_funding_range,
+        company_employee_range,
+        company_last_funding_type,
+        company_investors,
+        refreshed_at
+    )
+    SELECT
+        s.domain,
+        s.company_description,
+        s.company_tagline,
+        s.company_revenue,
+        s.company_revenue_range,
+        s.company_funding,
+        s.company_funding_range,
+        s.company_employee_range,
+        s.company_last_funding_type,
+        s.company_investors,
+        now()
+    FROM core.company_card_source s
+    WHERE s.domain = ANY(p_domains)
+    ON CONFLICT (domain) DO UPDATE SET
+        company_description = EXCLUDED.company_description,
+        company_tagline = EXCLUDED.company_tagline,
+        company_revenue = EXCLUDED.company_revenue,
+        company_revenue_range = EXCLUDED.company_revenue_range,
+        company_funding = EXCLUDED.company_funding,
+        company_funding_range = EXCLUDED.company_funding_range,
+        company_employee_range = EXCLUDED.company_employee_range,
+        company_last_funding_type = EXCLUDED.company_last_funding_type,
+        company_investors = EXCLUDED.company_investors,
+        refreshed_at = EXCLUDED.refreshed_at;
+
+    DELETE FROM core.company_card c
+    WHERE c.domain = ANY(p_domains)
+      AND NOT EXISTS (SELECT 1 FROM core.company_card_source s WHERE s.domain = c.domain);
+END;
+$$;
+
+
+-- Statement-level sync: one card refresh per statement for every domain it touched,
+-- so bulk upserts from the ingest functions cost one pass rather than one per row.
+CREATE OR REPLACE FUNCTION core.company_card_sync()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_domains TEXT[];
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        SELECT array_agg(DISTINCT domain) INTO v_domains FROM new_rows;
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT array_agg(DISTINCT domain) INTO v_domains FROM old_rows;
+    ELSE
+        SELECT array_agg(DISTINCT domain) INTO v_domains
+        FROM (SELECT domain FROM new_rows UNION SELECT domain FROM old_rows) changed;
+    END IF;
+
+    PERFORM core.refresh_company_cards(v_domains);
+    RETURN NULL;
+END;
+$$;
+
+DO $$
+DECLARE
+    v_table TEXT;
+BEGIN
+    FOREACH v_table IN ARRAY ARRAY[
+        'company_descriptions',
+        'company_revenue',
+        'company_funding',
+        'company_employee_range',
+        'company_funding_rounds'
+    ]
+    LOOP
+        EXECUTE format('DROP TRIGGER IF EXISTS company_card_sync_insert ON core.%I', v_table);
+        EXECUTE format('DROP TRIGGER IF EXISTS company_card_sync_update ON core.%I', v_table);
+        EXECUTE format('DROP TRIGGER IF EXISTS company_card_sync_delete ON core.%I', v_table);
+
+        EXECUTE format(
+            'CREATE TRIGGER company_card_sync_insert AFTER INSERT ON core.%I '
+            'REFERENCING NEW TABLE AS new_rows '
+            'FOR EACH STATEMENT EXECUTE FUNCTION core.company_card_sync()', v_table);
+        EXECUTE format(
+            'CREATE TRIGGER company_card_sync_update AFTER UPDATE ON core.%I '
+            'REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows '
+            'FOR EACH STATEMENT EXECUTE FUNCTION core.company_card_sync()', v_table);
+        EXECUTE format(
+            'CREATE TRIGGER company_card_sync_delete AFTER DELETE ON core.%I '
+            'REFERENCING OLD TABLE AS old_rows '
+            'FOR EACH STATEMENT EXECUTE FUNCTION core.company_card_sync()', v_table);
+    END LOOP;
+END;
+$$;
+
+
+-- Backfill
+INSERT INTO core.company_card
+SELECT s.*, now() FROM core.company_card_source s
+ON CONFLICT (domain) DO NOTHING;
+
+ANALYZE core.company_card;
+
+-- Permissions
+GRANT SELECT ON core.company_card_source TO anon, authenticated;
+GRANT SELECT ON core.company_card TO anon, authenticated;
+GRANT ALL ON core.company_card_source TO service_role;
+GRANT ALL ON core.company_card TO service_role;
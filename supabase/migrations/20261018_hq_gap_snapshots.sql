@@ -0,0 +1,24 @@
+-- HQ gap snapshots
+-- Timestamped counts for the admin gap analysis recipes (hq-api gaps.py). A scheduled
+-- run computes every recipe, plus United States / not United States splits for recipes
+-- with a country join, and appends one row per (recipe, country scope). The admin gap
+-- endpoints serve the newest row; the history is the trend series.
+
+CREATE TABLE IF NOT EXISTS hq.gap_snapshots (
+    id BIGSERIAL PRIMARY KEY,
+    run_id UUID NOT NULL,
+    recipe_id TEXT NOT NULL,
+    country TEXT NOT NULL DEFAULT 'all',  -- all, United States, not United States
+    gap_count BIGINT NOT NULL,
+    duration_ms INTEGER,
+    computed_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_hq_gap_snapshots_latest
+    ON hq.gap_snapshots(recipe_id, country, computed_at DESC);
+CREATE INDEX IF NOT EXISTS idx_hq_gap_snapshots_computed
+    ON hq.gap_snapshots(computed_at);
+
+-- Grant permissions
+GRANT ALL ON hq.gap_snapshots TO service_role;
+GRANT USAGE, SELECT ON SEQUENCE hq.gap_snapshots_id_seq TO service_role;
@@ -0,0 +1,89 @@
+-- Migration: Trigram Search Indexes
+-- Created: 2026-10-18
+-- Purpose: pg_trgm GIN indexes for the substring ("contains") filters on leads, companies
+--          and job boards. Those filters reach Postgres as `col ILIKE '%term%'` (built by
+--          hq-api/search.py), which a B-tree cannot serve, so each one scanned the whole
+--          relation. A trigram GIN index answers the same predicate for terms of 3+ chars.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA extensions;
+
+-- ============================================
+-- Leads (GET /api/leads and the signal endpoints)
+-- ============================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_leads_person_city_trgm
+    ON core.leads USING gin (person_city extensions.gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_leads_person_state_trgm
+    ON core.leads USING gin (person_state extensions.gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_leads_person_country_trgm
+    ON core.leads USING gin (person_country extensions.gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_leads_company_city_trgm
+    ON core.leads USING gin (company_city extensions.gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_leads_company_state_trgm
+    ON core.leads USING gin (company_state extensions.gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_leads_company_country_trgm
+    ON core.leads USING gin (company_country extensions.gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_leads_company_name_trgm
+    ON core.leads USING gin (company_name extensions.gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_leads_job_title_trgm
+    ON core.leads USING gin (matched_cleaned_job_title extensions.gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_leads_full_name_trgm
+    ON core.leads USING gin (full_name extensions.gin_trgm_ops);
+
+-- ============================================
+-- Job board postings (GET /job-boards/jobs/{domain})
+-- ============================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_company_job_postings_city_trgm
+    ON core.company_job_postings USING gin (city extensions.gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_company_job_postings_state_trgm
+    ON core.company_job_postings USING gin (state extensions.gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_company_job_postings_country_trgm
+    ON core.company_job_postings USING gin (country extensions.gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_company_job_postings_seniority_trgm
+    ON core.company_job_postings USING gin (seniority extensions.gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_company_job_postings_employment_type_trgm
+    ON core.company_job_postings USING gin (employment_type extensions.gin_trgm_ops);
+
+-- ============================================
+-- Companies (GET /api/companies)
+-- ============================================
+
+-- core.companies_full is indexed only where it is materialized; as a plain view its
+-- coalesced columns cannot use an index and the name/location filters keep scanning.
+DO $$
+DECLARE
+    v_relkind "char";
+    v_column TEXT;
+BEGIN
+    SELECT c.relkind INTO v_relkind
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = 'core' AND c.relname = 'companies_full';
+
+    IF v_relkind IS NULL OR v_relkind NOT IN ('r', 'm') THEN
+        RAISE NOTICE 'core.companies_full is not a table or materialized view; skipping trigram indexes';
+        RETURN;
+    END IF;
+
+    FOREACH v_column IN ARRAY ARRAY['name', 'company_city', 'company_state', 'company_country']
+    LOOP
+        EXECUTE format(
+            'CREATE INDEX IF NOT EXISTS %I ON core.companies_full USING gin (%I extensions.gin_trgm_ops)',
+            'idx_companies_full_' || v_column || '_trgm', v_column
+        );
+    END LOOP;
+END;
+$$;
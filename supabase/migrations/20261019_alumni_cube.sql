@@ -0,0 +1,223 @@
+-- Migration: Alumni Cube
+-- Created: 2026-10-19
+-- Purpose: Precomputed alumni counts per past employer, so the past-employer count,
+--          breakdown and preview endpoints and the /priority-companies alumni counts read
+--          a primary-keyed row instead of running COUNT(DISTINCT linkedin_url) over
+--          core.person_work_history (joined to locations and core.job_function_mapping)
+--          on every call.
+--
+--          One row per (employer_key, job_function, country) cell, with '*' rows for the
+--          rollups: distinct people can't be summed across cells (someone with two past
+--          roles at the same employer would count twice), so every combination the
+--          endpoints filter on is stored.
+--
+--          Writes to core.person_work_history / core.person_locations queue the affected
+--          employers in core.alumni_cube_dirty; hq-api (alumni.py) drains the queue
+--          every few seconds with core.drain_alumni_cube().
+
+-- Past-employer key: company name, case-folded and whitespace-collapsed
+CREATE OR REPLACE FUNCTION core.alumni_employer_key(p_company_name TEXT)
+RETURNS TEXT
+LANGUAGE sql
+IMMUTABLE
+PARALLEL SAFE
+AS $$
+    SELECT NULLIF(lower(btrim(regexp_replace(p_company_name, '\s+', ' ', 'g'))), '')
+$$;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_person_work_history_alumni_employer_key
+    ON core.person_work_history (core.alumni_employer_key(company_name))
+    WHERE is_current = false;
+
+CREATE TABLE IF NOT EXISTS core.alumni_cube (
+    employer_key TEXT NOT NULL,
+    job_function TEXT NOT NULL,         -- Sales Nav function, 'Other' when unmapped, '*' = all
+    country TEXT NOT NULL,              -- lower(person country), '' when unknown, '*' = all
+    alumni INTEGER NOT NULL,            -- distinct people
+    alumni_with_function INTEGER NOT NULL,  -- distinct people with a matched job function
+    engineering INTEGER NOT NULL,       -- distinct people whose matched function is Engineering
+    sales INTEGER NOT NULL,             -- distinct people whose matched function is Sales
+    sample_linkedin_urls TEXT[] NOT NULL DEFAULT '{}',  -- up to 50 alumni present in core.leads
+    refreshed_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (employer_key, job_function, country)
+);
+
+CREATE TABLE IF NOT EXISTS core.alumni_cube_dirty (
+    employer_key TEXT PRIMARY KEY,
+    queued_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+
+-- Recompute every cell for the given employers, dropping employers with no alumni left.
+CREATE OR REPLACE FUNCTION core.refresh_alumni_cube(p_keys TEXT[])
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF p_keys IS NULL OR cardinality(p_keys) = 0 THEN
+        RETURN;
+    END IF;
+
+    DELETE FROM core.alumni_cube WHERE employer_key = ANY(p_keys);
+
+    INSERT INTO core.alumni_cube (
+        employer_key, job_function, country,
+        alumni, alumni_with_function, engineering, sales,
+        sample_linkedin_urls, refreshed_at
+    )
+    WITH alumni AS (
+        SELECT
+            core.alumni_employer_key(pwh.company_name) AS employer_key,
+            COALESCE(jfm.sales_nav_function, 'Other') AS job_function,
+            COALESCE(lower(pl.country), '') AS country,
+            pwh.linkedin_url,
+            pwh.matched_job_function,
+            EXISTS (SELECT 1 FROM core.leads l WHERE l.linkedin_url = pwh.linkedin_url) AS is_lead
+        FROM core.person_work_history pwh
+        LEFT JOIN core.person_locations pl ON pwh.linkedin_url = pl.linkedin_url
+        LEFT JOIN core.job_function_mapping jfm ON pwh.matched_job_function = jfm.our_job_function
+        WHERE pwh.is_current = false
+          AND core.alumni_employer_key(pwh.company_name) = ANY(p_keys)
+    )
+    SELECT
+        employer_key,
+        CASE WHEN GROUPING(job_function) = 1 THEN '*' ELSE job_function END,
+        CASE WHEN GROUPING(country) = 1 THEN '*' ELSE country END,
+        COUNT(DISTINCT linkedin_url),
+        COUNT(DISTINCT linkedin_url) FILTER (WHERE matched_job_function IS NOT NULL),
+        COUNT(DISTINCT linkedin_url) FILTER (WHERE matched_job_function = 'Engineering'),
+        COUNT(DISTINCT linkedin_url) FILTER (WHERE matched_job_function = 'Sales'),
+        COALESCE((array_agg(DISTINCT linkedin_url) FILTER (WHERE is_lead))[1:50], '{}'),
+        now()
+    FROM alumni
+    GROUP BY GROUPING SETS (
+        (employer_key, job_function, country),
+        (employer_key, job_function),
+        (employer_key, country),
+        (employer_key)
+    );
+END;
+$$;
+
+
+-- Refresh up to p_limit queued employers; returns how many were refreshed. SKIP LOCKED
+-- lets several API replicas drain the queue without refreshing an employer twice.
+CREATE OR REPLACE FUNCTION core.drain_alumni_cube(p_limit INTEGER DEFAULT 500)
+RETURNS INTEGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_keys TEXT[];
+BEGIN
+    WITH picked AS (
+        SELECT employer_key
+        FROM core.alumni_cube_dirty
+        ORDER BY queued_at
+        LIMIT p_limit
+        FOR UPDATE SKIP LOCKED
+    ), removed AS (
+        DELETE FROM core.alumni_cube_dirty d
+        USING picked
+        WHERE d.employer_key = picked.employer_key
+        RETURNING d.employer_key
+    )
+    SELECT array_agg(employer_key) INTO v_keys FROM removed;
+
+    PERFORM core.refresh_alumni_cube(v_keys);
+    RETURN COALESCE(cardinality(v_keys), 0);
+END;
+$$;
+
+
+-- Statement-level queueing: work history rows name their employer directly; a location
+-- change re-queues every past employer of the people it touched.
+CREATE OR REPLACE FUNCTION core.alumni_cube_queue_work_history()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO core.alumni_cube_dirty (employer_key)
+        SELECT DISTINCT core.alumni_employer_key(company_name) FROM new_rows
+        WHERE core.alumni_employer_key(company_name) IS NOT NULL
+        ON CONFLICT (employer_key) DO NOTHING;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        INSERT INTO core.alumni_cube_dirty (employer_key)
+        SELECT DISTINCT core.alumni_employer_key(company_name) FROM old_rows
+        WHERE core.alumni_employer_key(company_name) IS NOT NULL
+        ON CONFLICT (employer_key) DO NOTHING;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION core.alumni_cube_queue_locations()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_urls TEXT[];
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        SELECT array_agg(DISTINCT linkedin_url) INTO v_urls FROM new_rows;
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT array_agg(DISTINCT linkedin_url) INTO v_urls FROM old_rows;
+    ELSE
+        SELECT array_agg(DISTINCT linkedin_url) INTO v_urls
+        FROM (SELECT linkedin_url FROM new_rows UNION SELECT linkedin_url FROM old_rows) changed;
+    END IF;
+
+    INSERT INTO core.alumni_cube_dirty (employer_key)
+    SELECT DISTINCT core.alumni_employer_key(pwh.company_name)
+    FROM core.person_work_history pwh
+    WHERE pwh.linkedin_url = ANY(v_urls)
+      AND pwh.is_current = false
+      AND core.alumni_employer_key(pwh.company_name) IS NOT NULL
+    ON CONFLICT (employer_key) DO NOTHING;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS alumni_cube_queue_insert ON core.person_work_history;
+DROP TRIGGER IF EXISTS alumni_cube_queue_update ON core.person_work_history;
+DROP TRIGGER IF EXISTS alumni_cube_queue_delete ON core.person_work_history;
+
+CREATE TRIGGER alumni_cube_queue_insert AFTER INSERT ON core.person_work_history
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION core.alumni_cube_queue_work_history();
+CREATE TRIGGER alumni_cube_queue_update AFTER UPDATE ON core.person_work_history
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION core.alumni_cube_queue_work_history();
+CREATE TRIGGER alumni_cube_queue_delete AFTER DELETE ON core.person_work_history
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION core.alumni_cube_queue_work_history();
+
+DROP TRIGGER IF EXISTS alumni_cube_queue_insert ON core.person_locations;
+DROP TRIGGER IF EXISTS alumni_cube_queue_update ON core.person_locations;
+DROP TRIGGER IF EXISTS alumni_cube_queue_delete ON core.person_locations;
+
+CREATE TRIGGER alumni_cube_queue_insert AFTER INSERT ON core.person_locations
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION core.alumni_cube_queue_locations();
+CREATE TRIGGER alumni_cube_queue_update AFTER UPDATE ON core.person_locations
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION core.alumni_cube_queue_locations();
+CREATE TRIGGER alumni_cube_queue_delete AFTER DELETE ON core.person_locations
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION core.alumni_cube_queue_locations();
+
+
+-- Backfill: queue every past employer; the hq-api drain task builds their cells. A
+-- change to core.job_function_mapping needs the same full re-queue.
+INSERT INTO core.alumni_cube_dirty (employer_key)
+SELECT DISTINCT core.alumni_employer_key(company_name)
+FROM core.person_work_history
+WHERE is_current = false
+  AND core.alumni_employer_key(company_name) IS NOT NULL
+ON CONFLICT (employer_key) DO NOTHING;
+
+-- Permissions
+GRANT SELECT ON core.alumni_cube TO anon, authenticated;
+GRANT ALL ON core.alumni_cube TO service_role;
+GRANT ALL ON core.alumni_cube_dirty TO service_role;
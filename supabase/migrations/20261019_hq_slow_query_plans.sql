@@ -0,0 +1,25 @@
+-- HQ slow query plans
+-- EXPLAIN (ANALYZE, BUFFERS) plans captured by hq-api (querylog.py) for read queries
+-- that ran over SLOW_QUERY_THRESHOLD_MS on one of its asyncpg pools. One row per capture;
+-- each query shape (fingerprint: SQL with literals replaced by ?) is captured at most
+-- once per cooldown period. Bind parameters are not stored.
+
+CREATE TABLE IF NOT EXISTS hq.slow_query_plans (
+    id BIGSERIAL PRIMARY KEY,
+    fingerprint_id TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    pool TEXT NOT NULL,               -- main, auth, pipeline
+    duration_ms NUMERIC NOT NULL,     -- duration of the slow call that triggered the capture
+    plan JSONB NOT NULL,
+    analyzed BOOLEAN NOT NULL DEFAULT TRUE,
+    captured_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_hq_slow_query_plans_fingerprint
+    ON hq.slow_query_plans(fingerprint_id, captured_at DESC);
+CREATE INDEX IF NOT EXISTS idx_hq_slow_query_plans_captured
+    ON hq.slow_query_plans(captured_at);
+
+-- Grant permissions
+GRANT ALL ON hq.slow_query_plans TO service_role;
+GRANT USAGE, SELECT ON SEQUENCE hq.slow_query_plans_id_seq TO service_role;
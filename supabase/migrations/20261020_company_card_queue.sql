@@ -0,0 +1,168 @@
+-- Migration: Company Card Queue
+-- Created: 2026-10-20
+-- Purpose: Stop recomputing company cards inside every enrichment write. The statement-level
+--          triggers on the card's source tables now only queue the touched domains in
+--          core.company_card_dirty; hq-api (company_cards.py) drains the queue in small
+--          batches, each claimed with a lease, recomputed and committed on its own, like the
+--          alumni cube. This replaces the per-domain advisory locks refresh_company_cards
+--          took, which on bulk upserts held one lock per domain until commit.
+--
+--          Cards lag their source tables by up to one drain interval.
+
+CREATE TABLE IF NOT EXISTS core.company_card_dirty (
+    domain TEXT PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 1,              -- bumped by every re-queue
+    queued_at TIMESTAMPTZ NOT NULL DEFAULT now(),   -- not claimed before this (pushed back after a failure)
+    attempts INTEGER NOT NULL DEFAULT 0,            -- failed refreshes since it was queued
+    claimed_until TIMESTAMPTZ                       -- drain lease; NULL when unclaimed
+);
+
+CREATE INDEX IF NOT EXISTS idx_company_card_dirty_queued_at
+    ON core.company_card_dirty (queued_at);
+
+
+-- Recompute the cards for the given domains from the source tables, dropping cards
+-- whose domain no longer appears in any of them.
+--
+-- Only the queue drain calls this. Two refreshes of the same domain never overlap (the
+-- lease, which outlives the drain's statement timeout), and a domain re-queued after it
+-- was claimed keeps its queue row (version check in finish_company_card_batch) and is
+-- refreshed again, so every card is eventually computed from a snapshot that includes
+-- every committed write to its sources.
+CREATE OR REPLACE FUNCTION core.refresh_company_cards(p_domains TEXT[])
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF p_domains IS NULL OR cardinality(p_domains) = 0 THEN
+        RETURN;
+    END IF;
+
+    INSERT INTO core.company_card (
+        domain,
+        company_description,
+        company_tagline,
+        company_revenue,
+        company_revenue_range,
+        company_funding,
+        company_funding_range,
+        company_employee_range,
+        company_last_funding_type,
+        company_investors,
+        refreshed_at
+    )
+    SELECT
+        s.domain,
+        s.company_description,
+        s.company_tagline,
+        s.company_revenue,
+        s.company_revenue_range,
+        s.company_funding,
+        s.company_funding_range,
+        s.company_employee_range,
+        s.company_last_funding_type,
+        s.company_investors,
+        now()
+    FROM core.company_card_source s
+    WHERE s.domain = ANY(p_domains)
+    ON CONFLICT (domain) DO UPDATE SET
+        company_description = EXCLUDED.company_description,
+        company_tagline = EXCLUDED.company_tagline,
+        company_revenue = EXCLUDED.company_revenue,
+        company_revenue_range = EXCLUDED.company_revenue_range,
+        company_funding = EXCLUDED.company_funding,
+        company_funding_range = EXCLUDED.company_funding_range,
+        company_employee_range = EXCLUDED.company_employee_range,
+        company_last_funding_type = EXCLUDED.company_last_funding_type,
+        company_investors = EXCLUDED.company_investors,
+        refreshed_at = EXCLUDED.refreshed_at;
+
+    DELETE FROM core.company_card c
+    WHERE c.domain = ANY(p_domains)
+      AND NOT EXISTS (SELECT 1 FROM core.company_card_source s WHERE s.domain = c.domain);
+END;
+$$;
+
+
+-- Statement-level queueing: one queue row per domain the statement touched. A domain
+-- already queued gets its version bumped, so a drain that claimed it earlier leaves it
+-- queued. Rows are upserted in domain order so concurrent bulk writers can't deadlock.
+CREATE OR REPLACE FUNCTION core.company_card_sync()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO core.company_card_dirty (domain)
+        SELECT DISTINCT domain FROM new_rows WHERE domain IS NOT NULL ORDER BY domain
+        ON CONFLICT (domain) DO UPDATE SET version = core.company_card_dirty.version + 1;
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO core.company_card_dirty (domain)
+        SELECT DISTINCT domain FROM old_rows WHERE domain IS NOT NULL ORDER BY domain
+        ON CONFLICT (domain) DO UPDATE SET version = core.company_card_dirty.version + 1;
+    ELSE
+        INSERT INTO core.company_card_dirty (domain)
+        SELECT domain FROM (SELECT domain FROM new_rows UNION SELECT domain FROM old_rows) changed
+        WHERE domain IS NOT NULL ORDER BY domain
+        ON CONFLICT (domain) DO UPDATE SET version = core.company_card_dirty.version + 1;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+
+-- Claim up to p_limit due, unclaimed (or lease-expired) domains for p_lease_seconds.
+-- Commits on its own, so no queue row stays locked while the batch is refreshed.
+CREATE OR REPLACE FUNCTION core.claim_company_card_batch(p_limit INTEGER, p_lease_seconds INTEGER)
+RETURNS TABLE (domain TEXT, version BIGINT)
+LANGUAGE sql
+AS $$
+    UPDATE core.company_card_dirty d
+    SET claimed_until = now() + make_interval(secs => p_lease_seconds)
+    FROM (
+        SELECT q.domain
+        FROM core.company_card_dirty q
+        WHERE q.queued_at <= now()
+          AND (q.claimed_until IS NULL OR q.claimed_until < now())
+        ORDER BY q.queued_at
+        LIMIT p_limit
+        FOR UPDATE SKIP LOCKED
+    ) picked
+    WHERE d.domain = picked.domain
+    RETURNING d.domain, d.version
+$$;
+
+
+-- Finish a claimed batch. On success, drop the queue rows whose version is still the
+-- claimed one (re-queued domains stay for another pass). On failure, count the attempt
+-- and push the domains back by p_retry_seconds * 2^attempts (capped at 64x). Either way
+-- the lease is released.
+CREATE OR REPLACE FUNCTION core.finish_company_card_batch(
+    p_domains TEXT[],
+    p_versions BIGINT[],
+    p_failed BOOLEAN,
+    p_retry_seconds INTEGER DEFAULT 30
+)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF NOT p_failed THEN
+        DELETE FROM core.company_card_dirty d
+        USING unnest(p_domains, p_versions) AS c(domain, version)
+        WHERE d.domain = c.domain AND d.version = c.version;
+    END IF;
+
+    UPDATE core.company_card_dirty d
+    SET claimed_until = NULL,
+        attempts = CASE WHEN p_failed THEN d.attempts + 1 ELSE d.attempts END,
+        queued_at = CASE
+            WHEN p_failed THEN now() + make_interval(secs => p_retry_seconds * power(2, LEAST(d.attempts, 6)))
+            ELSE d.queued_at
+        END
+    WHERE d.domain = ANY(p_domains);
+END;
+$$;
+
+-- Permissions
+GRANT ALL ON core.company_card_dirty TO service_role;
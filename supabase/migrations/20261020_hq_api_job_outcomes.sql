@@ -0,0 +1,6 @@
+-- HQ API job outcome counts
+-- Per-outcome counts (worker outcome label -> records) for a background job,
+-- accumulated across attempts like the total/completed/succeeded/failed
+-- counters, so a resumed job reports everything its earlier attempts did.
+
+ALTER TABLE hq.api_jobs ADD COLUMN IF NOT EXISTS outcomes JSONB NOT NULL DEFAULT '{}'::jsonb;
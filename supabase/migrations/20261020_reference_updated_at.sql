@@ -0,0 +1,39 @@
+-- Reference lookup updated_at
+-- reference.location_parsed and reference.job_title_parsed rows are updated in place
+-- (e.g. ingest_job_title_parsed on an existing raw_job_title + source), but only had
+-- created_at. The modal-functions reference cache refreshes incrementally on a
+-- watermark, so it needs a column that moves on UPDATE too.
+
+ALTER TABLE reference.location_parsed ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ;
+UPDATE reference.location_parsed SET updated_at = COALESCE(created_at, NOW()) WHERE updated_at IS NULL;
+ALTER TABLE reference.location_parsed ALTER COLUMN updated_at SET DEFAULT NOW();
+ALTER TABLE reference.location_parsed ALTER COLUMN updated_at SET NOT NULL;
+
+ALTER TABLE reference.job_title_parsed ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ;
+UPDATE reference.job_title_parsed SET updated_at = COALESCE(created_at, NOW()) WHERE updated_at IS NULL;
+ALTER TABLE reference.job_title_parsed ALTER COLUMN updated_at SET DEFAULT NOW();
+ALTER TABLE reference.job_title_parsed ALTER COLUMN updated_at SET NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_location_parsed_updated_at ON reference.location_parsed(updated_at, id);
+CREATE INDEX IF NOT EXISTS idx_job_title_parsed_updated_at ON reference.job_title_parsed(updated_at, id);
+
+-- Trigger for updated_at
+CREATE OR REPLACE FUNCTION reference.update_parsed_lookup_updated_at()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at = NOW();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS tr_location_parsed_updated_at ON reference.location_parsed;
+CREATE TRIGGER tr_location_parsed_updated_at
+    BEFORE UPDATE ON reference.location_parsed
+    FOR EACH ROW
+    EXECUTE FUNCTION reference.update_parsed_lookup_updated_at();
+
+DROP TRIGGER IF EXISTS tr_job_title_parsed_updated_at ON reference.job_title_parsed;
+CREATE TRIGGER tr_job_title_parsed_updated_at
+    BEFORE UPDATE ON reference.job_title_parsed
+    FOR EACH ROW
+    EXECUTE FUNCTION reference.update_parsed_lookup_updated_at();
@@ -0,0 +1,184 @@
+-- Migration: Alumni Cube Queue Leases
+-- Created: 2026-10-21
+-- Purpose: Drain core.alumni_cube_dirty the way core.company_card_dirty is drained
+--          (20261020_company_card_queue.sql). core.drain_alumni_cube() deleted its batch and
+--          refreshed it in one transaction, so a batch that hit the statement timeout rolled
+--          back and the same oldest employers came first again: the backfill never advanced
+--          past them. Employers are now claimed with a lease, refreshed and finished as
+--          separate statements by hq-api (alumni.py), and a failed employer goes back in the
+--          queue behind an exponential backoff instead of blocking the ones after it.
+--
+--          Also queues the past employers of people added to or removed from core.leads,
+--          whose cube cells carry sample_linkedin_urls filtered on core.leads.
+
+ALTER TABLE core.alumni_cube_dirty
+    ADD COLUMN IF NOT EXISTS version BIGINT NOT NULL DEFAULT 1,     -- bumped by every re-queue
+    ADD COLUMN IF NOT EXISTS attempts INTEGER NOT NULL DEFAULT 0,   -- failed refreshes since it was queued
+    ADD COLUMN IF NOT EXISTS claimed_until TIMESTAMPTZ;             -- drain lease; NULL when unclaimed
+
+COMMENT ON COLUMN core.alumni_cube_dirty.queued_at IS 'Not claimed before this (pushed back after a failure)';
+
+CREATE INDEX IF NOT EXISTS idx_alumni_cube_dirty_queued_at
+    ON core.alumni_cube_dirty (queued_at);
+
+DROP FUNCTION IF EXISTS core.drain_alumni_cube(INTEGER);
+
+
+-- Queue the past employers of the given people. A queued employer gets its version
+-- bumped, so a drain that claimed it earlier leaves it queued; rows are upserted in key
+-- order so concurrent bulk writers can't deadlock.
+CREATE OR REPLACE FUNCTION core.alumni_cube_queue_people(p_urls TEXT[])
+RETURNS VOID
+LANGUAGE sql
+AS $$
+    INSERT INTO core.alumni_cube_dirty (employer_key)
+    SELECT DISTINCT core.alumni_employer_key(pwh.company_name)
+    FROM core.person_work_history pwh
+    WHERE pwh.linkedin_url = ANY(p_urls)
+      AND pwh.is_current = false
+      AND core.alumni_employer_key(pwh.company_name) IS NOT NULL
+    ORDER BY 1
+    ON CONFLICT (employer_key) DO UPDATE SET version = core.alumni_cube_dirty.version + 1
+$$;
+
+
+CREATE OR REPLACE FUNCTION core.alumni_cube_queue_work_history()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO core.alumni_cube_dirty (employer_key)
+        SELECT DISTINCT core.alumni_employer_key(company_name) FROM new_rows
+        WHERE core.alumni_employer_key(company_name) IS NOT NULL
+        ORDER BY 1
+        ON CONFLICT (employer_key) DO UPDATE SET version = core.alumni_cube_dirty.version + 1;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        INSERT INTO core.alumni_cube_dirty (employer_key)
+        SELECT DISTINCT core.alumni_employer_key(company_name) FROM old_rows
+        WHERE core.alumni_employer_key(company_name) IS NOT NULL
+        ORDER BY 1
+        ON CONFLICT (employer_key) DO UPDATE SET version = core.alumni_cube_dirty.version + 1;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION core.alumni_cube_queue_locations()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_urls TEXT[];
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        SELECT array_agg(DISTINCT linkedin_url) INTO v_urls FROM new_rows;
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT array_agg(DISTINCT linkedin_url) INTO v_urls FROM old_rows;
+    ELSE
+        SELECT array_agg(DISTINCT linkedin_url) INTO v_urls
+        FROM (SELECT linkedin_url FROM new_rows UNION SELECT linkedin_url FROM old_rows) changed;
+    END IF;
+
+    PERFORM core.alumni_cube_queue_people(v_urls);
+    RETURN NULL;
+END;
+$$;
+
+-- Lead membership only matters for sample_linkedin_urls, so an UPDATE queues just the
+-- URLs that entered or left core.leads; ordinary lead enrichment updates queue nothing.
+CREATE OR REPLACE FUNCTION core.alumni_cube_queue_leads()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_urls TEXT[];
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        SELECT array_agg(DISTINCT linkedin_url) INTO v_urls FROM new_rows;
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT array_agg(DISTINCT linkedin_url) INTO v_urls FROM old_rows;
+    ELSE
+        SELECT array_agg(linkedin_url) INTO v_urls
+        FROM (
+            (SELECT linkedin_url FROM new_rows EXCEPT SELECT linkedin_url FROM old_rows)
+            UNION
+            (SELECT linkedin_url FROM old_rows EXCEPT SELECT linkedin_url FROM new_rows)
+        ) changed;
+    END IF;
+
+    IF v_urls IS NOT NULL THEN
+        PERFORM core.alumni_cube_queue_people(v_urls);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS alumni_cube_queue_insert ON core.leads;
+DROP TRIGGER IF EXISTS alumni_cube_queue_update ON core.leads;
+DROP TRIGGER IF EXISTS alumni_cube_queue_delete ON core.leads;
+
+CREATE TRIGGER alumni_cube_queue_insert AFTER INSERT ON core.leads
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION core.alumni_cube_queue_leads();
+CREATE TRIGGER alumni_cube_queue_update AFTER UPDATE ON core.leads
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION core.alumni_cube_queue_leads();
+CREATE TRIGGER alumni_cube_queue_delete AFTER DELETE ON core.leads
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION core.alumni_cube_queue_leads();
+
+
+-- Claim up to p_limit due, unclaimed (or lease-expired) employers for p_lease_seconds.
+-- Commits on its own, so no queue row stays locked while the batch is refreshed.
+CREATE OR REPLACE FUNCTION core.claim_alumni_cube_batch(p_limit INTEGER, p_lease_seconds INTEGER)
+RETURNS TABLE (employer_key TEXT, version BIGINT)
+LANGUAGE sql
+AS $$
+    UPDATE core.alumni_cube_dirty d
+    SET claimed_until = now() + make_interval(secs => p_lease_seconds)
+    FROM (
+        SELECT q.employer_key
+        FROM core.alumni_cube_dirty q
+        WHERE q.queued_at <= now()
+          AND (q.claimed_until IS NULL OR q.claimed_until < now())
+        ORDER BY q.queued_at
+        LIMIT p_limit
+        FOR UPDATE SKIP LOCKED
+    ) picked
+    WHERE d.employer_key = picked.employer_key
+    RETURNING d.employer_key, d.version
+$$;
+
+
+-- Finish a claimed batch. On success, drop the queue rows whose version is still the
+-- claimed one (re-queued employers stay for another pass). On failure, count the attempt
+-- and push the employers back by p_retry_seconds * 2^attempts (capped at 64x). Either
+-- way the lease is released.
+CREATE OR REPLACE FUNCTION core.finish_alumni_cube_batch(
+    p_keys TEXT[],
+    p_versions BIGINT[],
+    p_failed BOOLEAN,
+    p_retry_seconds INTEGER DEFAULT 30
+)
+RETURNS VOID
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF NOT p_failed THEN
+        DELETE FROM core.alumni_cube_dirty d
+        USING unnest(p_keys, p_versions) AS c(employer_key, version)
+        WHERE d.employer_key = c.employer_key AND d.version = c.version;
+    END IF;
+
+    UPDATE core.alumni_cube_dirty d
+    SET claimed_until = NULL,
+        attempts = CASE WHEN p_failed THEN d.attempts + 1 ELSE d.attempts END,
+        queued_at = CASE
+            WHEN p_failed THEN now() + make_interval(secs => p_retry_seconds * power(2, LEAST(d.attempts, 6)))
+            ELSE d.queued_at
+        END
+    WHERE d.employer_key = ANY(p_keys);
+END;
+$$;